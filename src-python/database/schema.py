@@ -18,6 +18,8 @@ def create_all_tables(conn: sqlite3.Connection) -> None:
         _create_data_collection_jobs_table,
         _create_analysis_jobs_table,
         _create_analysis_results_table,
+        _create_indicator_states_table,
+        _create_indicator_values_table,
         _create_algorithms_table,
         _create_proposal_generation_jobs_table,
         _create_algorithm_proposals_table,
@@ -25,6 +27,15 @@ def create_all_tables(conn: sqlite3.Connection) -> None:
         _create_backtest_results_table,
         _create_backtest_trades_table,
         _create_backtest_equity_curve_table,
+        _create_backtest_equity_blobs_table,
+        _create_backtest_sweep_results_table,
+        _create_backtest_walk_forward_windows_table,
+        _create_backtest_monte_carlo_results_table,
+        _create_backtest_states_table,
+        _create_backtest_result_cache_table,
+        _create_backtest_job_metrics_table,
+        _create_backtest_workers_table,
+        _create_backtest_job_checkpoints_table,
         _create_stock_prediction_jobs_table,
         _create_stock_predictions_table,
         _create_prediction_actions_table,
@@ -52,6 +63,24 @@ def _create_data_sets_table(conn: sqlite3.Connection) -> None:
             created_at TEXT NOT NULL DEFAULT (datetime('now'))
         )
     """)
+    
+    # Add content version column if it doesn't exist (bumped whenever the OHLCV rows change)
+    try:
+        conn.execute("""
+            ALTER TABLE data_sets
+            ADD COLUMN version INTEGER NOT NULL DEFAULT 1
+        """)
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+    
+    # Add updated_at column if it doesn't exist (set by DataUpdater)
+    try:
+        conn.execute("""
+            ALTER TABLE data_sets
+            ADD COLUMN updated_at TEXT
+        """)
+    except sqlite3.OperationalError:
+        pass  # Column already exists
 
 
 def _create_ohlcv_data_table(conn: sqlite3.Connection) -> None:
@@ -146,6 +175,39 @@ def _create_analysis_results_table(conn: sqlite3.Connection) -> None:
     """)
 
 
+def _create_indicator_states_table(conn: sqlite3.Connection) -> None:
+    """Create indicator_states table (streaming indicator state per data set, advanced on update)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS indicator_states (
+            data_set_id INTEGER NOT NULL,
+            indicator TEXT NOT NULL,  -- Indicator key with parameters (e.g. 'rsi_14')
+            last_date TEXT NOT NULL,  -- Last bar the state includes
+            state TEXT NOT NULL,  -- JSON from StreamingIndicator.to_dict
+            updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+            PRIMARY KEY (data_set_id, indicator),
+            FOREIGN KEY (data_set_id) REFERENCES data_sets(id)
+        )
+    """)
+
+
+def _create_indicator_values_table(conn: sqlite3.Connection) -> None:
+    """Create indicator_values table (materialized indicator columns per data set, extended on ingest)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS indicator_values (
+            data_set_id INTEGER NOT NULL,
+            indicator TEXT NOT NULL,  -- Column name: indicator key, plus '.field' for multi-value indicators (e.g. 'macd_12_26_9.signal')
+            params TEXT NOT NULL,  -- JSON spec of the indicator
+            num_points INTEGER NOT NULL,
+            last_date TEXT NOT NULL,  -- Last bar of the column
+            dates BLOB NOT NULL,  -- zlib-compressed int64 epoch-second deltas
+            series BLOB NOT NULL,  -- zlib-compressed float64 values, NaN while warming up
+            updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+            PRIMARY KEY (data_set_id, indicator),
+            FOREIGN KEY (data_set_id) REFERENCES data_sets(id)
+        )
+    """)
+
+
 def _create_algorithms_table(conn: sqlite3.Connection) -> None:
     """Create algorithms table (selected algorithms)."""
     conn.execute("""
@@ -210,7 +272,7 @@ def _create_backtest_jobs_table(conn: sqlite3.Connection) -> None:
             start_date TEXT NOT NULL,
             end_date TEXT NOT NULL,
             data_set_id INTEGER,
-            status TEXT NOT NULL,  -- 'pending' | 'running' | 'completed' | 'failed'
+            status TEXT NOT NULL,  -- 'pending' | 'running' | 'completed' | 'failed' | 'cancelled'
             progress REAL DEFAULT 0.0,
             message TEXT,
             error TEXT,
@@ -220,6 +282,41 @@ def _create_backtest_jobs_table(conn: sqlite3.Connection) -> None:
             FOREIGN KEY (data_set_id) REFERENCES data_sets(id)
         )
     """)
+    
+    # Add job type column if it doesn't exist ('backtest' | 'sweep' | 'walk_forward')
+    try:
+        conn.execute("""
+            ALTER TABLE backtest_jobs
+            ADD COLUMN job_type TEXT NOT NULL DEFAULT 'backtest'
+        """)
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+    
+    # Add data set list column if it doesn't exist (JSON array of data set IDs for portfolio backtests)
+    try:
+        conn.execute("""
+            ALTER TABLE backtest_jobs
+            ADD COLUMN data_set_ids TEXT
+        """)
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+    
+    # Add queue columns if they don't exist (batch and JSON run settings of jobs queued for the backtest worker)
+    try:
+        conn.execute("""
+            ALTER TABLE backtest_jobs
+            ADD COLUMN batch_id TEXT
+        """)
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+    
+    try:
+        conn.execute("""
+            ALTER TABLE backtest_jobs
+            ADD COLUMN parameters TEXT
+        """)
+    except sqlite3.OperationalError:
+        pass  # Column already exists
 
 
 def _create_backtest_results_table(conn: sqlite3.Connection) -> None:
@@ -243,6 +340,30 @@ def _create_backtest_results_table(conn: sqlite3.Connection) -> None:
             FOREIGN KEY (algorithm_id) REFERENCES algorithms(id)
         )
     """)
+    
+    # Add risk and benchmark metric columns if they don't exist (computed from daily equity by PerformanceCalculator)
+    for column in (
+        'cagr REAL',
+        'volatility REAL',
+        'sortino_ratio REAL',
+        'calmar_ratio REAL',
+        'exposure REAL',
+        'var_95 REAL',
+        'cvar_95 REAL',
+        'longest_drawdown INTEGER',
+        'buy_and_hold_return REAL',
+        'excess_return REAL',
+        'alpha REAL',
+        'beta REAL',
+        'benchmark_return REAL',
+        'benchmark_excess_return REAL',
+        'benchmark_alpha REAL',
+        'benchmark_beta REAL'
+    ):
+        try:
+            conn.execute(f"ALTER TABLE backtest_results ADD COLUMN {column}")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
 
 
 def _create_backtest_trades_table(conn: sqlite3.Connection) -> None:
@@ -261,6 +382,15 @@ def _create_backtest_trades_table(conn: sqlite3.Connection) -> None:
             FOREIGN KEY (job_id) REFERENCES backtest_jobs(job_id)
         )
     """)
+    
+    # Add symbol column if it doesn't exist (set for portfolio backtests)
+    try:
+        conn.execute("""
+            ALTER TABLE backtest_trades
+            ADD COLUMN symbol TEXT
+        """)
+    except sqlite3.OperationalError:
+        pass  # Column already exists
 
 
 def _create_backtest_equity_curve_table(conn: sqlite3.Connection) -> None:
@@ -276,6 +406,159 @@ def _create_backtest_equity_curve_table(conn: sqlite3.Connection) -> None:
     """)
 
 
+def _create_backtest_equity_blobs_table(conn: sqlite3.Connection) -> None:
+    """Create backtest_equity_blobs table (compact equity curve storage, one row per job)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS backtest_equity_blobs (
+            job_id TEXT PRIMARY KEY,
+            num_points INTEGER NOT NULL,
+            dates BLOB NOT NULL,  -- zlib-compressed '<i8' second deltas (first one from 1970-01-01)
+            equity BLOB NOT NULL,  -- zlib-compressed '<f8' equity values
+            FOREIGN KEY (job_id) REFERENCES backtest_jobs(job_id)
+        )
+    """)
+
+
+def _create_backtest_sweep_results_table(conn: sqlite3.Connection) -> None:
+    """Create backtest_sweep_results table (ranked parameter sweep results)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS backtest_sweep_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            rank INTEGER NOT NULL,
+            parameters TEXT NOT NULL,  -- JSON
+            total_return REAL,
+            sharpe_ratio REAL,
+            max_drawdown REAL,
+            win_rate REAL,
+            total_trades INTEGER,
+            average_profit REAL,
+            average_loss REAL,
+            error TEXT,
+            rung INTEGER,  -- Last rung reached in a successive halving search
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            FOREIGN KEY (job_id) REFERENCES backtest_jobs(job_id)
+        )
+    """)
+
+
+def _create_backtest_walk_forward_windows_table(conn: sqlite3.Connection) -> None:
+    """Create backtest_walk_forward_windows table (per-window walk-forward results)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS backtest_walk_forward_windows (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            window_index INTEGER NOT NULL,
+            in_sample_start TEXT NOT NULL,
+            in_sample_end TEXT NOT NULL,
+            out_of_sample_start TEXT NOT NULL,
+            out_of_sample_end TEXT NOT NULL,
+            parameters TEXT,  -- JSON (winning in-sample parameters)
+            in_sample_score REAL,
+            total_return REAL,
+            sharpe_ratio REAL,
+            max_drawdown REAL,
+            win_rate REAL,
+            total_trades INTEGER,
+            average_profit REAL,
+            average_loss REAL,
+            error TEXT,
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            FOREIGN KEY (job_id) REFERENCES backtest_jobs(job_id)
+        )
+    """)
+
+
+def _create_backtest_monte_carlo_results_table(conn: sqlite3.Connection) -> None:
+    """Create backtest_monte_carlo_results table (bootstrap confidence intervals per metric)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS backtest_monte_carlo_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            method TEXT NOT NULL,  -- 'trades' | 'daily_returns'
+            num_simulations INTEGER NOT NULL,
+            confidence_level REAL NOT NULL,
+            metric TEXT NOT NULL,  -- 'total_return' | 'max_drawdown' | 'sharpe_ratio'
+            mean REAL,
+            median REAL,
+            lower REAL,
+            upper REAL,
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            FOREIGN KEY (job_id) REFERENCES backtest_jobs(job_id)
+        )
+    """)
+
+
+def _create_backtest_states_table(conn: sqlite3.Connection) -> None:
+    """Create backtest_states table (end-of-run state for continuing a backtest on new bars)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS backtest_states (
+            job_id TEXT PRIMARY KEY,
+            last_date TEXT NOT NULL,
+            state TEXT NOT NULL,  -- JSON (indicator recursions, cash, open position)
+            updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+            FOREIGN KEY (job_id) REFERENCES backtest_jobs(job_id)
+        )
+    """)
+
+
+def _create_backtest_result_cache_table(conn: sqlite3.Connection) -> None:
+    """Create backtest_result_cache table (completed job per backtest input hash)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS backtest_result_cache (
+            cache_key TEXT PRIMARY KEY,  -- SHA-256 of algorithm, data set version, date range and capital
+            job_id TEXT NOT NULL,
+            data_set_id INTEGER NOT NULL,
+            data_set_version INTEGER NOT NULL,
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            FOREIGN KEY (job_id) REFERENCES backtest_jobs(job_id),
+            FOREIGN KEY (data_set_id) REFERENCES data_sets(id)
+        )
+    """)
+
+
+def _create_backtest_job_metrics_table(conn: sqlite3.Connection) -> None:
+    """Create backtest_job_metrics table (stage timings and peak memory of a backtest run)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS backtest_job_metrics (
+            job_id TEXT PRIMARY KEY,
+            stage_timings TEXT NOT NULL,  -- JSON object of stage -> seconds
+            total_seconds REAL NOT NULL,
+            stage_peak_memory TEXT,  -- JSON object of stage -> peak bytes allocated during it
+            peak_memory INTEGER,  -- Highest stage peak in bytes (NULL when memory was not traced)
+            profile_path TEXT,  -- cProfile dump (NULL unless profiling was requested)
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            FOREIGN KEY (job_id) REFERENCES backtest_jobs(job_id)
+        )
+    """)
+
+
+def _create_backtest_workers_table(conn: sqlite3.Connection) -> None:
+    """Create backtest_workers table (the live backtest worker process and its heartbeat)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS backtest_workers (
+            worker_id TEXT PRIMARY KEY,
+            pid INTEGER NOT NULL,
+            started_at TEXT NOT NULL,
+            heartbeat_at TEXT NOT NULL
+        )
+    """)
+
+
+def _create_backtest_job_checkpoints_table(conn: sqlite3.Connection) -> None:
+    """Create backtest_job_checkpoints table (finished batches of a sweep or walk-forward job)."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS backtest_job_checkpoints (
+            job_id TEXT NOT NULL,
+            batch_index INTEGER NOT NULL,  -- Combination batch, successive halving rung or walk-forward window
+            results TEXT NOT NULL,  -- JSON
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            PRIMARY KEY (job_id, batch_index),
+            FOREIGN KEY (job_id) REFERENCES backtest_jobs(job_id)
+        )
+    """)
+
+
 def _create_stock_prediction_jobs_table(conn: sqlite3.Connection) -> None:
     """Create stock_prediction_jobs table."""
     conn.execute("""
@@ -438,8 +721,13 @@ def _create_indexes(conn: sqlite3.Connection) -> None:
         # Backtest indexes
         "CREATE INDEX IF NOT EXISTS idx_backtest_jobs_status ON backtest_jobs(status)",
         "CREATE INDEX IF NOT EXISTS idx_backtest_jobs_algorithm_id ON backtest_jobs(algorithm_id)",
+        "CREATE INDEX IF NOT EXISTS idx_backtest_jobs_batch_id ON backtest_jobs(batch_id)",
         "CREATE INDEX IF NOT EXISTS idx_backtest_trades_job_id ON backtest_trades(job_id)",
         "CREATE INDEX IF NOT EXISTS idx_backtest_equity_job_id ON backtest_equity_curve(job_id)",
+        "CREATE INDEX IF NOT EXISTS idx_backtest_sweep_results_job_id ON backtest_sweep_results(job_id, rank)",
+        "CREATE INDEX IF NOT EXISTS idx_backtest_walk_forward_windows_job_id ON backtest_walk_forward_windows(job_id, window_index)",
+        "CREATE INDEX IF NOT EXISTS idx_backtest_monte_carlo_results_job_id ON backtest_monte_carlo_results(job_id)",
+        "CREATE INDEX IF NOT EXISTS idx_backtest_result_cache_data_set_id ON backtest_result_cache(data_set_id)",
         
         # Stock prediction indexes
         "CREATE INDEX IF NOT EXISTS idx_stock_prediction_jobs_status ON stock_prediction_jobs(status)",
@@ -9,6 +9,14 @@ from modules.backtest.algorithm_parser import AlgorithmParser
 from modules.backtest.signal_generator import SignalGenerator
 from modules.backtest.trade_simulator import TradeSimulator
 from modules.backtest.performance_calculator import PerformanceCalculator
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.backtest.parameter_sweep import ParameterSweep
+from modules.backtest.batch_backtest import BatchBacktest
+from modules.backtest.walk_forward import WalkForwardAnalysis
+from modules.backtest.monte_carlo import MonteCarloSimulator
+from modules.backtest.portfolio_engine import PortfolioBacktestEngine, SymbolPanel
+from modules.backtest.stage_profiler import StageProfiler
+from modules.backtest.successive_halving import SuccessiveHalvingOptimizer
 
 __all__ = [
     'BacktestEngine',
@@ -16,4 +24,13 @@ __all__ = [
     'SignalGenerator',
     'TradeSimulator',
     'PerformanceCalculator',
+    'IndicatorCache',
+    'ParameterSweep',
+    'BatchBacktest',
+    'WalkForwardAnalysis',
+    'MonteCarloSimulator',
+    'PortfolioBacktestEngine',
+    'SymbolPanel',
+    'StageProfiler',
+    'SuccessiveHalvingOptimizer',
 ]
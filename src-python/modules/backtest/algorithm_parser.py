@@ -7,13 +7,20 @@ Related Documentation:
 DEPENDENCY MAP:
 
 Parents (Files that import this file):
-  └─ src-python/modules/backtest/backtest_engine.py
+  ├─ src-python/modules/backtest/backtest_engine.py
+  ├─ src-python/modules/backtest/signal_generator.py
+  ├─ src-python/modules/backtest/portfolio_engine.py
+  └─ src-python/modules/backtest/data_loader.py
 
 Dependencies (External files that this file imports):
+  ├─ numpy
   ├─ typing (standard library)
+  ├─ src-python/modules/data_analysis/indicator_engine
   └─ src/types/algorithm (TypeScript types, used as reference)
 """
-from typing import Dict, Any, List, Optional
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+from modules.data_analysis.indicator_engine import DEFAULT_FIELDS, INDICATOR_FIELDS
 
 
 class AlgorithmParser:
@@ -70,17 +77,12 @@ class AlgorithmParser:
         
         # Get the value to compare
         compare_value = None
+        source = self._get_compare_source(trigger_type, period, condition.get('indicator'))
         
-        if trigger_type == 'rsi':
-            compare_value = indicator_values.get('rsi')
-        elif trigger_type == 'macd':
-            compare_value = indicator_values.get('macd')
-        elif trigger_type == 'price':
-            compare_value = price_data.get('close')
-        elif trigger_type == 'volume':
-            compare_value = price_data.get('volume')
-        elif trigger_type == 'moving_average':
-            compare_value = indicator_values.get(f'ma_{period}')
+        if source is not None:
+            source_name, key = source
+            values = indicator_values if source_name == 'indicator' else price_data
+            compare_value = values.get(key)
         
         if compare_value is None:
             return False
@@ -88,6 +90,71 @@ class AlgorithmParser:
         # Evaluate condition
         return self._evaluate_operator(operator, compare_value, value)
     
+    def get_required_indicators(self, triggers: List[Dict[str, Any]]) -> List[str]:
+        """
+        List the indicator names referenced by a trigger list.
+        
+        Args:
+            triggers: List of trigger definitions
+        
+        Returns:
+            Indicator names in first-use order (e.g., ['rsi', 'ma_20'])
+        """
+        names = []
+        for trigger in triggers:
+            condition = trigger.get('condition', {})
+            if not condition:
+                continue
+            source = self._get_compare_source(
+                trigger.get('type', '').lower(),
+                condition.get('period', 14),
+                condition.get('indicator')
+            )
+            if source is not None and source[0] == 'indicator' and source[1] not in names:
+                names.append(source[1])
+        return names
+    
+    def _get_compare_source(
+        self,
+        trigger_type: str,
+        period: Any,
+        field: Optional[str] = None
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Resolve which value a trigger type compares against.
+        
+        Args:
+            trigger_type: Trigger type ('rsi', 'macd', 'price', 'volume', 'moving_average',
+                'sma', 'ema', 'atr', 'obv', 'vwap', 'bollinger', 'stochastic', 'adx')
+            period: Period from the trigger condition (used by all types but rsi, macd, price, volume and obv)
+            field: Value of a multi-value indicator from the condition's 'indicator'
+                (bollinger: upper/middle/lower/percent_b, stochastic: k/d, adx: adx/plus_di/minus_di);
+                defaults to percent_b, k and adx
+        
+        Returns:
+            Tuple of ('indicator' | 'price', key) or None for unknown trigger types
+        """
+        if trigger_type == 'rsi':
+            return ('indicator', 'rsi')
+        elif trigger_type == 'macd':
+            return ('indicator', 'macd')
+        elif trigger_type == 'price':
+            return ('price', 'close')
+        elif trigger_type == 'volume':
+            return ('price', 'volume')
+        elif trigger_type in ('moving_average', 'sma'):
+            return ('indicator', f'ma_{period}')
+        elif trigger_type == 'obv':
+            return ('indicator', 'obv')
+        elif trigger_type in ('ema', 'atr', 'vwap'):
+            return ('indicator', f'{trigger_type}_{period}')
+        elif trigger_type in INDICATOR_FIELDS:
+            field = field or DEFAULT_FIELDS[trigger_type]
+            if field not in INDICATOR_FIELDS[trigger_type]:
+                return None
+            return ('indicator', f'{trigger_type}_{period}.{field}')
+        return None
+    
     def _evaluate_operator(self, operator: str, compare_value: float, target_value: Any) -> bool:
         """
         Evaluate comparison operator.
@@ -164,4 +231,112 @@ class AlgorithmParser:
                 final_result = final_result and results[i + 1]
         
         return final_result
-
+    
+    def compile_trigger_mask(
+        self,
+        triggers: List[Dict[str, Any]],
+        indicator_arrays: Dict[str, np.ndarray],
+        price_arrays: Dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Evaluate all triggers for every bar at once.
+        
+        Produces the same result as calling evaluate_triggers row by row, where
+        missing indicators (NaN) never satisfy a condition. Arrays may also be
+        2-D (dates x symbols) to evaluate a whole universe in one pass.
+        
+        Args:
+            triggers: List of trigger definitions
+            indicator_arrays: Dict of per-bar indicator arrays (e.g., {'rsi': array, 'ma_20': array})
+            price_arrays: Dict of per-bar price arrays ('open', 'high', 'low', 'close', 'volume')
+        
+        Returns:
+            Boolean array with the shape of the price arrays
+        """
+        shape = np.shape(next(iter(price_arrays.values()))) if price_arrays else (0,)
+        if not triggers:
+            return np.zeros(shape, dtype=bool)
+        
+        final_mask = self._compile_trigger(triggers[0], indicator_arrays, price_arrays, shape)
+        for i in range(1, len(triggers)):
+            operator = triggers[i - 1].get('logical_operator', 'AND')
+            mask = self._compile_trigger(triggers[i], indicator_arrays, price_arrays, shape)
+            if operator == 'OR':
+                final_mask = final_mask | mask
+            else:
+                # AND, and default to AND for anything else
+                final_mask = final_mask & mask
+        
+        return final_mask
+    
+    def _compile_trigger(
+        self,
+        trigger: Dict[str, Any],
+        indicator_arrays: Dict[str, np.ndarray],
+        price_arrays: Dict[str, np.ndarray],
+        shape: Tuple[int, ...]
+    ) -> np.ndarray:
+        """
+        Evaluate a single trigger condition for every bar.
+        
+        Args:
+            trigger: Trigger definition with 'type' and 'condition'
+            indicator_arrays: Dict of per-bar indicator arrays
+            price_arrays: Dict of per-bar price arrays
+            shape: Shape of the price arrays
+        
+        Returns:
+            Boolean array with the shape of the price arrays
+        """
+        trigger_type = trigger.get('type', '').lower()
+        condition = trigger.get('condition', {})
+        
+        if not condition:
+            return np.zeros(shape, dtype=bool)
+        
+        operator = condition.get('operator', '')
+        value = condition.get('value')
+        period = condition.get('period', 14)
+        
+        source = self._get_compare_source(trigger_type, period, condition.get('indicator'))
+        if source is None:
+            return np.zeros(shape, dtype=bool)
+        
+        source_name, key = source
+        arrays = indicator_arrays if source_name == 'indicator' else price_arrays
+        if key not in arrays:
+            return np.zeros(shape, dtype=bool)
+        
+        compare_values = np.asarray(arrays[key], dtype=float)
+        return self._evaluate_operator_mask(operator, compare_values, value)
+    
+    def _evaluate_operator_mask(self, operator: str, compare_values: np.ndarray, target_value: Any) -> np.ndarray:
+        """
+        Evaluate comparison operator element-wise.
+        
+        NaN compares False under every operator, matching a missing indicator value.
+        
+        Args:
+            operator: Operator ('gt', 'lt', 'gte', 'lte', 'eq', 'between')
+            compare_values: Values to compare
+            target_value: Target value or range
+        
+        Returns:
+            Boolean array
+        """
+        if operator == 'gt':
+            return compare_values > target_value
+        elif operator == 'lt':
+            return compare_values < target_value
+        elif operator == 'gte':
+            return compare_values >= target_value
+        elif operator == 'lte':
+            return compare_values <= target_value
+        elif operator == 'eq':
+            return np.abs(compare_values - target_value) < 0.0001  # Float comparison
+        elif operator == 'between':
+            if isinstance(target_value, list) and len(target_value) == 2:
+                return (target_value[0] <= compare_values) & (compare_values <= target_value[1])
+            return np.zeros(compare_values.shape, dtype=bool)
+        else:
+            return np.zeros(compare_values.shape, dtype=bool)
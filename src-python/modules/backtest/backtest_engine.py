@@ -7,22 +7,33 @@ Related Documentation:
 DEPENDENCY MAP:
 
 Parents (Files that import this file):
-  └─ src-python/scripts/run_backtest.py
+  ├─ src-python/scripts/run_backtest.py
+  ├─ src-python/modules/backtest/batch_backtest.py
+  ├─ src-python/modules/backtest/parameter_sweep.py
+  ├─ src-python/modules/backtest/portfolio_engine.py
+  ├─ src-python/modules/backtest/successive_halving.py
+  └─ src-python/scripts/continue_backtest.py
 
 Dependencies (External files that this file imports):
   ├─ pandas
+  ├─ numpy
   ├─ typing (standard library)
   ├─ src-python/modules/backtest/algorithm_parser
+  ├─ src-python/modules/backtest/indicator_cache
   ├─ src-python/modules/backtest/signal_generator
   ├─ src-python/modules/backtest/trade_simulator
-  └─ src-python/modules/backtest/performance_calculator
+  ├─ src-python/modules/backtest/performance_calculator
+  └─ src-python/modules/backtest/stage_profiler
 """
 import pandas as pd
-from typing import Dict, Any, Optional
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple, Sequence
 from modules.backtest.algorithm_parser import AlgorithmParser
+from modules.backtest.indicator_cache import IndicatorCache
 from modules.backtest.signal_generator import SignalGenerator
 from modules.backtest.trade_simulator import TradeSimulator
 from modules.backtest.performance_calculator import PerformanceCalculator
+from modules.backtest.stage_profiler import StageProfiler
 
 
 class BacktestEngine:
@@ -34,7 +45,14 @@ class BacktestEngine:
         data: pd.DataFrame,
         start_date: str,
         end_date: str,
-        initial_capital: float = 100000.0
+        initial_capital: float = 100000.0,
+        indicator_cache: Optional[IndicatorCache] = None,
+        state: Optional[Dict[str, Any]] = None,
+        profiler: Optional[StageProfiler] = None,
+        warmup_bars: int = 0,
+        benchmark: Optional[pd.DataFrame] = None,
+        history: Optional[pd.DataFrame] = None,
+        score: bool = True
     ):
         """
         Initialize backtest engine.
@@ -45,12 +63,35 @@ class BacktestEngine:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             initial_capital: Initial capital for backtesting
+            indicator_cache: Indicators precomputed for the date-filtered data (optional)
+            state: End state of an earlier run over the bars right before start_date
+                (optional). The run then continues indicators, cash and any open
+                position instead of starting over.
+            profiler: Stage profiler collecting this run's timings (optional, a new one
+                without cProfile is used by default)
+            warmup_bars: Number of bars before start_date the indicators are computed
+                over, so they are available from the first bar (ignored with an
+                indicator_cache or state)
+            benchmark: DataFrame with the dates and closes of an index the
+                performance is compared with, besides buying and holding data (optional)
+            history: OHLCV bars before data, used with state to recompute indicators
+                that cannot be continued from a saved state (optional)
+            score: Calculate the performance (default). Without it, results hold the
+                'equity', 'positions' and 'closes' arrays instead of 'performance', so
+                many runs can be scored at once with PerformanceCalculator.calculate_performances
         """
         self.algorithm = algorithm
         self.data = data
         self.start_date = start_date
         self.end_date = end_date
         self.initial_capital = initial_capital
+        self.indicator_cache = indicator_cache
+        self.state = state
+        self.profiler = profiler
+        self.warmup_bars = warmup_bars
+        self.benchmark = benchmark
+        self.history = history
+        self.score = score
         
         self.algorithm_parser = AlgorithmParser()
         self.signal_generator = SignalGenerator()
@@ -62,53 +103,243 @@ class BacktestEngine:
         Run backtest.
         
         Returns:
-            Dict with backtest results
+            Dict with backtest results, including the stage timings and peak
+            memory of this run under 'profile'
         """
-        # 1. Filter data by date range
-        filtered_data = self._filter_data()
+        profiler = self.profiler or StageProfiler()
+        with profiler.run():
+            results = self._run_stages(profiler)
+        results['profile'] = profiler.to_dict()
+        return results
+    
+    def _run_stages(self, profiler: StageProfiler) -> Dict[str, Any]:
+        """Run every stage of the backtest under the profiler's timers."""
+        # 1. Filter data by date range (keeping the warmup bars for the indicators)
+        with profiler.stage('filter'):
+            warmup_data, warmup_count = self._filter_data()
+            filtered_data = warmup_data.iloc[warmup_count:].reset_index(drop=True) if warmup_count else warmup_data
         
         if filtered_data.empty:
             raise ValueError(f"No data available for date range {self.start_date} to {self.end_date}")
         
         # 2. Parse algorithm
-        parsed_algorithm = self.algorithm_parser.parse_algorithm(self.algorithm)
+        with profiler.stage('parse'):
+            parsed_algorithm = self.algorithm_parser.parse_algorithm(self.algorithm)
         
         # 3. Generate signals
-        signals_df = self.signal_generator.generate_signals(filtered_data, parsed_algorithm)
+        with profiler.stage('signals'):
+            indicator_cache = self.indicator_cache
+            if indicator_cache is None:
+                if self.state is not None:
+                    indicator_cache = IndicatorCache(
+                        filtered_data,
+                        resume_states=self.state['indicators'],
+                        history=self.history
+                    )
+                elif warmup_count:
+                    warmup_cache = IndicatorCache(warmup_data)
+                    warmup_cache.precompute(
+                        self.algorithm_parser.get_required_indicators(parsed_algorithm.get('triggers', []))
+                    )
+                    indicator_cache = warmup_cache.slice(warmup_count, len(warmup_data))
+                else:
+                    indicator_cache = self.signal_generator.create_indicator_cache(filtered_data)
+            signals_df = self.signal_generator.generate_signals(
+                filtered_data,
+                parsed_algorithm,
+                indicator_cache=indicator_cache
+            )
         
         # 4. Simulate trades
-        trades = self.trade_simulator.simulate_trades(signals_df, parsed_algorithm)
+        with profiler.stage('simulate'):
+            trade_state = None
+            carried_entry_date = None
+            if self.state is not None:
+                trade_state = {'capital': self.state['capital'], 'position': self.state['position']}
+                if self.state['position']:
+                    # Same type as the dates of this run's trades
+                    carried_entry_date = pd.Timestamp(self.state['position']['entry_date'])
+            trade_array, end_trade_state = self.trade_simulator.simulate_signal_trades(
+                signals_df,
+                parsed_algorithm,
+                trade_state
+            )
+            dates = filtered_data['date'].tolist()
+            trades = self.trade_simulator.trades_to_dicts(trade_array, dates, carried_entry_date)
         
-        # 5. Calculate performance
-        performance = self.performance_calculator.calculate_performance(trades)
+        # 5. Calculate mark-to-market equity
+        with profiler.stage('equity'):
+            closes = signals_df['close'].to_numpy()
+            equity = self.performance_calculator.calculate_equity(
+                trade_array,
+                closes,
+                trade_state['capital'] if trade_state else None
+            )
         
-        # 6. Calculate equity curve
-        dates = filtered_data['date'].tolist()
-        equity_curve = self.performance_calculator.calculate_equity_curve(trades, dates)
+        # 6. Calculate performance against buying and holding, and equity curve
+        with profiler.stage('performance'):
+            positions = self.performance_calculator.calculate_open_positions(trade_array, len(equity))
+            results = {'trades': trades}
+            if self.score:
+                results['performance'] = self.performance_calculator.calculate_performance(
+                    trades,
+                    equity,
+                    positions,
+                    buy_and_hold=closes,
+                    benchmark=align_benchmark(self.benchmark, dates) if self.benchmark is not None else None
+                )
+            else:
+                results.update(equity=equity, positions=positions, closes=closes)
+            results['equity_curve'] = self.performance_calculator.calculate_equity_curve(equity, dates)
+            results['state'] = self._build_state(indicator_cache, end_trade_state, dates, carried_entry_date, positions)
         
-        return {
-            'trades': trades,
-            'performance': performance,
-            'equity_curve': equity_curve
-        }
+        return results
     
-    def _filter_data(self) -> pd.DataFrame:
+    def _build_state(
+        self,
+        indicator_cache: IndicatorCache,
+        trade_state: Dict[str, Any],
+        dates: List[Any],
+        carried_entry_date: Any,
+        positions: np.ndarray
+    ) -> Dict[str, Any]:
         """
-        Filter data by date range.
+        Build the JSON-serializable end-of-run state a continuation run starts from.
+        
+        Args:
+            indicator_cache: Indicator cache used for this run
+            trade_state: End state from TradeSimulator
+            dates: Date of each bar of this run
+            carried_entry_date: Entry date of a position carried in from the state (if any)
+            positions: Open position of each bar of this run
         
         Returns:
-            Filtered DataFrame
+            Dict with the algorithm, last processed date, indicator states, cash, open position
+            and number of bars held in a position since the start of the backtest
         """
-        if self.data.empty:
-            return pd.DataFrame()
+        position = None
+        if trade_state['position'] is not None:
+            entry_index = trade_state['position']['entry_index']
+            entry_date = dates[entry_index] if entry_index >= 0 else carried_entry_date
+            position = {
+                'entry_date': _format_date(entry_date),
+                'entry_price': trade_state['position']['entry_price'],
+                'quantity': trade_state['position']['quantity']
+            }
         
-        # Ensure date column is datetime
-        if not pd.api.types.is_datetime64_any_dtype(self.data['date']):
-            self.data['date'] = pd.to_datetime(self.data['date'])
+        # A position still open was closed on the last bar only for reporting; it is held there
+        exposed_bars = int(np.count_nonzero(positions)) + (position is not None)
+        if self.state is not None:
+            exposed_bars += self.state['exposed_bars']
         
-        # Filter by date range
-        mask = (self.data['date'] >= self.start_date) & (self.data['date'] <= self.end_date)
-        filtered = self.data[mask].copy()
+        return {
+            'algorithm': self.algorithm,
+            'initial_capital': self.initial_capital,
+            'last_date': _format_date(dates[-1]),
+            'indicators': indicator_cache.get_states(),
+            'capital': trade_state['capital'],
+            'position': position,
+            'exposed_bars': exposed_bars
+        }
+    
+    def _filter_data(self) -> Tuple[pd.DataFrame, int]:
+        """
+        Filter data by date range.
         
-        return filtered
+        Returns:
+            Tuple of (filtered DataFrame, preceded by the warmup bars if any are used,
+            number of warmup bars)
+        """
+        if self.indicator_cache is not None or self.state is not None:
+            return filter_data_by_date_range(self.data, self.start_date, self.end_date), 0
+        return filter_data_with_warmup(self.data, self.start_date, self.end_date, self.warmup_bars)
+
+
+def filter_data_by_date_range(data: pd.DataFrame, start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    Filter OHLCV data by date range.
+    
+    Converts the date column of data to datetime in place if needed. When
+    every row is in range (e.g. data loaded for this range), a shallow copy
+    is returned instead of copying the values.
+    
+    Args:
+        data: DataFrame with OHLCV data
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+    
+    Returns:
+        Filtered DataFrame
+    """
+    if data.empty:
+        return pd.DataFrame()
+    
+    # Ensure date column is datetime
+    if not pd.api.types.is_datetime64_any_dtype(data['date']):
+        data['date'] = pd.to_datetime(data['date'])
+    
+    # Filter by date range
+    mask = (data['date'] >= start_date) & (data['date'] <= end_date)
+    if mask.all():
+        return data.copy(deep=False)
+    filtered = data[mask].copy()
+    
+    return filtered
+
+
+def filter_data_with_warmup(
+    data: pd.DataFrame,
+    start_date: str,
+    end_date: str,
+    warmup_bars: int
+) -> Tuple[pd.DataFrame, int]:
+    """
+    Filter OHLCV data by date range, keeping up to warmup_bars bars before it.
+    
+    Args:
+        data: DataFrame with OHLCV data in date order
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        warmup_bars: Number of bars before start_date to keep
+    
+    Returns:
+        Tuple of (filtered DataFrame starting with the warmup bars, number of warmup bars).
+        Without warmup bars the DataFrame is the one filter_data_by_date_range returns.
+    """
+    filtered = filter_data_by_date_range(data, start_date, end_date)
+    if warmup_bars <= 0 or filtered.empty:
+        return filtered, 0
+    
+    earlier = np.flatnonzero((data['date'] < start_date).to_numpy())[-warmup_bars:]
+    if len(earlier) == 0:
+        return filtered, 0
+    return pd.concat([data.iloc[earlier], filtered], ignore_index=True), len(earlier)
+
+
+def align_benchmark(benchmark: pd.DataFrame, dates: Sequence[Any]) -> Optional[np.ndarray]:
+    """
+    Align the closes of a benchmark data set with the bars of a backtest.
+    
+    Each bar takes the last benchmark close on or before its date; bars
+    before the first benchmark date take its first close.
+    
+    Args:
+        benchmark: DataFrame with 'date' and 'close' columns in date order
+        dates: Date of each bar
+    
+    Returns:
+        Array of benchmark closes, one per bar (None if the benchmark has no rows)
+    """
+    if benchmark.empty:
+        return None
+    benchmark_dates = pd.to_datetime(benchmark['date']).to_numpy()
+    bar_dates = pd.to_datetime(pd.Series(dates)).to_numpy()
+    indices = np.searchsorted(benchmark_dates, bar_dates, side='right') - 1
+    return benchmark['close'].to_numpy(dtype=float)[np.maximum(indices, 0)]
+
 
+def _format_date(value: Any) -> str:
+    """Convert a date value (str, datetime or pandas Timestamp) to YYYY-MM-DD."""
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d')
+    return str(value)
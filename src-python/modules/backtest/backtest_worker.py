@@ -0,0 +1,532 @@
+"""
+Backtest worker process.
+
+Backtests are queued in backtest_jobs by run_backtest.py and run by one
+long-lived worker process instead of a thread of the short-lived script
+that queued them. The worker claims queued batches, runs up to
+max_concurrent_jobs of them at once in child processes and exits after
+idling for idle_timeout seconds. A heartbeat row in backtest_workers tells
+run_backtest.py whether a worker is alive or must be started.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  ├─ src-python/scripts/run_backtest.py
+  ├─ src-python/scripts/run_parameter_sweep.py
+  ├─ src-python/scripts/run_walk_forward.py
+  └─ src-python/scripts/backtest_worker.py
+
+Dependencies (External files that this file imports):
+  ├─ sqlite3 (standard library)
+  ├─ json (standard library)
+  ├─ logging (standard library)
+  ├─ multiprocessing (standard library)
+  ├─ os (standard library)
+  ├─ subprocess (standard library)
+  ├─ sys (standard library)
+  ├─ time (standard library)
+  ├─ uuid (standard library)
+  ├─ datetime (standard library)
+  ├─ pathlib (standard library)
+  ├─ typing (standard library)
+  ├─ src-python/database.connection
+  ├─ src-python/modules/backtest/batch_backtest
+  ├─ src-python/modules/backtest/data_loader
+  ├─ src-python/modules/backtest/job_manager
+  ├─ src-python/modules/backtest/optimization_jobs
+  ├─ src-python/modules/backtest/portfolio_engine
+  ├─ src-python/modules/backtest/result_cache
+  └─ src-python/modules/backtest/stage_profiler
+"""
+import sqlite3
+import json
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from database.connection import get_connection
+from modules.backtest.batch_backtest import BatchBacktest
+from modules.backtest.data_loader import load_ohlcv, load_symbol_data
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.optimization_jobs import OPTIMIZATION_JOB_TYPES, run_optimization_job
+from modules.backtest.portfolio_engine import PortfolioBacktestEngine, SymbolPanel
+from modules.backtest.result_cache import BacktestResultCache
+from modules.backtest.stage_profiler import StageProfiler, default_profile_path
+
+
+logger = logging.getLogger(__name__)
+
+# A worker whose heartbeat is older than this is considered dead
+HEARTBEAT_TIMEOUT = timedelta(seconds=30)
+
+WORKER_SCRIPT = Path(__file__).parent.parent.parent / 'scripts' / 'backtest_worker.py'
+
+
+def run_backtest_jobs(
+    job_ids: Dict[int, str],
+    start_date: str,
+    end_date: str,
+    data_set_id: Optional[int],
+    max_workers: Optional[int] = 1,
+    data_set_ids: Optional[List[int]] = None,
+    max_positions: Optional[int] = None,
+    initial_capital: float = 100000.0,
+    cache_keys: Optional[Dict[int, str]] = None,
+    data_set_version: Optional[int] = None,
+    compact_equity: bool = False,
+    profile: bool = False,
+    warmup_bars: int = 0,
+    benchmark_data_set_id: Optional[int] = None
+):
+    """
+    Run backtests for every algorithm of one batch of jobs.
+    
+    With data_set_id each algorithm runs on that data set; otherwise it runs
+    as one portfolio across data_set_ids. Jobs with an entry in cache_keys are
+    recorded in the result cache once their results are saved. With
+    compact_equity the equity curves are stored as compressed blobs. Stage
+    timings are saved for every run; with profile each run also writes a
+    cProfile dump and saves the peak memory of each stage. Only the date range plus warmup_bars earlier bars per data
+    set are loaded. Every backtest is compared with buying and holding its
+    data and, with benchmark_data_set_id, with that data set as an index,
+    which is loaded once for the batch.
+    """
+    conn = get_connection()
+    job_manager = BacktestJobManager(conn=conn)
+    result_cache = BacktestResultCache(conn=conn)
+    pending_job_ids = dict(job_ids)
+    profile_paths = {
+        algorithm_id: default_profile_path(job_id)
+        for algorithm_id, job_id in job_ids.items()
+    } if profile else {}
+    
+    try:
+        # Update job status to running
+        for job_id in pending_job_ids.values():
+            job_manager.update_job_status(job_id, 'running', 0.1, 'Loading algorithm...')
+        
+        # Load algorithms from database
+        cursor = conn.cursor()
+        algorithms = {}
+        for algorithm_id in job_ids:
+            cursor.execute("""
+                SELECT name, description, definition
+                FROM algorithms
+                WHERE id = ?
+            """, (algorithm_id,))
+            
+            algorithm_row = cursor.fetchone()
+            if not algorithm_row:
+                error = f"Algorithm with id {algorithm_id} not found"
+                job_manager.update_job_status(
+                    pending_job_ids.pop(algorithm_id),
+                    'failed',
+                    0.0,
+                    f'Backtest failed: {error}',
+                    error=error,
+                    completed=True
+                )
+                continue
+            
+            algorithm_name, algorithm_description, definition_json = algorithm_row
+            algorithms[algorithm_id] = json.loads(definition_json)
+        
+        if not algorithms:
+            return
+        
+        for job_id in pending_job_ids.values():
+            job_manager.update_job_status(job_id, 'running', 0.2, 'Loading data...')
+        
+        # Load the date range once for every algorithm
+        if data_set_id:
+            data = load_ohlcv(cursor, data_set_id, start_date, end_date, warmup_bars, stored_indicators=True)
+        else:
+            symbol_data = load_symbol_data(cursor, data_set_ids or [], start_date, end_date, warmup_bars)
+        benchmark = None
+        if benchmark_data_set_id:
+            if benchmark_data_set_id == data_set_id:
+                benchmark = data
+            else:
+                benchmark = load_ohlcv(cursor, benchmark_data_set_id, start_date, end_date)
+        
+        for job_id in pending_job_ids.values():
+            job_manager.update_job_status(job_id, 'running', 0.3, 'Running backtest...')
+        
+        def save_algorithm_results(algorithm_id: int, results: Dict[str, Any]):
+            job_id = pending_job_ids.pop(algorithm_id)
+            if job_manager.is_cancelled(job_id):
+                return
+            if 'error' in results:
+                job_manager.update_job_status(
+                    job_id,
+                    'failed',
+                    0.0,
+                    f"Backtest failed: {results['error']}",
+                    error=results['error'],
+                    completed=True
+                )
+                return
+            
+            try:
+                job_manager.update_job_status(job_id, 'running', 0.9, 'Saving results...')
+                
+                # Save results
+                job_manager.save_results(
+                    job_id=job_id,
+                    algorithm_id=algorithm_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    performance=results['performance'],
+                    trades=results['trades'],
+                    equity_curve=results['equity_curve'],
+                    state=results.get('state'),
+                    compact_equity=compact_equity
+                )
+                if results.get('profile'):
+                    job_manager.save_metrics(job_id, results['profile'])
+                if cache_keys and algorithm_id in cache_keys:
+                    result_cache.store(cache_keys[algorithm_id], job_id, data_set_id, data_set_version)
+                
+                job_manager.update_job_status(
+                    job_id,
+                    'completed',
+                    1.0,
+                    'Backtest completed successfully',
+                    completed=True
+                )
+            except Exception as e:
+                conn.rollback()
+                job_manager.update_job_status(
+                    job_id,
+                    'failed',
+                    0.0,
+                    f'Backtest failed: {str(e)}',
+                    error=str(e),
+                    completed=True
+                )
+        
+        if not data_set_id:
+            # Align the data sets once and share the panel's indicators across algorithms
+            panel = SymbolPanel(symbol_data, start_date, end_date, warmup_bars)
+            for algorithm_id, algorithm in algorithms.items():
+                try:
+                    results = PortfolioBacktestEngine(
+                        algorithm=algorithm,
+                        panel=panel,
+                        initial_capital=initial_capital,
+                        max_positions=max_positions,
+                        profiler=StageProfiler(profile_paths.get(algorithm_id)),
+                        benchmark=benchmark
+                    ).run()
+                except Exception as e:
+                    results = {'error': str(e)}
+                save_algorithm_results(algorithm_id, results)
+            return
+        
+        # Run backtests against the shared data and indicators
+        batch = BatchBacktest(
+            algorithms=algorithms,
+            data=data,
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=initial_capital,
+            max_workers=max_workers,
+            profile_paths=profile_paths,
+            warmup_bars=warmup_bars,
+            benchmark=benchmark
+        )
+        batch.run(result_callback=save_algorithm_results)
+    except Exception as e:
+        # Update remaining jobs to failed
+        for job_id in pending_job_ids.values():
+            job_manager.update_job_status(
+                job_id,
+                'failed',
+                0.0,
+                f'Backtest failed: {str(e)}',
+                error=str(e),
+                completed=True
+            )
+
+
+def run_claimed_jobs(jobs: List[Dict[str, Any]]):
+    """
+    Run a batch claimed with BacktestJobManager.claim_pending_batch.
+    
+    Sweep and walk-forward jobs resume from their checkpoints when they were
+    queued again after a worker restart.
+    
+    Args:
+        jobs: Claimed job dicts of one batch
+    """
+    first = jobs[0]
+    if first['job_type'] in OPTIMIZATION_JOB_TYPES:
+        for job in jobs:
+            run_optimization_job(job)
+        return
+    
+    parameters = first['parameters']
+    run_backtest_jobs(
+        job_ids={job['algorithm_id']: job['job_id'] for job in jobs},
+        start_date=first['start_date'],
+        end_date=first['end_date'],
+        data_set_id=first['data_set_id'],
+        max_workers=parameters.get('max_workers', 1),
+        data_set_ids=first['data_set_ids'],
+        max_positions=parameters.get('max_positions'),
+        initial_capital=parameters.get('initial_capital', 100000.0),
+        cache_keys={
+            job['algorithm_id']: job['parameters']['cache_key']
+            for job in jobs
+            if job['parameters'].get('cache_key')
+        },
+        data_set_version=parameters.get('data_set_version'),
+        compact_equity=parameters.get('compact_equity', False),
+        profile=parameters.get('profile', False),
+        warmup_bars=parameters.get('warmup_bars', 0),
+        benchmark_data_set_id=parameters.get('benchmark_data_set_id')
+    )
+
+
+def is_worker_alive(conn: sqlite3.Connection) -> bool:
+    """
+    Check whether a backtest worker has sent a heartbeat recently.
+    
+    Args:
+        conn: Database connection
+    
+    Returns:
+        True if a live worker will pick up queued jobs
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT MAX(heartbeat_at) FROM backtest_workers")
+    row = cursor.fetchone()
+    if not row or not row[0]:
+        return False
+    return datetime.fromisoformat(row[0]) > datetime.now() - HEARTBEAT_TIMEOUT
+
+
+def start_worker_process() -> subprocess.Popen:
+    """
+    Start scripts/backtest_worker.py detached from the calling process.
+    
+    Returns:
+        Handle of the started process
+    """
+    if os.name == 'nt':
+        options = {'creationflags': subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        options = {'start_new_session': True}
+    return subprocess.Popen(
+        [sys.executable, str(WORKER_SCRIPT)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        **options
+    )
+
+
+def ensure_worker_running(conn: sqlite3.Connection) -> bool:
+    """
+    Start a backtest worker unless a live one will pick up queued jobs.
+    
+    Call after the jobs are queued and committed; a worker only exits when
+    nothing is queued, so queued jobs are never left without a worker.
+    
+    Args:
+        conn: Database connection
+    
+    Returns:
+        True if a worker was started
+    """
+    if is_worker_alive(conn):
+        return False
+    start_worker_process()
+    return True
+
+
+class BacktestWorker:
+    """Claim queued backtest batches and run them in a bounded set of child processes."""
+    
+    def __init__(
+        self,
+        max_concurrent_jobs: int = 2,
+        poll_interval: float = 1.0,
+        idle_timeout: float = 60.0,
+        conn: Optional[sqlite3.Connection] = None
+    ):
+        """
+        Initialize backtest worker.
+        
+        Args:
+            max_concurrent_jobs: Number of batches run at the same time
+            poll_interval: Seconds between checks for queued jobs
+            idle_timeout: Seconds without queued or running jobs before the worker exits
+            conn: Database connection (optional)
+        """
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self.conn = conn or get_connection()
+        self.job_manager = BacktestJobManager(conn=self.conn)
+        self.worker_id = str(uuid.uuid4())
+        self.processes: Dict[int, Any] = {}
+        self.process_jobs: Dict[int, List[str]] = {}
+    
+    def register(self) -> bool:
+        """
+        Register as the live worker unless another one is alive.
+        
+        Jobs left running by a dead worker are queued again. Both happen in
+        one immediate transaction, so two starting workers cannot both win.
+        
+        Returns:
+            True if this worker is now the live worker
+        """
+        if self.conn.in_transaction:
+            self.conn.commit()
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            if is_worker_alive(self.conn):
+                self.conn.rollback()
+                return False
+            
+            now = datetime.now().isoformat()
+            cursor.execute("DELETE FROM backtest_workers")
+            cursor.execute("""
+                INSERT INTO backtest_workers (worker_id, pid, started_at, heartbeat_at)
+                VALUES (?, ?, ?, ?)
+            """, (self.worker_id, os.getpid(), now, now))
+            cursor.execute("""
+                UPDATE backtest_jobs
+                SET status = 'pending', progress = 0.0, message = 'Queued again after a worker restart'
+                WHERE status = 'running' AND batch_id IS NOT NULL
+            """)
+            if cursor.rowcount:
+                logger.warning(f"Queued {cursor.rowcount} interrupted backtest jobs again")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return True
+    
+    def heartbeat(self) -> bool:
+        """
+        Refresh the heartbeat of this worker.
+        
+        Returns:
+            False if another worker has replaced this one
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            UPDATE backtest_workers
+            SET heartbeat_at = ?
+            WHERE worker_id = ?
+        """, (datetime.now().isoformat(), self.worker_id))
+        self.conn.commit()
+        return cursor.rowcount == 1
+    
+    def unregister(self, only_if_idle: bool = False) -> bool:
+        """
+        Remove this worker's heartbeat row.
+        
+        Args:
+            only_if_idle: Keep the row and return False if jobs are queued
+        
+        Returns:
+            True if the row was removed
+        """
+        if self.conn.in_transaction:
+            self.conn.commit()
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            if only_if_idle:
+                cursor.execute("""
+                    SELECT 1 FROM backtest_jobs
+                    WHERE status = 'pending' AND batch_id IS NOT NULL
+                    LIMIT 1
+                """)
+                if cursor.fetchone():
+                    self.conn.rollback()
+                    return False
+            cursor.execute("DELETE FROM backtest_workers WHERE worker_id = ?", (self.worker_id,))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return True
+    
+    def start_batch(self, jobs: List[Dict[str, Any]]):
+        """Run a claimed batch in a new child process."""
+        process = multiprocessing.Process(target=run_claimed_jobs, args=(jobs,))
+        process.start()
+        self.processes[process.pid] = process
+        self.process_jobs[process.pid] = [job['job_id'] for job in jobs]
+    
+    def reap(self):
+        """Collect finished child processes and fail jobs a crashed one left unfinished."""
+        for pid, process in list(self.processes.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            job_ids = self.process_jobs.pop(pid)
+            del self.processes[pid]
+            failed = self.job_manager.fail_unfinished_jobs(
+                job_ids,
+                f'Backtest worker process exited with code {process.exitcode}'
+            )
+            if failed:
+                logger.error(f"Backtest process {pid} exited with code {process.exitcode}; failed {failed} jobs")
+    
+    def run(self) -> bool:
+        """
+        Run until idle for idle_timeout seconds.
+        
+        Returns:
+            False if another live worker was found and nothing was run
+        """
+        if not self.register():
+            return False
+        
+        active = True
+        idle_since = time.monotonic()
+        try:
+            while True:
+                self.reap()
+                while active and len(self.processes) < self.max_concurrent_jobs:
+                    jobs = self.job_manager.claim_pending_batch()
+                    if not jobs:
+                        break
+                    self.start_batch(jobs)
+                
+                if self.processes:
+                    idle_since = time.monotonic()
+                elif not active or (
+                    time.monotonic() - idle_since >= self.idle_timeout
+                    and self.unregister(only_if_idle=True)
+                ):
+                    break
+                
+                if active and not self.heartbeat():
+                    logger.warning("Another backtest worker took over; finishing running jobs")
+                    active = False
+                time.sleep(self.poll_interval)
+        finally:
+            for process in self.processes.values():
+                process.join()
+            self.reap()
+            self.unregister()
+        return True
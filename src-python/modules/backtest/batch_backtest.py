@@ -0,0 +1,212 @@
+"""
+Batch backtest module for running several algorithms against one data set.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  ├─ src-python/modules/backtest/backtest_worker.py
+  ├─ src-python/modules/backtest/parameter_sweep.py
+  └─ src-python/modules/backtest/successive_halving.py
+
+Dependencies (External files that this file imports):
+  ├─ pandas
+  ├─ concurrent.futures (standard library)
+  ├─ typing (standard library)
+  ├─ src-python/modules/backtest/algorithm_parser
+  ├─ src-python/modules/backtest/backtest_engine
+  ├─ src-python/modules/backtest/data_loader
+  ├─ src-python/modules/backtest/indicator_cache
+  └─ src-python/modules/backtest/stage_profiler
+"""
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from modules.backtest.algorithm_parser import AlgorithmParser
+from modules.backtest.backtest_engine import BacktestEngine, filter_data_with_warmup
+from modules.backtest.data_loader import STORED_INDICATORS
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.backtest.stage_profiler import StageProfiler
+
+
+# Per-process state set once by the pool initializer
+_worker_state: Dict[str, Any] = {}
+
+
+def prepare_shared_inputs(
+    algorithms: List[Dict[str, Any]],
+    data: pd.DataFrame,
+    start_date: str,
+    end_date: str,
+    warmup_bars: int = 0
+) -> Tuple[pd.DataFrame, IndicatorCache]:
+    """
+    Filter data once and precompute every indicator the given algorithms reference.
+    
+    Stored indicator columns of data (see load_ohlcv) are used as they are.
+    
+    Args:
+        algorithms: Algorithm definitions that will run against the data
+        data: DataFrame with OHLCV data
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        warmup_bars: Number of bars before start_date the indicators are computed over
+    
+    Returns:
+        Tuple of (date-filtered data, indicator cache for that data)
+    """
+    warmup_data, warmup_count = filter_data_with_warmup(data, start_date, end_date, warmup_bars)
+    warmup_data = warmup_data.reset_index(drop=True)
+    if len(warmup_data) <= warmup_count:
+        raise ValueError(f"No data available for date range {start_date} to {end_date}")
+    
+    algorithm_parser = AlgorithmParser()
+    indicator_cache = IndicatorCache(warmup_data, values={
+        name: warmup_data[name].to_numpy() for name in STORED_INDICATORS if name in warmup_data.columns
+    })
+    for algorithm in algorithms:
+        indicator_cache.precompute(
+            algorithm_parser.get_required_indicators(algorithm.get('triggers', []))
+        )
+    
+    if warmup_count:
+        indicator_cache = indicator_cache.slice(warmup_count, len(warmup_data))
+    return indicator_cache.data, indicator_cache
+
+
+def _init_worker(
+    data: pd.DataFrame,
+    indicator_cache: IndicatorCache,
+    start_date: str,
+    end_date: str,
+    initial_capital: float,
+    benchmark: Optional[pd.DataFrame] = None
+):
+    """Store the shared batch inputs in the worker process."""
+    _worker_state['data'] = data
+    _worker_state['indicator_cache'] = indicator_cache
+    _worker_state['start_date'] = start_date
+    _worker_state['end_date'] = end_date
+    _worker_state['initial_capital'] = initial_capital
+    _worker_state['benchmark'] = benchmark
+
+
+def _run_algorithm(
+    algorithm_id: int,
+    algorithm: Dict[str, Any],
+    profile_path: Optional[str] = None
+) -> Tuple[int, Dict[str, Any]]:
+    """Run one algorithm against the worker's shared data and indicators."""
+    try:
+        engine = BacktestEngine(
+            algorithm=algorithm,
+            data=_worker_state['data'],
+            start_date=_worker_state['start_date'],
+            end_date=_worker_state['end_date'],
+            initial_capital=_worker_state['initial_capital'],
+            indicator_cache=_worker_state['indicator_cache'],
+            profiler=StageProfiler(profile_path),
+            benchmark=_worker_state['benchmark']
+        )
+        return algorithm_id, engine.run()
+    except Exception as e:
+        return algorithm_id, {'error': str(e)}
+
+
+class BatchBacktest:
+    """Run several algorithms against one data set with shared indicators."""
+    
+    def __init__(
+        self,
+        algorithms: Dict[int, Dict[str, Any]],
+        data: pd.DataFrame,
+        start_date: str,
+        end_date: str,
+        initial_capital: float = 100000.0,
+        max_workers: Optional[int] = 1,
+        profile_paths: Optional[Dict[int, str]] = None,
+        warmup_bars: int = 0,
+        benchmark: Optional[pd.DataFrame] = None
+    ):
+        """
+        Initialize batch backtest.
+        
+        Args:
+            algorithms: Dict of algorithm ID to algorithm definition
+            data: DataFrame with OHLCV data
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            initial_capital: Initial capital for backtesting
+            max_workers: Number of worker processes (default: 1 runs in-process, None uses CPU count)
+            profile_paths: Dict of algorithm ID to the file its cProfile dump is written to (optional)
+            warmup_bars: Number of bars before start_date the indicators are computed over
+            benchmark: DataFrame with the dates and closes of an index every
+                algorithm is compared with (optional)
+        """
+        self.algorithms = algorithms
+        self.data = data
+        self.start_date = start_date
+        self.end_date = end_date
+        self.initial_capital = initial_capital
+        self.max_workers = max_workers
+        self.profile_paths = profile_paths or {}
+        self.warmup_bars = warmup_bars
+        self.benchmark = benchmark
+    
+    def run(
+        self,
+        result_callback: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Run every algorithm.
+        
+        Args:
+            result_callback: Called with (algorithm_id, results) as each backtest finishes (optional)
+        
+        Returns:
+            Dict of algorithm ID to backtest results ('trades', 'performance',
+            'equity_curve') or {'error': message} if that algorithm failed
+        """
+        filtered_data, indicator_cache = prepare_shared_inputs(
+            list(self.algorithms.values()),
+            self.data,
+            self.start_date,
+            self.end_date,
+            self.warmup_bars
+        )
+        initargs = (
+            filtered_data,
+            indicator_cache,
+            self.start_date,
+            self.end_date,
+            self.initial_capital,
+            self.benchmark[['date', 'close']] if self.benchmark is not None else None
+        )
+        
+        all_results = {}
+        if self.max_workers == 1 or len(self.algorithms) <= 1:
+            _init_worker(*initargs)
+            for algorithm_id, algorithm in self.algorithms.items():
+                _, results = _run_algorithm(algorithm_id, algorithm, self.profile_paths.get(algorithm_id))
+                all_results[algorithm_id] = results
+                if result_callback:
+                    result_callback(algorithm_id, results)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=initargs
+            ) as executor:
+                futures = [
+                    executor.submit(_run_algorithm, algorithm_id, algorithm, self.profile_paths.get(algorithm_id))
+                    for algorithm_id, algorithm in self.algorithms.items()
+                ]
+                for future in as_completed(futures):
+                    algorithm_id, results = future.result()
+                    all_results[algorithm_id] = results
+                    if result_callback:
+                        result_callback(algorithm_id, results)
+        
+        return all_results
@@ -0,0 +1,201 @@
+"""
+OHLCV data loading for backtests.
+
+Only the bars of the requested date range, plus the warmup bars the
+algorithm's indicators need before it, are read from SQLite. Rows are
+written straight from the cursor into NumPy arrays, with dates converted
+to epoch seconds by SQLite, so no per-row Python tuples or date parsing
+are involved. Indicators materialized in indicator_values can be loaded
+alongside the bars as extra columns.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  ├─ src-python/scripts/run_backtest.py
+  ├─ src-python/modules/backtest/backtest_worker.py
+  ├─ src-python/modules/backtest/batch_backtest.py
+  └─ src-python/modules/backtest/optimization_jobs.py
+
+Dependencies (External files that this file imports):
+  ├─ sqlite3 (standard library)
+  ├─ pandas
+  ├─ numpy
+  ├─ typing (standard library)
+  ├─ src-python/modules/backtest/algorithm_parser
+  ├─ src-python/modules/backtest/indicator_cache
+  └─ src-python/modules/data_analysis/indicator_store
+"""
+import sqlite3
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Optional
+from modules.backtest.algorithm_parser import AlgorithmParser
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.data_analysis.indicator_store import IndicatorStore
+
+
+_ROW_DTYPE = np.dtype([
+    ('date', np.int64),
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('volume', np.float64)
+])
+
+# Indicator cache names of the stored columns that equal the cache's own
+# values; warmup-dependent recursions (RSI, MACD) are always computed
+STORED_INDICATORS = {
+    'ma_20': 'sma_20',
+    'ma_50': 'sma_50'
+}
+
+
+def get_warmup_bars(algorithms: List[Dict[str, Any]]) -> int:
+    """
+    Get the number of bars the longest indicator lookback of some algorithms needs.
+    
+    Args:
+        algorithms: Algorithm definitions
+    
+    Returns:
+        Number of bars before the first bar with every indicator available
+    """
+    algorithm_parser = AlgorithmParser()
+    lookbacks = [0]
+    for algorithm in algorithms:
+        for name in algorithm_parser.get_required_indicators(algorithm.get('triggers', [])):
+            lookbacks.append(IndicatorCache.get_lookback(name) or 0)
+    return max(lookbacks)
+
+
+def load_ohlcv(
+    cursor: sqlite3.Cursor,
+    data_set_id: int,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    warmup_bars: int = 0,
+    stored_indicators: bool = False
+) -> pd.DataFrame:
+    """
+    Load the OHLCV bars of a data set within a date range.
+    
+    Args:
+        cursor: Database cursor
+        data_set_id: Data set ID
+        start_date: First date (YYYY-MM-DD, optional)
+        end_date: Last date, inclusive (YYYY-MM-DD, optional)
+        warmup_bars: Number of bars before start_date to include as well
+        stored_indicators: Add the STORED_INDICATORS columns from indicator_values
+            when they cover every loaded bar
+    
+    Returns:
+        DataFrame with columns date (datetime64), open, high, low, close, volume
+        (plus the stored indicator columns, named like the indicator cache) in date order
+    
+    Raises:
+        ValueError: If the data set has no bars in the range
+    """
+    lower_bound = start_date
+    if start_date is not None and warmup_bars > 0:
+        # The warmup is counted in bars, so gaps in the dates do not matter
+        cursor.execute("""
+            SELECT date
+            FROM ohlcv_data
+            WHERE data_set_id = ? AND date < ?
+            ORDER BY date DESC
+            LIMIT 1 OFFSET ?
+        """, (data_set_id, start_date, warmup_bars - 1))
+        row = cursor.fetchone()
+        lower_bound = row[0] if row else None
+    
+    conditions = ['data_set_id = ?']
+    parameters: List[Any] = [data_set_id]
+    if lower_bound is not None:
+        conditions.append('date >= ?')
+        parameters.append(lower_bound)
+    if end_date is not None:
+        conditions.append('date <= ?')
+        parameters.append(end_date)
+    
+    # sqlite3.Row results cannot fill a structured array, plain tuples can
+    row_cursor = cursor.connection.cursor()
+    row_cursor.row_factory = None
+    row_cursor.execute(f"""
+        SELECT CAST(strftime('%s', date) AS INTEGER), open, high, low, close, volume
+        FROM ohlcv_data
+        WHERE {' AND '.join(conditions)}
+        ORDER BY date ASC
+    """, parameters)
+    rows = np.fromiter(row_cursor, dtype=_ROW_DTYPE)
+    if len(rows) == 0:
+        raise ValueError("No OHLCV data available")
+    
+    data = pd.DataFrame({
+        'date': rows['date'].astype('datetime64[s]').astype('datetime64[ns]'),
+        'open': rows['open'],
+        'high': rows['high'],
+        'low': rows['low'],
+        'close': rows['close'],
+        'volume': rows['volume']
+    })
+    if stored_indicators:
+        stored = IndicatorStore(cursor.connection).load(data_set_id, list(STORED_INDICATORS.values()))
+        # A store that lags behind the bars is ignored and the indicators are computed
+        if stored is not None and data['date'].isin(stored['date']).all():
+            aligned = stored.set_index('date').reindex(data['date'])
+            for name, column in STORED_INDICATORS.items():
+                data[name] = aligned[column].to_numpy()
+    return data
+
+
+def load_symbol_data(
+    cursor: sqlite3.Cursor,
+    data_set_ids: List[int],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    warmup_bars: int = 0
+) -> Dict[str, pd.DataFrame]:
+    """
+    Load the OHLCV bars of several data sets, keyed by symbol.
+    
+    Data sets sharing a symbol are told apart by their ID. Data sets without
+    bars in the range are left out.
+    
+    Args:
+        cursor: Database cursor
+        data_set_ids: Data set IDs
+        start_date: First date (YYYY-MM-DD, optional)
+        end_date: Last date, inclusive (YYYY-MM-DD, optional)
+        warmup_bars: Number of bars before start_date to include for each data set
+    
+    Returns:
+        Dict of symbol to DataFrame as returned by load_ohlcv
+    
+    Raises:
+        ValueError: If none of the data sets has bars in the range
+    """
+    placeholders = ', '.join('?' * len(data_set_ids))
+    cursor.execute(f"""
+        SELECT id, symbol, name
+        FROM data_sets
+        WHERE id IN ({placeholders})
+        ORDER BY id ASC
+    """, data_set_ids)
+    labels = {row[0]: row[1] or row[2] for row in cursor.fetchall()}
+    label_counts = pd.Series(list(labels.values()), dtype=object).value_counts()
+    
+    symbol_data = {}
+    for data_set_id, label in labels.items():
+        try:
+            data = load_ohlcv(cursor, data_set_id, start_date, end_date, warmup_bars)
+        except ValueError:
+            continue
+        symbol_data[f"{label} ({data_set_id})" if label_counts[label] > 1 else label] = data
+    
+    if not symbol_data:
+        raise ValueError("No OHLCV data available")
+    return symbol_data
@@ -0,0 +1,336 @@
+"""
+Indicator cache module for backtest engine.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  ├─ src-python/modules/backtest/signal_generator.py
+  ├─ src-python/modules/backtest/backtest_engine.py
+  ├─ src-python/modules/backtest/parameter_sweep.py
+  ├─ src-python/modules/backtest/walk_forward.py
+  ├─ src-python/modules/backtest/portfolio_engine.py
+  ├─ src-python/modules/backtest/data_loader.py
+  └─ src-python/modules/backtest/successive_halving.py
+
+Dependencies (External files that this file imports):
+  ├─ pandas
+  ├─ numpy
+  ├─ typing (standard library)
+  ├─ src-python/modules/data_analysis/technical_indicators
+  ├─ src-python/modules/data_analysis/indicator_engine
+  └─ src-python/modules/data_analysis/streaming_indicators
+"""
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+from modules.data_analysis.indicator_engine import IndicatorEngine, parse_indicator_name
+from modules.data_analysis.streaming_indicators import (
+    StreamingATR,
+    StreamingBollinger,
+    StreamingEMA,
+    StreamingIndicator,
+    StreamingSMA,
+    restore_streaming_indicator
+)
+from modules.data_analysis.technical_indicators import TechnicalIndicators
+
+
+# Streaming indicators that continue IndicatorEngine indicators of the same type;
+# the other engine indicators are recomputed over the bars since their first one
+STREAMING_ENGINE_INDICATORS = {
+    'sma': StreamingSMA,
+    'ema': StreamingEMA,
+    'atr': StreamingATR,
+    'bollinger': StreamingBollinger
+}
+
+
+class IndicatorCache:
+    """Compute full-series indicator arrays once and reuse them across backtests."""
+    
+    DEFAULT_INDICATORS = ['rsi', 'macd', 'ma_20', 'ma_50']
+    
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        values: Optional[Dict[str, np.ndarray]] = None,
+        resume_states: Optional[Dict[str, Dict[str, Any]]] = None,
+        history: Optional[pd.DataFrame] = None
+    ):
+        """
+        Initialize indicator cache.
+        
+        Args:
+            data: DataFrame with OHLCV data the indicators are computed from
+            values: Precomputed indicator arrays (optional)
+            resume_states: Indicator states from get_states() of a cache over the bars
+                right before data (optional). Indicators then continue their recursions
+                instead of starting over, and indicators without a state cannot be computed.
+            history: OHLCV bars before data (optional). Resumed engine indicators without a
+                streaming form are recomputed over the bars since their first bar.
+        """
+        self.data = data
+        self.technical_indicators = TechnicalIndicators()
+        self.resume_states = resume_states
+        self.history = history
+        self._values: Dict[str, np.ndarray] = {}
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._engine: Optional[IndicatorEngine] = None
+        for name, array in (values or {}).items():
+            self._values[name] = np.asarray(array, dtype=float)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the engine's intermediate arrays when pickling for worker processes."""
+        state = self.__dict__.copy()
+        state['_engine'] = None
+        return state
+    
+    def __len__(self) -> int:
+        """Number of bars covered by the cache."""
+        return len(self.data)
+    
+    def get(self, name: str) -> Optional[np.ndarray]:
+        """
+        Get an indicator array, computing it on first access.
+        
+        Args:
+            name: Indicator name ('rsi', 'macd', 'ma_<period>' or an IndicatorEngine name)
+        
+        Returns:
+            Array with one value per bar (NaN where unavailable) or None for unknown indicators
+        """
+        if name not in self._values:
+            array = self._compute(name)
+            if array is None:
+                return None
+            self._values[name] = array
+        return self._values[name]
+    
+    def get_many(self, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Get several indicator arrays.
+        
+        Args:
+            names: Indicator names
+        
+        Returns:
+            Dict of indicator arrays (unknown indicators are omitted)
+        """
+        arrays = {}
+        for name in names:
+            array = self.get(name)
+            if array is not None:
+                arrays[name] = array
+        return arrays
+    
+    def precompute(self, names: Iterable[str]) -> None:
+        """
+        Compute indicators up front, e.g. before handing the cache to worker processes.
+        
+        Args:
+            names: Indicator names
+        """
+        self.get_many(names)
+    
+    @staticmethod
+    def get_lookback(name: str) -> Optional[int]:
+        """
+        Get the number of bars an indicator needs before its first value.
+        
+        Args:
+            name: Indicator name ('rsi', 'macd', 'ma_<period>' or an IndicatorEngine name)
+        
+        Returns:
+            Number of bars or None for unknown indicators
+        """
+        if name == 'rsi':
+            return 14  # One delta per bar over the RSI period
+        if name == 'macd':
+            return 26 + 9 - 1  # Slow EMA plus signal line periods, as in continue_macd_series
+        if name.startswith('ma_'):
+            try:
+                period = int(float(name[len('ma_'):]))
+            except ValueError:
+                return None
+            return period - 1 if period > 0 else None
+        return IndicatorEngine.get_lookback(name)
+    
+    def get_states(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the end-of-series state of every indicator computed by this cache.
+        
+        Precomputed moving averages take their state from the last closes;
+        other indicators passed in as precomputed values have no state.
+        
+        Returns:
+            Dict of indicator name to JSON-serializable state
+        """
+        states = dict(self._states)
+        for name in self._values:
+            period = self._parse_period(name[len('ma_'):]) if name.startswith('ma_') else None
+            if name not in states and period is not None:
+                closes = self.data['close'].values
+                _, states[name] = self.technical_indicators.continue_sma_series(
+                    closes[max(0, len(closes) - (period - 1)):], period
+                )
+        return states
+    
+    def slice(self, start: int, stop: int) -> 'IndicatorCache':
+        """
+        Get a cache for a contiguous range of bars.
+        
+        Indicators already computed keep the values from the full series, so
+        windows after the first start with warmed-up indicators. A slice that
+        runs to the last bar also keeps the end states of those indicators.
+        
+        Args:
+            start: First bar position
+            stop: Position after the last bar
+        
+        Returns:
+            IndicatorCache aligned with data.iloc[start:stop] (index reset)
+        """
+        sliced = IndicatorCache(
+            self.data.iloc[start:stop].reset_index(drop=True),
+            values={name: array[start:stop] for name, array in self._values.items()}
+        )
+        if stop >= len(self):
+            sliced._states = dict(self._states)
+        return sliced
+    
+    @property
+    def names(self) -> List[str]:
+        """Names of the indicators computed so far."""
+        return list(self._values.keys())
+    
+    def _compute(self, name: str) -> Optional[np.ndarray]:
+        """Compute a single indicator array and remember its end state."""
+        close_prices = self.data['close'].values
+        if name == 'rsi':
+            array, end_state = self.technical_indicators.continue_rsi_series(
+                close_prices, 14, self._get_resume_state(name)
+            )
+        elif name == 'macd':
+            array, end_state = self.technical_indicators.continue_macd_series(
+                close_prices, state=self._get_resume_state(name)
+            )
+        elif name.startswith('ma_'):
+            period = self._parse_period(name[len('ma_'):])
+            if period is None:
+                return None
+            array, end_state = self.technical_indicators.continue_sma_series(
+                close_prices, period, self._get_resume_state(name)
+            )
+        elif IndicatorEngine.get_lookback(name) is not None:
+            array, end_state = self._compute_engine_indicator(name, self._get_resume_state(name))
+        else:
+            return None
+        
+        self._states[name] = end_state
+        return array
+    
+    def _compute_engine_indicator(
+        self,
+        name: str,
+        state: Optional[Dict[str, Any]]
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Compute an IndicatorEngine indicator and its end state.
+        
+        Indicators with a streaming form save the streaming indicator and
+        continue it bar by bar. The others save the date of their first bar
+        and are recomputed over history from that date plus data.
+        """
+        indicator_type, period, field = parse_indicator_name(name)
+        if indicator_type in STREAMING_ENGINE_INDICATORS:
+            if state is not None:
+                return self._continue_streaming(restore_streaming_indicator(state), field)
+            if self._engine is None:
+                self._engine = IndicatorEngine(self.data)
+            return self._engine.get(name), self._get_streaming_state(indicator_type, period)
+        
+        if state is None:
+            first_date = pd.Timestamp(self.data['date'].iloc[0]).isoformat() if len(self.data) else None
+            if self._engine is None:
+                self._engine = IndicatorEngine(self.data)
+            return self._engine.get(name), {'first_date': first_date}
+        
+        first_date = state['first_date']
+        if self.history is None:
+            raise ValueError(f"Indicator '{name}' needs the bars since {first_date} to continue")
+        history_dates = pd.to_datetime(self.history['date'])
+        earlier = self.history[
+            (history_dates >= pd.Timestamp(first_date)) & (history_dates < pd.Timestamp(self.data['date'].iloc[0]))
+        ]
+        columns = ['high', 'low', 'close', 'volume']
+        bars = pd.concat([earlier[columns], self.data[columns]], ignore_index=True)
+        return IndicatorEngine(bars).get(name)[len(earlier):], {'first_date': first_date}
+    
+    def _get_streaming_state(self, indicator_type: str, period: int) -> Dict[str, Any]:
+        """Build the streaming indicator state after the last bar from the engine's arrays."""
+        indicator = STREAMING_ENGINE_INDICATORS[indicator_type](period)
+        if len(self.data) < period:
+            # Still warming up; replaying the few bars gives the partial state
+            for bar in self.data.to_dict('records'):
+                indicator.update(bar)
+            return indicator.to_dict()
+        
+        indicator.bars = len(self.data)
+        if indicator_type in ('sma', 'bollinger'):
+            indicator._set_state({'window': self.data['close'].values[-period:].tolist()})
+            if indicator_type == 'sma':
+                indicator.value = float(self._engine.get(f'sma_{period}')[-1])
+            else:
+                indicator.value = {
+                    band: float(self._engine.get(f'bollinger_{period}.{band}')[-1])
+                    for band in StreamingBollinger.fields
+                }
+        elif indicator_type == 'ema':
+            indicator.value = float(self._engine.get(f'ema_{period}')[-1])
+            indicator._set_state({'ema': indicator.value})
+        else:
+            indicator.value = float(self._engine.get(f'atr_{period}')[-1])
+            indicator._set_state({
+                'previous_close': float(self.data['close'].iloc[-1]),
+                'ranges': [],
+                'atr': indicator.value
+            })
+        return indicator.to_dict()
+    
+    def _continue_streaming(
+        self,
+        indicator: StreamingIndicator,
+        field: Optional[str]
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Advance a restored streaming indicator over data."""
+        field = field or ('percent_b' if indicator.fields else None)
+        values = []
+        for bar in self.data.to_dict('records'):
+            value = indicator.update(bar)
+            if value is not None and field == 'percent_b':
+                # Same definition as IndicatorEngine: a flat window puts the close in the middle
+                width = value['upper'] - value['lower']
+                value = (float(bar['close']) - value['lower']) / width if width > 0 else 0.5
+            elif value is not None and field is not None:
+                value = value[field]
+            values.append(np.nan if value is None else value)
+        return np.array(values, dtype=float), indicator.to_dict()
+    
+    def _get_resume_state(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get the state an indicator continues from (None when starting a new series)."""
+        if self.resume_states is None:
+            return None
+        if name not in self.resume_states:
+            raise ValueError(f"No saved state for indicator '{name}'")
+        return self.resume_states[name]
+    
+    def _parse_period(self, value: str) -> Optional[int]:
+        """Parse a positive integer period from an indicator name suffix."""
+        try:
+            period = int(float(value))
+        except ValueError:
+            return None
+        return period if period > 0 else None
@@ -0,0 +1,79 @@
+"""
+Cancellation and checkpoints of long-running backtest jobs.
+
+Parameter sweeps, successive halving searches and walk-forward analyses run
+in batches (chunks of combinations, rungs or windows). Between batches they
+check whether their job was cancelled and save the finished batch, so a run
+that is stopped or whose worker dies resumes from the last saved batch
+instead of starting over.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  ├─ src-python/modules/backtest/parameter_sweep.py
+  ├─ src-python/modules/backtest/successive_halving.py
+  ├─ src-python/modules/backtest/walk_forward.py
+  └─ src-python/modules/backtest/optimization_jobs.py
+
+Dependencies (External files that this file imports):
+  ├─ typing (standard library)
+  └─ src-python/modules/backtest/job_manager
+"""
+from typing import Dict, Any, Optional
+
+from modules.backtest.job_manager import BacktestJobManager
+
+
+class JobCancelled(Exception):
+    """Raised between batches when the running job has been cancelled."""
+
+
+class JobControl:
+    """Check for cancellation and save or load the finished batches of one job."""
+    
+    def __init__(self, job_id: str, job_manager: Optional[BacktestJobManager] = None):
+        """
+        Initialize job control.
+        
+        Args:
+            job_id: Job ID
+            job_manager: Job manager (optional)
+        """
+        self.job_id = job_id
+        self.job_manager = job_manager or BacktestJobManager()
+    
+    def check_cancelled(self):
+        """
+        Stop the run if its job has been cancelled.
+        
+        Raises:
+            JobCancelled: If the job's status is 'cancelled'
+        """
+        if self.job_manager.is_cancelled(self.job_id):
+            raise JobCancelled(f"Job {self.job_id} was cancelled")
+    
+    def load_checkpoints(self) -> Dict[int, Any]:
+        """
+        Load the batches finished by earlier runs of the job.
+        
+        Returns:
+            Dict of batch index to batch results
+        """
+        return self.job_manager.load_checkpoints(self.job_id)
+    
+    def save_checkpoint(self, batch_index: int, results: Any):
+        """
+        Save a finished batch.
+        
+        Args:
+            batch_index: Index of the batch
+            results: Batch results
+        """
+        self.job_manager.save_checkpoint(self.job_id, batch_index, results)
+    
+    def clear(self):
+        """Delete the saved batches once the job's results are saved."""
+        self.job_manager.clear_checkpoints(self.job_id)
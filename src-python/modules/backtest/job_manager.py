@@ -7,7 +7,17 @@ Related Documentation:
 DEPENDENCY MAP:
 
 Parents (Files that import this file):
-  └─ src-python/scripts/run_backtest.py
+  ├─ src-python/scripts/run_backtest.py
+  ├─ src-python/modules/backtest/backtest_worker.py
+  ├─ src-python/scripts/run_monte_carlo.py
+  ├─ src-python/scripts/continue_backtest.py
+  ├─ src-python/scripts/get_backtest_results.py
+  ├─ src-python/scripts/get_backtest_status.py
+  ├─ src-python/scripts/cancel_backtest_job.py
+  ├─ src-python/scripts/run_parameter_sweep.py
+  ├─ src-python/scripts/run_walk_forward.py
+  ├─ src-python/modules/backtest/job_control.py
+  └─ src-python/modules/backtest/optimization_jobs.py
 
 Dependencies (External files that this file imports):
   ├─ sqlite3 (standard library)
@@ -15,13 +25,18 @@ Dependencies (External files that this file imports):
   ├─ datetime (standard library)
   ├─ typing (standard library)
   ├─ logging (standard library)
+  ├─ zlib (standard library)
+  ├─ numpy
   └─ src-python/database.connection
 """
 import sqlite3
 import json
 import logging
+import zlib
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+
+import numpy as np
 
 from database.connection import get_connection
 
@@ -29,6 +44,64 @@ from database.connection import get_connection
 logger = logging.getLogger(__name__)
 
 
+def encode_equity_curve(dates: np.ndarray, equity: np.ndarray) -> Tuple[bytes, bytes]:
+    """
+    Encode an equity curve as two compressed blobs.
+    
+    Dates are stored as second deltas, which repeat for bars of one interval
+    and compress to a few bytes; equity values are stored as raw little-endian
+    float64.
+    
+    Args:
+        dates: Array of datetime64 dates
+        equity: Array of equity values
+    
+    Returns:
+        Tuple of (dates blob, equity blob)
+    """
+    seconds = dates.astype('datetime64[s]').astype(np.int64)
+    deltas = np.diff(seconds, prepend=0).astype('<i8')
+    return (
+        zlib.compress(deltas.tobytes()),
+        zlib.compress(np.asarray(equity, dtype='<f8').tobytes())
+    )
+
+
+def decode_equity_curve(dates_blob: bytes, equity_blob: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decode blobs written by encode_equity_curve.
+    
+    Args:
+        dates_blob: Compressed second deltas
+        equity_blob: Compressed equity values
+    
+    Returns:
+        Tuple of (datetime64[s] dates, float64 equity)
+    """
+    deltas = np.frombuffer(zlib.decompress(dates_blob), dtype='<i8')
+    equity = np.frombuffer(zlib.decompress(equity_blob), dtype='<f8').astype(np.float64)
+    return np.cumsum(deltas, dtype=np.int64).astype('datetime64[s]'), equity
+
+
+def format_equity_dates(dates: np.ndarray) -> List[str]:
+    """
+    Format equity curve dates as ISO strings, without the time for bars at midnight.
+    
+    Args:
+        dates: Array of datetime64 dates
+    
+    Returns:
+        List of 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS' strings
+    """
+    seconds = dates.astype('datetime64[s]')
+    days = seconds.astype('datetime64[D]')
+    return np.where(
+        seconds == days,
+        np.datetime_as_string(days),
+        np.datetime_as_string(seconds)
+    ).tolist()
+
+
 class BacktestJobManager:
     """Manages backtest jobs."""
     
@@ -46,7 +119,9 @@ class BacktestJobManager:
         algorithm_id: int,
         start_date: str,
         end_date: str,
-        data_set_id: Optional[int] = None
+        data_set_id: Optional[int] = None,
+        job_type: str = 'backtest',
+        data_set_ids: Optional[List[int]] = None
     ) -> str:
         """
         Create a new backtest job.
@@ -56,6 +131,8 @@ class BacktestJobManager:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             data_set_id: Data set ID (optional)
+            job_type: Job type ('backtest' | 'sweep' | 'walk_forward')
+            data_set_ids: Data set IDs of a portfolio backtest (optional)
             
         Returns:
             Job ID
@@ -70,15 +147,17 @@ class BacktestJobManager:
         cursor.execute("""
             INSERT INTO backtest_jobs (
                 job_id, algorithm_id, start_date, end_date, data_set_id,
-                status, progress, message, created_at
+                job_type, data_set_ids, status, progress, message, created_at
             )
-            VALUES (?, ?, ?, ?, ?, 'pending', 0.0, 'Job created', ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', 0.0, 'Job created', ?)
         """, (
             job_id,
             algorithm_id,
             start_date,
             end_date,
             data_set_id,
+            job_type,
+            json.dumps(data_set_ids) if data_set_ids is not None else None,
             datetime.now().isoformat()
         ))
         
@@ -105,6 +184,8 @@ class BacktestJobManager:
             message: Status message
             error: Error message (optional)
             completed: Whether job is completed
+        
+        A cancelled job keeps its status; updates from the run it stopped are ignored.
         """
         if not self.conn:
             self.conn = get_connection()
@@ -115,18 +196,246 @@ class BacktestJobManager:
             cursor.execute("""
                 UPDATE backtest_jobs
                 SET status = ?, progress = ?, message = ?, error = ?, completed_at = ?
-                WHERE job_id = ?
+                WHERE job_id = ? AND status != 'cancelled'
             """, (status, progress, message, error, datetime.now().isoformat(), job_id))
         else:
             cursor.execute("""
                 UPDATE backtest_jobs
                 SET status = ?, progress = ?, message = ?, error = ?
-                WHERE job_id = ?
+                WHERE job_id = ? AND status != 'cancelled'
             """, (status, progress, message, error, job_id))
         
         self.conn.commit()
         logger.debug(f"Updated backtest job {job_id}: {status} ({progress:.1%})")
     
+    def cancel_job(self, job_id: str) -> bool:
+        """
+        Cancel a pending or running job.
+        
+        A queued job is never claimed; a running sweep or walk-forward analysis
+        stops at its next batch, and a running backtest's results are not saved.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            True if the job was cancelled, False if it had already finished
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            UPDATE backtest_jobs
+            SET status = 'cancelled', message = 'Cancelled', completed_at = ?
+            WHERE job_id = ? AND status IN ('pending', 'running')
+        """, (datetime.now().isoformat(), job_id))
+        
+        self.conn.commit()
+        if cursor.rowcount:
+            logger.info(f"Cancelled backtest job {job_id}")
+        return cursor.rowcount > 0
+    
+    def is_cancelled(self, job_id: str) -> bool:
+        """
+        Check whether a job has been cancelled.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            True if the job's status is 'cancelled'
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT status FROM backtest_jobs WHERE job_id = ?", (job_id,))
+        row = cursor.fetchone()
+        return bool(row) and row[0] == 'cancelled'
+    
+    def save_checkpoint(self, job_id: str, batch_index: int, results: Any):
+        """
+        Save the results of a finished batch of a sweep or walk-forward job.
+        
+        Args:
+            job_id: Job ID
+            batch_index: Index of the batch
+            results: Batch results; dates are stored as YYYY-MM-DD and numpy
+                scalars as plain numbers
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO backtest_job_checkpoints (job_id, batch_index, results, created_at)
+            VALUES (?, ?, ?, ?)
+        """, (job_id, batch_index, json.dumps(results, default=self._checkpoint_value), datetime.now().isoformat()))
+        self.conn.commit()
+    
+    def _checkpoint_value(self, value: Any) -> Any:
+        """Convert a value json cannot encode (dates, numpy scalars) for a checkpoint."""
+        if isinstance(value, np.generic):
+            return value.item()
+        if hasattr(value, 'strftime'):
+            return self._format_date(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    
+    def load_checkpoints(self, job_id: str) -> Dict[int, Any]:
+        """
+        Load the saved batches of a job.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            Dict of batch index to batch results
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT batch_index, results
+            FROM backtest_job_checkpoints
+            WHERE job_id = ?
+        """, (job_id,))
+        return {row[0]: json.loads(row[1]) for row in cursor.fetchall()}
+    
+    def clear_checkpoints(self, job_id: str):
+        """
+        Delete the saved batches of a job once its results are saved.
+        
+        Args:
+            job_id: Job ID
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM backtest_job_checkpoints WHERE job_id = ?", (job_id,))
+        self.conn.commit()
+    
+    def enqueue_jobs(self, job_parameters: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Queue pending jobs for the backtest worker as one batch.
+        
+        Jobs of a batch are claimed together, so they share loaded data and
+        indicators.
+        
+        Args:
+            job_parameters: Dict of job ID to run settings (JSON-serializable)
+        
+        Returns:
+            Batch ID
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        import uuid
+        batch_id = str(uuid.uuid4())
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            UPDATE backtest_jobs
+            SET batch_id = ?, parameters = ?, message = 'Queued for backtest worker'
+            WHERE job_id = ?
+        """, [
+            (batch_id, json.dumps(parameters), job_id)
+            for job_id, parameters in job_parameters.items()
+        ])
+        
+        self.conn.commit()
+        logger.info(f"Queued {len(job_parameters)} backtest jobs as batch {batch_id}")
+        return batch_id
+    
+    def claim_pending_batch(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Claim the oldest queued batch and mark its jobs running.
+        
+        The claim runs in an immediate transaction, so concurrent callers
+        never claim the same job.
+        
+        Returns:
+            List of job dicts (job_id, algorithm_id, start_date, end_date,
+            data_set_id, data_set_ids, job_type, parameters) or None if nothing is queued
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        if self.conn.in_transaction:
+            self.conn.commit()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute("""
+                SELECT batch_id
+                FROM backtest_jobs
+                WHERE status = 'pending' AND batch_id IS NOT NULL
+                ORDER BY created_at ASC
+                LIMIT 1
+            """)
+            row = cursor.fetchone()
+            if not row:
+                self.conn.commit()
+                return None
+            
+            cursor.execute("""
+                SELECT job_id, algorithm_id, start_date, end_date, data_set_id, data_set_ids, job_type, parameters
+                FROM backtest_jobs
+                WHERE batch_id = ? AND status = 'pending'
+                ORDER BY created_at ASC
+            """, (row[0],))
+            jobs = [
+                {
+                    'job_id': job_row[0],
+                    'algorithm_id': job_row[1],
+                    'start_date': job_row[2],
+                    'end_date': job_row[3],
+                    'data_set_id': job_row[4],
+                    'data_set_ids': json.loads(job_row[5]) if job_row[5] else None,
+                    'job_type': job_row[6],
+                    'parameters': json.loads(job_row[7]) if job_row[7] else {}
+                }
+                for job_row in cursor.fetchall()
+            ]
+            cursor.executemany("""
+                UPDATE backtest_jobs
+                SET status = 'running', progress = 0.05, message = 'Starting backtest...'
+                WHERE job_id = ?
+            """, [(job['job_id'],) for job in jobs])
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        
+        return jobs
+    
+    def fail_unfinished_jobs(self, job_ids: List[str], error: str) -> int:
+        """
+        Mark the jobs that are still pending or running as failed.
+        
+        Args:
+            job_ids: Job IDs
+            error: Error message
+        
+        Returns:
+            Number of jobs marked failed
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        completed_at = datetime.now().isoformat()
+        cursor.executemany("""
+            UPDATE backtest_jobs
+            SET status = 'failed', progress = 0.0, message = ?, error = ?, completed_at = ?
+            WHERE job_id = ? AND status IN ('pending', 'running')
+        """, [(f'Backtest failed: {error}', error, completed_at, job_id) for job_id in job_ids])
+        
+        self.conn.commit()
+        return cursor.rowcount
+    
     def save_results(
         self,
         job_id: str,
@@ -135,11 +444,16 @@ class BacktestJobManager:
         end_date: str,
         performance: Dict[str, Any],
         trades: List[Dict[str, Any]],
-        equity_curve: List[Dict[str, Any]]
+        equity_curve: List[Dict[str, Any]],
+        state: Optional[Dict[str, Any]] = None,
+        compact_equity: bool = False
     ):
         """
         Save backtest results to database.
         
+        All rows are written in a single transaction, which is rolled back if
+        any insert fails.
+        
         Args:
             job_id: Job ID
             algorithm_id: Algorithm ID
@@ -148,20 +462,52 @@ class BacktestJobManager:
             performance: Performance metrics
             trades: List of trades
             equity_curve: Equity curve data
+            state: End-of-run state from BacktestEngine for continuation runs (optional)
+            compact_equity: Store the equity curve as one compressed blob in
+                backtest_equity_blobs instead of one row per bar
         """
         if not self.conn:
             self.conn = get_connection()
         
         cursor = self.conn.cursor()
         
-        # Save performance metrics to backtest_results
+        try:
+            self._insert_results(cursor, job_id, algorithm_id, start_date, end_date, performance)
+            self._insert_trades(cursor, job_id, trades)
+            if compact_equity:
+                self._save_equity_blob(cursor, job_id, *self._equity_arrays(equity_curve))
+            else:
+                self._insert_equity_rows(cursor, job_id, equity_curve)
+            if state is not None:
+                self._save_state(cursor, job_id, state)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        
+        logger.info(f"Saved backtest results for job {job_id}")
+    
+    def _insert_results(
+        self,
+        cursor: sqlite3.Cursor,
+        job_id: str,
+        algorithm_id: int,
+        start_date: str,
+        end_date: str,
+        performance: Dict[str, Any]
+    ):
+        """Insert the performance metrics of a backtest (without committing)."""
         cursor.execute("""
             INSERT INTO backtest_results (
                 job_id, algorithm_id, start_date, end_date,
                 total_return, sharpe_ratio, max_drawdown, win_rate,
-                total_trades, average_profit, average_loss, created_at
+                total_trades, average_profit, average_loss,
+                cagr, volatility, sortino_ratio, calmar_ratio,
+                exposure, var_95, cvar_95, longest_drawdown,
+                buy_and_hold_return, excess_return, alpha, beta,
+                benchmark_return, benchmark_excess_return, benchmark_alpha, benchmark_beta, created_at
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             job_id,
             algorithm_id,
@@ -174,41 +520,507 @@ class BacktestJobManager:
             performance.get('total_trades', 0),
             performance.get('average_profit', 0.0),
             performance.get('average_loss', 0.0),
+            *self._extended_metric_values(performance),
             datetime.now().isoformat()
         ))
+    
+    def _extended_metric_values(self, performance: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Get the risk and benchmark metrics of a performance dict in column order (None where missing)."""
+        return (
+            performance.get('cagr'),
+            performance.get('volatility'),
+            performance.get('sortino_ratio'),
+            performance.get('calmar_ratio'),
+            performance.get('exposure'),
+            performance.get('var_95'),
+            performance.get('cvar_95'),
+            performance.get('longest_drawdown'),
+            performance.get('buy_and_hold_return'),
+            performance.get('excess_return'),
+            performance.get('alpha'),
+            performance.get('beta'),
+            performance.get('benchmark_return'),
+            performance.get('benchmark_excess_return'),
+            performance.get('benchmark_alpha'),
+            performance.get('benchmark_beta')
+        )
+    
+    def append_results(
+        self,
+        job_id: str,
+        end_date: str,
+        performance: Dict[str, Any],
+        trades: List[Dict[str, Any]],
+        equity_curve: List[Dict[str, Any]],
+        state: Dict[str, Any],
+        replace_open_trade: bool = False
+    ):
+        """
+        Append the results of a continuation run to an existing backtest.
         
-        # Save trades
-        for trade in trades:
-            cursor.execute("""
-                INSERT INTO backtest_trades (
-                    job_id, entry_date, exit_date, entry_price, exit_price,
-                    quantity, profit, profit_rate
+        Args:
+            job_id: Job ID
+            end_date: New end date of the backtest
+            performance: Performance metrics recomputed over the whole backtest
+            trades: Trades of the continuation run
+            equity_curve: Equity curve of the new bars
+            state: End-of-run state after the new bars
+            replace_open_trade: Delete the last stored trade first; it was the position
+                still open at the previous end, closed there only for reporting
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        
+        try:
+            if replace_open_trade:
+                cursor.execute("""
+                    DELETE FROM backtest_trades
+                    WHERE id = (SELECT MAX(id) FROM backtest_trades WHERE job_id = ?)
+                """, (job_id,))
+            
+            self._insert_trades(cursor, job_id, trades)
+            
+            cursor.execute("SELECT dates, equity FROM backtest_equity_blobs WHERE job_id = ?", (job_id,))
+            blob = cursor.fetchone()
+            if blob:
+                stored_dates, stored_equity = decode_equity_curve(blob[0], blob[1])
+                new_dates, new_equity = self._equity_arrays(equity_curve)
+                self._save_equity_blob(
+                    cursor,
+                    job_id,
+                    np.concatenate([stored_dates, new_dates]),
+                    np.concatenate([stored_equity, new_equity])
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            else:
+                self._insert_equity_rows(cursor, job_id, equity_curve)
+            
+            cursor.execute("""
+                UPDATE backtest_results
+                SET end_date = ?, total_return = ?, sharpe_ratio = ?, max_drawdown = ?,
+                    win_rate = ?, total_trades = ?, average_profit = ?, average_loss = ?,
+                    cagr = ?, volatility = ?, sortino_ratio = ?, calmar_ratio = ?,
+                    exposure = ?, var_95 = ?, cvar_95 = ?, longest_drawdown = ?,
+                    buy_and_hold_return = ?, excess_return = ?, alpha = ?, beta = ?,
+                    benchmark_return = ?, benchmark_excess_return = ?, benchmark_alpha = ?, benchmark_beta = ?
+                WHERE job_id = ?
             """, (
+                end_date,
+                performance.get('total_return', 0.0),
+                performance.get('sharpe_ratio', 0.0),
+                performance.get('max_drawdown', 0.0),
+                performance.get('win_rate', 0.0),
+                performance.get('total_trades', 0),
+                performance.get('average_profit', 0.0),
+                performance.get('average_loss', 0.0),
+                *self._extended_metric_values(performance),
+                job_id
+            ))
+            cursor.execute("UPDATE backtest_jobs SET end_date = ? WHERE job_id = ?", (end_date, job_id))
+            self._save_state(cursor, job_id, state)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        
+        logger.info(f"Appended {len(equity_curve)} bars to backtest job {job_id}")
+    
+    def copy_results(self, source_job_id: str, job_id: str, algorithm_id: int):
+        """
+        Copy the stored results of a completed backtest to another job.
+        
+        Used for result cache hits, so every job keeps its own rows.
+        
+        Args:
+            source_job_id: Job ID whose results are copied
+            job_id: Job ID receiving the results
+            algorithm_id: Algorithm ID of the receiving job
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        
+        cursor.execute("""
+            INSERT INTO backtest_results (
+                job_id, algorithm_id, start_date, end_date,
+                total_return, sharpe_ratio, max_drawdown, win_rate,
+                total_trades, average_profit, average_loss,
+                cagr, volatility, sortino_ratio, calmar_ratio,
+                exposure, var_95, cvar_95, longest_drawdown,
+                buy_and_hold_return, excess_return, alpha, beta,
+                benchmark_return, benchmark_excess_return, benchmark_alpha, benchmark_beta, created_at
+            )
+            SELECT ?, ?, start_date, end_date,
+                   total_return, sharpe_ratio, max_drawdown, win_rate,
+                   total_trades, average_profit, average_loss,
+                   cagr, volatility, sortino_ratio, calmar_ratio,
+                   exposure, var_95, cvar_95, longest_drawdown,
+                   buy_and_hold_return, excess_return, alpha, beta,
+                   benchmark_return, benchmark_excess_return, benchmark_alpha, benchmark_beta, ?
+            FROM backtest_results
+            WHERE job_id = ?
+        """, (job_id, algorithm_id, datetime.now().isoformat(), source_job_id))
+        cursor.execute("""
+            INSERT INTO backtest_trades (
+                job_id, entry_date, exit_date, entry_price, exit_price,
+                quantity, profit, profit_rate, symbol
+            )
+            SELECT ?, entry_date, exit_date, entry_price, exit_price,
+                   quantity, profit, profit_rate, symbol
+            FROM backtest_trades
+            WHERE job_id = ?
+            ORDER BY id ASC
+        """, (job_id, source_job_id))
+        cursor.execute("""
+            INSERT INTO backtest_equity_curve (job_id, date, equity)
+            SELECT ?, date, equity
+            FROM backtest_equity_curve
+            WHERE job_id = ?
+            ORDER BY id ASC
+        """, (job_id, source_job_id))
+        cursor.execute("""
+            INSERT INTO backtest_equity_blobs (job_id, num_points, dates, equity)
+            SELECT ?, num_points, dates, equity
+            FROM backtest_equity_blobs
+            WHERE job_id = ?
+        """, (job_id, source_job_id))
+        cursor.execute("""
+            INSERT INTO backtest_states (job_id, last_date, state, updated_at)
+            SELECT ?, last_date, state, ?
+            FROM backtest_states
+            WHERE job_id = ?
+        """, (job_id, datetime.now().isoformat(), source_job_id))
+        
+        self.conn.commit()
+        logger.info(f"Copied backtest results of job {source_job_id} to job {job_id}")
+    
+    def get_state(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the saved end-of-run state of a backtest.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            State dict or None if the job has no saved state
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT state FROM backtest_states WHERE job_id = ?", (job_id,))
+        row = cursor.fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def save_metrics(self, job_id: str, profile: Dict[str, Any]):
+        """
+        Save the stage timings and peak memory of a backtest run.
+        
+        Args:
+            job_id: Job ID
+            profile: Figures from StageProfiler.to_dict
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO backtest_job_metrics (
+                job_id, stage_timings, total_seconds, stage_peak_memory,
+                peak_memory, profile_path, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            job_id,
+            json.dumps(profile['stages']),
+            profile['total_seconds'],
+            json.dumps(profile['stage_peak_memory']),
+            profile['peak_memory'],
+            profile['profile_path'],
+            datetime.now().isoformat()
+        ))
+        self.conn.commit()
+    
+    def get_metrics(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stage timings and peak memory of a backtest run.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            Dict in the StageProfiler.to_dict format, or None if none were saved
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT stage_timings, total_seconds, stage_peak_memory, peak_memory, profile_path
+            FROM backtest_job_metrics
+            WHERE job_id = ?
+        """, (job_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return {
+            'stages': json.loads(row[0]),
+            'total_seconds': row[1],
+            'stage_peak_memory': json.loads(row[2]) if row[2] else {},
+            'peak_memory': row[3],
+            'profile_path': row[4]
+        }
+    
+    def get_equity_curve(self, job_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the stored equity curve of a backtest, from either storage mode.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            Tuple of (datetime64[s] dates, float64 equity), both empty if nothing is stored
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT dates, equity FROM backtest_equity_blobs WHERE job_id = ?", (job_id,))
+        row = cursor.fetchone()
+        if row:
+            return decode_equity_curve(row[0], row[1])
+        
+        cursor.execute("""
+            SELECT date, equity
+            FROM backtest_equity_curve
+            WHERE job_id = ?
+            ORDER BY date ASC
+        """, (job_id,))
+        rows = cursor.fetchall()
+        dates = np.array([row[0] for row in rows], dtype='datetime64[s]')
+        equity = np.array([row[1] for row in rows], dtype=np.float64)
+        return dates, equity
+    
+    def _save_state(self, cursor: sqlite3.Cursor, job_id: str, state: Dict[str, Any]):
+        """Insert or replace the end-of-run state of a backtest (without committing)."""
+        cursor.execute("""
+            INSERT OR REPLACE INTO backtest_states (job_id, last_date, state, updated_at)
+            VALUES (?, ?, ?, ?)
+        """, (job_id, state['last_date'], json.dumps(state), datetime.now().isoformat()))
+    
+    def _insert_trades(self, cursor: sqlite3.Cursor, job_id: str, trades: List[Dict[str, Any]]):
+        """Insert the trades of a backtest in one batch (without committing)."""
+        cursor.executemany("""
+            INSERT INTO backtest_trades (
+                job_id, entry_date, exit_date, entry_price, exit_price,
+                quantity, profit, profit_rate, symbol
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
                 job_id,
-                trade['entry_date'],
-                trade['exit_date'],
+                self._format_date(trade['entry_date']),
+                self._format_date(trade['exit_date']),
                 trade['entry_price'],
                 trade['exit_price'],
                 trade['quantity'],
                 trade['profit'],
-                trade['profit_rate']
+                trade['profit_rate'],
+                trade.get('symbol')
+            )
+            for trade in trades
+        ])
+    
+    def _insert_equity_rows(self, cursor: sqlite3.Cursor, job_id: str, equity_curve: List[Dict[str, Any]]):
+        """Insert the equity points of a backtest in one batch (without committing)."""
+        cursor.executemany("""
+            INSERT INTO backtest_equity_curve (
+                job_id, date, equity
+            )
+            VALUES (?, ?, ?)
+        """, [
+            (job_id, self._format_date(point['date']), point['equity'])
+            for point in equity_curve
+        ])
+    
+    def _save_equity_blob(self, cursor: sqlite3.Cursor, job_id: str, dates: np.ndarray, equity: np.ndarray):
+        """Insert or replace the compact equity curve of a backtest (without committing)."""
+        dates_blob, equity_blob = encode_equity_curve(dates, equity)
+        cursor.execute("""
+            INSERT OR REPLACE INTO backtest_equity_blobs (job_id, num_points, dates, equity)
+            VALUES (?, ?, ?, ?)
+        """, (job_id, len(equity), sqlite3.Binary(dates_blob), sqlite3.Binary(equity_blob)))
+    
+    def _equity_arrays(self, equity_curve: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert equity curve points into (datetime64[s] dates, float64 equity) arrays."""
+        dates = np.array([point['date'] for point in equity_curve], dtype='datetime64[s]')
+        equity = np.array([point['equity'] for point in equity_curve], dtype=np.float64)
+        return dates, equity
+    
+    def _format_date(self, value: Any) -> str:
+        """Convert a date value (str, datetime or pandas Timestamp) to YYYY-MM-DD, with the time unless it is midnight."""
+        if hasattr(value, 'strftime'):
+            if (getattr(value, 'hour', 0), getattr(value, 'minute', 0), getattr(value, 'second', 0)) != (0, 0, 0):
+                return value.strftime('%Y-%m-%dT%H:%M:%S')
+            return value.strftime('%Y-%m-%d')
+        return str(value)
+    
+    def save_sweep_results(
+        self,
+        job_id: str,
+        ranked_results: List[Dict[str, Any]]
+    ):
+        """
+        Save ranked parameter sweep results to database.
+        
+        Args:
+            job_id: Job ID
+            ranked_results: Sweep results in rank order (each with 'parameters' and
+                'performance' or 'error', and 'rung' for successive halving searches)
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        created_at = datetime.now().isoformat()
+        
+        rows = []
+        for rank, result in enumerate(ranked_results, start=1):
+            performance = result.get('performance') or {}
+            rows.append((
+                job_id,
+                rank,
+                json.dumps(result['parameters']),
+                performance.get('total_return'),
+                performance.get('sharpe_ratio'),
+                performance.get('max_drawdown'),
+                performance.get('win_rate'),
+                performance.get('total_trades'),
+                performance.get('average_profit'),
+                performance.get('average_loss'),
+                result.get('error'),
+                result.get('rung'),
+                created_at
             ))
         
-        # Save equity curve
-        for point in equity_curve:
-            cursor.execute("""
-                INSERT INTO backtest_equity_curve (
-                    job_id, date, equity
-                )
-                VALUES (?, ?, ?)
-            """, (
+        cursor.executemany("""
+            INSERT INTO backtest_sweep_results (
+                job_id, rank, parameters,
+                total_return, sharpe_ratio, max_drawdown, win_rate,
+                total_trades, average_profit, average_loss, error, rung, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        
+        self.conn.commit()
+        logger.info(f"Saved {len(rows)} sweep results for job {job_id}")
+    
+    def save_walk_forward_windows(
+        self,
+        job_id: str,
+        window_results: List[Dict[str, Any]],
+        rank_by: str = 'sharpe_ratio'
+    ):
+        """
+        Save per-window walk-forward results to database.
+        
+        Args:
+            job_id: Job ID
+            window_results: Window results from WalkForwardAnalysis.run
+            rank_by: Metric the in-sample winners were picked by (stored as in_sample_score)
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        created_at = datetime.now().isoformat()
+        
+        rows = []
+        for result in window_results:
+            in_sample_performance = result.get('in_sample_performance') or {}
+            performance = (result.get('out_of_sample') or {}).get('performance') or {}
+            parameters = result.get('parameters')
+            rows.append((
                 job_id,
-                point['date'],
-                point['equity']
+                result['window_index'],
+                result['in_sample_start_date'],
+                result['in_sample_end_date'],
+                result['out_of_sample_start_date'],
+                result['out_of_sample_end_date'],
+                json.dumps(parameters) if parameters is not None else None,
+                in_sample_performance.get(rank_by),
+                performance.get('total_return'),
+                performance.get('sharpe_ratio'),
+                performance.get('max_drawdown'),
+                performance.get('win_rate'),
+                performance.get('total_trades'),
+                performance.get('average_profit'),
+                performance.get('average_loss'),
+                result.get('error'),
+                created_at
             ))
         
+        cursor.executemany("""
+            INSERT INTO backtest_walk_forward_windows (
+                job_id, window_index, in_sample_start, in_sample_end,
+                out_of_sample_start, out_of_sample_end, parameters, in_sample_score,
+                total_return, sharpe_ratio, max_drawdown, win_rate,
+                total_trades, average_profit, average_loss, error, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        
         self.conn.commit()
-        logger.info(f"Saved backtest results for job {job_id}")
-
+        logger.info(f"Saved {len(rows)} walk-forward windows for job {job_id}")
+    
+    def save_monte_carlo_results(
+        self,
+        job_id: str,
+        report: Dict[str, Any]
+    ):
+        """
+        Save a Monte Carlo report to database, replacing earlier reports of the same method.
+        
+        Args:
+            job_id: Job ID of the backtest that was resampled
+            report: Report from MonteCarloSimulator ('method', 'num_simulations',
+                'confidence_level' and per-metric 'metrics')
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        created_at = datetime.now().isoformat()
+        
+        cursor.execute("""
+            DELETE FROM backtest_monte_carlo_results
+            WHERE job_id = ? AND method = ?
+        """, (job_id, report['method']))
+        
+        rows = [
+            (
+                job_id,
+                report['method'],
+                report['num_simulations'],
+                report['confidence_level'],
+                metric,
+                values['mean'],
+                values['median'],
+                values['lower'],
+                values['upper'],
+                created_at
+            )
+            for metric, values in report['metrics'].items()
+        ]
+        cursor.executemany("""
+            INSERT INTO backtest_monte_carlo_results (
+                job_id, method, num_simulations, confidence_level,
+                metric, mean, median, lower, upper, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        
+        self.conn.commit()
+        logger.info(f"Saved Monte Carlo results ({report['method']}) for job {job_id}")
@@ -0,0 +1,181 @@
+"""
+Monte Carlo robustness module for backtest engine.
+
+Resamples the trade sequence (or daily returns) of a finished backtest with
+replacement and reports confidence intervals for total return, max drawdown
+and Sharpe ratio. All paths of a batch are simulated as one 2-D array.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  └─ src-python/scripts/run_monte_carlo.py
+
+Dependencies (External files that this file imports):
+  ├─ numpy
+  ├─ typing (standard library)
+  └─ src-python/modules/backtest/performance_calculator
+"""
+import numpy as np
+from typing import Dict, Any, List, Optional
+from modules.backtest.performance_calculator import TRADING_DAYS_PER_YEAR
+
+
+# Upper bound on resampled values held in memory at once (simulations x path length)
+MAX_BATCH_ELEMENTS = 2_000_000
+
+METRICS = ['total_return', 'max_drawdown', 'sharpe_ratio']
+
+
+class MonteCarloSimulator:
+    """Bootstrap backtest results to estimate the spread of performance metrics."""
+    
+    def __init__(
+        self,
+        initial_capital: float = 100000.0,
+        num_simulations: int = 10000,
+        confidence_level: float = 0.9,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize Monte Carlo simulator.
+        
+        Args:
+            initial_capital: Initial capital of the backtest
+            num_simulations: Number of resampled paths (default: 10000)
+            confidence_level: Width of the reported interval (default: 0.9 -> 5th to 95th percentile)
+            seed: Random seed (optional)
+        """
+        if num_simulations <= 0:
+            raise ValueError("num_simulations must be positive")
+        if not 0 < confidence_level < 1:
+            raise ValueError("confidence_level must be between 0 and 1")
+        
+        self.initial_capital = initial_capital
+        self.num_simulations = num_simulations
+        self.confidence_level = confidence_level
+        self.rng = np.random.default_rng(seed)
+    
+    def simulate_trades(self, trades: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Resample the trade sequence with replacement.
+        
+        Each path draws len(trades) trades and applies their profits in order;
+        Sharpe ratio is computed per trade like PerformanceCalculator's trade-based fallback.
+        
+        Args:
+            trades: List of trade dictionaries (with 'profit' and 'profit_rate')
+        
+        Returns:
+            Dict with 'method', 'num_simulations', 'confidence_level' and per-metric 'metrics'
+        """
+        profits = np.array([trade['profit'] for trade in trades], dtype=float)
+        profit_rates = np.array([trade['profit_rate'] for trade in trades], dtype=float) / 100.0
+        if len(profits) == 0:
+            raise ValueError("No trades to resample")
+        
+        metric_arrays = self._run_batches(len(profits), lambda indices: self._trade_metrics(
+            profits[indices],
+            profit_rates[indices]
+        ))
+        return self._summarize('trades', metric_arrays)
+    
+    def simulate_daily_returns(self, equity: np.ndarray) -> Dict[str, Any]:
+        """
+        Resample daily returns of an equity curve with replacement.
+        
+        Args:
+            equity: Daily equity array
+        
+        Returns:
+            Dict with 'method', 'num_simulations', 'confidence_level' and per-metric 'metrics'
+        """
+        equity = np.asarray(equity, dtype=float)
+        if len(equity) < 2:
+            raise ValueError("At least two equity points are required")
+        returns = np.diff(equity) / equity[:-1]
+        
+        log_returns = np.log1p(returns)
+        metric_arrays = self._run_batches(len(returns), lambda indices: self._return_metrics(
+            returns[indices],
+            log_returns[indices]
+        ))
+        return self._summarize('daily_returns', metric_arrays)
+    
+    def _run_batches(self, path_length: int, compute_metrics) -> Dict[str, np.ndarray]:
+        """Draw resampling indices in batches and collect the metrics of every path."""
+        batch_size = max(1, min(self.num_simulations, MAX_BATCH_ELEMENTS // path_length))
+        collected = {metric: [] for metric in METRICS}
+        remaining = self.num_simulations
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            indices = self.rng.integers(0, path_length, size=(size, path_length))
+            for metric, values in compute_metrics(indices).items():
+                collected[metric].append(values)
+            remaining -= size
+        return {metric: np.concatenate(values) for metric, values in collected.items()}
+    
+    def _trade_metrics(self, profits: np.ndarray, profit_rates: np.ndarray) -> Dict[str, np.ndarray]:
+        """Metrics for a (paths x trades) batch of resampled trades."""
+        equity = self.initial_capital + np.cumsum(profits, axis=1)
+        total_return = (equity[:, -1] - self.initial_capital) / self.initial_capital * 100
+        
+        # Drawdown relative to the running peak, counting initial capital as the first peak
+        peaks = np.maximum(np.maximum.accumulate(equity, axis=1), self.initial_capital)
+        max_drawdown = np.max((peaks - equity) / peaks, axis=1) * 100
+        
+        sharpe_ratio = self._sharpe(profit_rates, periods_per_year=1)
+        return {
+            'total_return': total_return,
+            'max_drawdown': max_drawdown,
+            'sharpe_ratio': sharpe_ratio
+        }
+    
+    def _return_metrics(self, returns: np.ndarray, log_returns: np.ndarray) -> Dict[str, np.ndarray]:
+        """Metrics for a (paths x days) batch of resampled daily returns."""
+        # Work on cumulative log growth; cumsum and subtraction are cheaper than cumprod and division
+        log_growth = np.cumsum(log_returns, axis=1)
+        total_return = np.expm1(log_growth[:, -1]) * 100
+        
+        peaks = np.maximum.accumulate(log_growth, axis=1)
+        np.maximum(peaks, 0.0, out=peaks)
+        peaks -= log_growth
+        max_drawdown = -np.expm1(-np.max(peaks, axis=1)) * 100
+        
+        sharpe_ratio = self._sharpe(returns, periods_per_year=TRADING_DAYS_PER_YEAR)
+        return {
+            'total_return': total_return,
+            'max_drawdown': max_drawdown,
+            'sharpe_ratio': sharpe_ratio
+        }
+    
+    def _sharpe(self, returns: np.ndarray, periods_per_year: int) -> np.ndarray:
+        """Row-wise Sharpe ratio (0.0 where returns have no variance)."""
+        if returns.shape[1] < 2:
+            return np.zeros(returns.shape[0])
+        mean_return = np.mean(returns, axis=1)
+        std_return = np.std(returns, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe_ratio = mean_return / std_return * np.sqrt(periods_per_year)
+        return np.where(std_return > 0, sharpe_ratio, 0.0)
+    
+    def _summarize(self, method: str, metric_arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Reduce simulated metric values to mean, median and confidence bounds."""
+        tail = (1 - self.confidence_level) / 2 * 100
+        metrics = {}
+        for metric, values in metric_arrays.items():
+            lower, median, upper = np.percentile(values, [tail, 50, 100 - tail])
+            metrics[metric] = {
+                'mean': round(float(np.mean(values)), 2),
+                'median': round(float(median), 2),
+                'lower': round(float(lower), 2),
+                'upper': round(float(upper), 2)
+            }
+        return {
+            'method': method,
+            'num_simulations': self.num_simulations,
+            'confidence_level': self.confidence_level,
+            'metrics': metrics
+        }
@@ -0,0 +1,283 @@
+"""
+Parameter sweep and walk-forward jobs.
+
+Runs one sweep or walk-forward job with its status written to backtest_jobs,
+either inline from run_parameter_sweep.py / run_walk_forward.py or queued for
+the backtest worker. Finished batches are checkpointed, so a job that the
+worker was running when it died resumes from its last batch once a new
+worker queues it again; a cancelled job stops at its next batch.
+
+A job dict has the fields returned by BacktestJobManager.claim_pending_batch;
+its 'parameters' hold the run settings of the job.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  ├─ src-python/modules/backtest/backtest_worker.py
+  ├─ src-python/scripts/run_parameter_sweep.py
+  └─ src-python/scripts/run_walk_forward.py
+
+Dependencies (External files that this file imports):
+  ├─ sqlite3 (standard library)
+  ├─ json (standard library)
+  ├─ logging (standard library)
+  ├─ typing (standard library)
+  ├─ src-python/database.connection
+  ├─ src-python/modules/backtest/data_loader
+  ├─ src-python/modules/backtest/job_control
+  ├─ src-python/modules/backtest/job_manager
+  ├─ src-python/modules/backtest/parameter_sweep
+  ├─ src-python/modules/backtest/successive_halving
+  └─ src-python/modules/backtest/walk_forward
+"""
+import sqlite3
+import json
+import logging
+from typing import Dict, Any, List, Optional
+
+from database.connection import get_connection
+from modules.backtest.data_loader import load_ohlcv
+from modules.backtest.job_control import JobCancelled, JobControl
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.parameter_sweep import ParameterSweep
+from modules.backtest.successive_halving import SuccessiveHalvingOptimizer
+from modules.backtest.walk_forward import WalkForwardAnalysis
+
+
+logger = logging.getLogger(__name__)
+
+# Job types run by run_optimization_job
+OPTIMIZATION_JOB_TYPES = ('sweep', 'walk_forward')
+
+
+def _load_algorithm(cursor: sqlite3.Cursor, algorithm_id: int) -> Dict[str, Any]:
+    """Load an algorithm definition."""
+    cursor.execute("SELECT definition FROM algorithms WHERE id = ?", (algorithm_id,))
+    algorithm_row = cursor.fetchone()
+    if not algorithm_row:
+        raise ValueError(f"Algorithm with id {algorithm_id} not found")
+    return json.loads(algorithm_row[0])
+
+
+def run_sweep_job(job: Dict[str, Any], conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
+    """
+    Run a parameter sweep job and save its ranked results.
+    
+    Settings (job['parameters']): parameter_grid, initial_capital, rank_by,
+    max_workers, search ('grid' or 'successive_halving'), num_candidates,
+    eta, min_bars and seed.
+    
+    Args:
+        job: Job dict
+        conn: Database connection (optional)
+    
+    Returns:
+        Ranked sweep results
+    
+    Raises:
+        JobCancelled: If the job was cancelled before it finished
+    """
+    conn = conn or get_connection()
+    job_manager = BacktestJobManager(conn=conn)
+    job_id = job['job_id']
+    control = JobControl(job_id, job_manager)
+    settings = job['parameters']
+    
+    try:
+        job_manager.update_job_status(job_id, 'running', 0.05, 'Loading data...')
+        
+        # Load the date range once for every combination
+        cursor = conn.cursor()
+        algorithm_definition = _load_algorithm(cursor, job['algorithm_id'])
+        data = load_ohlcv(cursor, job['data_set_id'], job['start_date'], job['end_date'], stored_indicators=True)
+        
+        def report_progress(completed: int, total: int):
+            job_manager.update_job_status(
+                job_id,
+                'running',
+                0.1 + 0.8 * completed / total,
+                f'Evaluated {completed}/{total} combinations'
+            )
+        
+        rank_by = settings.get('rank_by', 'sharpe_ratio')
+        if settings.get('search', 'grid') == 'successive_halving':
+            optimizer = SuccessiveHalvingOptimizer(
+                algorithm=algorithm_definition,
+                data=data,
+                start_date=job['start_date'],
+                end_date=job['end_date'],
+                initial_capital=settings.get('initial_capital', 100000.0),
+                max_workers=settings.get('max_workers'),
+                eta=int(settings.get('eta', 3)),
+                min_bars=int(settings.get('min_bars', 63))
+            )
+            ranked_results = optimizer.run(
+                settings['parameter_grid'],
+                num_candidates=settings.get('num_candidates'),
+                rank_by=rank_by,
+                seed=int(settings.get('seed', 0)),
+                progress_callback=report_progress,
+                control=control
+            )
+        else:
+            sweep = ParameterSweep(
+                algorithm=algorithm_definition,
+                data=data,
+                start_date=job['start_date'],
+                end_date=job['end_date'],
+                initial_capital=settings.get('initial_capital', 100000.0),
+                max_workers=settings.get('max_workers')
+            )
+            ranked_results = sweep.run(
+                settings['parameter_grid'],
+                rank_by=rank_by,
+                progress_callback=report_progress,
+                control=control
+            )
+        
+        control.check_cancelled()
+        job_manager.update_job_status(job_id, 'running', 0.9, 'Saving results...')
+        job_manager.save_sweep_results(job_id, ranked_results)
+        control.clear()
+        job_manager.update_job_status(
+            job_id,
+            'completed',
+            1.0,
+            'Parameter sweep completed successfully',
+            completed=True
+        )
+        return ranked_results
+    except JobCancelled:
+        control.clear()
+        logger.info(f"Parameter sweep {job_id} was cancelled")
+        raise
+    except Exception as e:
+        job_manager.update_job_status(
+            job_id,
+            'failed',
+            0.0,
+            f'Parameter sweep failed: {str(e)}',
+            error=str(e),
+            completed=True
+        )
+        raise
+
+
+def run_walk_forward_job(job: Dict[str, Any], conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
+    """
+    Run a walk-forward job and save its windows and stitched backtest.
+    
+    Settings (job['parameters']): parameter_grid, in_sample_size,
+    out_of_sample_size, anchored, initial_capital, rank_by and max_workers.
+    
+    Args:
+        job: Job dict
+        conn: Database connection (optional)
+    
+    Returns:
+        Results of WalkForwardAnalysis.run
+    
+    Raises:
+        JobCancelled: If the job was cancelled before it finished
+    """
+    conn = conn or get_connection()
+    job_manager = BacktestJobManager(conn=conn)
+    job_id = job['job_id']
+    control = JobControl(job_id, job_manager)
+    settings = job['parameters']
+    
+    try:
+        job_manager.update_job_status(job_id, 'running', 0.05, 'Loading data...')
+        
+        # Load the date range once for every window
+        cursor = conn.cursor()
+        algorithm_definition = _load_algorithm(cursor, job['algorithm_id'])
+        data = load_ohlcv(cursor, job['data_set_id'], job['start_date'], job['end_date'], stored_indicators=True)
+        
+        analysis = WalkForwardAnalysis(
+            algorithm=algorithm_definition,
+            data=data,
+            start_date=job['start_date'],
+            end_date=job['end_date'],
+            in_sample_size=int(settings['in_sample_size']),
+            out_of_sample_size=int(settings['out_of_sample_size']),
+            anchored=bool(settings.get('anchored', False)),
+            initial_capital=settings.get('initial_capital', 100000.0),
+            max_workers=settings.get('max_workers')
+        )
+        
+        def report_progress(completed: int, total: int):
+            job_manager.update_job_status(
+                job_id,
+                'running',
+                0.1 + 0.8 * completed / total,
+                f'Evaluated {completed}/{total} windows'
+            )
+        
+        rank_by = settings.get('rank_by', 'sharpe_ratio')
+        results = analysis.run(
+            settings['parameter_grid'],
+            rank_by=rank_by,
+            progress_callback=report_progress,
+            control=control
+        )
+        
+        control.check_cancelled()
+        job_manager.update_job_status(job_id, 'running', 0.9, 'Saving results...')
+        job_manager.save_walk_forward_windows(job_id, results['windows'], rank_by=rank_by)
+        job_manager.save_results(
+            job_id=job_id,
+            algorithm_id=job['algorithm_id'],
+            start_date=job['start_date'],
+            end_date=job['end_date'],
+            performance=results['performance'],
+            trades=results['trades'],
+            equity_curve=results['equity_curve']
+        )
+        control.clear()
+        job_manager.update_job_status(
+            job_id,
+            'completed',
+            1.0,
+            'Walk-forward analysis completed successfully',
+            completed=True
+        )
+        return results
+    except JobCancelled:
+        control.clear()
+        logger.info(f"Walk-forward analysis {job_id} was cancelled")
+        raise
+    except Exception as e:
+        job_manager.update_job_status(
+            job_id,
+            'failed',
+            0.0,
+            f'Walk-forward analysis failed: {str(e)}',
+            error=str(e),
+            completed=True
+        )
+        raise
+
+
+def run_optimization_job(job: Dict[str, Any], conn: Optional[sqlite3.Connection] = None):
+    """
+    Run a queued sweep or walk-forward job claimed by the backtest worker.
+    
+    Failures are recorded on the job; a cancelled job is left cancelled.
+    
+    Args:
+        job: Claimed job dict
+        conn: Database connection (optional)
+    """
+    try:
+        if job['job_type'] == 'walk_forward':
+            run_walk_forward_job(job, conn)
+        else:
+            run_sweep_job(job, conn)
+    except JobCancelled:
+        pass
+    except Exception:
+        logger.exception(f"{job['job_type']} job {job['job_id']} failed")
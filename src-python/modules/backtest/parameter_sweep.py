@@ -0,0 +1,369 @@
+"""
+Parameter sweep module for backtest engine.
+
+Workers only run the backtests; the parent scores each batch of
+combinations with one 2-D PerformanceCalculator.calculate_performances call.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  ├─ src-python/modules/backtest/optimization_jobs.py
+  ├─ src-python/modules/backtest/walk_forward.py
+  └─ src-python/modules/backtest/successive_halving.py
+
+Dependencies (External files that this file imports):
+  ├─ pandas
+  ├─ numpy
+  ├─ os (standard library)
+  ├─ copy (standard library)
+  ├─ math (standard library)
+  ├─ itertools (standard library)
+  ├─ concurrent.futures (standard library)
+  ├─ typing (standard library)
+  ├─ src-python/modules/backtest/backtest_engine
+  ├─ src-python/modules/backtest/batch_backtest
+  ├─ src-python/modules/backtest/indicator_cache
+  ├─ src-python/modules/backtest/job_control
+  └─ src-python/modules/backtest/performance_calculator
+"""
+import os
+import copy
+import math
+import itertools
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.batch_backtest import prepare_shared_inputs
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.backtest.job_control import JobControl
+from modules.backtest.performance_calculator import PerformanceCalculator
+
+
+# Metrics where a smaller value ranks higher
+LOWER_IS_BETTER = {'max_drawdown'}
+
+# A controlled sweep is split into about this many batches; cancellation is
+# checked and a checkpoint saved after each one
+SWEEP_BATCHES = 20
+
+# Per-process state set once by the pool initializer, so OHLCV data and
+# indicator arrays are transferred to each worker only once
+_worker_state: Dict[str, Any] = {}
+
+
+def apply_parameters(algorithm: Dict[str, Any], parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of an algorithm definition with parameter values substituted.
+    
+    Args:
+        algorithm: Algorithm definition
+        parameters: Dict of dotted paths to values
+            (e.g., {'triggers.0.condition.value': 30, 'actions.0.parameters.percentage': 50})
+    
+    Returns:
+        New algorithm definition
+    """
+    updated = copy.deepcopy(algorithm)
+    for path, value in parameters.items():
+        keys = path.split('.')
+        target = updated
+        for key in keys[:-1]:
+            target = target[int(key)] if isinstance(target, list) else target.setdefault(key, {})
+        last_key = keys[-1]
+        if isinstance(target, list):
+            target[int(last_key)] = value
+        else:
+            target[last_key] = value
+    return updated
+
+
+def expand_grid(parameter_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Expand a parameter grid into its combinations.
+    
+    Args:
+        parameter_grid: Dict of dotted paths to candidate values
+    
+    Returns:
+        List of parameter dicts (cartesian product of the grid)
+    """
+    if not parameter_grid:
+        return [{}]
+    
+    paths = list(parameter_grid.keys())
+    return [
+        dict(zip(paths, values))
+        for values in itertools.product(*(parameter_grid[path] for path in paths))
+    ]
+
+
+def rank_results(results: List[Dict[str, Any]], rank_by: str = 'sharpe_ratio') -> List[Dict[str, Any]]:
+    """
+    Order results best first by a performance metric; failed combinations go last.
+    
+    Args:
+        results: Sweep results
+        rank_by: Performance metric to rank by
+    
+    Returns:
+        Sorted list of results
+    """
+    descending = rank_by not in LOWER_IS_BETTER
+    
+    def sort_key(result: Dict[str, Any]) -> Tuple[int, float]:
+        value = (result.get('performance') or {}).get(rank_by)
+        if value is None:
+            return (1, 0.0)
+        return (0, -value if descending else value)
+    
+    return sorted(results, key=sort_key)
+
+
+def _init_worker(
+    algorithm: Dict[str, Any],
+    data: pd.DataFrame,
+    indicator_cache: IndicatorCache,
+    start_date: str,
+    end_date: str,
+    initial_capital: float
+):
+    """Store the shared sweep inputs in the worker process."""
+    _worker_state['algorithm'] = algorithm
+    _worker_state['data'] = data
+    _worker_state['indicator_cache'] = indicator_cache
+    _worker_state['start_date'] = start_date
+    _worker_state['end_date'] = end_date
+    _worker_state['initial_capital'] = initial_capital
+
+
+def unscored_result(parameters: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep what score_results needs from the results of a BacktestEngine run with score=False."""
+    return {
+        'parameters': parameters,
+        'trades': [{'profit': trade['profit'], 'profit_rate': trade['profit_rate']} for trade in results['trades']],
+        'equity': results['equity'],
+        'positions': results['positions'],
+        'closes': results['closes']
+    }
+
+
+def score_results(results: List[Dict[str, Any]], initial_capital: float) -> List[Dict[str, Any]]:
+    """
+    Score the runs of one batch over the same bars with a single 2-D metrics call.
+    
+    Args:
+        results: Results from unscored_result, or with 'parameters' and 'error'
+        initial_capital: Initial capital of the backtests
+    
+    Returns:
+        Results in the same order, each with 'parameters' and 'performance' (or 'error')
+    """
+    runs = [result for result in results if 'error' not in result]
+    if not runs:
+        return results
+    performances = iter(PerformanceCalculator(initial_capital).calculate_performances(
+        [run['trades'] for run in runs],
+        np.vstack([run['equity'] for run in runs]),
+        np.vstack([run['positions'] for run in runs]),
+        buy_and_hold=runs[0]['closes']
+    ))
+    return [
+        result if 'error' in result else {'parameters': result['parameters'], 'performance': next(performances)}
+        for result in results
+    ]
+
+
+def _run_combination(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one backtest for a parameter combination using the worker state, leaving it unscored."""
+    try:
+        engine = BacktestEngine(
+            algorithm=apply_parameters(_worker_state['algorithm'], parameters),
+            data=_worker_state['data'],
+            start_date=_worker_state['start_date'],
+            end_date=_worker_state['end_date'],
+            initial_capital=_worker_state['initial_capital'],
+            indicator_cache=_worker_state['indicator_cache'],
+            score=False
+        )
+        return unscored_result(parameters, engine.run())
+    except Exception as e:
+        return {'parameters': parameters, 'error': str(e)}
+
+
+class ParameterSweep:
+    """Run a backtest for every combination in a parameter grid."""
+    
+    def __init__(
+        self,
+        algorithm: Dict[str, Any],
+        data: pd.DataFrame,
+        start_date: str,
+        end_date: str,
+        initial_capital: float = 100000.0,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initialize parameter sweep.
+        
+        Args:
+            algorithm: Base algorithm definition
+            data: DataFrame with OHLCV data
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            initial_capital: Initial capital for backtesting
+            max_workers: Number of worker processes (default: CPU count, 1 runs in-process)
+        """
+        self.algorithm = algorithm
+        self.data = data
+        self.start_date = start_date
+        self.end_date = end_date
+        self.initial_capital = initial_capital
+        self.max_workers = max_workers
+    
+    def expand_grid(self, parameter_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """
+        Expand a parameter grid into its combinations.
+        
+        Args:
+            parameter_grid: Dict of dotted paths to candidate values
+        
+        Returns:
+            List of parameter dicts (cartesian product of the grid)
+        """
+        return expand_grid(parameter_grid)
+    
+    def run(
+        self,
+        parameter_grid: Dict[str, List[Any]],
+        rank_by: str = 'sharpe_ratio',
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        control: Optional[JobControl] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the sweep and rank the results.
+        
+        Args:
+            parameter_grid: Dict of dotted paths to candidate values
+            rank_by: Performance metric to rank by (default: 'sharpe_ratio')
+            progress_callback: Called with (completed, total) as results arrive (optional)
+            control: Cancellation and checkpoints of the sweep's job (optional)
+        
+        Returns:
+            List of results ordered best first, each with 'parameters' and
+            'performance' (or 'error' if the combination failed)
+        """
+        combinations = self.expand_grid(parameter_grid)
+        return self.run_combinations(combinations, rank_by, progress_callback, control)
+    
+    def run_combinations(
+        self,
+        combinations: List[Dict[str, Any]],
+        rank_by: str = 'sharpe_ratio',
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        control: Optional[JobControl] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a backtest for each parameter combination and rank the results.
+        
+        The combinations of each batch are scored together once they have run.
+        With control, the combinations run in SWEEP_BATCHES batches. Batches
+        saved by an earlier run of the job are skipped; after each batch the
+        results are saved and the job is checked for cancellation.
+        
+        Args:
+            combinations: List of parameter dicts
+            rank_by: Performance metric to rank by (default: 'sharpe_ratio')
+            progress_callback: Called with (completed, total) as results arrive (optional)
+            control: Cancellation and checkpoints of the sweep's job (optional)
+        
+        Returns:
+            List of results ordered best first
+        
+        Raises:
+            JobCancelled: If the job was cancelled before the last batch
+        """
+        # Filter once and precompute every indicator any combination needs
+        filtered_data, indicator_cache = prepare_shared_inputs(
+            [apply_parameters(self.algorithm, parameters) for parameters in combinations],
+            self.data,
+            self.start_date,
+            self.end_date
+        )
+        initargs = (
+            self.algorithm,
+            filtered_data,
+            indicator_cache,
+            self.start_date,
+            self.end_date,
+            self.initial_capital
+        )
+        
+        total = len(combinations)
+        batch_size = max(1, math.ceil(total / SWEEP_BATCHES)) if control else max(1, total)
+        checkpoints = control.load_checkpoints() if control else {}
+        in_process = self.max_workers == 1 or total <= 1
+        if in_process:
+            _init_worker(*initargs)
+        
+        results = []
+        executor = None
+        try:
+            for batch_index, batch_start in enumerate(range(0, total, batch_size)):
+                if batch_index in checkpoints:
+                    results.extend(checkpoints[batch_index])
+                    if progress_callback:
+                        progress_callback(len(results), total)
+                    continue
+                if control:
+                    control.check_cancelled()
+                
+                batch = combinations[batch_start:batch_start + batch_size]
+                batch_results = []
+                if in_process:
+                    for parameters in batch:
+                        batch_results.append(_run_combination(parameters))
+                        if progress_callback:
+                            progress_callback(len(results) + len(batch_results), total)
+                else:
+                    if executor is None:
+                        executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            initializer=_init_worker,
+                            initargs=initargs
+                        )
+                    worker_count = self.max_workers or os.cpu_count() or 1
+                    chunksize = max(1, len(batch) // (worker_count * 4))
+                    for result in executor.map(_run_combination, batch, chunksize=chunksize):
+                        batch_results.append(result)
+                        if progress_callback and (
+                            len(batch_results) % chunksize == 0 or len(batch_results) == len(batch)
+                        ):
+                            progress_callback(len(results) + len(batch_results), total)
+                
+                batch_results = score_results(batch_results, self.initial_capital)
+                results.extend(batch_results)
+                if control:
+                    control.save_checkpoint(batch_index, batch_results)
+        finally:
+            if executor:
+                executor.shutdown()
+        
+        return self.rank_results(results, rank_by)
+    
+    def rank_results(self, results: List[Dict[str, Any]], rank_by: str = 'sharpe_ratio') -> List[Dict[str, Any]]:
+        """
+        Order results best first by a performance metric; failed combinations go last.
+        
+        Args:
+            results: Sweep results
+            rank_by: Performance metric to rank by
+        
+        Returns:
+            Sorted list of results
+        """
+        return rank_results(results, rank_by)
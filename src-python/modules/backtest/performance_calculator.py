@@ -1,21 +1,218 @@
 """
 Performance calculator module for backtest engine.
 
+Risk metrics of daily equity are computed row-wise, so many equity curves
+(e.g. every combination of a sweep) can be scored at once as a 2-D array.
+
 Related Documentation:
   └─ Plan: docs/03_plans/backtest/README.md
 
 DEPENDENCY MAP:
 
 Parents (Files that import this file):
-  └─ src-python/modules/backtest/backtest_engine.py
+  ├─ src-python/modules/backtest/backtest_engine.py
+  ├─ src-python/modules/backtest/portfolio_engine.py
+  ├─ src-python/modules/backtest/parameter_sweep.py
+  ├─ src-python/modules/backtest/walk_forward.py
+  ├─ src-python/scripts/continue_backtest.py
+  └─ src-python/scripts/get_backtest_results.py
 
 Dependencies (External files that this file imports):
   ├─ typing (standard library)
-  └─ numpy
+  ├─ numpy
+  └─ src-python/utils/rolling.py
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 import numpy as np
 
+from utils.rolling import rolling_mean, rolling_std
+
+
+# Trading days per year used to annualize daily Sharpe ratios
+TRADING_DAYS_PER_YEAR = 252
+
+# Confidence level of the daily value at risk and conditional value at risk
+VAR_CONFIDENCE = 0.95
+
+# Windows (in trading days) of the rolling Sharpe ratios: about a quarter and a year
+ROLLING_SHARPE_WINDOWS = (63, 252)
+
+# Equity metrics added to the performance of a backtest, with their rounding
+RISK_METRICS = {
+    'cagr': 2,
+    'volatility': 2,
+    'sortino_ratio': 2,
+    'calmar_ratio': 2,
+    'exposure': 2,
+    'var_95': 2,
+    'cvar_95': 2,
+    'longest_drawdown': 0
+}
+
+
+def calculate_risk_metrics(
+    equity: np.ndarray,
+    positions: Optional[np.ndarray] = None,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = TRADING_DAYS_PER_YEAR,
+    confidence: float = VAR_CONFIDENCE
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate risk metrics of daily equity curves in one vectorized pass.
+    
+    Args:
+        equity: Equity curves as a (curves x bars) array, or one curve as a 1-D array
+        positions: Open positions at the end of each bar, same shape as equity
+            (optional, 'exposure' is only reported when given)
+        risk_free_rate: Annual risk-free rate subtracted from daily returns
+        periods_per_year: Bars per year used to annualize
+        confidence: Confidence level of the value at risk
+    
+    Returns:
+        Dict of metric name to an array with one value per curve:
+        'total_return', 'cagr', 'volatility', 'max_drawdown', 'var_95' and
+        'cvar_95' in percent (the value at risk metrics as positive daily
+        losses), 'sharpe_ratio', 'sortino_ratio', 'calmar_ratio',
+        'longest_drawdown' in bars and 'exposure' as the percentage of bars
+        with an open position
+    """
+    equity = np.atleast_2d(np.asarray(equity, dtype=float))
+    num_curves, length = equity.shape
+    zeros = np.zeros(num_curves)
+    metrics = {metric: zeros.copy() for metric in (
+        'total_return', 'cagr', 'volatility', 'sharpe_ratio', 'sortino_ratio',
+        'max_drawdown', 'calmar_ratio', 'longest_drawdown', 'var_95', 'cvar_95'
+    )}
+    if positions is not None:
+        metrics['exposure'] = np.mean(np.atleast_2d(positions) != 0, axis=1) * 100 if length else zeros.copy()
+    if length < 2:
+        return metrics
+    
+    initial = equity[:, 0]
+    final = equity[:, -1]
+    returns = np.diff(equity, axis=1) / equity[:, :-1]
+    num_returns = returns.shape[1]
+    
+    metrics['total_return'] = (final / initial - 1) * 100
+    growth = np.maximum(final / initial, 0.0)
+    metrics['cagr'] = (growth ** (periods_per_year / num_returns) - 1) * 100
+    
+    annualize = np.sqrt(periods_per_year)
+    if num_returns >= 2:
+        excess_returns = returns - risk_free_rate / periods_per_year
+        mean_excess = np.mean(excess_returns, axis=1)
+        std_excess = np.std(excess_returns, axis=1)
+        downside = np.sqrt(np.mean(np.minimum(excess_returns, 0.0) ** 2, axis=1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            metrics['sharpe_ratio'] = np.where(std_excess > 0, mean_excess / std_excess * annualize, 0.0)
+            metrics['sortino_ratio'] = np.where(downside > 0, mean_excess / downside * annualize, 0.0)
+        metrics['volatility'] = np.std(returns, axis=1) * annualize * 100
+    
+    # Drawdown from the running peak; a drawdown lasts from its peak bar until a new peak
+    peaks = np.maximum.accumulate(equity, axis=1)
+    drawdowns = (peaks - equity) / peaks
+    metrics['max_drawdown'] = np.max(drawdowns, axis=1) * 100
+    bar_index = np.arange(length)
+    last_peak = np.maximum.accumulate(np.where(drawdowns > 0, 0, bar_index), axis=1)
+    metrics['longest_drawdown'] = np.max(bar_index - last_peak, axis=1).astype(float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        metrics['calmar_ratio'] = np.where(
+            metrics['max_drawdown'] > 0,
+            metrics['cagr'] / metrics['max_drawdown'],
+            0.0
+        )
+    
+    # Value at risk is the loss quantile; conditional value at risk averages the returns beyond it
+    var_returns = np.quantile(returns, 1 - confidence, axis=1)
+    tail = returns <= var_returns[:, np.newaxis]
+    metrics['var_95'] = -var_returns * 100
+    metrics['cvar_95'] = -np.sum(np.where(tail, returns, 0.0), axis=1) / np.sum(tail, axis=1) * 100
+    return metrics
+
+
+def calculate_benchmark_metrics(
+    equity: np.ndarray,
+    benchmark: np.ndarray,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = TRADING_DAYS_PER_YEAR
+) -> Dict[str, np.ndarray]:
+    """
+    Compare equity curves with buying and holding a benchmark over the same bars.
+    
+    Args:
+        equity: Equity curves as a (curves x bars) array, or one curve as a 1-D array
+        benchmark: Benchmark closes aligned with the bars of equity
+        risk_free_rate: Annual risk-free rate subtracted from daily returns
+        periods_per_year: Bars per year used to annualize
+    
+    Returns:
+        Dict of metric name to an array with one value per curve:
+        'benchmark_return' (buy and hold total return in percent),
+        'excess_return' (total return minus benchmark_return, in percentage
+        points), 'beta' of daily returns against the benchmark and 'alpha'
+        (annualized Jensen's alpha in percent)
+    """
+    equity = np.atleast_2d(np.asarray(equity, dtype=float))
+    benchmark = np.asarray(benchmark, dtype=float)
+    num_curves, length = equity.shape
+    metrics = {metric: np.zeros(num_curves) for metric in ('benchmark_return', 'excess_return', 'alpha', 'beta')}
+    if length < 2:
+        return metrics
+    
+    metrics['benchmark_return'] = np.full(num_curves, (benchmark[-1] / benchmark[0] - 1) * 100)
+    metrics['excess_return'] = (equity[:, -1] / equity[:, 0] - 1) * 100 - metrics['benchmark_return']
+    
+    daily_risk_free = risk_free_rate / periods_per_year
+    returns = np.diff(equity, axis=1) / equity[:, :-1] - daily_risk_free
+    benchmark_returns = np.diff(benchmark) / benchmark[:-1] - daily_risk_free
+    centered_benchmark = benchmark_returns - np.mean(benchmark_returns)
+    benchmark_variance = np.mean(centered_benchmark ** 2)
+    if benchmark_variance > 0:
+        # Covariance of every curve with the benchmark as one matrix-vector product
+        covariance = (returns - np.mean(returns, axis=1, keepdims=True)) @ centered_benchmark / len(centered_benchmark)
+        metrics['beta'] = covariance / benchmark_variance
+    metrics['alpha'] = (
+        np.mean(returns, axis=1) - metrics['beta'] * np.mean(benchmark_returns)
+    ) * periods_per_year * 100
+    return metrics
+
+
+def calculate_rolling_sharpe(
+    equity: np.ndarray,
+    window: int,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = TRADING_DAYS_PER_YEAR
+) -> np.ndarray:
+    """
+    Calculate the annualized Sharpe ratio of the daily returns in a trailing window.
+    
+    Args:
+        equity: Equity curves as a (curves x bars) array, or one curve as a 1-D array
+        window: Number of daily returns in each window
+        risk_free_rate: Annual risk-free rate subtracted from daily returns
+        periods_per_year: Bars per year used to annualize
+    
+    Returns:
+        Array shaped like equity with the Sharpe ratio of the window ending at
+        each bar; NaN until the window is full, 0.0 where returns have no variance
+    """
+    equity = np.asarray(equity, dtype=float)
+    curves = np.atleast_2d(equity)
+    rolling = np.full(curves.shape, np.nan)
+    if curves.shape[1] > window >= 2:
+        excess_returns = np.diff(curves, axis=1) / curves[:, :-1] - risk_free_rate / periods_per_year
+        # O(bars) per curve; a view of every window would take curves x bars x window values
+        for row, returns in enumerate(excess_returns):
+            mean_excess = rolling_mean(returns, window)
+            std_excess = rolling_std(returns, window)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rolling[row, window:] = np.where(
+                    std_excess > 0,
+                    mean_excess / std_excess * np.sqrt(periods_per_year),
+                    0.0
+                )
+    return rolling if equity.ndim > 1 else rolling[0]
+
 
 class PerformanceCalculator:
     """Calculate performance metrics from trades."""
@@ -31,114 +228,209 @@ class PerformanceCalculator:
         self.initial_capital = initial_capital
         self.risk_free_rate = risk_free_rate
     
-    def calculate_performance(self, trades: List[Dict[str, Any]]) -> Dict[str, float]:
+    def calculate_performance(
+        self,
+        trades: List[Dict[str, Any]],
+        equity: Optional[np.ndarray] = None,
+        positions: Optional[np.ndarray] = None,
+        buy_and_hold: Optional[np.ndarray] = None,
+        benchmark: Optional[np.ndarray] = None
+    ) -> Dict[str, float]:
         """
         Calculate performance metrics from trades.
         
+        When the daily mark-to-market equity is given, Sharpe ratio and max
+        drawdown are computed from daily returns, along with the RISK_METRICS;
+        otherwise they fall back to per-trade profits.
+        
         Args:
             trades: List of trade dictionaries
+            equity: Daily equity array from calculate_equity (optional)
+            positions: Open positions per bar from calculate_open_positions
+                (optional, used for 'exposure')
+            buy_and_hold: Closes of the traded data per bar (optional); adds
+                'buy_and_hold_return', 'excess_return', 'alpha' and 'beta'
+            benchmark: Closes of an index per bar (optional); adds
+                'benchmark_return', 'benchmark_excess_return', 'benchmark_alpha'
+                and 'benchmark_beta'
         
         Returns:
             Dict with performance metrics
         """
+        if equity is not None and len(equity) > 1:
+            return self.calculate_performances(
+                [trades],
+                np.asarray(equity, dtype=float)[np.newaxis],
+                np.asarray(positions)[np.newaxis] if positions is not None else None,
+                buy_and_hold,
+                benchmark
+            )[0]
+        
+        performance = self._calculate_trade_statistics(trades)
         if not trades:
-            return {
-                'total_return': 0.0,
-                'sharpe_ratio': 0.0,
-                'max_drawdown': 0.0,
-                'win_rate': 0.0,
-                'total_trades': 0,
-                'average_profit': 0.0,
-                'average_loss': 0.0
-            }
-        
-        # Calculate total return
-        total_profit = sum(trade['profit'] for trade in trades)
-        total_return = (total_profit / self.initial_capital) * 100
-        
-        # Calculate win rate
-        winning_trades = [t for t in trades if t['profit'] > 0]
-        losing_trades = [t for t in trades if t['profit'] < 0]
-        win_rate = (len(winning_trades) / len(trades)) * 100 if trades else 0.0
-        
-        # Calculate average profit and loss
-        average_profit = np.mean([t['profit'] for t in winning_trades]) if winning_trades else 0.0
-        average_loss = np.mean([t['profit'] for t in losing_trades]) if losing_trades else 0.0
+            return performance
         
         # Calculate Sharpe ratio (simplified)
-        returns = [t['profit_rate'] / 100.0 for t in trades]
+        returns = np.fromiter((trade['profit_rate'] for trade in trades), dtype=float, count=len(trades)) / 100.0
         if len(returns) > 1:
-            mean_return = np.mean(returns)
             std_return = np.std(returns)
-            sharpe_ratio = (mean_return - self.risk_free_rate) / std_return if std_return > 0 else 0.0
-        else:
-            sharpe_ratio = 0.0
+            if std_return > 0:
+                performance['sharpe_ratio'] = round(float((np.mean(returns) - self.risk_free_rate) / std_return), 2)
+        
+        # Calculate max drawdown (simplified - based on trade profits, with no profit as the first peak)
+        cumulative_profit = np.cumsum([trade['profit'] for trade in trades])
+        peaks = np.maximum(np.maximum.accumulate(cumulative_profit), 0.0)
+        max_drawdown = float(np.max(peaks - cumulative_profit))
+        if self.initial_capital > 0:
+            performance['max_drawdown'] = round(max_drawdown / self.initial_capital * 100, 2)
+        return performance
+    
+    def calculate_performances(
+        self,
+        trade_lists: List[List[Dict[str, Any]]],
+        equity: np.ndarray,
+        positions: Optional[np.ndarray] = None,
+        buy_and_hold: Optional[np.ndarray] = None,
+        benchmark: Optional[np.ndarray] = None
+    ) -> List[Dict[str, float]]:
+        """
+        Calculate performance metrics of many backtests over the same bars.
+        
+        The equity metrics of every backtest come from one calculate_risk_metrics
+        (and calculate_benchmark_metrics) call on the (curves x bars) array.
         
-        # Calculate max drawdown (simplified - based on trade profits)
-        cumulative_profit = 0.0
-        peak = 0.0
-        max_drawdown = 0.0
+        Args:
+            trade_lists: Trades of each backtest (dicts with at least 'profit')
+            equity: Daily equity as a (curves x bars) array, one row per backtest
+            positions: Open positions per bar, shaped like equity (optional, used for 'exposure')
+            buy_and_hold: Closes of the traded data per bar (optional), as for calculate_performance
+            benchmark: Closes of an index per bar (optional), as for calculate_performance
+        
+        Returns:
+            List of performance dicts, one per backtest, as from calculate_performance
+        """
+        if equity.shape[1] < 2:
+            return [self.calculate_performance(trades) for trades in trade_lists]
         
-        for trade in trades:
-            cumulative_profit += trade['profit']
-            if cumulative_profit > peak:
-                peak = cumulative_profit
-            drawdown = peak - cumulative_profit
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
+        performances = [self._calculate_trade_statistics(trades) for trades in trade_lists]
         
-        max_drawdown_percent = (max_drawdown / self.initial_capital) * 100 if self.initial_capital > 0 else 0.0
+        risk_metrics = calculate_risk_metrics(equity, positions, self.risk_free_rate)
+        comparisons = []
+        for prefix, closes in (('buy_and_hold', buy_and_hold), ('benchmark', benchmark)):
+            if closes is not None and np.all(np.isfinite(closes)):
+                comparisons.append((prefix, calculate_benchmark_metrics(equity, closes, self.risk_free_rate)))
         
+        for row, performance in enumerate(performances):
+            performance['sharpe_ratio'] = round(float(risk_metrics['sharpe_ratio'][row]), 2)
+            performance['max_drawdown'] = round(float(risk_metrics['max_drawdown'][row]), 2)
+            for metric, digits in RISK_METRICS.items():
+                if metric in risk_metrics:
+                    value = round(float(risk_metrics[metric][row]), digits)
+                    performance[metric] = int(value) if digits == 0 else value
+            for prefix, comparison in comparisons:
+                performance[f'{prefix}_return'] = round(float(comparison['benchmark_return'][row]), 2)
+                # Buy and hold of the traded data is the default baseline and goes unprefixed
+                key_prefix = '' if prefix == 'buy_and_hold' else 'benchmark_'
+                for metric in ('excess_return', 'alpha', 'beta'):
+                    performance[key_prefix + metric] = round(float(comparison[metric][row]), 2)
+        return performances
+    
+    def _calculate_trade_statistics(self, trades: List[Dict[str, Any]]) -> Dict[str, float]:
+        """Calculate the trade-based metrics, with zero Sharpe ratio and max drawdown."""
+        profits = np.fromiter((trade['profit'] for trade in trades), dtype=float, count=len(trades))
+        wins = profits[profits > 0]
+        losses = profits[profits < 0]
         return {
-            'total_return': round(total_return, 2),
-            'sharpe_ratio': round(sharpe_ratio, 2),
-            'max_drawdown': round(max_drawdown_percent, 2),
-            'win_rate': round(win_rate, 2),
+            'total_return': round(float(profits.sum() / self.initial_capital * 100), 2),
+            'sharpe_ratio': 0.0,
+            'max_drawdown': 0.0,
+            'win_rate': round(len(wins) / len(profits) * 100, 2) if len(profits) else 0.0,
             'total_trades': len(trades),
-            'average_profit': round(average_profit, 2),
-            'average_loss': round(average_loss, 2)
+            'average_profit': round(float(wins.mean()), 2) if len(wins) else 0.0,
+            'average_loss': round(float(losses.mean()), 2) if len(losses) else 0.0
         }
     
+    def calculate_equity(
+        self,
+        trades: np.ndarray,
+        closes: np.ndarray,
+        initial_cash: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Calculate daily mark-to-market equity (cash plus position x close).
+        
+        Cash and position changes are scattered onto their entry/exit bars and
+        accumulated with cumsum, so no per-date loop is needed.
+        
+        Args:
+            trades: Structured array of trades with TRADE_DTYPE; a trade with
+                entry_index -1 is a position carried in from an earlier run
+            closes: Array of close prices per bar
+            initial_cash: Cash before the first bar (default: initial_capital)
+        
+        Returns:
+            Array of equity values, one per bar
+        """
+        if initial_cash is None:
+            initial_cash = self.initial_capital
+        closes = np.asarray(closes, dtype=float)
+        length = len(closes)
+        
+        opened = trades[trades['entry_index'] >= 0]
+        carried_quantity = float(trades['quantity'][trades['entry_index'] < 0].sum())
+        exit_quantity = trades['quantity'].astype(float)
+        entry_quantity = opened['quantity'].astype(float)
+        
+        cash_flows = (
+            np.bincount(trades['exit_index'], weights=exit_quantity * trades['exit_price'], minlength=length)
+            - np.bincount(opened['entry_index'], weights=entry_quantity * opened['entry_price'], minlength=length)
+        )
+        position_changes = (
+            np.bincount(opened['entry_index'], weights=entry_quantity, minlength=length)
+            - np.bincount(trades['exit_index'], weights=exit_quantity, minlength=length)
+        )
+        
+        # Accumulate from the starting cash so each step matches TradeSimulator's running capital
+        cash = np.cumsum(np.concatenate(([initial_cash], cash_flows)))[1:]
+        position = carried_quantity + np.cumsum(position_changes)
+        return cash + position * closes
+    
+    def calculate_open_positions(self, trades: np.ndarray, length: int) -> np.ndarray:
+        """
+        Count the positions open at the end of each bar.
+        
+        Args:
+            trades: Structured array of trades with TRADE_DTYPE; a trade with
+                entry_index -1 is a position carried in from an earlier run
+            length: Number of bars
+        
+        Returns:
+            Array of open position counts, one per bar
+        """
+        opened = trades['entry_index'][trades['entry_index'] >= 0]
+        carried = int(np.sum(trades['entry_index'] < 0))
+        changes = (
+            np.bincount(opened, minlength=length)
+            - np.bincount(trades['exit_index'], minlength=length)
+        )
+        return carried + np.cumsum(changes)
+    
     def calculate_equity_curve(
         self,
-        trades: List[Dict[str, Any]],
-        dates: List[str]
+        equity: np.ndarray,
+        dates: Sequence[Any]
     ) -> List[Dict[str, Any]]:
         """
-        Calculate equity curve over time.
+        Convert daily equity into equity curve points.
         
         Args:
-            trades: List of trade dictionaries
+            equity: Daily equity array from calculate_equity
             dates: List of dates in the backtest period
         
         Returns:
             List of equity points (date, equity)
         """
-        equity_curve = []
-        capital = self.initial_capital
-        
-        # Create a map of trades by exit date
-        trades_by_date = {}
-        for trade in trades:
-            exit_date = trade['exit_date']
-            if exit_date not in trades_by_date:
-                trades_by_date[exit_date] = []
-            trades_by_date[exit_date].append(trade)
-        
-        # Track open positions
-        open_positions = {}  # {entry_date: trade}
-        
-        for date in dates:
-            # Close positions that exit on this date
-            if date in trades_by_date:
-                for trade in trades_by_date[date]:
-                    capital += trade['quantity'] * trade['exit_price']
-            
-            # Add equity point
-            equity_curve.append({
-                'date': date,
-                'equity': round(capital, 2)
-            })
-        
-        return equity_curve
-
+        return [
+            {'date': date, 'equity': value}
+            for date, value in zip(dates, np.round(equity, 2).tolist())
+        ]
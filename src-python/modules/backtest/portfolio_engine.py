@@ -0,0 +1,369 @@
+"""
+Portfolio backtest module for running one algorithm across several symbols.
+
+Data sets are aligned on the union of their dates as 2-D (dates x symbols)
+arrays, so triggers are evaluated for the whole universe in one pass and all
+positions draw on a single cash balance.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  └─ src-python/modules/backtest/backtest_worker.py
+
+Dependencies (External files that this file imports):
+  ├─ pandas
+  ├─ numpy
+  ├─ typing (standard library)
+  ├─ src-python/modules/backtest/algorithm_parser
+  ├─ src-python/modules/backtest/backtest_engine
+  ├─ src-python/modules/backtest/indicator_cache
+  ├─ src-python/modules/backtest/trade_simulator
+  ├─ src-python/modules/backtest/performance_calculator
+  └─ src-python/modules/backtest/stage_profiler
+"""
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+from modules.backtest.algorithm_parser import AlgorithmParser
+from modules.backtest.backtest_engine import align_benchmark, filter_data_with_warmup
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.backtest.trade_simulator import TradeSimulator
+from modules.backtest.performance_calculator import PerformanceCalculator
+from modules.backtest.stage_profiler import StageProfiler
+
+
+PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class SymbolPanel:
+    """OHLCV data and indicators of several symbols aligned on a common date index."""
+    
+    def __init__(
+        self,
+        data: Dict[str, pd.DataFrame],
+        start_date: str,
+        end_date: str,
+        warmup_bars: int = 0
+    ):
+        """
+        Initialize symbol panel.
+        
+        Args:
+            data: Dict of symbol to DataFrame with OHLCV data
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            warmup_bars: Number of bars before start_date each symbol's indicators
+                are computed over
+        """
+        frames = {}
+        warmup_frames = []
+        warmup_counts = []
+        for symbol, frame in data.items():
+            warmup_frame, warmup_count = filter_data_with_warmup(frame, start_date, end_date, warmup_bars)
+            if len(warmup_frame) > warmup_count:
+                warmup_frame = warmup_frame.reset_index(drop=True)
+                frames[symbol] = warmup_frame.iloc[warmup_count:].reset_index(drop=True)
+                warmup_frames.append(warmup_frame)
+                warmup_counts.append(warmup_count)
+        if not frames:
+            raise ValueError(f"No data available for date range {start_date} to {end_date}")
+        
+        self.symbols: List[str] = list(frames.keys())
+        self.dates = pd.DatetimeIndex(np.unique(np.concatenate(
+            [frame['date'].to_numpy() for frame in frames.values()]
+        )))
+        
+        # Indicators are computed on each symbol's own bars, exactly as a single-symbol backtest does
+        self._rows = [self.dates.get_indexer(frame['date']) for frame in frames.values()]
+        self._caches = [IndicatorCache(frame) for frame in warmup_frames]
+        self._warmup_counts = warmup_counts
+        self._indicators: Dict[str, np.ndarray] = {}
+        
+        self.prices = {
+            column: self._align([frame[column].to_numpy(dtype=float) for frame in frames.values()])
+            for column in PRICE_COLUMNS
+        }
+        self.available = ~np.isnan(self.prices['close'])
+    
+    def __len__(self) -> int:
+        """Number of dates in the common index."""
+        return len(self.dates)
+    
+    def get_indicators(self, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Get 2-D indicator arrays, computing them on first access.
+        
+        Args:
+            names: Indicator names
+        
+        Returns:
+            Dict of (dates x symbols) arrays with NaN where a symbol has no value
+            (unknown indicators are omitted)
+        """
+        arrays = {}
+        for name in names:
+            if name not in self._indicators:
+                columns = [cache.get(name) for cache in self._caches]
+                if any(column is None for column in columns):
+                    continue
+                columns = [column[count:] for column, count in zip(columns, self._warmup_counts)]
+                self._indicators[name] = self._align(columns)
+            arrays[name] = self._indicators[name]
+        return arrays
+    
+    def _align(self, columns: List[np.ndarray]) -> np.ndarray:
+        """Scatter per-symbol arrays into a (dates x symbols) array, NaN where a symbol has no bar."""
+        panel = np.full((len(self.dates), len(columns)), np.nan)
+        for j, (rows, values) in enumerate(zip(self._rows, columns)):
+            panel[rows, j] = values
+        return panel
+
+
+class PortfolioBacktestEngine:
+    """Backtest one algorithm across every symbol of a panel with shared capital."""
+    
+    def __init__(
+        self,
+        algorithm: Dict[str, Any],
+        panel: SymbolPanel,
+        initial_capital: float = 100000.0,
+        max_positions: Optional[int] = None,
+        profiler: Optional[StageProfiler] = None,
+        benchmark: Optional[pd.DataFrame] = None
+    ):
+        """
+        Initialize portfolio backtest engine.
+        
+        Args:
+            algorithm: Algorithm definition
+            panel: Aligned symbol data
+            initial_capital: Initial capital for backtesting
+            max_positions: Maximum number of positions held at once (default: number of symbols)
+            profiler: Stage profiler collecting this run's timings (optional)
+            benchmark: DataFrame with the dates and closes of an index the
+                portfolio is compared with, besides buying and holding every symbol (optional)
+        """
+        if max_positions is not None and max_positions <= 0:
+            raise ValueError("max_positions must be positive")
+        
+        self.algorithm = algorithm
+        self.panel = panel
+        self.initial_capital = initial_capital
+        self.max_positions = max_positions or len(panel.symbols)
+        self.profiler = profiler
+        self.benchmark = benchmark
+        
+        self.algorithm_parser = AlgorithmParser()
+        self.trade_simulator = TradeSimulator(initial_capital)
+        self.performance_calculator = PerformanceCalculator(initial_capital)
+    
+    def run(self) -> Dict[str, Any]:
+        """
+        Run portfolio backtest.
+        
+        Returns:
+            Dict with 'trades' (each with its 'symbol'), 'performance' and
+            'equity_curve' of the whole portfolio, plus per-symbol 'symbols' totals
+            and the stage timings under 'profile'
+        """
+        profiler = self.profiler or StageProfiler()
+        with profiler.run():
+            with profiler.stage('parse'):
+                parsed_algorithm = self.algorithm_parser.parse_algorithm(self.algorithm)
+            
+            with profiler.stage('signals'):
+                entries, exits = self.generate_signals(parsed_algorithm)
+            
+            with profiler.stage('simulate'):
+                actions = parsed_algorithm.get('actions', [])
+                parameters = actions[0].get('parameters', {}) if actions else {}  # Use first action for now
+                trades, symbol_indices = self.simulate_trades(entries, exits, parameters)
+                dates = self.panel.dates.tolist()
+                trade_dicts = self.trade_simulator.trades_to_dicts(trades, dates)
+                for trade, symbol_index in zip(trade_dicts, symbol_indices.tolist()):
+                    trade['symbol'] = self.panel.symbols[symbol_index]
+            
+            with profiler.stage('equity'):
+                equity = self.calculate_equity(trades, symbol_indices)
+            
+            with profiler.stage('performance'):
+                num_symbols = len(self.panel.symbols)
+                trade_counts = np.bincount(symbol_indices, minlength=num_symbols)
+                profits = np.bincount(symbol_indices, weights=trades['profit'], minlength=num_symbols)
+                positions = self.performance_calculator.calculate_open_positions(trades, len(equity))
+                performance = self.performance_calculator.calculate_performance(
+                    trade_dicts,
+                    equity,
+                    positions,
+                    buy_and_hold=self.calculate_buy_and_hold(),
+                    benchmark=align_benchmark(self.benchmark, dates) if self.benchmark is not None else None
+                )
+                results = {
+                    'trades': trade_dicts,
+                    'performance': performance,
+                    'equity_curve': self.performance_calculator.calculate_equity_curve(equity, dates),
+                    'symbols': [
+                        {'symbol': symbol, 'total_trades': int(count), 'total_profit': round(float(profit), 2)}
+                        for symbol, count, profit in zip(self.panel.symbols, trade_counts, profits)
+                    ]
+                }
+        
+        results['profile'] = profiler.to_dict()
+        return results
+    
+    def generate_signals(self, algorithm: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the triggers for every date and symbol at once.
+        
+        Args:
+            algorithm: Parsed algorithm definition
+        
+        Returns:
+            Tuple of (entry mask, exit mask), both (dates x symbols)
+        """
+        shape = self.panel.prices['close'].shape
+        entries = np.zeros(shape, dtype=bool)
+        exits = np.zeros(shape, dtype=bool)
+        
+        triggers = algorithm.get('triggers', [])
+        actions = algorithm.get('actions', [])
+        if not triggers or not actions:
+            return entries, exits
+        
+        indicator_arrays = self.panel.get_indicators(
+            self.algorithm_parser.get_required_indicators(triggers)
+        )
+        trigger_mask = self.algorithm_parser.compile_trigger_mask(
+            triggers,
+            indicator_arrays,
+            self.panel.prices
+        ) & self.panel.available
+        
+        # The first action decides what a trigger means, as in SignalGenerator
+        signal_type = actions[0].get('type', 'hold')
+        if signal_type == 'buy':
+            entries = trigger_mask
+        elif signal_type == 'sell':
+            exits = trigger_mask
+        return entries, exits
+    
+    def simulate_trades(
+        self,
+        entries: np.ndarray,
+        exits: np.ndarray,
+        parameters: Dict[str, Any]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate trades for every symbol with one shared cash balance.
+        
+        Only dates where some symbol has a signal or its data ends are visited.
+        On each date, exits are filled first; entries then take the free position
+        slots in symbol order, each sized at percentage of the remaining cash
+        split over the slots still free. A position is closed on its symbol's last bar.
+        
+        With a single symbol this reproduces TradeSimulator.simulate_trades_state.
+        
+        Args:
+            entries: (dates x symbols) buy mask
+            exits: (dates x symbols) sell mask
+            parameters: Parameters of the action (e.g., {'percentage': 50})
+        
+        Returns:
+            Tuple of (structured array of trades with TRADE_DTYPE, symbol index of each trade)
+        """
+        closes = self.panel.prices['close']
+        available = self.panel.available
+        num_dates, num_symbols = closes.shape
+        
+        last_bars = num_dates - 1 - np.argmax(available[::-1], axis=0)
+        is_last_bar = np.zeros(closes.shape, dtype=bool)
+        is_last_bar[last_bars, np.arange(num_symbols)] = True
+        
+        quantity_percentage = parameters.get('percentage', 100.0) / 100.0
+        capital = self.initial_capital
+        positions: Dict[int, Tuple[int, float, int]] = {}  # symbol -> (entry_index, entry_price, quantity)
+        records = []
+        record_symbols = []
+        
+        def close_position(symbol: int, exit_index: int):
+            nonlocal capital
+            entry_index, entry_price, quantity = positions.pop(symbol)
+            exit_price = float(closes[exit_index, symbol])
+            capital += quantity * exit_price
+            records.append((entry_index, exit_index, entry_price, exit_price, quantity))
+            record_symbols.append(symbol)
+        
+        event_dates = np.flatnonzero((entries | exits | is_last_bar).any(axis=1))
+        for i in event_dates.tolist():
+            for symbol in np.flatnonzero(exits[i]).tolist():
+                if symbol in positions:
+                    close_position(symbol, i)
+            
+            free_slots = self.max_positions - len(positions)
+            for symbol in np.flatnonzero(entries[i]).tolist():
+                if free_slots <= 0:
+                    break
+                if symbol in positions:
+                    continue
+                entry_price = float(closes[i, symbol])
+                quantity = int(capital * quantity_percentage / free_slots / entry_price)
+                if quantity <= 0:
+                    continue
+                capital -= quantity * entry_price
+                positions[symbol] = (i, entry_price, quantity)
+                free_slots -= 1
+            
+            for symbol in np.flatnonzero(is_last_bar[i]).tolist():
+                if symbol in positions:
+                    close_position(symbol, i)
+        
+        return self.trade_simulator.build_trades(records), np.array(record_symbols, dtype=np.int64)
+    
+    def calculate_buy_and_hold(self) -> np.ndarray:
+        """
+        Calculate the value of buying every symbol with an equal share of capital on the first date.
+        
+        A symbol is valued at its last known close, and at its first close
+        before it has any bar.
+        
+        Returns:
+            Array of buy-and-hold values per date, starting at 1.0
+        """
+        marks = pd.DataFrame(self.panel.prices['close']).ffill().bfill().to_numpy()
+        return np.mean(marks / marks[0], axis=1)
+    
+    def calculate_equity(self, trades: np.ndarray, symbol_indices: np.ndarray) -> np.ndarray:
+        """
+        Calculate daily mark-to-market equity of the portfolio.
+        
+        Positions are valued at the last known close of their symbol, so a
+        missing bar does not drop a holding from the equity.
+        
+        Args:
+            trades: Structured array of trades with TRADE_DTYPE
+            symbol_indices: Symbol index of each trade
+        
+        Returns:
+            Array of equity values, one per date
+        """
+        closes = self.panel.prices['close']
+        length = len(closes)
+        quantity = trades['quantity'].astype(float)
+        
+        cash_flows = (
+            np.bincount(trades['exit_index'], weights=quantity * trades['exit_price'], minlength=length)
+            - np.bincount(trades['entry_index'], weights=quantity * trades['entry_price'], minlength=length)
+        )
+        cash = np.cumsum(np.concatenate(([self.initial_capital], cash_flows)))[1:]
+        
+        position_changes = np.zeros(closes.shape)
+        np.add.at(position_changes, (trades['entry_index'], symbol_indices), quantity)
+        np.add.at(position_changes, (trades['exit_index'], symbol_indices), -quantity)
+        positions = np.cumsum(position_changes, axis=0)
+        
+        marks = pd.DataFrame(closes).ffill().to_numpy()
+        position_values = np.where(positions != 0, positions * np.nan_to_num(marks), 0.0)
+        return cash + position_values.sum(axis=1)
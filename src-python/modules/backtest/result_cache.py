@@ -0,0 +1,202 @@
+"""
+Content-addressed cache of backtest results.
+
+A backtest is identified by a hash of its inputs: the normalized algorithm
+definition, the data set and its content version, the date range and the
+initial capital. The cache maps that hash to a completed job whose stored
+results can be reused instead of running the backtest again.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  ├─ src-python/scripts/run_backtest.py
+  ├─ src-python/modules/backtest/backtest_worker.py
+  ├─ src-python/scripts/continue_backtest.py
+  ├─ src-python/scripts/update_data_set.py
+  └─ src-python/scripts/delete_data_set.py
+
+Dependencies (External files that this file imports):
+  ├─ sqlite3 (standard library)
+  ├─ json (standard library)
+  ├─ hashlib (standard library)
+  ├─ typing (standard library)
+  └─ src-python/database.connection
+"""
+import sqlite3
+import json
+import hashlib
+from typing import Dict, Any, Optional
+
+from database.connection import get_connection
+
+
+class BacktestResultCache:
+    """Look up and record completed backtests by the hash of their inputs."""
+    
+    def __init__(self, conn: Optional[sqlite3.Connection] = None):
+        """
+        Initialize result cache.
+        
+        Args:
+            conn: Database connection (optional, will create new if not provided)
+        """
+        self.conn = conn
+    
+    @staticmethod
+    def make_key(
+        algorithm: Dict[str, Any],
+        data_set_id: int,
+        data_set_version: int,
+        start_date: str,
+        end_date: str,
+        initial_capital: float,
+        warmup_bars: int = 0,
+        benchmark_data_set_id: Optional[int] = None,
+        benchmark_version: Optional[int] = None
+    ) -> str:
+        """
+        Build the cache key of a backtest.
+        
+        The algorithm is serialized with sorted keys, so definitions that only
+        differ in key order share a key.
+        
+        Args:
+            algorithm: Algorithm definition
+            data_set_id: Data set ID
+            data_set_version: Content version of the data set
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            initial_capital: Initial capital
+            warmup_bars: Number of bars loaded before start_date for the indicators
+            benchmark_data_set_id: Data set ID of the index the backtest is compared with (optional)
+            benchmark_version: Content version of the benchmark data set
+        
+        Returns:
+            Hex SHA-256 digest
+        """
+        key = {
+            'algorithm': algorithm,
+            'data_set_id': data_set_id,
+            'data_set_version': data_set_version,
+            'start_date': start_date,
+            'end_date': end_date,
+            'initial_capital': float(initial_capital),
+            'warmup_bars': int(warmup_bars)
+        }
+        if benchmark_data_set_id is not None:
+            # Only added when set, so keys of backtests without a benchmark stay unchanged
+            key['benchmark_data_set_id'] = benchmark_data_set_id
+            key['benchmark_version'] = benchmark_version
+        payload = json.dumps(key, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get_data_set_version(self, data_set_id: int) -> Optional[int]:
+        """
+        Get the content version of a data set.
+        
+        Args:
+            data_set_id: Data set ID
+        
+        Returns:
+            Version number or None if the data set does not exist
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT version FROM data_sets WHERE id = ?", (data_set_id,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+    
+    def lookup(self, cache_key: str) -> Optional[str]:
+        """
+        Find the completed job stored for a cache key.
+        
+        Entries whose completed job or its results no longer exist are removed.
+        
+        Args:
+            cache_key: Key from make_key
+        
+        Returns:
+            Job ID with stored results, or None on a miss
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT c.job_id, r.job_id
+            FROM backtest_result_cache c
+            LEFT JOIN backtest_jobs j ON j.job_id = c.job_id AND j.status = 'completed'
+            LEFT JOIN backtest_results r ON r.job_id = j.job_id
+            WHERE c.cache_key = ?
+        """, (cache_key,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        if row[1] is None:
+            cursor.execute("DELETE FROM backtest_result_cache WHERE cache_key = ?", (cache_key,))
+            self.conn.commit()
+            return None
+        return row[0]
+    
+    def store(self, cache_key: str, job_id: str, data_set_id: int, data_set_version: int):
+        """
+        Record the completed job for a cache key.
+        
+        Args:
+            cache_key: Key from make_key
+            job_id: Job ID whose results were saved
+            data_set_id: Data set ID
+            data_set_version: Content version of the data set the job ran on
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO backtest_result_cache (
+                cache_key, job_id, data_set_id, data_set_version
+            )
+            VALUES (?, ?, ?, ?)
+        """, (cache_key, job_id, data_set_id, data_set_version))
+        self.conn.commit()
+    
+    def invalidate_data_set(self, data_set_id: int) -> int:
+        """
+        Remove every entry computed on a data set, e.g. after it was updated or deleted.
+        
+        Args:
+            data_set_id: Data set ID
+        
+        Returns:
+            Number of removed entries
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM backtest_result_cache WHERE data_set_id = ?", (data_set_id,))
+        self.conn.commit()
+        return cursor.rowcount
+    
+    def invalidate_job(self, job_id: str) -> int:
+        """
+        Remove the entries pointing at a job, e.g. after its results were extended.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            Number of removed entries
+        """
+        if not self.conn:
+            self.conn = get_connection()
+        
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM backtest_result_cache WHERE job_id = ?", (job_id,))
+        self.conn.commit()
+        return cursor.rowcount
@@ -11,13 +11,17 @@ Parents (Files that import this file):
 
 Dependencies (External files that this file imports):
   ├─ pandas
+  ├─ numpy
   ├─ typing (standard library)
   ├─ src-python/modules/backtest/algorithm_parser
+  ├─ src-python/modules/backtest/indicator_cache
   └─ src-python/modules/data_analysis/technical_indicators
 """
 import pandas as pd
-from typing import Dict, Any, List, Optional
+import numpy as np
+from typing import Dict, Any, Optional
 from modules.backtest.algorithm_parser import AlgorithmParser
+from modules.backtest.indicator_cache import IndicatorCache
 from modules.data_analysis.technical_indicators import TechnicalIndicators
 
 
@@ -32,7 +36,8 @@ class SignalGenerator:
     def generate_signals(
         self,
         data: pd.DataFrame,
-        algorithm: Dict[str, Any]
+        algorithm: Dict[str, Any],
+        indicator_cache: Optional[IndicatorCache] = None
     ) -> pd.DataFrame:
         """
         Generate trading signals for the given data and algorithm.
@@ -40,6 +45,7 @@ class SignalGenerator:
         Args:
             data: DataFrame with OHLCV data (columns: date, open, high, low, close, volume)
             algorithm: Parsed algorithm definition
+            indicator_cache: Indicators precomputed for the same rows as data (optional)
         
         Returns:
             DataFrame with signals added (columns: date, open, high, low, close, volume, signal)
@@ -54,95 +60,44 @@ class SignalGenerator:
         if not triggers or not actions:
             return signals_df
         
-        # Calculate technical indicators for all data
-        indicator_values_cache = self._calculate_indicators(data)
-        
-        # Generate signals for each row
-        for idx, row in signals_df.iterrows():
-            price_data = {
-                'open': row['open'],
-                'high': row['high'],
-                'low': row['low'],
-                'close': row['close'],
-                'volume': row['volume']
-            }
-            
-            # Get indicator values up to current index
-            indicator_values = self._get_indicator_values(indicator_values_cache, idx)
-            
-            # Evaluate triggers
-            trigger_satisfied = self.algorithm_parser.evaluate_triggers(
-                triggers,
-                indicator_values,
-                price_data
-            )
-            
-            if trigger_satisfied:
-                # Get action (use first action for now)
-                action = actions[0] if actions else None
-                if action:
-                    signal_type = action.get('type', 'hold')
-                    signals_df.at[idx, 'signal'] = signal_type
-        
-        return signals_df
-    
-    def _calculate_indicators(self, data: pd.DataFrame) -> Dict[str, List[Optional[float]]]:
-        """
-        Calculate technical indicators for all data points.
-        
-        Args:
-            data: DataFrame with OHLCV data
-        
-        Returns:
-            Dict with indicator names as keys and lists of values as values
-        """
-        indicators = {
-            'rsi': [],
-            'macd': [],
-            'ma_20': [],
-            'ma_50': [],
+        # Calculate the technical indicators the triggers reference
+        if indicator_cache is None:
+            indicator_cache = self.create_indicator_cache(data)
+        elif len(indicator_cache) != len(data):
+            raise ValueError("Indicator cache does not match the data length")
+        indicator_arrays = indicator_cache.get_many(
+            self.algorithm_parser.get_required_indicators(triggers)
+        )
+        price_arrays = {
+            column: data[column].to_numpy()
+            for column in ('open', 'high', 'low', 'close', 'volume')
         }
         
-        # Calculate RSI
-        for i in range(len(data)):
-            subset = data.iloc[:i+1]
-            rsi_result = self.technical_indicators.calculate_rsi(subset, period=14)
-            indicators['rsi'].append(rsi_result['value'] if rsi_result else None)
-        
-        # Calculate MACD
-        for i in range(len(data)):
-            subset = data.iloc[:i+1]
-            macd_result = self.technical_indicators.calculate_macd(subset)
-            indicators['macd'].append(macd_result['macd'] if macd_result else None)
+        # Evaluate triggers for every bar at once
+        trigger_mask = self.algorithm_parser.compile_trigger_mask(
+            triggers,
+            indicator_arrays,
+            price_arrays
+        )
         
-        # Calculate Moving Averages
-        for i in range(len(data)):
-            subset = data.iloc[:i+1]
-            ma_20 = subset['close'].tail(20).mean() if len(subset) >= 20 else None
-            ma_50 = subset['close'].tail(50).mean() if len(subset) >= 50 else None
-            indicators['ma_20'].append(ma_20)
-            indicators['ma_50'].append(ma_50)
+        # Get action (use first action for now)
+        action = actions[0] if actions else None
+        if action and trigger_mask.any():
+            signal_type = action.get('type', 'hold')
+            signals = np.full(len(signals_df), None, dtype=object)
+            signals[trigger_mask] = signal_type
+            signals_df['signal'] = pd.Series(signals, index=signals_df.index, dtype=object)
         
-        return indicators
+        return signals_df
     
-    def _get_indicator_values(
-        self,
-        indicator_cache: Dict[str, List[Optional[float]]],
-        index: int
-    ) -> Dict[str, float]:
+    def create_indicator_cache(self, data: pd.DataFrame) -> IndicatorCache:
         """
-        Get indicator values at a specific index.
+        Create an indicator cache for the given data.
         
         Args:
-            indicator_cache: Cached indicator values
-            index: Index to get values for
+            data: DataFrame with OHLCV data
         
         Returns:
-            Dict with indicator values (None values are filtered out)
+            IndicatorCache computing each indicator for the whole series in one pass
         """
-        values = {}
-        for indicator_name, value_list in indicator_cache.items():
-            if index < len(value_list) and value_list[index] is not None:
-                values[indicator_name] = value_list[index]
-        return values
-
+        return IndicatorCache(data)
@@ -0,0 +1,140 @@
+"""
+Stage timing and memory instrumentation for backtest runs.
+
+Each stage of a run is timed with a wall clock. With memory tracing on,
+tracemalloc also records the peak memory allocated during each stage: the
+peak is reset when a stage starts, so each stage reports its own high-water
+mark rather than that of the process (or an earlier run in it). Tracing
+hooks every allocation and slows allocation-heavy stages many times over,
+so it is opt-in and on by default only together with the cProfile dump of
+the whole run, which can be requested for deeper analysis.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  ├─ src-python/modules/backtest/backtest_engine.py
+  ├─ src-python/modules/backtest/portfolio_engine.py
+  ├─ src-python/modules/backtest/batch_backtest.py
+  └─ src-python/modules/backtest/backtest_worker.py
+
+Dependencies (External files that this file imports):
+  ├─ cProfile (standard library)
+  ├─ time (standard library)
+  ├─ tracemalloc (standard library)
+  ├─ contextlib (standard library)
+  ├─ pathlib (standard library)
+  ├─ typing (standard library)
+  └─ src-python/database.connection
+"""
+import cProfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterator
+
+from database.connection import get_db_path
+
+
+def get_peak_memory() -> Optional[int]:
+    """
+    Get the peak memory traced by tracemalloc since its last reset.
+    
+    Returns:
+        Peak traced bytes, or None when tracemalloc is not tracing
+    """
+    if not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()[1]
+
+
+def default_profile_path(job_id: str) -> str:
+    """
+    Get the cProfile dump path of a job, in a profiles directory next to the database.
+    
+    Args:
+        job_id: Job ID
+    
+    Returns:
+        Path of the .prof file
+    """
+    return str(Path(get_db_path()).parent / 'profiles' / f'{job_id}.prof')
+
+
+class StageProfiler:
+    """Collect per-stage timings and peak memory of one backtest run."""
+    
+    def __init__(self, profile_path: Optional[str] = None, trace_memory: Optional[bool] = None):
+        """
+        Initialize stage profiler.
+        
+        Args:
+            profile_path: Write a cProfile dump of the run to this file (optional)
+            trace_memory: Record the peak memory of each stage with tracemalloc
+                (default: only when a profile_path is given)
+        """
+        self.profile_path = profile_path
+        self.trace_memory = profile_path is not None if trace_memory is None else trace_memory
+        self.stages: Dict[str, float] = {}
+        self.stage_memory: Dict[str, Optional[int]] = {}
+        self.total_seconds = 0.0
+    
+    @contextmanager
+    def run(self) -> Iterator['StageProfiler']:
+        """Time the whole run, trace its memory if enabled and, with a profile_path, profile it with cProfile."""
+        profile = cProfile.Profile() if self.profile_path else None
+        # Tracing already started by the caller is left running
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        started = time.perf_counter()
+        if profile:
+            profile.enable()
+        try:
+            yield self
+        finally:
+            if profile:
+                profile.disable()
+                Path(self.profile_path).parent.mkdir(parents=True, exist_ok=True)
+                profile.dump_stats(self.profile_path)
+            if started_tracing:
+                tracemalloc.stop()
+            self.total_seconds += time.perf_counter() - started
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time one stage and record its peak memory; repeated stages accumulate time and keep the highest peak."""
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+            peak = get_peak_memory() if self.trace_memory else None
+            previous = self.stage_memory.get(name)
+            if peak is not None and previous is not None:
+                peak = max(peak, previous)
+            self.stage_memory[name] = peak
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the collected figures.
+        
+        Returns:
+            Dict with 'stages' (seconds per stage in run order), 'total_seconds',
+            'stage_peak_memory' (peak bytes allocated during each stage, None
+            without memory tracing), 'peak_memory'
+            and 'profile_path' (None unless profiling was requested)
+        """
+        memory = [value for value in self.stage_memory.values() if value is not None]
+        return {
+            'stages': {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            'total_seconds': round(self.total_seconds, 6),
+            'stage_peak_memory': dict(self.stage_memory),
+            'peak_memory': max(memory) if memory else None,
+            'profile_path': self.profile_path
+        }
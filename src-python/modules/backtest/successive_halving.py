@@ -0,0 +1,321 @@
+"""
+Successive halving parameter search for backtest engine.
+
+Every candidate parameterization is first scored on a short window at the
+end of the date range. Only the best 1/eta of them are promoted to the next
+rung, whose window is eta times longer, until the survivors run on the full
+range. Each rung costs about the same number of bars, so the search grows
+with the number of rungs (log_eta of the candidates) rather than with the
+candidates themselves. Indicators are computed once for the whole series and
+sliced per window.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  └─ src-python/modules/backtest/optimization_jobs.py
+
+Dependencies (External files that this file imports):
+  ├─ pandas
+  ├─ math (standard library)
+  ├─ os (standard library)
+  ├─ random (standard library)
+  ├─ concurrent.futures (standard library)
+  ├─ typing (standard library)
+  ├─ src-python/modules/backtest/backtest_engine
+  ├─ src-python/modules/backtest/batch_backtest
+  ├─ src-python/modules/backtest/indicator_cache
+  ├─ src-python/modules/backtest/job_control
+  └─ src-python/modules/backtest/parameter_sweep
+"""
+import math
+import os
+import random
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Callable
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.batch_backtest import prepare_shared_inputs
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.backtest.job_control import JobControl
+from modules.backtest.parameter_sweep import apply_parameters, rank_results, score_results, unscored_result
+
+
+# Per-process state set once by the pool initializer, so the full series and
+# its indicator arrays are transferred to each worker only once
+_worker_state: Dict[str, Any] = {}
+
+
+def sample_grid(
+    parameter_grid: Dict[str, List[Any]],
+    num_candidates: Optional[int] = None,
+    seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Draw distinct combinations from a parameter grid without expanding it.
+    
+    Args:
+        parameter_grid: Dict of dotted paths to candidate values
+        num_candidates: Number of combinations to draw (default: the whole grid)
+        seed: Random seed of the draw
+    
+    Returns:
+        List of parameter dicts; the whole grid in grid order when it has no
+        more than num_candidates combinations
+    """
+    paths = list(parameter_grid.keys())
+    sizes = [len(parameter_grid[path]) for path in paths]
+    total = math.prod(sizes)
+    if num_candidates is None or num_candidates >= total:
+        indices = range(total)
+    else:
+        indices = sorted(random.Random(seed).sample(range(total), num_candidates))
+    
+    combinations = []
+    for index in indices:
+        # Decode the mixed-radix index, last path varying fastest like itertools.product
+        parameters = {}
+        for path, size in zip(reversed(paths), reversed(sizes)):
+            index, position = divmod(index, size)
+            parameters[path] = parameter_grid[path][position]
+        combinations.append({path: parameters[path] for path in paths})
+    return combinations
+
+
+def build_rungs(num_candidates: int, length: int, eta: int = 3, min_bars: int = 63) -> List[Dict[str, int]]:
+    """
+    Plan the rungs of a successive halving search.
+    
+    Rungs are added until a single rung would hold at most eta candidates or
+    the shortest window would fall below min_bars.
+    
+    Args:
+        num_candidates: Number of candidates in the first rung
+        length: Number of bars in the full range
+        eta: Reduction factor between rungs
+        min_bars: Shortest window worth scoring a candidate on
+    
+    Returns:
+        List of rungs with 'rung', 'candidates' (number evaluated) and 'bars'
+        (window length, counted back from the last bar); the last rung spans the full range
+    """
+    if eta < 2:
+        raise ValueError("eta must be at least 2")
+    if num_candidates <= 0 or length <= 0:
+        raise ValueError("Successive halving needs at least one candidate and one bar")
+    
+    num_rungs = 1
+    while eta ** num_rungs < num_candidates and length // eta ** num_rungs >= min_bars:
+        num_rungs += 1
+    
+    return [
+        {
+            'rung': rung,
+            'candidates': math.ceil(num_candidates / eta ** rung),
+            'bars': length // eta ** (num_rungs - 1 - rung)
+        }
+        for rung in range(num_rungs)
+    ]
+
+
+def _init_worker(
+    algorithm: Dict[str, Any],
+    indicator_cache: IndicatorCache,
+    initial_capital: float
+):
+    """Store the shared search inputs in the worker process."""
+    _worker_state['algorithm'] = algorithm
+    _worker_state['indicator_cache'] = indicator_cache
+    _worker_state['initial_capital'] = initial_capital
+
+
+def _run_candidate(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one candidate on the bars from task['start'] to the end of the worker's series."""
+    parameters = task['parameters']
+    full_cache = _worker_state['indicator_cache']
+    try:
+        indicator_cache = full_cache.slice(task['start'], len(full_cache))
+        dates = indicator_cache.data['date']
+        engine = BacktestEngine(
+            algorithm=apply_parameters(_worker_state['algorithm'], parameters),
+            data=indicator_cache.data,
+            start_date=dates.iloc[0],
+            end_date=dates.iloc[-1],
+            initial_capital=_worker_state['initial_capital'],
+            indicator_cache=indicator_cache,
+            score=False
+        )
+        return unscored_result(parameters, engine.run())
+    except Exception as e:
+        return {'parameters': parameters, 'error': str(e)}
+
+
+class SuccessiveHalvingOptimizer:
+    """Search algorithm parameters by promoting the best candidates to longer windows."""
+    
+    def __init__(
+        self,
+        algorithm: Dict[str, Any],
+        data: pd.DataFrame,
+        start_date: str,
+        end_date: str,
+        initial_capital: float = 100000.0,
+        max_workers: Optional[int] = None,
+        eta: int = 3,
+        min_bars: int = 63
+    ):
+        """
+        Initialize successive halving optimizer.
+        
+        Args:
+            algorithm: Base algorithm definition
+            data: DataFrame with OHLCV data
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            initial_capital: Initial capital for backtesting
+            max_workers: Number of worker processes (default: CPU count, 1 runs in-process)
+            eta: Reduction factor; each rung keeps the best 1/eta of its candidates
+                and runs them on an eta times longer window
+            min_bars: Shortest window worth scoring a candidate on
+        """
+        self.algorithm = algorithm
+        self.data = data
+        self.start_date = start_date
+        self.end_date = end_date
+        self.initial_capital = initial_capital
+        self.max_workers = max_workers
+        self.eta = eta
+        self.min_bars = min_bars
+    
+    def run(
+        self,
+        parameter_grid: Dict[str, List[Any]],
+        num_candidates: Optional[int] = None,
+        rank_by: str = 'sharpe_ratio',
+        seed: int = 0,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        control: Optional[JobControl] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Draw candidates from a parameter grid and search them.
+        
+        Args:
+            parameter_grid: Dict of dotted paths to candidate values
+            num_candidates: Number of combinations to draw (default: the whole grid)
+            rank_by: Performance metric to rank by (default: 'sharpe_ratio')
+            seed: Random seed of the draw
+            progress_callback: Called with (completed, total) backtests as results arrive (optional)
+            control: Cancellation and checkpoints of the search's job (optional)
+        
+        Returns:
+            Results ordered best first, as returned by run_candidates
+        """
+        candidates = sample_grid(parameter_grid, num_candidates, seed)
+        return self.run_candidates(candidates, rank_by, progress_callback, control)
+    
+    def run_candidates(
+        self,
+        candidates: List[Dict[str, Any]],
+        rank_by: str = 'sharpe_ratio',
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        control: Optional[JobControl] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run successive halving over a list of candidates.
+        
+        With control, each finished rung is saved and rungs saved by an
+        earlier run of the job are not run again; the job is checked for
+        cancellation before each rung.
+        
+        Args:
+            candidates: List of parameter dicts
+            rank_by: Performance metric to rank by (default: 'sharpe_ratio')
+            progress_callback: Called with (completed, total) backtests as results arrive (optional)
+            control: Cancellation and checkpoints of the search's job (optional)
+        
+        Returns:
+            Every candidate once, with 'parameters', 'performance' (or 'error'),
+            'rung' (last rung reached), 'start_date' and 'bars' of that rung's
+            window. Candidates that reached a later rung come first; within a
+            rung they are ranked by rank_by on that rung's window.
+        
+        Raises:
+            JobCancelled: If the job was cancelled before the last rung
+        """
+        # Filter once and compute every indicator any candidate needs for the whole series
+        filtered_data, indicator_cache = prepare_shared_inputs(
+            [apply_parameters(self.algorithm, parameters) for parameters in candidates],
+            self.data,
+            self.start_date,
+            self.end_date
+        )
+        length = len(filtered_data)
+        rungs = build_rungs(len(candidates), length, self.eta, self.min_bars)
+        initargs = (self.algorithm, indicator_cache, self.initial_capital)
+        
+        total = sum(rung['candidates'] for rung in rungs)
+        completed = 0
+        eliminated: List[List[Dict[str, Any]]] = []
+        survivors = candidates
+        checkpoints = control.load_checkpoints() if control else {}
+        parallel = self.max_workers != 1 and len(candidates) > 1
+        if not parallel:
+            _init_worker(*initargs)
+        
+        executor = None
+        try:
+            for rung in rungs:
+                if rung['rung'] in checkpoints:
+                    rung_results = checkpoints[rung['rung']]
+                    completed += len(rung_results)
+                    if progress_callback:
+                        progress_callback(completed, total)
+                else:
+                    if control:
+                        control.check_cancelled()
+                    start = length - rung['bars']
+                    start_date = filtered_data['date'].iloc[start].strftime('%Y-%m-%d')
+                    tasks = [{'parameters': parameters, 'start': start} for parameters in survivors]
+                    if parallel:
+                        if executor is None:
+                            executor = ProcessPoolExecutor(
+                                max_workers=self.max_workers,
+                                initializer=_init_worker,
+                                initargs=initargs
+                            )
+                        worker_count = self.max_workers or os.cpu_count() or 1
+                        chunksize = max(1, len(tasks) // (worker_count * 4))
+                        results_iter = executor.map(_run_candidate, tasks, chunksize=chunksize)
+                    else:
+                        results_iter = map(_run_candidate, tasks)
+                    
+                    rung_results = []
+                    for result in results_iter:
+                        rung_results.append(result)
+                        completed += 1
+                        if progress_callback:
+                            progress_callback(completed, total)
+                    # Every candidate of a rung runs on the same bars, so they are scored together
+                    rung_results = score_results(rung_results, self.initial_capital)
+                    for result in rung_results:
+                        result['rung'] = rung['rung']
+                        result['start_date'] = start_date
+                        result['bars'] = rung['bars']
+                    if control:
+                        control.save_checkpoint(rung['rung'], rung_results)
+                
+                ranked = rank_results(rung_results, rank_by)
+                next_count = rungs[rung['rung'] + 1]['candidates'] if rung['rung'] + 1 < len(rungs) else len(ranked)
+                eliminated.append(ranked[next_count:])
+                survivors = [result['parameters'] for result in ranked[:next_count]]
+                final = ranked[:next_count]
+        finally:
+            if executor:
+                executor.shutdown()
+        
+        ordered = list(final)
+        for rung_results in reversed(eliminated):
+            ordered.extend(rung_results)
+        return ordered
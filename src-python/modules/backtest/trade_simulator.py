@@ -7,18 +7,33 @@ Related Documentation:
 DEPENDENCY MAP:
 
 Parents (Files that import this file):
-  └─ src-python/modules/backtest/backtest_engine.py
+  ├─ src-python/modules/backtest/backtest_engine.py
+  └─ src-python/modules/backtest/portfolio_engine.py
 
 Dependencies (External files that this file imports):
   ├─ pandas
+  ├─ numpy
   ├─ typing (standard library)
   └─ datetime (standard library)
 """
 import pandas as pd
-from typing import List, Dict, Any, Optional
+import numpy as np
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime
 
 
+# One record per closed trade; dates are bar indices into the simulated series
+TRADE_DTYPE = np.dtype([
+    ('entry_index', np.int64),
+    ('exit_index', np.int64),
+    ('entry_price', np.float64),
+    ('exit_price', np.float64),
+    ('quantity', np.int64),
+    ('profit', np.float64),
+    ('profit_rate', np.float64),
+])
+
+
 class TradeSimulator:
     """Simulate trades based on signals."""
     
@@ -46,98 +61,177 @@ class TradeSimulator:
         Returns:
             List of trade dictionaries
         """
-        trades = []
-        position = None  # {'entry_date', 'entry_price', 'quantity'}
-        capital = self.initial_capital
+        trades, _ = self.simulate_signal_trades(signals_df, algorithm)
+        return self.trades_to_dicts(trades, signals_df['date'].tolist())
+    
+    def simulate_signal_trades(
+        self,
+        signals_df: pd.DataFrame,
+        algorithm: Dict[str, Any],
+        state: Optional[Dict[str, Any]] = None
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Simulate trades based on signals, keeping them as a structured array.
         
+        Args:
+            signals_df: DataFrame with signals (columns: date, open, high, low, close, volume, signal)
+            algorithm: Algorithm definition with actions
+            state: End state of an earlier run to continue from (optional)
+        
+        Returns:
+            Tuple of (structured array of trades with TRADE_DTYPE, end state)
+        """
         actions = algorithm.get('actions', [])
         if not actions:
-            return trades
+            return self.build_trades([]), self._build_state(
+                state['capital'] if state else self.initial_capital,
+                None
+            )
         
-        action = actions[0]  # Use first action for now
-        action_type = action.get('type', 'hold')
-        parameters = action.get('parameters', {})
+        parameters = actions[0].get('parameters', {})  # Use first action for now
+        return self.simulate_trades_state(
+            signals_df['signal'].to_numpy(),
+            signals_df['close'].to_numpy(),
+            parameters,
+            state
+        )
+    
+    def simulate_trades_state(
+        self,
+        signals: np.ndarray,
+        closes: np.ndarray,
+        parameters: Dict[str, Any],
+        state: Optional[Dict[str, Any]] = None
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Simulate trades on signal and close arrays, optionally continuing an earlier run.
         
-        for idx, row in signals_df.iterrows():
-            signal = row['signal']
-            date = row['date']
-            close_price = row['close']
-            
-            if signal == 'buy' and position is None:
-                # Enter position
-                quantity = self._calculate_quantity(capital, close_price, parameters)
-                if quantity > 0:
-                    position = {
-                        'entry_date': date,
-                        'entry_price': close_price,
-                        'quantity': quantity
-                    }
-                    capital -= quantity * close_price
-            
-            elif signal == 'sell' and position is not None:
-                # Exit position
-                exit_price = close_price
-                profit = (exit_price - position['entry_price']) * position['quantity']
-                profit_rate = (profit / (position['entry_price'] * position['quantity'])) * 100
-                
-                trade = {
-                    'entry_date': position['entry_date'],
-                    'exit_date': date,
-                    'entry_price': position['entry_price'],
-                    'exit_price': exit_price,
-                    'quantity': position['quantity'],
-                    'profit': round(profit, 2),
-                    'profit_rate': round(profit_rate, 2)
-                }
-                trades.append(trade)
+        Buy and sell bars are located with vectorized ops; the scalar pass only
+        visits entry/exit transitions, since position sizing depends on the
+        capital left by earlier trades.
+        
+        A position still open on the last bar is closed there in the returned
+        trades, but reported as open in the end state so a continuation run can
+        keep holding it. A position carried in from state has entry_index -1.
+        
+        Args:
+            signals: Array of signals per bar ('buy', 'sell', 'hold', None)
+            closes: Array of close prices per bar
+            parameters: Parameters of the action (e.g., {'percentage': 50})
+            state: End state of an earlier run ({'capital', 'position'}; optional)
+        
+        Returns:
+            Tuple of (structured array of trades with TRADE_DTYPE, end state with
+            'capital' (cash excluding the open position) and 'position'
+            (None or {'entry_index', 'entry_price', 'quantity'}))
+        """
+        capital = state['capital'] if state else self.initial_capital
+        position = None
+        if state and state.get('position'):
+            position = (-1, state['position']['entry_price'], state['position']['quantity'])
+        
+        records = []
+        if len(signals) == 0:
+            return self.build_trades(records), self._build_state(capital, position)
+        
+        buy_indices = np.flatnonzero(signals == 'buy')
+        sell_indices = np.flatnonzero(signals == 'sell')
+        close_values = np.asarray(closes, dtype=float).tolist()
+        
+        percentage = parameters.get('percentage', 100.0)
+        quantity_percentage = percentage / 100.0
+        
+        next_buy = 0
+        while True:
+            if position is None:
+                if next_buy >= len(buy_indices):
+                    break
                 
-                capital += position['quantity'] * exit_price
-                position = None
-        
-        # Close any open position at the end
-        if position is not None:
-            last_row = signals_df.iloc[-1]
-            exit_price = last_row['close']
-            profit = (exit_price - position['entry_price']) * position['quantity']
-            profit_rate = (profit / (position['entry_price'] * position['quantity'])) * 100
+                # Enter at the first buy bar that affords at least one share
+                entry_index = int(buy_indices[next_buy])
+                entry_price = close_values[entry_index]
+                quantity = int(capital * quantity_percentage / entry_price)
+                if quantity <= 0:
+                    candidates = buy_indices[next_buy + 1:]
+                    affordable = np.flatnonzero(
+                        (capital * quantity_percentage / np.asarray(closes, dtype=float)[candidates]) >= 1
+                    )
+                    if len(affordable) == 0:
+                        break
+                    next_buy += 1 + int(affordable[0])
+                    continue
+                capital -= quantity * entry_price
+                position = (entry_index, entry_price, quantity)
             
-            trade = {
-                'entry_date': position['entry_date'],
-                'exit_date': last_row['date'],
-                'entry_price': position['entry_price'],
-                'exit_price': exit_price,
-                'quantity': position['quantity'],
-                'profit': round(profit, 2),
-                'profit_rate': round(profit_rate, 2)
-            }
-            trades.append(trade)
+            # Exit at the first sell bar after entry, or the last bar if none
+            entry_index, entry_price, quantity = position
+            next_sell = np.searchsorted(sell_indices, entry_index, side='right')
+            if next_sell >= len(sell_indices):
+                records.append((entry_index, len(signals) - 1, entry_price, close_values[-1], quantity))
+                break
+            
+            exit_index = int(sell_indices[next_sell])
+            exit_price = close_values[exit_index]
+            capital += quantity * exit_price
+            records.append((entry_index, exit_index, entry_price, exit_price, quantity))
+            position = None
+            next_buy = int(np.searchsorted(buy_indices, exit_index, side='right'))
         
+        return self.build_trades(records), self._build_state(capital, position)
+    
+    def build_trades(self, records: List[Tuple[int, int, float, float, int]]) -> np.ndarray:
+        """Build the structured trade array and its profit columns from (entry, exit, prices, quantity) records."""
+        trades = np.zeros(len(records), dtype=TRADE_DTYPE)
+        if records:
+            entry_idx, exit_idx, entry_prices, exit_prices, quantities = zip(*records)
+            trades['entry_index'] = entry_idx
+            trades['exit_index'] = exit_idx
+            trades['entry_price'] = entry_prices
+            trades['exit_price'] = exit_prices
+            trades['quantity'] = quantities
+            profit = (trades['exit_price'] - trades['entry_price']) * trades['quantity']
+            profit_rate = (profit / (trades['entry_price'] * trades['quantity'])) * 100
+            trades['profit'] = np.round(profit, 2)
+            trades['profit_rate'] = np.round(profit_rate, 2)
         return trades
     
-    def _calculate_quantity(
+    def _build_state(self, capital: float, position: Optional[Tuple[int, float, int]]) -> Dict[str, Any]:
+        """Build the end state from the remaining cash and the open (entry_index, entry_price, quantity)."""
+        if position is None:
+            return {'capital': capital, 'position': None}
+        entry_index, entry_price, quantity = position
+        return {
+            'capital': capital,
+            'position': {'entry_index': entry_index, 'entry_price': entry_price, 'quantity': quantity}
+        }
+    
+    def trades_to_dicts(
         self,
-        capital: float,
-        price: float,
-        parameters: Dict[str, Any]
-    ) -> float:
+        trades: np.ndarray,
+        dates: Sequence[Any],
+        carried_entry_date: Any = None
+    ) -> List[Dict[str, Any]]:
         """
-        Calculate quantity to buy based on capital and parameters.
+        Convert a structured trade array into trade dictionaries.
         
         Args:
-            capital: Available capital
-            price: Current price
-            parameters: Action parameters
+            trades: Structured array of trades with TRADE_DTYPE
+            dates: Date of each bar, indexed by entry_index/exit_index
+            carried_entry_date: Entry date of a position carried in from an earlier run (entry_index -1)
         
         Returns:
-            Quantity to buy
+            List of trade dictionaries
         """
-        # Use percentage if specified, otherwise use all capital
-        percentage = parameters.get('percentage', 100.0)
-        quantity_percentage = percentage / 100.0
-        
-        available_capital = capital * quantity_percentage
-        quantity = available_capital / price
-        
-        # Round down to avoid fractional shares
-        return int(quantity)
-
+        return [
+            {
+                'entry_date': dates[entry_index] if entry_index >= 0 else carried_entry_date,
+                'exit_date': dates[exit_index],
+                'entry_price': entry_price,
+                'exit_price': exit_price,
+                'quantity': quantity,
+                'profit': profit,
+                'profit_rate': profit_rate
+            }
+            for entry_index, exit_index, entry_price, exit_price, quantity, profit, profit_rate
+            in trades.tolist()
+        ]
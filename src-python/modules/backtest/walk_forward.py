@@ -0,0 +1,332 @@
+"""
+Walk-forward analysis module for backtest engine.
+
+Each window runs the parameter search on its in-sample range and scores the
+winning parameters on the following out-of-sample range. Indicators are
+computed once for the whole series and sliced per window.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/backtest/README.md
+
+DEPENDENCY MAP:
+
+Parents (Files that import this file):
+  └─ src-python/modules/backtest/optimization_jobs.py
+
+Dependencies (External files that this file imports):
+  ├─ pandas
+  ├─ numpy
+  ├─ concurrent.futures (standard library)
+  ├─ typing (standard library)
+  ├─ src-python/modules/backtest/backtest_engine
+  ├─ src-python/modules/backtest/batch_backtest
+  ├─ src-python/modules/backtest/indicator_cache
+  ├─ src-python/modules/backtest/job_control
+  ├─ src-python/modules/backtest/parameter_sweep
+  └─ src-python/modules/backtest/performance_calculator
+"""
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Callable
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.batch_backtest import prepare_shared_inputs
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.backtest.job_control import JobControl
+from modules.backtest.parameter_sweep import apply_parameters, expand_grid, rank_results
+from modules.backtest.performance_calculator import PerformanceCalculator
+
+
+# Per-process state set once by the pool initializer, so the full series and
+# its indicator arrays are transferred to each worker only once
+_worker_state: Dict[str, Any] = {}
+
+
+def build_windows(
+    length: int,
+    in_sample_size: int,
+    out_of_sample_size: int,
+    anchored: bool = False
+) -> List[Dict[str, int]]:
+    """
+    Split a series into consecutive in-sample/out-of-sample windows.
+    
+    Out-of-sample ranges follow each other without overlap; the last one is
+    truncated at the end of the series.
+    
+    Args:
+        length: Number of bars in the series
+        in_sample_size: Bars per in-sample range
+        out_of_sample_size: Bars per out-of-sample range
+        anchored: Start every in-sample range at the first bar (default: False rolls it forward)
+    
+    Returns:
+        List of windows with bar positions (end positions are exclusive)
+    """
+    if in_sample_size <= 0 or out_of_sample_size <= 0:
+        raise ValueError("in_sample_size and out_of_sample_size must be positive")
+    if in_sample_size >= length:
+        raise ValueError(
+            f"Not enough data for walk-forward analysis: {length} bars, in-sample size {in_sample_size}"
+        )
+    
+    windows = []
+    out_of_sample_start = in_sample_size
+    while out_of_sample_start < length:
+        out_of_sample_end = min(out_of_sample_start + out_of_sample_size, length)
+        windows.append({
+            'window_index': len(windows),
+            'in_sample_start': 0 if anchored else out_of_sample_start - in_sample_size,
+            'in_sample_end': out_of_sample_start,
+            'out_of_sample_start': out_of_sample_start,
+            'out_of_sample_end': out_of_sample_end
+        })
+        out_of_sample_start = out_of_sample_end
+    return windows
+
+
+def _init_worker(
+    algorithm: Dict[str, Any],
+    combinations: List[Dict[str, Any]],
+    indicator_cache: IndicatorCache,
+    initial_capital: float,
+    rank_by: str
+):
+    """Store the shared walk-forward inputs in the worker process."""
+    _worker_state['algorithm'] = algorithm
+    _worker_state['combinations'] = combinations
+    _worker_state['indicator_cache'] = indicator_cache
+    _worker_state['initial_capital'] = initial_capital
+    _worker_state['rank_by'] = rank_by
+
+
+def _run_range(parameters: Dict[str, Any], start: int, stop: int) -> Dict[str, Any]:
+    """Run one backtest on a bar range of the worker's series."""
+    indicator_cache = _worker_state['indicator_cache'].slice(start, stop)
+    dates = indicator_cache.data['date']
+    engine = BacktestEngine(
+        algorithm=apply_parameters(_worker_state['algorithm'], parameters),
+        data=indicator_cache.data,
+        start_date=dates.iloc[0],
+        end_date=dates.iloc[-1],
+        initial_capital=_worker_state['initial_capital'],
+        indicator_cache=indicator_cache
+    )
+    return engine.run()
+
+
+def _run_window(window: Dict[str, int]) -> Dict[str, Any]:
+    """Search parameters on the in-sample range and score the winner out of sample."""
+    result = dict(window)
+    dates = _worker_state['indicator_cache'].data['date']
+    result['in_sample_start_date'] = dates.iloc[window['in_sample_start']].strftime('%Y-%m-%d')
+    result['in_sample_end_date'] = dates.iloc[window['in_sample_end'] - 1].strftime('%Y-%m-%d')
+    result['out_of_sample_start_date'] = dates.iloc[window['out_of_sample_start']].strftime('%Y-%m-%d')
+    result['out_of_sample_end_date'] = dates.iloc[window['out_of_sample_end'] - 1].strftime('%Y-%m-%d')
+    
+    in_sample_results = []
+    for parameters in _worker_state['combinations']:
+        try:
+            results = _run_range(parameters, window['in_sample_start'], window['in_sample_end'])
+            in_sample_results.append({'parameters': parameters, 'performance': results['performance']})
+        except Exception as e:
+            in_sample_results.append({'parameters': parameters, 'error': str(e)})
+    
+    best = rank_results(in_sample_results, _worker_state['rank_by'])[0]
+    result['parameters'] = best['parameters']
+    if 'performance' not in best:
+        result['error'] = best.get('error', 'No parameter combination succeeded in sample')
+        return result
+    result['in_sample_performance'] = best['performance']
+    
+    try:
+        result['out_of_sample'] = _run_range(
+            best['parameters'],
+            window['out_of_sample_start'],
+            window['out_of_sample_end']
+        )
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+class WalkForwardAnalysis:
+    """Run walk-forward analysis over rolling or anchored windows."""
+    
+    def __init__(
+        self,
+        algorithm: Dict[str, Any],
+        data: pd.DataFrame,
+        start_date: str,
+        end_date: str,
+        in_sample_size: int,
+        out_of_sample_size: int,
+        anchored: bool = False,
+        initial_capital: float = 100000.0,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initialize walk-forward analysis.
+        
+        Args:
+            algorithm: Base algorithm definition
+            data: DataFrame with OHLCV data
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            in_sample_size: Bars per in-sample range
+            out_of_sample_size: Bars per out-of-sample range
+            anchored: Grow the in-sample range from the first bar instead of rolling it
+            initial_capital: Initial capital for backtesting
+            max_workers: Number of worker processes (default: CPU count, 1 runs in-process)
+        """
+        self.algorithm = algorithm
+        self.data = data
+        self.start_date = start_date
+        self.end_date = end_date
+        self.in_sample_size = in_sample_size
+        self.out_of_sample_size = out_of_sample_size
+        self.anchored = anchored
+        self.initial_capital = initial_capital
+        self.max_workers = max_workers
+    
+    def run(
+        self,
+        parameter_grid: Dict[str, List[Any]],
+        rank_by: str = 'sharpe_ratio',
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        control: Optional[JobControl] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the walk-forward analysis.
+        
+        With control, each finished window is saved and windows saved by an
+        earlier run of the job are not run again; the job is checked for
+        cancellation as windows finish.
+        
+        Args:
+            parameter_grid: Dict of dotted paths to candidate values
+            rank_by: Performance metric used to pick in-sample winners (default: 'sharpe_ratio')
+            progress_callback: Called with (completed, total) as windows finish (optional)
+            control: Cancellation and checkpoints of the analysis's job (optional)
+        
+        Returns:
+            Dict with 'windows' (per-window parameters and results) and the stitched
+            out-of-sample 'trades', 'performance' and 'equity_curve'
+        
+        Raises:
+            JobCancelled: If the job was cancelled before the last window finished
+        """
+        combinations = expand_grid(parameter_grid)
+        
+        # Filter once and compute every indicator any combination needs for the whole series
+        filtered_data, indicator_cache = prepare_shared_inputs(
+            [apply_parameters(self.algorithm, parameters) for parameters in combinations],
+            self.data,
+            self.start_date,
+            self.end_date
+        )
+        windows = build_windows(
+            len(filtered_data),
+            self.in_sample_size,
+            self.out_of_sample_size,
+            self.anchored
+        )
+        initargs = (
+            self.algorithm,
+            combinations,
+            indicator_cache,
+            self.initial_capital,
+            rank_by
+        )
+        
+        total = len(windows)
+        checkpoints = control.load_checkpoints() if control else {}
+        window_results = [
+            checkpoints[window['window_index']]
+            for window in windows
+            if window['window_index'] in checkpoints
+        ]
+        remaining = [window for window in windows if window['window_index'] not in checkpoints]
+        if window_results and progress_callback:
+            progress_callback(len(window_results), total)
+        
+        def finish_window(result: Dict[str, Any]):
+            window_results.append(result)
+            if control:
+                control.save_checkpoint(result['window_index'], result)
+            if progress_callback:
+                progress_callback(len(window_results), total)
+        
+        if self.max_workers == 1 or len(remaining) <= 1:
+            _init_worker(*initargs)
+            for window in remaining:
+                if control:
+                    control.check_cancelled()
+                finish_window(_run_window(window))
+        elif remaining:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=initargs
+            ) as executor:
+                futures = [executor.submit(_run_window, window) for window in remaining]
+                try:
+                    for future in as_completed(futures):
+                        finish_window(future.result())
+                        if control and len(window_results) < total:
+                            control.check_cancelled()
+                except BaseException:
+                    # Drop the windows that have not started
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+        
+        window_results.sort(key=lambda result: result['window_index'])
+        combined = self.combine_out_of_sample(window_results)
+        combined['windows'] = window_results
+        return combined
+    
+    def combine_out_of_sample(self, window_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Stitch the out-of-sample results of every window into one backtest result.
+        
+        Each window starts from initial_capital, so equity is chained by adding
+        the profit carried over from earlier windows.
+        
+        Args:
+            window_results: Window results in window order
+        
+        Returns:
+            Dict with 'trades', 'performance' and 'equity_curve'
+        """
+        trades = []
+        equity_curve = []
+        exposed_bars = 0.0
+        carried_profit = 0.0
+        for result in window_results:
+            out_of_sample = result.get('out_of_sample')
+            if not out_of_sample:
+                continue
+            trades.extend(out_of_sample['trades'])
+            exposure = (out_of_sample.get('performance') or {}).get('exposure', 0.0)
+            exposed_bars += exposure * len(out_of_sample['equity_curve'])
+            equity = np.array([point['equity'] for point in out_of_sample['equity_curve']])
+            equity = equity + carried_profit
+            equity_curve.extend(
+                {'date': point['date'], 'equity': value}
+                for point, value in zip(out_of_sample['equity_curve'], np.round(equity, 2).tolist())
+            )
+            if len(equity) > 0:
+                carried_profit = float(equity[-1]) - self.initial_capital
+        
+        performance_calculator = PerformanceCalculator(self.initial_capital)
+        equity = np.array([point['equity'] for point in equity_curve])
+        performance = performance_calculator.calculate_performance(trades, equity)
+        if len(equity) > 1:
+            # Exposure of the windows weighted by their number of bars
+            performance['exposure'] = round(exposed_bars / len(equity), 2)
+        return {
+            'trades': trades,
+            'performance': performance,
+            'equity_curve': equity_curve
+        }
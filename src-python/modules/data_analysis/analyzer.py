@@ -8,25 +8,48 @@ Related Documentation:
 import sqlite3
 import json
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+from modules.data_analysis.indicator_engine import DEFAULT_ENGINE_INDICATORS, IndicatorEngine, parse_indicator_name
+from modules.data_analysis.indicator_store import IndicatorStore
 from modules.data_analysis.technical_indicators import TechnicalIndicators
 from modules.data_analysis.trend_analyzer import TrendAnalyzer
 from modules.data_analysis.statistics import StatisticsCalculator
 
+INSERT_RESULT_SQL = """
+    INSERT INTO analysis_results (job_id, data_set_id, analysis_summary, technical_indicators, statistics, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def get_result_row(job_id: str, data_set_id: int, results: Dict) -> Tuple:
+    """Get the INSERT_RESULT_SQL parameters of an analysis result."""
+    return (
+        job_id,
+        data_set_id,
+        json.dumps(results['analysis_summary']),
+        json.dumps(results['technical_indicators']),
+        json.dumps(results['statistics']),
+        datetime.now().isoformat()
+    )
+
 
 class DataAnalyzer:
     """Main data analyzer that orchestrates all analysis components."""
     
-    def __init__(self, conn: Optional[sqlite3.Connection] = None):
+    def __init__(self, conn: Optional[sqlite3.Connection] = None, indicators: Optional[List[str]] = None):
         """
         Initialize DataAnalyzer.
         
         Args:
             conn: Database connection (optional, will create new if not provided)
+            indicators: IndicatorEngine names to report besides RSI and MACD
+                (default: DEFAULT_ENGINE_INDICATORS)
         """
         self.conn = conn
+        self.indicators = DEFAULT_ENGINE_INDICATORS if indicators is None else indicators
         self.technical_indicators = TechnicalIndicators()
         self.trend_analyzer = TrendAnalyzer()
         self.statistics_calculator = StatisticsCalculator()
@@ -46,59 +69,14 @@ class DataAnalyzer:
             # Update job status to running
             self._update_job_status(job_id, 'running', 0.1, 'Loading data...')
             
-            # Load OHLCV data
-            data = self._load_ohlcv_data(data_set_id)
-            if data is None or len(data) == 0:
+            results = self.analyze(
+                data_set_id,
+                lambda progress, message: self._update_job_status(job_id, 'running', progress, message)
+            )
+            if results is None:
                 self._update_job_status(job_id, 'failed', 0.0, 'No data found')
                 return {'success': False, 'error': f'No data found for data set {data_set_id}'}
             
-            self._update_job_status(job_id, 'running', 0.3, 'Calculating technical indicators...')
-            
-            # Calculate technical indicators
-            rsi = self.technical_indicators.calculate_rsi(data)
-            macd = self.technical_indicators.calculate_macd(data)
-            
-            technical_indicators = {}
-            if rsi:
-                technical_indicators['rsi'] = rsi
-            if macd:
-                technical_indicators['macd'] = macd
-            
-            self._update_job_status(job_id, 'running', 0.6, 'Analyzing trends...')
-            
-            # Analyze trends
-            trend_analysis = self.trend_analyzer.analyze_trend(data)
-            if not trend_analysis:
-                trend_analysis = {
-                    'trend_direction': 'sideways',
-                    'volatility_level': 'medium',
-                    'dominant_patterns': []
-                }
-            
-            self._update_job_status(job_id, 'running', 0.8, 'Calculating statistics...')
-            
-            # Calculate statistics
-            statistics = self.statistics_calculator.calculate(data)
-            if not statistics:
-                statistics = {
-                    'price_range': {'min': 0, 'max': 0, 'current': 0},
-                    'volume_average': 0,
-                    'price_change_percent': 0
-                }
-            
-            # Structure results
-            analysis_summary = {
-                'trend_direction': trend_analysis['trend_direction'],
-                'volatility_level': trend_analysis['volatility_level'],
-                'dominant_patterns': trend_analysis['dominant_patterns']
-            }
-            
-            results = {
-                'analysis_summary': analysis_summary,
-                'technical_indicators': technical_indicators,
-                'statistics': statistics
-            }
-            
             self._update_job_status(job_id, 'running', 0.9, 'Saving results...')
             
             # Save results to database
@@ -119,6 +97,82 @@ class DataAnalyzer:
                 'error': str(e)
             }
     
+    def analyze(
+        self,
+        data_set_id: int,
+        progress_callback: Optional[Callable[[float, str], None]] = None
+    ) -> Optional[Dict]:
+        """
+        Analyze a data set without touching job records.
+        
+        Args:
+            data_set_id: Data set ID to analyze
+            progress_callback: Called with (progress, message) before each stage (optional)
+        
+        Returns:
+            Dict with 'analysis_summary', 'technical_indicators' and 'statistics',
+            or None if the data set has no data
+        """
+        # Load OHLCV data
+        data = self._load_ohlcv_data(data_set_id)
+        if data is None or len(data) == 0:
+            return None
+        
+        if progress_callback:
+            progress_callback(0.3, 'Calculating technical indicators...')
+        
+        # Read the stored indicators, calculating them if the store lags behind the bars
+        stored = self._load_stored_indicators(data_set_id, data)
+        if stored is not None:
+            rsi, macd = stored
+        else:
+            rsi = self.technical_indicators.calculate_rsi(data)
+            macd = self.technical_indicators.calculate_macd(data)
+        
+        technical_indicators = {}
+        if rsi:
+            technical_indicators['rsi'] = rsi
+        if macd:
+            technical_indicators['macd'] = macd
+        technical_indicators.update(self._calculate_engine_indicators(data))
+        
+        if progress_callback:
+            progress_callback(0.6, 'Analyzing trends...')
+        
+        # Analyze trends
+        trend_analysis = self.trend_analyzer.analyze_trend(data)
+        if not trend_analysis:
+            trend_analysis = {
+                'trend_direction': 'sideways',
+                'volatility_level': 'medium',
+                'dominant_patterns': []
+            }
+        
+        if progress_callback:
+            progress_callback(0.8, 'Calculating statistics...')
+        
+        # Calculate statistics
+        statistics = self.statistics_calculator.calculate(data)
+        if not statistics:
+            statistics = {
+                'price_range': {'min': 0, 'max': 0, 'current': 0},
+                'volume_average': 0,
+                'price_change_percent': 0
+            }
+        
+        # Structure results
+        analysis_summary = {
+            'trend_direction': trend_analysis['trend_direction'],
+            'volatility_level': trend_analysis['volatility_level'],
+            'dominant_patterns': trend_analysis['dominant_patterns']
+        }
+        
+        return {
+            'analysis_summary': analysis_summary,
+            'technical_indicators': technical_indicators,
+            'statistics': statistics
+        }
+    
     def _load_ohlcv_data(self, data_set_id: int) -> Optional[pd.DataFrame]:
         """Load OHLCV data from database."""
         if not self.conn:
@@ -140,6 +194,91 @@ class DataAnalyzer:
         data = pd.DataFrame(rows, columns=['date', 'open', 'high', 'low', 'close', 'volume'])
         return data
     
+    def _load_stored_indicators(
+        self,
+        data_set_id: int,
+        data: pd.DataFrame
+    ) -> Optional[Tuple[Optional[Dict], Optional[Dict]]]:
+        """
+        Get the RSI and MACD of the last bar from indicator_values.
+        
+        Args:
+            data_set_id: Data set ID
+            data: OHLCV data of the data set
+        
+        Returns:
+            Tuple of (RSI, MACD) as returned by calculate_rsi and calculate_macd,
+            or None if the stored columns do not cover every bar of data
+        """
+        stored = IndicatorStore(self.conn).load(data_set_id, [
+            'rsi_14',
+            'macd_12_26_9.macd',
+            'macd_12_26_9.signal',
+            'macd_12_26_9.histogram'
+        ])
+        if stored is None or len(stored) != len(data):
+            return None
+        if stored['date'].iloc[-1] != pd.Timestamp(data['date'].iloc[-1]):
+            return None
+        
+        last = stored.iloc[-1]
+        rsi = None
+        if not np.isnan(last['rsi_14']):
+            rsi = {
+                'value': float(last['rsi_14']),
+                'period': 14,
+                'signal': self.technical_indicators.get_rsi_signal(last['rsi_14'])
+            }
+        macd = None
+        if not np.isnan(last['macd_12_26_9.macd']):
+            macd = {
+                'macd': float(last['macd_12_26_9.macd']),
+                'signal': float(last['macd_12_26_9.signal']),
+                'histogram': float(last['macd_12_26_9.histogram']),
+                'signal_type': self.technical_indicators.get_macd_signal_type(
+                    last['macd_12_26_9.macd'], last['macd_12_26_9.signal']
+                )
+            }
+        return rsi, macd
+    
+    def _calculate_engine_indicators(self, data: pd.DataFrame) -> Dict:
+        """
+        Get the last-bar values of the configured indicators from one batched pass.
+        
+        SMA and EMA are lists with one entry per period; every other type reports
+        its first configured period. Indicators without a value yet are omitted.
+        
+        Args:
+            data: OHLCV data
+        
+        Returns:
+            Dict of 'sma', 'ema', 'bollinger_bands', 'atr', 'stochastic', 'obv', 'vwap' and 'adx' results
+        """
+        arrays = IndicatorEngine(data).compute(self.indicators)
+        results: Dict = {}
+        for name in self.indicators:
+            parsed = parse_indicator_name(name)
+            if parsed is None or parsed[2] is not None:
+                continue
+            indicator_type, period, _ = parsed
+            values = {}
+            for key, array in arrays.items():
+                if key == name:
+                    values['value'] = float(array[-1])
+                elif key.startswith(f'{name}.'):
+                    values[key[len(name) + 1:]] = float(array[-1])
+            if not values or any(np.isnan(value) for value in values.values()):
+                continue
+            result = {key: round(value, 4) for key, value in values.items()}
+            if period is not None:
+                result['period'] = period
+            
+            if indicator_type in ('sma', 'ema'):
+                results.setdefault(indicator_type, []).append(result)
+            else:
+                results.setdefault('bollinger_bands' if indicator_type == 'bollinger' else indicator_type, result)
+        return results
+    
     def _update_job_status(self, job_id: str, status: str, progress: float, message: str, completed: bool = False):
         """Update analysis job status."""
         if not self.conn:
@@ -170,17 +309,7 @@ class DataAnalyzer:
             self.conn = get_connection()
         
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO analysis_results (job_id, data_set_id, analysis_summary, technical_indicators, statistics, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            job_id,
-            data_set_id,
-            json.dumps(results['analysis_summary']),
-            json.dumps(results['technical_indicators']),
-            json.dumps(results['statistics']),
-            datetime.now().isoformat()
-        ))
+        cursor.execute(INSERT_RESULT_SQL, get_result_row(job_id, data_set_id, results))
         
         self.conn.commit()
 
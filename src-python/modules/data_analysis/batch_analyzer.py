@@ -0,0 +1,213 @@
+"""
+Multi-data-set analysis.
+
+Analyzes many data sets in a process pool. Each data set keeps its own
+analysis_jobs row, so status and results are read as for single analyses,
+but workers only compute: the parent writes finished results and job
+statuses in batches, one transaction per batch, instead of committing
+every stage of every job.
+
+Related Documentation:
+  ├─ Spec: src-python/modules/data_analysis/analyzer.spec.md
+  └─ Plan: docs/03_plans/data-analysis/README.md
+"""
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from database.connection import get_connection
+from modules.data_analysis.analyzer import INSERT_RESULT_SQL, DataAnalyzer, get_result_row
+
+RUNNER_SCRIPT = Path(__file__).parent.parent.parent / 'scripts' / 'analyze_many.py'
+
+# Per-process analyzer set once by the pool initializer, so each worker opens one connection
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(indicators: Optional[List[str]]):
+    """Create the analyzer of a worker process."""
+    _worker_state['analyzer'] = DataAnalyzer(get_connection(), indicators)
+
+
+def _analyze(job: Tuple[str, int]) -> Dict[str, Any]:
+    """Analyze one data set, returning its results or error instead of raising."""
+    job_id, data_set_id = job
+    try:
+        results = _worker_state['analyzer'].analyze(data_set_id)
+    except Exception as e:
+        return {'job_id': job_id, 'data_set_id': data_set_id, 'error': f'Analysis failed: {str(e)}'}
+    if results is None:
+        return {'job_id': job_id, 'data_set_id': data_set_id, 'error': 'No data found'}
+    return {'job_id': job_id, 'data_set_id': data_set_id, 'results': results}
+
+
+def start_batch_process(jobs: List[Tuple[str, int]], max_workers: Optional[int] = None) -> subprocess.Popen:
+    """
+    Start scripts/analyze_many.py detached from the calling process to run created jobs.
+    
+    Args:
+        jobs: List of (job_id, data_set_id) from BatchAnalyzer.create_jobs
+        max_workers: Number of worker processes (default: CPU count)
+    
+    Returns:
+        Handle of the started process
+    """
+    if os.name == 'nt':
+        options = {'creationflags': subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        options = {'start_new_session': True}
+    process = subprocess.Popen(
+        [sys.executable, str(RUNNER_SCRIPT), '--run'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        **options
+    )
+    process.stdin.write(json.dumps({'jobs': jobs, 'max_workers': max_workers}).encode('utf-8'))
+    process.stdin.close()
+    return process
+
+
+class BatchAnalyzer:
+    """Analyze many data sets in worker processes with batched database writes."""
+    
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        max_workers: Optional[int] = None,
+        write_batch_size: int = 50,
+        write_interval: float = 2.0,
+        indicators: Optional[List[str]] = None
+    ):
+        """
+        Initialize batch analyzer.
+        
+        Args:
+            conn: Database connection the results are written with
+            max_workers: Number of worker processes (default: CPU count, 1 runs in-process)
+            write_batch_size: Finished jobs written per transaction
+            write_interval: Seconds after which finished jobs are written even if the batch is not full
+            indicators: IndicatorEngine names passed to DataAnalyzer (optional)
+        """
+        self.conn = conn
+        self.max_workers = max_workers
+        self.write_batch_size = max(1, write_batch_size)
+        self.write_interval = write_interval
+        self.indicators = indicators
+    
+    def create_jobs(self, data_set_ids: List[int]) -> List[Tuple[str, int]]:
+        """
+        Create one pending analysis job per data set in a single transaction.
+        
+        Args:
+            data_set_ids: Data set IDs to analyze
+        
+        Returns:
+            List of (job_id, data_set_id)
+        """
+        jobs = [(str(uuid.uuid4()), data_set_id) for data_set_id in data_set_ids]
+        created_at = datetime.now().isoformat()
+        self.conn.executemany("""
+            INSERT INTO analysis_jobs (job_id, data_set_id, status, progress, message, created_at)
+            VALUES (?, ?, 'pending', 0.0, 'Analysis job created', ?)
+        """, [(job_id, data_set_id, created_at) for job_id, data_set_id in jobs])
+        self.conn.commit()
+        return jobs
+    
+    def run(self, jobs: List[Tuple[str, int]]) -> Dict[str, int]:
+        """
+        Run created jobs and write their results.
+        
+        Args:
+            jobs: List of (job_id, data_set_id) from create_jobs
+        
+        Returns:
+            Dict with the number of 'completed' and 'failed' jobs
+        """
+        counts = {'completed': 0, 'failed': 0}
+        if not jobs:
+            return counts
+        self.conn.executemany("""
+            UPDATE analysis_jobs
+            SET status = 'running', progress = 0.1, message = 'Analyzing...'
+            WHERE job_id = ?
+        """, [(job_id,) for job_id, _ in jobs])
+        self.conn.commit()
+        
+        finished: List[Dict[str, Any]] = []
+        last_write = time.monotonic()
+        
+        def finish_job(outcome: Dict[str, Any]):
+            nonlocal last_write
+            finished.append(outcome)
+            counts['failed' if 'error' in outcome else 'completed'] += 1
+            if len(finished) >= self.write_batch_size or time.monotonic() - last_write >= self.write_interval:
+                self._write(finished)
+                finished.clear()
+                last_write = time.monotonic()
+        
+        try:
+            if self.max_workers == 1 or len(jobs) <= 1:
+                _init_worker(self.indicators)
+                for job in jobs:
+                    finish_job(_analyze(job))
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.indicators,)
+                ) as executor:
+                    futures = [executor.submit(_analyze, job) for job in jobs]
+                    for future in as_completed(futures):
+                        finish_job(future.result())
+        except BaseException as e:
+            # Jobs without an outcome would stay 'running' forever
+            self._write(finished)
+            finished.clear()
+            self._fail_unfinished(jobs, f'Analysis failed: {str(e)}')
+            raise
+        self._write(finished)
+        return counts
+    
+    def _write(self, outcomes: List[Dict[str, Any]]):
+        """Write results and final job statuses of finished jobs in one transaction."""
+        if not outcomes:
+            return
+        completed_at = datetime.now().isoformat()
+        succeeded = [outcome for outcome in outcomes if 'error' not in outcome]
+        failed = [outcome for outcome in outcomes if 'error' in outcome]
+        
+        cursor = self.conn.cursor()
+        cursor.executemany(INSERT_RESULT_SQL, [
+            get_result_row(outcome['job_id'], outcome['data_set_id'], outcome['results'])
+            for outcome in succeeded
+        ])
+        cursor.executemany("""
+            UPDATE analysis_jobs
+            SET status = 'completed', progress = 1.0, message = 'Analysis completed', completed_at = ?
+            WHERE job_id = ?
+        """, [(completed_at, outcome['job_id']) for outcome in succeeded])
+        cursor.executemany("""
+            UPDATE analysis_jobs
+            SET status = 'failed', progress = 0.0, message = ?, error = ?, completed_at = ?
+            WHERE job_id = ?
+        """, [(outcome['error'], outcome['error'], completed_at, outcome['job_id']) for outcome in failed])
+        self.conn.commit()
+    
+    def _fail_unfinished(self, jobs: List[Tuple[str, int]], error: str):
+        """Mark jobs still pending or running as failed."""
+        self.conn.executemany("""
+            UPDATE analysis_jobs
+            SET status = 'failed', progress = 0.0, message = ?, error = ?, completed_at = ?
+            WHERE job_id = ? AND status IN ('pending', 'running')
+        """, [(error, error, datetime.now().isoformat(), job_id) for job_id, _ in jobs])
+        self.conn.commit()
@@ -0,0 +1,333 @@
+"""
+Batched indicator engine.
+
+Computes a configurable set of indicators over one OHLCV series in a single
+pass: intermediate arrays (moving averages, EMAs, true range, Wilder
+averages, rolling extremes, close-to-close changes) are computed once and
+shared, so e.g. Bollinger Bands reuse the SMA of the same period and ADX
+reuses the ATR's true range and Wilder smoothing.
+
+Indicator names carry their period, and a field for indicators with several
+values:
+
+  sma_<period>, ema_<period>, atr_<period>, vwap_<period>, obv,
+  bollinger_<period>.<upper|middle|lower|percent_b>  (2 standard deviations),
+  stochastic_<period>.<k|d>                          (%D over 3 bars),
+  adx_<period>.<adx|plus_di|minus_di>
+
+A multi-value name without a field selects its DEFAULT_FIELDS entry in get
+and every field in compute. Arrays have one value per bar, NaN until the
+indicator has enough bars. SMA, EMA, Bollinger and ATR equal the streaming
+indicators of the same parameters bit for bit; SMA and Bollinger use the
+window-only utils.rolling.window_mean and window_std for that.
+
+Related Documentation:
+  ├─ Spec: src-python/modules/data_analysis/analyzer.spec.md
+  └─ Plan: docs/03_plans/data-analysis/README.md
+"""
+from typing import Dict, Any, Optional, Iterable, Tuple
+import numpy as np
+import pandas as pd
+
+from utils.rolling import rolling_max, rolling_mean, rolling_min, rolling_sum, window_mean, window_std
+
+
+# Fields of indicators with several values, and the field a trigger compares by default
+INDICATOR_FIELDS = {
+    'bollinger': ('upper', 'middle', 'lower', 'percent_b'),
+    'stochastic': ('k', 'd'),
+    'adx': ('adx', 'plus_di', 'minus_di')
+}
+DEFAULT_FIELDS = {
+    'bollinger': 'percent_b',
+    'stochastic': 'k',
+    'adx': 'adx'
+}
+
+BOLLINGER_NUM_STD = 2.0
+STOCHASTIC_D_PERIOD = 3
+
+# Indicators computed by default (e.g. for data analysis)
+DEFAULT_ENGINE_INDICATORS = [
+    'sma_20',
+    'sma_50',
+    'sma_200',
+    'ema_12',
+    'ema_26',
+    'bollinger_20',
+    'atr_14',
+    'stochastic_14',
+    'obv',
+    'vwap_20',
+    'adx_14'
+]
+
+
+def parse_indicator_name(name: str) -> Optional[Tuple[str, Optional[int], Optional[str]]]:
+    """
+    Split an indicator name into its type, period and field.
+    
+    Args:
+        name: Indicator name (e.g. 'sma_20', 'adx_14.plus_di', 'obv')
+    
+    Returns:
+        Tuple of (type, period or None, field or None), or None if the name is
+        not an engine indicator
+    """
+    base, _, field = name.partition('.')
+    indicator_type, _, period_text = base.rpartition('_')
+    if base == 'obv':
+        return ('obv', None, None) if not field else None
+    if indicator_type not in ('sma', 'ema', 'atr', 'vwap', 'bollinger', 'stochastic', 'adx'):
+        return None
+    try:
+        period = int(period_text)
+    except ValueError:
+        return None
+    if period < 1:
+        return None
+    if field and field not in INDICATOR_FIELDS.get(indicator_type, ()):
+        return None
+    return indicator_type, period, field or None
+
+
+class IndicatorEngine:
+    """Compute indicators over one OHLCV series, sharing intermediate arrays."""
+    
+    def __init__(self, data: pd.DataFrame):
+        """
+        Initialize indicator engine.
+        
+        Args:
+            data: DataFrame with 'high', 'low', 'close' and 'volume' columns
+        """
+        self.close = data['close'].to_numpy(dtype=np.float64)
+        self.high = data['high'].to_numpy(dtype=np.float64)
+        self.low = data['low'].to_numpy(dtype=np.float64)
+        self.volume = data['volume'].to_numpy(dtype=np.float64)
+        self._intermediates: Dict[Tuple[Any, ...], Any] = {}
+    
+    def __len__(self) -> int:
+        """Number of bars."""
+        return len(self.close)
+    
+    def get(self, name: str) -> Optional[np.ndarray]:
+        """
+        Get one indicator array.
+        
+        Args:
+            name: Indicator name (a multi-value name without a field selects its default field)
+        
+        Returns:
+            Array with one value per bar or None for unknown indicators
+        """
+        parsed = parse_indicator_name(name)
+        if parsed is None:
+            return None
+        indicator_type, period, field = parsed
+        values = self._compute(indicator_type, period)
+        if isinstance(values, dict):
+            return values[field or DEFAULT_FIELDS[indicator_type]]
+        return values
+    
+    def compute(self, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Compute several indicators.
+        
+        Args:
+            names: Indicator names (a multi-value name without a field gives every field)
+        
+        Returns:
+            Dict of indicator name (with '.field' for multi-value indicators) to array;
+            unknown names are omitted
+        """
+        arrays = {}
+        for name in names:
+            parsed = parse_indicator_name(name)
+            if parsed is None:
+                continue
+            indicator_type, period, field = parsed
+            values = self._compute(indicator_type, period)
+            if not isinstance(values, dict):
+                arrays[name] = values
+            elif field:
+                arrays[name] = values[field]
+            else:
+                for field_name, array in values.items():
+                    arrays[f"{name}.{field_name}"] = array
+        return arrays
+    
+    @staticmethod
+    def get_lookback(name: str) -> Optional[int]:
+        """
+        Get the number of bars an indicator needs before its first value.
+        
+        Args:
+            name: Indicator name
+        
+        Returns:
+            Number of bars or None for unknown indicators
+        """
+        parsed = parse_indicator_name(name)
+        if parsed is None:
+            return None
+        indicator_type, period, field = parsed
+        if indicator_type == 'obv':
+            return 0
+        if indicator_type == 'stochastic' and field == 'd':
+            return period - 1 + STOCHASTIC_D_PERIOD - 1
+        if indicator_type == 'adx' and (field or DEFAULT_FIELDS['adx']) == 'adx':
+            return 2 * period - 2  # DI values, then a Wilder average of DX
+        return period - 1
+    
+    def _compute(self, indicator_type: str, period: Optional[int]) -> Any:
+        """Compute an indicator (an array, or a dict of arrays per field)."""
+        if indicator_type == 'sma':
+            return self._sma(period)
+        if indicator_type == 'ema':
+            return self._ema(period)
+        if indicator_type == 'atr':
+            return self._atr(period)
+        if indicator_type == 'vwap':
+            return self._vwap(period)
+        if indicator_type == 'obv':
+            return self._obv()
+        if indicator_type == 'bollinger':
+            return self._bollinger(period)
+        if indicator_type == 'stochastic':
+            return self._stochastic(period)
+        return self._adx(period)
+    
+    def _pad(self, values: np.ndarray) -> np.ndarray:
+        """Left-pad values of complete windows with NaN to one value per bar."""
+        padded = np.full(len(self), np.nan)
+        if len(values):
+            padded[len(self) - len(values):] = values
+        return padded
+    
+    def _sma(self, period: int) -> np.ndarray:
+        key = ('sma', period)
+        if key not in self._intermediates:
+            self._intermediates[key] = self._pad(window_mean(self.close, period))
+        return self._intermediates[key]
+    
+    def _ema(self, period: int) -> np.ndarray:
+        """EMA of closes seeded with the first close, reported from the period-th bar."""
+        key = ('ema', period)
+        if key not in self._intermediates:
+            ema = np.full(len(self), np.nan)
+            multiplier = 2 / (period + 1)
+            previous = None
+            # Recurse on Python floats; indexing NumPy scalars dominates on long series
+            for i, price in enumerate(self.close.tolist()):
+                previous = price if previous is None else (price * multiplier) + (previous * (1 - multiplier))
+                if i >= period - 1:
+                    ema[i] = previous
+            self._intermediates[key] = ema
+        return self._intermediates[key]
+    
+    def _wilder(self, values: np.ndarray, period: int, start: int = 0) -> np.ndarray:
+        """Wilder average: the mean of the first period values from start, then (prev * (p - 1) + x) / p."""
+        smoothed = np.full(len(values), np.nan)
+        first = start + period - 1
+        if first >= len(values):
+            return smoothed
+        average = float(np.mean(values[start:first + 1]))
+        smoothed[first] = average
+        for i, value in enumerate(values[first + 1:].tolist(), start=first + 1):
+            average = (average * (period - 1) + value) / period
+            smoothed[i] = average
+        return smoothed
+    
+    def _true_range(self) -> np.ndarray:
+        """True range; the first bar, with no previous close, uses high - low."""
+        key = ('true_range',)
+        if key not in self._intermediates:
+            previous_close = np.concatenate(([np.nan], self.close[:-1]))
+            high_low = self.high - self.low
+            self._intermediates[key] = np.fmax(
+                high_low,
+                np.fmax(np.abs(self.high - previous_close), np.abs(self.low - previous_close))
+            )
+        return self._intermediates[key]
+    
+    def _atr(self, period: int) -> np.ndarray:
+        key = ('atr', period)
+        if key not in self._intermediates:
+            self._intermediates[key] = self._wilder(self._true_range(), period)
+        return self._intermediates[key]
+    
+    def _close_change(self) -> np.ndarray:
+        """Close-to-close change, 0 for the first bar."""
+        key = ('close_change',)
+        if key not in self._intermediates:
+            self._intermediates[key] = np.diff(self.close, prepend=self.close[:1])
+        return self._intermediates[key]
+    
+    def _obv(self) -> np.ndarray:
+        key = ('obv',)
+        if key not in self._intermediates:
+            self._intermediates[key] = np.cumsum(np.sign(self._close_change()) * self.volume)
+        return self._intermediates[key]
+    
+    def _vwap(self, period: int) -> np.ndarray:
+        """Volume-weighted typical price over the last period bars."""
+        key = ('vwap', period)
+        if key not in self._intermediates:
+            typical_price = (self.high + self.low + self.close) / 3
+            volume = rolling_sum(self.volume, period)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                vwap = np.where(volume > 0, rolling_sum(typical_price * self.volume, period) / volume, np.nan)
+            self._intermediates[key] = self._pad(vwap)
+        return self._intermediates[key]
+    
+    def _bollinger(self, period: int) -> Dict[str, np.ndarray]:
+        """Bollinger Bands around the SMA with population standard deviations."""
+        key = ('bollinger', period)
+        if key not in self._intermediates:
+            middle = self._sma(period)
+            width = BOLLINGER_NUM_STD * self._pad(window_std(self.close, period))
+            upper = middle + width
+            lower = middle - width
+            # A flat window has no band; its close sits in the middle
+            with np.errstate(divide='ignore', invalid='ignore'):
+                percent_b = np.where(width > 0, (self.close - lower) / (upper - lower), 0.5)
+            percent_b[np.isnan(middle)] = np.nan
+            self._intermediates[key] = {'upper': upper, 'middle': middle, 'lower': lower, 'percent_b': percent_b}
+        return self._intermediates[key]
+    
+    def _stochastic(self, period: int) -> Dict[str, np.ndarray]:
+        """Stochastic oscillator %K over period bars and its %D average."""
+        key = ('stochastic', period)
+        if key not in self._intermediates:
+            lowest = self._pad(rolling_min(self.low, period))
+            highest = self._pad(rolling_max(self.high, period))
+            price_range = highest - lowest
+            # A flat range puts the close in the middle
+            with np.errstate(divide='ignore', invalid='ignore'):
+                k = np.where(price_range > 0, 100 * (self.close - lowest) / price_range, 50.0)
+            k[np.isnan(lowest)] = np.nan
+            d = self._pad(rolling_mean(k[period - 1:], STOCHASTIC_D_PERIOD))
+            self._intermediates[key] = {'k': k, 'd': d}
+        return self._intermediates[key]
+    
+    def _adx(self, period: int) -> Dict[str, np.ndarray]:
+        """Average directional index with the directional indicators, sharing the ATR."""
+        key = ('adx', period)
+        if key not in self._intermediates:
+            up_move = np.diff(self.high, prepend=self.high[:1])
+            down_move = -np.diff(self.low, prepend=self.low[:1])
+            plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+            minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+            
+            atr = self._atr(period)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                plus_di = np.where(atr > 0, 100 * self._wilder(plus_dm, period) / atr, 0.0)
+                minus_di = np.where(atr > 0, 100 * self._wilder(minus_dm, period) / atr, 0.0)
+                di_sum = plus_di + minus_di
+                dx = np.where(di_sum > 0, 100 * np.abs(plus_di - minus_di) / di_sum, 0.0)
+            plus_di[np.isnan(atr)] = np.nan
+            minus_di[np.isnan(atr)] = np.nan
+            adx = self._wilder(dx, period, start=period - 1)
+            self._intermediates[key] = {'adx': adx, 'plus_di': plus_di, 'minus_di': minus_di}
+        return self._intermediates[key]
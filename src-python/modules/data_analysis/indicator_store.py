@@ -0,0 +1,204 @@
+"""
+Materialized indicator values.
+
+The streaming indicators of every data set are stored per bar in
+indicator_values, so analysis and backtests read precomputed columns instead
+of recomputing indicators from ohlcv_data. Each row holds one column of one
+data set: the bar dates as compressed second deltas and the values as
+compressed float64 (NaN while the indicator warms up). Indicators returning
+several values get one column per field (e.g. 'macd_12_26_9.signal').
+
+Columns are extended from the states in indicator_states as new bars land;
+a data set whose columns and states disagree (e.g. after an interrupted
+update) is rebuilt from its first bar.
+
+Related Documentation:
+  ├─ Spec: src-python/modules/data_analysis/analyzer.spec.md
+  └─ Plan: docs/03_plans/data-analysis/README.md
+"""
+import sqlite3
+import json
+import zlib
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from modules.data_analysis.streaming_indicators import (
+    DEFAULT_STREAMING_INDICATORS,
+    advance_indicator_states,
+    create_streaming_indicator
+)
+
+
+def _encode_column(dates: np.ndarray, values: np.ndarray) -> Tuple[bytes, bytes]:
+    """Encode datetime64[s] dates and float values as two compressed blobs."""
+    seconds = dates.astype('datetime64[s]').astype(np.int64)
+    deltas = np.diff(seconds, prepend=0).astype('<i8')
+    return (
+        zlib.compress(deltas.tobytes()),
+        zlib.compress(np.asarray(values, dtype='<f8').tobytes())
+    )
+
+
+def _decode_column(dates_blob: bytes, values_blob: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """Decode blobs written by _encode_column into datetime64[s] dates and float64 values."""
+    deltas = np.frombuffer(zlib.decompress(dates_blob), dtype='<i8')
+    dates = np.cumsum(deltas, dtype=np.int64).astype('datetime64[s]')
+    values = np.frombuffer(zlib.decompress(values_blob), dtype='<f8').astype(np.float64)
+    return dates, values
+
+
+class IndicatorStore:
+    """Keep the indicator columns of data sets in sync with their bars."""
+    
+    def __init__(self, conn: sqlite3.Connection, specs: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize indicator store.
+        
+        Args:
+            conn: Database connection
+            specs: Indicators to store (default: DEFAULT_STREAMING_INDICATORS)
+        """
+        self.conn = conn
+        self.specs = specs or DEFAULT_STREAMING_INDICATORS
+        
+        # Column names of each indicator key
+        self.columns: Dict[str, List[str]] = {}
+        self.params: Dict[str, Dict[str, Any]] = {}
+        for spec in self.specs:
+            indicator = create_streaming_indicator(spec)
+            if indicator.fields:
+                self.columns[indicator.key] = [f"{indicator.key}.{field}" for field in indicator.fields]
+            else:
+                self.columns[indicator.key] = [indicator.key]
+            self.params[indicator.key] = spec
+    
+    def update(self, data_set_id: int, rebuild: bool = False) -> Dict[str, Any]:
+        """
+        Extend the columns of a data set by its bars after their last date.
+        
+        Args:
+            data_set_id: Data set ID
+            rebuild: Recompute every column from the first bar (e.g. after stored
+                bars were corrected)
+        
+        Returns:
+            Dict with the number of bars added ('num_points') and whether the
+            columns were rebuilt ('rebuilt')
+        """
+        cursor = self.conn.cursor()
+        if not rebuild:
+            rebuild = not self._in_sync(cursor, data_set_id)
+        
+        dates: List[str] = []
+        new_values: Dict[str, List[float]] = {
+            column: [] for columns in self.columns.values() for column in columns
+        }
+        
+        def collect(date: str, values: Dict[str, Any]):
+            dates.append(date)
+            for key, columns in self.columns.items():
+                value = values.get(key)
+                if len(columns) == 1:
+                    new_values[columns[0]].append(np.nan if value is None else value)
+                else:
+                    for column in columns:
+                        field = column[len(key) + 1:]
+                        new_values[column].append(np.nan if value is None else value[field])
+        
+        advance_indicator_states(self.conn, data_set_id, self.specs, rebuild=rebuild, on_bar=collect)
+        if not dates and not rebuild:
+            return {'num_points': 0, 'rebuilt': False}
+        
+        existing = {} if rebuild else self._load_rows(cursor, data_set_id)
+        new_dates = pd.to_datetime(pd.Series(dates, dtype=object)).to_numpy().astype('datetime64[s]')
+        updated_at = datetime.now().isoformat()
+        rows = []
+        for key, columns in self.columns.items():
+            for column in columns:
+                column_dates, column_values = new_dates, np.asarray(new_values[column], dtype=np.float64)
+                if column in existing:
+                    column_dates = np.concatenate((existing[column][0], column_dates))
+                    column_values = np.concatenate((existing[column][1], column_values))
+                dates_blob, values_blob = _encode_column(column_dates, column_values)
+                rows.append((
+                    data_set_id,
+                    column,
+                    json.dumps(self.params[key]),
+                    len(column_values),
+                    dates[-1] if dates else None,
+                    dates_blob,
+                    values_blob,
+                    updated_at
+                ))
+        
+        if rebuild:
+            cursor.execute("DELETE FROM indicator_values WHERE data_set_id = ?", (data_set_id,))
+        if dates:
+            cursor.executemany("""
+                INSERT OR REPLACE INTO indicator_values
+                (data_set_id, indicator, params, num_points, last_date, dates, series, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+        self.conn.commit()
+        return {'num_points': len(dates), 'rebuilt': rebuild}
+    
+    def load(self, data_set_id: int, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Load stored columns of a data set.
+        
+        Args:
+            data_set_id: Data set ID
+            columns: Column names (default: every stored column)
+        
+        Returns:
+            DataFrame with 'date' (datetime64) and one column per indicator value,
+            or None if any requested column is not stored
+        """
+        rows = self._load_rows(self.conn.cursor(), data_set_id, columns)
+        if not rows or (columns is not None and len(rows) < len(set(columns))):
+            return None
+        
+        dates = next(iter(rows.values()))[0]
+        if any(len(column_dates) != len(dates) for column_dates, _ in rows.values()):
+            return None
+        frame = {'date': dates.astype('datetime64[ns]')}
+        for column in columns or sorted(rows):
+            frame[column] = rows[column][1]
+        return pd.DataFrame(frame)
+    
+    def _in_sync(self, cursor: sqlite3.Cursor, data_set_id: int) -> bool:
+        """Check every column was extended to the last date of its indicator's state."""
+        cursor.execute("""
+            SELECT indicator, last_date FROM indicator_states WHERE data_set_id = ?
+        """, (data_set_id,))
+        state_dates = {row[0]: row[1] for row in cursor.fetchall()}
+        cursor.execute("""
+            SELECT indicator, last_date FROM indicator_values WHERE data_set_id = ?
+        """, (data_set_id,))
+        column_dates = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        if not state_dates and not column_dates:
+            return True  # Nothing stored yet; every column starts from the first bar
+        for key, columns in self.columns.items():
+            if key not in state_dates:
+                return False
+            if any(column_dates.get(column) != state_dates[key] for column in columns):
+                return False
+        return True
+    
+    def _load_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        data_set_id: int,
+        columns: Optional[List[str]] = None
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Load and decode stored columns as a dict of column name to (dates, values)."""
+        query = "SELECT indicator, dates, series FROM indicator_values WHERE data_set_id = ?"
+        parameters: List[Any] = [data_set_id]
+        if columns is not None:
+            query += f" AND indicator IN ({', '.join('?' * len(columns))})"
+            parameters.extend(columns)
+        cursor.execute(query, parameters)
+        return {row[0]: _decode_column(row[1], row[2]) for row in cursor.fetchall()}
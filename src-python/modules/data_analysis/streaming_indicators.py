@@ -0,0 +1,492 @@
+"""
+Streaming technical indicators.
+
+Each indicator holds its recursion state and advances by one bar in O(1)
+(SMA and Bollinger Bands in O(period)), so scheduled updates and live
+evaluation extend indicators with new bars instead of recomputing the whole
+history. States are plain JSON and are saved per data set in
+indicator_states.
+
+Values match the series of TechnicalIndicators (RSI and MACD rounding
+included) and of IndicatorEngine bit for bit: SMA and Bollinger Bands reduce
+their window every bar as utils.rolling.window_mean and window_std do, so
+stored and computed values are equal whatever bar a series starts at.
+
+Related Documentation:
+  ├─ Spec: src-python/modules/data_analysis/analyzer.spec.md
+  └─ Plan: docs/03_plans/data-analysis/README.md
+"""
+import sqlite3
+import json
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Mapping, Callable, Tuple
+
+import numpy as np
+
+
+# Indicators kept current for every data set by DataUpdater
+DEFAULT_STREAMING_INDICATORS = [
+    {'type': 'rsi', 'period': 14},
+    {'type': 'macd', 'fast_period': 12, 'slow_period': 26, 'signal_period': 9},
+    {'type': 'sma', 'period': 20},
+    {'type': 'sma', 'period': 50},
+    {'type': 'ema', 'period': 20},
+    {'type': 'bollinger', 'period': 20, 'num_std': 2.0},
+    {'type': 'atr', 'period': 14}
+]
+
+
+class StreamingIndicator:
+    """Base class of indicators that advance one bar at a time."""
+    
+    type_name = ''
+    # Names of the values of indicators that return a dict (empty for a single value)
+    fields: Tuple[str, ...] = ()
+    
+    def __init__(self, **params: Any):
+        """
+        Initialize indicator.
+        
+        Args:
+            params: Indicator parameters (e.g. period)
+        """
+        self.params = params
+        self.bars = 0
+        self.value: Any = None
+    
+    @property
+    def key(self) -> str:
+        """Name of the indicator with its parameters (e.g. 'rsi_14', 'bollinger_20_2')."""
+        parts = [self.type_name]
+        for value in self.params.values():
+            parts.append(f"{value:g}" if isinstance(value, float) else str(value))
+        return '_'.join(parts)
+    
+    def update(self, bar: Mapping[str, Any]) -> Any:
+        """
+        Advance the indicator by one bar.
+        
+        Args:
+            bar: Bar with 'close' (and 'high', 'low' for range-based indicators)
+        
+        Returns:
+            Indicator value after the bar (None while warming up)
+        """
+        self.value = self._update(bar)
+        self.bars += 1
+        return self.value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the indicator.
+        
+        Returns:
+            JSON-serializable dict with 'type', 'params', 'bars', 'value' and 'state'
+        """
+        return {
+            'type': self.type_name,
+            'params': dict(self.params),
+            'bars': self.bars,
+            'value': self.value,
+            'state': self._get_state()
+        }
+    
+    def _update(self, bar: Mapping[str, Any]) -> Any:
+        """Advance the recursion by one bar and return the new value."""
+        raise NotImplementedError
+    
+    def _get_state(self) -> Dict[str, Any]:
+        """Get the recursion state."""
+        raise NotImplementedError
+    
+    def _set_state(self, state: Dict[str, Any]):
+        """Restore the recursion state."""
+        raise NotImplementedError
+
+
+class StreamingEMA(StreamingIndicator):
+    """Exponential moving average of closes, seeded with the first close."""
+    
+    type_name = 'ema'
+    
+    def __init__(self, period: int = 20):
+        """
+        Initialize EMA.
+        
+        Args:
+            period: EMA period; values are reported from the period-th bar
+        """
+        super().__init__(period=period)
+        self.period = period
+        self.multiplier = 2 / (period + 1)
+        self.ema: Optional[float] = None
+    
+    def advance(self, price: float) -> float:
+        """Advance the recursion by one price and return the EMA, ready or not."""
+        if self.ema is None:
+            self.ema = price
+        else:
+            self.ema = (price * self.multiplier) + (self.ema * (1 - self.multiplier))
+        return self.ema
+    
+    def _update(self, bar: Mapping[str, Any]) -> Optional[float]:
+        ema = self.advance(float(bar['close']))
+        return ema if self.bars + 1 >= self.period else None
+    
+    def _get_state(self) -> Dict[str, Any]:
+        return {'ema': self.ema}
+    
+    def _set_state(self, state: Dict[str, Any]):
+        self.ema = state['ema']
+
+
+class StreamingSMA(StreamingIndicator):
+    """Simple moving average of closes over a ring buffer, reduced as utils.rolling.window_mean."""
+    
+    type_name = 'sma'
+    
+    def __init__(self, period: int = 20):
+        """
+        Initialize SMA.
+        
+        Args:
+            period: Window length
+        """
+        super().__init__(period=period)
+        self.period = period
+        self.window: deque = deque(maxlen=period)
+    
+    def _update(self, bar: Mapping[str, Any]) -> Optional[float]:
+        self.window.append(float(bar['close']))
+        if len(self.window) < self.period:
+            return None
+        return float(np.sum(np.array(self.window)) / self.period)
+    
+    def _get_state(self) -> Dict[str, Any]:
+        return {'window': list(self.window)}
+    
+    def _set_state(self, state: Dict[str, Any]):
+        self.window = deque(state['window'], maxlen=self.period)
+
+
+class StreamingBollinger(StreamingIndicator):
+    """Bollinger Bands: SMA of closes plus and minus num_std population standard deviations."""
+    
+    type_name = 'bollinger'
+    fields = ('upper', 'middle', 'lower')
+    
+    def __init__(self, period: int = 20, num_std: float = 2.0):
+        """
+        Initialize Bollinger Bands.
+        
+        Args:
+            period: Window length
+            num_std: Band width in standard deviations
+        """
+        super().__init__(period=period, num_std=float(num_std))
+        self.period = period
+        self.num_std = float(num_std)
+        self.window: deque = deque(maxlen=period)
+    
+    def _update(self, bar: Mapping[str, Any]) -> Optional[Dict[str, float]]:
+        self.window.append(float(bar['close']))
+        if len(self.window) < self.period:
+            return None
+        
+        # Same reductions as utils.rolling.window_mean and window_std
+        window = np.array(self.window)
+        middle = np.sum(window) / self.period
+        deviations = window - middle
+        width = self.num_std * float(np.sqrt(np.sum(deviations * deviations) / self.period))
+        middle = float(middle)
+        return {'upper': middle + width, 'middle': middle, 'lower': middle - width}
+    
+    def _get_state(self) -> Dict[str, Any]:
+        return {'window': list(self.window)}
+    
+    def _set_state(self, state: Dict[str, Any]):
+        self.window = deque(state['window'], maxlen=self.period)
+
+
+class StreamingRSI(StreamingIndicator):
+    """RSI with Wilder's smoothing, as TechnicalIndicators.continue_rsi_series."""
+    
+    type_name = 'rsi'
+    
+    def __init__(self, period: int = 14):
+        """
+        Initialize RSI.
+        
+        Args:
+            period: RSI period
+        """
+        super().__init__(period=period)
+        self.period = period
+        self.previous_close: Optional[float] = None
+        self.gains: List[float] = []
+        self.losses: List[float] = []
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+    
+    def _update(self, bar: Mapping[str, Any]) -> Optional[float]:
+        price = float(bar['close'])
+        previous_close = self.previous_close
+        self.previous_close = price
+        if previous_close is None:
+            return None
+        
+        delta = price - previous_close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if self.avg_gain is None:
+            # Collect the first period deltas for the initial averages
+            self.gains.append(gain)
+            self.losses.append(loss)
+            if len(self.gains) < self.period:
+                return None
+            self.avg_gain = sum(self.gains) / self.period
+            self.avg_loss = sum(self.losses) / self.period
+            self.gains = []
+            self.losses = []
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+        
+        if self.avg_loss == 0:
+            return 100.0
+        rs = self.avg_gain / self.avg_loss
+        return round(100 - (100 / (1 + rs)), 2)
+    
+    def _get_state(self) -> Dict[str, Any]:
+        return {
+            'previous_close': self.previous_close,
+            'gains': list(self.gains),
+            'losses': list(self.losses),
+            'avg_gain': self.avg_gain,
+            'avg_loss': self.avg_loss
+        }
+    
+    def _set_state(self, state: Dict[str, Any]):
+        self.previous_close = state['previous_close']
+        self.gains = list(state['gains'])
+        self.losses = list(state['losses'])
+        self.avg_gain = state['avg_gain']
+        self.avg_loss = state['avg_loss']
+
+
+class StreamingMACD(StreamingIndicator):
+    """MACD line, signal line and histogram, as TechnicalIndicators.calculate_macd."""
+    
+    type_name = 'macd'
+    fields = ('macd', 'signal', 'histogram')
+    
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        """
+        Initialize MACD.
+        
+        Args:
+            fast_period: Fast EMA period
+            slow_period: Slow EMA period
+            signal_period: Signal line EMA period
+        """
+        super().__init__(fast_period=fast_period, slow_period=slow_period, signal_period=signal_period)
+        self.fast = StreamingEMA(fast_period)
+        self.slow = StreamingEMA(slow_period)
+        self.signal = StreamingEMA(signal_period)
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+    
+    def _update(self, bar: Mapping[str, Any]) -> Optional[Dict[str, float]]:
+        price = float(bar['close'])
+        macd = self.fast.advance(price) - self.slow.advance(price)
+        # The MACD line starts once the slow EMA is ready; the signal EMA is seeded there
+        if self.bars + 1 < self.slow_period:
+            return None
+        signal = self.signal.advance(macd)
+        # Same validity rule as calculate_macd: slow_period + signal_period bars are needed
+        if self.bars + 1 < self.slow_period + self.signal_period:
+            return None
+        return {
+            'macd': round(macd, 4),
+            'signal': round(signal, 4),
+            'histogram': round(macd - signal, 4)
+        }
+    
+    def _get_state(self) -> Dict[str, Any]:
+        return {'fast_ema': self.fast.ema, 'slow_ema': self.slow.ema, 'signal_ema': self.signal.ema}
+    
+    def _set_state(self, state: Dict[str, Any]):
+        self.fast.ema = state['fast_ema']
+        self.slow.ema = state['slow_ema']
+        self.signal.ema = state['signal_ema']
+
+
+class StreamingATR(StreamingIndicator):
+    """Average True Range with Wilder's smoothing; the first bar's true range is high - low."""
+    
+    type_name = 'atr'
+    
+    def __init__(self, period: int = 14):
+        """
+        Initialize ATR.
+        
+        Args:
+            period: ATR period
+        """
+        super().__init__(period=period)
+        self.period = period
+        self.previous_close: Optional[float] = None
+        self.ranges: List[float] = []
+        self.atr: Optional[float] = None
+    
+    def _update(self, bar: Mapping[str, Any]) -> Optional[float]:
+        high = float(bar['high'])
+        low = float(bar['low'])
+        true_range = high - low
+        if self.previous_close is not None:
+            true_range = max(true_range, abs(high - self.previous_close), abs(low - self.previous_close))
+        self.previous_close = float(bar['close'])
+        
+        if self.atr is None:
+            self.ranges.append(true_range)
+            if len(self.ranges) < self.period:
+                return None
+            # Seeded with np.mean, as IndicatorEngine's Wilder average
+            self.atr = float(np.mean(self.ranges))
+            self.ranges = []
+        else:
+            self.atr = (self.atr * (self.period - 1) + true_range) / self.period
+        return self.atr
+    
+    def _get_state(self) -> Dict[str, Any]:
+        return {'previous_close': self.previous_close, 'ranges': list(self.ranges), 'atr': self.atr}
+    
+    def _set_state(self, state: Dict[str, Any]):
+        self.previous_close = state['previous_close']
+        self.ranges = list(state['ranges'])
+        self.atr = state['atr']
+
+
+STREAMING_INDICATORS = {
+    indicator_class.type_name: indicator_class
+    for indicator_class in (
+        StreamingRSI,
+        StreamingEMA,
+        StreamingMACD,
+        StreamingSMA,
+        StreamingBollinger,
+        StreamingATR
+    )
+}
+
+
+def create_streaming_indicator(spec: Dict[str, Any]) -> StreamingIndicator:
+    """
+    Create an indicator from a spec.
+    
+    Args:
+        spec: Dict with 'type' ('rsi', 'ema', 'macd', 'sma', 'bollinger' or 'atr')
+            and the indicator's parameters (e.g. {'type': 'sma', 'period': 50})
+    
+    Returns:
+        New indicator with no bars
+    """
+    params = dict(spec)
+    indicator_type = params.pop('type', None)
+    if indicator_type not in STREAMING_INDICATORS:
+        raise ValueError(f"Unknown streaming indicator: {indicator_type}")
+    return STREAMING_INDICATORS[indicator_type](**params)
+
+
+def restore_streaming_indicator(data: Dict[str, Any]) -> StreamingIndicator:
+    """
+    Restore an indicator serialized with to_dict.
+    
+    Args:
+        data: Serialized indicator
+    
+    Returns:
+        Indicator that continues after the last bar it saw
+    """
+    indicator = create_streaming_indicator({'type': data['type'], **data['params']})
+    indicator.bars = data['bars']
+    indicator.value = data['value']
+    indicator._set_state(data['state'])
+    return indicator
+
+
+def advance_indicator_states(
+    conn: sqlite3.Connection,
+    data_set_id: int,
+    specs: Optional[List[Dict[str, Any]]] = None,
+    rebuild: bool = False,
+    on_bar: Optional[Callable[[str, Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Advance the saved indicators of a data set over its bars after their last date.
+    
+    Indicators without a saved state, or all of them with rebuild (e.g. after
+    stored bars were corrected), start from the first bar. Commits the saved states.
+    
+    Args:
+        conn: Database connection
+        data_set_id: Data set ID
+        specs: Indicators to keep (default: DEFAULT_STREAMING_INDICATORS)
+        rebuild: Discard the saved states and replay the whole history
+        on_bar: Called with (date, {indicator key: value}) for every replayed bar,
+            holding the indicators advanced by that bar (optional)
+    
+    Returns:
+        Dict of indicator key to its value after the last bar
+    """
+    indicators = [create_streaming_indicator(spec) for spec in specs or DEFAULT_STREAMING_INDICATORS]
+    cursor = conn.cursor()
+    saved = {}
+    if not rebuild:
+        cursor.execute("""
+            SELECT indicator, last_date, state
+            FROM indicator_states
+            WHERE data_set_id = ?
+        """, (data_set_id,))
+        saved = {row[0]: (row[1], json.loads(row[2])) for row in cursor.fetchall()}
+    
+    last_dates = {}
+    for position, indicator in enumerate(indicators):
+        if indicator.key in saved:
+            last_dates[indicator.key], state = saved[indicator.key]
+            indicators[position] = restore_streaming_indicator(state)
+    
+    # Indicators continue from different dates; read from the earliest of them
+    starts = [last_dates.get(indicator.key) for indicator in indicators]
+    from_date = None if None in starts else min(starts)
+    cursor.execute("""
+        SELECT date, open, high, low, close, volume
+        FROM ohlcv_data
+        WHERE data_set_id = ? AND (? IS NULL OR date > ?)
+        ORDER BY date ASC
+    """, (data_set_id, from_date, from_date))
+    
+    last_date = from_date
+    for date, open_price, high, low, close, volume in cursor.fetchall():
+        bar = {'open': open_price, 'high': high, 'low': low, 'close': close, 'volume': volume}
+        values = {}
+        for indicator in indicators:
+            start = last_dates.get(indicator.key)
+            if start is None or date > start:
+                values[indicator.key] = indicator.update(bar)
+        if on_bar:
+            on_bar(date, values)
+        last_date = date
+    
+    if last_date is not None:
+        updated_at = datetime.now().isoformat()
+        cursor.executemany("""
+            INSERT OR REPLACE INTO indicator_states (data_set_id, indicator, last_date, state, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (data_set_id, indicator.key, last_date, json.dumps(indicator.to_dict()), updated_at)
+            for indicator in indicators
+        ])
+        conn.commit()
+    return {indicator.key: indicator.value for indicator in indicators}
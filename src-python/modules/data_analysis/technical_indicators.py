@@ -7,7 +7,8 @@ Related Documentation:
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, Any, Optional, Tuple
+from utils.rolling import window_mean
 
 
 class TechnicalIndicators:
@@ -50,20 +51,30 @@ class TechnicalIndicators:
             rs = avg_gain / avg_loss
             rsi = 100 - (100 / (1 + rs))
         
-        # Determine signal
-        if rsi > 70:
-            signal = 'overbought'
-        elif rsi < 30:
-            signal = 'oversold'
-        else:
-            signal = 'neutral'
-        
         return {
             'value': round(rsi, 2),
             'period': period,
-            'signal': signal
+            'signal': self.get_rsi_signal(rsi)
         }
     
+    @staticmethod
+    def get_rsi_signal(rsi: float) -> str:
+        """Classify an RSI value as 'overbought', 'oversold' or 'neutral'."""
+        if rsi > 70:
+            return 'overbought'
+        if rsi < 30:
+            return 'oversold'
+        return 'neutral'
+    
+    @staticmethod
+    def get_macd_signal_type(macd: float, signal: float) -> str:
+        """Classify a MACD line against its signal line as 'bullish', 'bearish' or 'neutral'."""
+        if macd > signal:
+            return 'bullish'
+        if macd < signal:
+            return 'bearish'
+        return 'neutral'
+    
     def calculate_macd(self, data: pd.DataFrame, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Optional[Dict]:
         """
         Calculate MACD (Moving Average Convergence Divergence).
@@ -111,21 +122,221 @@ class TechnicalIndicators:
         current_signal = signal_line[-1]
         current_histogram = histogram[-1]
         
-        # Determine signal type
-        if current_macd > current_signal:
-            signal_type = 'bullish'
-        elif current_macd < current_signal:
-            signal_type = 'bearish'
-        else:
-            signal_type = 'neutral'
-        
         return {
             'macd': round(current_macd, 4),
             'signal': round(current_signal, 4),
             'histogram': round(current_histogram, 4),
-            'signal_type': signal_type
+            'signal_type': self.get_macd_signal_type(current_macd, current_signal)
+        }
+    
+    def calculate_rsi_series(self, data: pd.DataFrame, period: int = 14) -> np.ndarray:
+        """
+        Calculate RSI for every bar in a single pass.
+        
+        Value at index i equals calculate_rsi(data.iloc[:i+1])['value'].
+        
+        Args:
+            data: DataFrame with OHLCV data
+            period: RSI period (default: 14)
+        
+        Returns:
+            Array of RSI values (NaN where there is insufficient data)
+        """
+        rsi, _ = self.continue_rsi_series(data['close'].values, period)
+        return rsi
+    
+    def continue_rsi_series(
+        self,
+        close_prices: np.ndarray,
+        period: int = 14,
+        state: Optional[Dict[str, Any]] = None
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Calculate RSI for new bars, continuing Wilder's smoothing from a saved state.
+        
+        Splitting a series and continuing from the returned state gives the same
+        values as calculate_rsi_series on the whole series.
+        
+        Args:
+            close_prices: Close prices of the new bars
+            period: RSI period (default: 14)
+            state: State returned by an earlier call (None starts a new series)
+        
+        Returns:
+            Tuple of (RSI values for the new bars, JSON-serializable state after the last bar)
+        """
+        if state is None:
+            state = {'previous_close': None, 'gains': [], 'losses': [], 'avg_gain': None, 'avg_loss': None}
+        close_prices = np.asarray(close_prices, dtype=float)
+        rsi = np.full(len(close_prices), np.nan)
+        if len(close_prices) == 0:
+            return rsi, state
+        
+        # deltas[j] is the change into bar j + offset
+        if state['previous_close'] is None:
+            deltas = np.diff(close_prices)
+            offset = 1
+        else:
+            deltas = np.diff(np.concatenate(([state['previous_close']], close_prices)))
+            offset = 0
+        gains = np.where(deltas > 0, deltas, 0)
+        losses = np.where(deltas < 0, -deltas, 0)
+        
+        warmup_gains = list(state['gains'])
+        warmup_losses = list(state['losses'])
+        avg_gain = state['avg_gain']
+        avg_loss = state['avg_loss']
+        
+        # Collect deltas until the first average (same as calculate_rsi) can be taken
+        first = 0
+        if avg_gain is None:
+            first = min(period - len(warmup_gains), len(deltas))
+            warmup_gains.extend(gains[:first].tolist())
+            warmup_losses.extend(losses[:first].tolist())
+        
+        avg_gains = []
+        avg_losses = []
+        if avg_gain is None and len(warmup_gains) == period:
+            avg_gain = float(np.mean(np.array(warmup_gains)))
+            avg_loss = float(np.mean(np.array(warmup_losses)))
+            avg_gains.append(avg_gain)
+            avg_losses.append(avg_loss)
+            warmup_gains = []
+            warmup_losses = []
+        first_valid = first - 1 if avg_gains else first
+        
+        if avg_gain is not None:
+            gain_values = gains.tolist()
+            loss_values = losses.tolist()
+            for i in range(first, len(deltas)):
+                avg_gain = (avg_gain * (period - 1) + gain_values[i]) / period
+                avg_loss = (avg_loss * (period - 1) + loss_values[i]) / period
+                avg_gains.append(avg_gain)
+                avg_losses.append(avg_loss)
+        
+        if avg_gains:
+            avg_gains = np.array(avg_gains)
+            avg_losses = np.array(avg_losses)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rs = avg_gains / avg_losses
+                values = 100 - (100 / (1 + rs))
+            values = np.where(avg_losses == 0, 100.0, values)
+            rsi[first_valid + offset:] = np.round(values, 2)
+        
+        return rsi, {
+            'previous_close': float(close_prices[-1]),
+            'gains': warmup_gains,
+            'losses': warmup_losses,
+            'avg_gain': avg_gain,
+            'avg_loss': avg_loss
+        }
+    
+    def calculate_macd_series(self, data: pd.DataFrame, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> np.ndarray:
+        """
+        Calculate the MACD line for every bar in a single pass.
+        
+        Value at index i equals calculate_macd(data.iloc[:i+1])['macd'].
+        
+        Args:
+            data: DataFrame with OHLCV data
+            fast_period: Fast EMA period (default: 12)
+            slow_period: Slow EMA period (default: 26)
+            signal_period: Signal line EMA period (default: 9)
+        
+        Returns:
+            Array of MACD values (NaN where there is insufficient data)
+        """
+        macd, _ = self.continue_macd_series(data['close'].values, fast_period, slow_period, signal_period)
+        return macd
+    
+    def continue_macd_series(
+        self,
+        close_prices: np.ndarray,
+        fast_period: int = 12,
+        slow_period: int = 26,
+        signal_period: int = 9,
+        state: Optional[Dict[str, Any]] = None
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Calculate the MACD line for new bars, continuing both EMAs from a saved state.
+        
+        Args:
+            close_prices: Close prices of the new bars
+            fast_period: Fast EMA period (default: 12)
+            slow_period: Slow EMA period (default: 26)
+            signal_period: Signal line EMA period (default: 9)
+            state: State returned by an earlier call (None starts a new series)
+        
+        Returns:
+            Tuple of (MACD values for the new bars, JSON-serializable state after the last bar)
+        """
+        if state is None:
+            state = {'fast_ema': None, 'slow_ema': None, 'bars': 0}
+        close_prices = np.asarray(close_prices, dtype=float)
+        macd = np.full(len(close_prices), np.nan)
+        if len(close_prices) == 0:
+            return macd, state
+        
+        # EMA values only depend on earlier prices, so the recursions simply carry on
+        fast_ema, fast_last = self._continue_ema(close_prices, fast_period, state['fast_ema'])
+        slow_ema, slow_last = self._continue_ema(close_prices, slow_period, state['slow_ema'])
+        
+        # Same validity rule as calculate_macd: slow_period + signal_period bars are needed
+        first_valid = max(0, slow_period + signal_period - 1 - state['bars'])
+        if first_valid < len(close_prices):
+            macd[first_valid:] = np.round(fast_ema[first_valid:] - slow_ema[first_valid:], 4)
+        
+        return macd, {
+            'fast_ema': fast_last,
+            'slow_ema': slow_last,
+            'bars': state['bars'] + len(close_prices)
         }
     
+    def calculate_sma_series(self, data: pd.DataFrame, period: int) -> np.ndarray:
+        """
+        Calculate the simple moving average of close prices for every bar.
+        
+        Args:
+            data: DataFrame with OHLCV data
+            period: Window length
+        
+        Returns:
+            Array of SMA values (NaN for the first period - 1 bars)
+        """
+        sma, _ = self.continue_sma_series(data['close'].values, period)
+        return sma
+    
+    def continue_sma_series(
+        self,
+        close_prices: np.ndarray,
+        period: int,
+        state: Optional[Dict[str, Any]] = None
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Calculate the simple moving average for new bars, continuing from a saved state.
+        
+        Args:
+            close_prices: Close prices of the new bars
+            period: Window length
+            state: State returned by an earlier call (None starts a new series)
+        
+        Returns:
+            Tuple of (SMA values for the new bars, JSON-serializable state holding the
+            last period - 1 closes)
+        """
+        previous = state['closes'] if state else []
+        close_prices = np.concatenate((
+            np.asarray(previous, dtype=float),
+            np.asarray(close_prices, dtype=float)
+        ))
+        sma = np.full(len(close_prices), np.nan)
+        if len(close_prices) >= period:
+            # Reduced like pandas mean of each window, and like the stored StreamingSMA columns
+            sma[period - 1:] = window_mean(close_prices, period)
+        
+        tail = close_prices[max(0, len(close_prices) - (period - 1)):] if period > 1 else close_prices[:0]
+        return sma[len(previous):], {'closes': tail.tolist()}
+    
     def _calculate_ema(self, prices: np.ndarray, period: int) -> np.ndarray:
         """Calculate Exponential Moving Average."""
         ema = np.zeros(len(prices))
@@ -133,8 +344,35 @@ class TechnicalIndicators:
         
         multiplier = 2 / (period + 1)
         
-        for i in range(1, len(prices)):
-            ema[i] = (prices[i] * multiplier) + (ema[i - 1] * (1 - multiplier))
+        # Recurse on Python floats; indexing NumPy scalars dominates on long series
+        previous = float(ema[0])
+        values = prices.tolist()
+        for i in range(1, len(values)):
+            previous = (values[i] * multiplier) + (previous * (1 - multiplier))
+            ema[i] = previous
         
         return ema[period - 1:]
-
+    
+    def _continue_ema(
+        self,
+        prices: np.ndarray,
+        period: int,
+        previous: Optional[float]
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Continue an EMA recursion over new prices.
+        
+        The first price seeds the EMA when there is no previous value, like _calculate_ema.
+        
+        Returns:
+            Tuple of (EMA for every new price, last EMA value)
+        """
+        ema = np.empty(len(prices))
+        multiplier = 2 / (period + 1)
+        for i, price in enumerate(prices.tolist()):
+            if previous is None:
+                previous = price
+            else:
+                previous = (price * multiplier) + (previous * (1 - multiplier))
+            ema[i] = previous
+        return ema, previous
@@ -9,6 +9,8 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Optional
 
+from utils.rolling import rolling_mean
+
 
 class TrendAnalyzer:
     """Analyze price trends from OHLCV data."""
@@ -51,14 +53,7 @@ class TrendAnalyzer:
     
     def _calculate_sma(self, prices: np.ndarray, period: int) -> np.ndarray:
         """Calculate Simple Moving Average."""
-        if len(prices) < period:
-            return np.array([])
-        
-        sma = np.zeros(len(prices) - period + 1)
-        for i in range(len(sma)):
-            sma[i] = np.mean(prices[i:i + period])
-        
-        return sma
+        return rolling_mean(prices, period)
     
     def _determine_trend_direction(self, prices: np.ndarray, sma_20: np.ndarray, sma_50: np.ndarray) -> str:
         """Determine trend direction based on price and moving averages."""
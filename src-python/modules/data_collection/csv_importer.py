@@ -9,9 +9,13 @@ from datetime import datetime
 
 from database.connection import get_connection
 from utils.json_io import json_response
+from modules.data_analysis.indicator_store import IndicatorStore
 import sqlite3
+import logging
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 class CSVImporter:
     """CSV importer for OHLCV data."""
@@ -153,8 +157,14 @@ class CSVImporter:
                 ))
             
             self.conn.commit()
-            return data_set_id
         except Exception as e:
             self.conn.rollback()
             raise Exception(f"Failed to save to database: {str(e)}")
+        
+        # Materialize the indicators; a failure leaves them to the backfill
+        try:
+            IndicatorStore(self.conn).update(data_set_id)
+        except Exception:
+            logger.exception(f"Error storing indicators of dataset {data_set_id}")
+        return data_set_id
 
@@ -17,7 +17,8 @@ Dependencies (External files that this file imports):
   ├─ logging (standard library)
   ├─ src-python/database.connection
   ├─ src-python/modules/data_collection.data_collector
-  └─ src-python/modules/data_collection.api_clients
+  ├─ src-python/modules/data_collection.api_clients
+  └─ src-python/modules/data_analysis.indicator_store
 """
 import sqlite3
 import logging
@@ -28,6 +29,7 @@ import pandas as pd
 from database.connection import get_connection
 from modules.data_collection.data_collector import DataCollector
 from modules.data_collection.api_clients import YahooFinanceClient, AlphaVantageClient
+from modules.data_analysis.indicator_store import IndicatorStore
 
 logger = logging.getLogger(__name__)
 
@@ -187,18 +189,27 @@ class DataUpdater:
             # Apply updates
             added_count, updated_count = self._apply_updates(data_set_id, df)
             
-            # Update dataset metadata
+            # Update dataset metadata; the version bump invalidates cached backtest results
             cursor = self.conn.cursor()
             cursor.execute("""
                 UPDATE data_sets
                 SET end_date = ?,
                     record_count = (SELECT COUNT(*) FROM ohlcv_data WHERE data_set_id = ?),
-                    updated_at = ?
+                    updated_at = ?,
+                    version = version + 1
                 WHERE id = ?
             """, (end_date, data_set_id, datetime.now().isoformat(), data_set_id))
             
             self.conn.commit()
             
+            # Extend the stored indicators by the new bars; corrected bars, and bars
+            # filled in on or before the previous latest date, need a full replay
+            rebuild = updated_count > 0 or pd.Timestamp(df['date'].min()) <= pd.Timestamp(latest_date)
+            try:
+                IndicatorStore(self.conn).update(data_set_id, rebuild=rebuild)
+            except Exception:
+                logger.exception(f"Error advancing indicators of dataset {data_set_id}")
+            
             return {
                 'success': True,
                 'added_count': added_count,
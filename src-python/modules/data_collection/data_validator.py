@@ -11,6 +11,7 @@ Parents (Files that import this file):
 
 Dependencies (External files that this file imports):
   ├─ sqlite3 (standard library)
+  ├─ numpy (external)
   ├─ pandas (external)
   ├─ datetime (standard library)
   ├─ typing (standard library)
@@ -21,6 +22,7 @@ import sqlite3
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
+import numpy as np
 import pandas as pd
 
 from database.connection import get_connection
@@ -121,19 +123,15 @@ class DataValidator:
         if len(df) < 2:
             return issues
         
-        df_sorted = df.sort_values('date')
-        date_diff = df_sorted['date'].diff()
+        dates = df['date'].sort_values().to_numpy()
+        days = np.diff(dates) // np.timedelta64(1, 'D')
         
-        # Check for gaps larger than expected (more than 3 days, accounting for weekends)
-        for idx, diff in enumerate(date_diff):
-            if pd.isna(diff):
-                continue
-            
-            days = diff.days
-            if days > 3:  # More than 3 days gap
-                prev_date = df_sorted.iloc[idx - 1]['date']
-                curr_date = df_sorted.iloc[idx]['date']
-                issues.append(f"Date gap detected: {prev_date.strftime('%Y-%m-%d')} to {curr_date.strftime('%Y-%m-%d')} ({days} days)")
+        # Check for gaps larger than expected (more than 3 days, accounting for weekends);
+        # only the gaps are formatted, not every row
+        for idx in np.flatnonzero(days > 3):
+            prev_date = pd.Timestamp(dates[idx])
+            curr_date = pd.Timestamp(dates[idx + 1])
+            issues.append(f"Date gap detected: {prev_date.strftime('%Y-%m-%d')} to {curr_date.strftime('%Y-%m-%d')} ({days[idx]} days)")
         
         return issues
     
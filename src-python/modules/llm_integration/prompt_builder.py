@@ -231,5 +231,35 @@ class PromptBuilder:
             lower = bb.get("lower", 0)
             lines.append(f"ボリンジャーバンド: 上限={upper:.2f}, 中央={middle:.2f}, 下限={lower:.2f}")
         
+        # ATR
+        if "atr" in technical_indicators:
+            atr = technical_indicators["atr"]
+            lines.append(f"ATR({atr.get('period', 0)}): {atr.get('value', 0):.2f}")
+        
+        # Stochastic
+        if "stochastic" in technical_indicators:
+            stochastic = technical_indicators["stochastic"]
+            lines.append(
+                f"ストキャスティクス({stochastic.get('period', 0)}): "
+                f"%K={stochastic.get('k', 0):.2f}, %D={stochastic.get('d', 0):.2f}"
+            )
+        
+        # OBV
+        if "obv" in technical_indicators:
+            lines.append(f"OBV: {technical_indicators['obv'].get('value', 0):.0f}")
+        
+        # VWAP
+        if "vwap" in technical_indicators:
+            vwap = technical_indicators["vwap"]
+            lines.append(f"VWAP({vwap.get('period', 0)}): {vwap.get('value', 0):.2f}")
+        
+        # ADX
+        if "adx" in technical_indicators:
+            adx = technical_indicators["adx"]
+            lines.append(
+                f"ADX({adx.get('period', 0)}): {adx.get('adx', 0):.2f} "
+                f"(+DI: {adx.get('plus_di', 0):.2f}, -DI: {adx.get('minus_di', 0):.2f})"
+            )
+        
         return "\n".join(lines) if lines else "テクニカル指標データなし"
 
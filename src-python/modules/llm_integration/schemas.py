@@ -48,13 +48,16 @@ class TriggerCondition(BaseModel):
         description="Comparison operator"
     )
     value: Union[float, List[float]] = Field(description="Comparison value or range")
-    period: Optional[int] = Field(default=None, ge=1, description="Period for moving averages")
-    indicator: Optional[str] = Field(default=None, description="Indicator name")
+    period: Optional[int] = Field(default=None, ge=1, description="Indicator period")
+    indicator: Optional[str] = Field(
+        default=None,
+        description="Indicator value for bollinger (upper, middle, lower, percent_b), stochastic (k, d) and adx (adx, plus_di, minus_di)"
+    )
 
 
 class TriggerDefinition(BaseModel):
     """Trigger definition."""
-    type: str = Field(description="Trigger type (rsi, macd, price, volume, moving_average)")
+    type: str = Field(description="Trigger type (rsi, macd, price, volume, moving_average, sma, ema, atr, obv, vwap, bollinger, stochastic, adx)")
     condition: TriggerCondition = Field(description="Trigger condition")
     logical_operator: Optional[Literal["AND", "OR"]] = Field(
         default=None, description="Logical operator for multiple triggers"
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Script to run data analysis jobs for many data sets.
+Called from Rust Tauri command.
+
+Creates one analysis job per data set and returns their IDs right away; the
+jobs run in a detached process (this script with --run) that analyzes the
+data sets in a process pool and writes results in batches.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/data-analysis/README.md
+"""
+import sys
+import json
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.connection import get_connection
+from modules.data_analysis.batch_analyzer import BatchAnalyzer, start_batch_process
+from utils.json_io import read_json_input, write_json_output, json_response
+
+
+def run_jobs():
+    """Run the jobs passed on stdin by start_batch_process."""
+    input_data = json.loads(sys.stdin.read())
+    analyzer = BatchAnalyzer(get_connection(), max_workers=input_data.get('max_workers'))
+    analyzer.run([(job_id, data_set_id) for job_id, data_set_id in input_data['jobs']])
+
+
+def main():
+    """Main entry point."""
+    try:
+        # Read input from stdin
+        input_data = read_json_input()
+        data_set_ids = input_data.get('data_set_ids', 'all')
+        max_workers = input_data.get('max_workers')
+        
+        conn = get_connection()
+        cursor = conn.cursor()
+        if data_set_ids == 'all':
+            cursor.execute("SELECT id FROM data_sets ORDER BY id ASC")
+            data_set_ids = [row[0] for row in cursor.fetchall()]
+        elif not isinstance(data_set_ids, list) or not data_set_ids:
+            result = json_response(success=False, error="data_set_ids must be a list of IDs or 'all'")
+            write_json_output(result)
+            sys.exit(1)
+        else:
+            # Validate data sets exist
+            data_set_ids = [int(data_set_id) for data_set_id in data_set_ids]
+            placeholders = ','.join('?' * len(data_set_ids))
+            cursor.execute(f"SELECT id FROM data_sets WHERE id IN ({placeholders})", data_set_ids)
+            missing = sorted(set(data_set_ids) - {row[0] for row in cursor.fetchall()})
+            if missing:
+                result = json_response(success=False, error=f"Data sets with ids {missing} not found")
+                write_json_output(result)
+                sys.exit(1)
+        
+        analyzer = BatchAnalyzer(conn, max_workers=max_workers)
+        jobs = analyzer.create_jobs(data_set_ids)
+        if jobs:
+            start_batch_process(jobs, max_workers)
+        
+        result = json_response(success=True, data={
+            'jobs': [{'job_id': job_id, 'data_set_id': data_set_id} for job_id, data_set_id in jobs]
+        })
+        write_json_output(result)
+    except Exception as e:
+        result = json_response(success=False, error=str(e))
+        write_json_output(result)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    if '--run' in sys.argv[1:]:
+        run_jobs()
+    else:
+        main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Script to fill the stored indicator columns of existing data sets.
+Called from Rust Tauri command.
+
+Data sets imported before indicator_values existed have no stored columns;
+their columns are computed from the first bar. Data sets already in sync
+are only extended by bars that are not stored yet, unless rebuild is set.
+
+Related Documentation:
+  └─ Plan: docs/03_plans/data-analysis/README.md
+"""
+import sys
+import logging
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.connection import get_connection
+from modules.data_analysis.indicator_store import IndicatorStore
+from utils.json_io import read_json_input, write_json_output, json_response
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point."""
+    try:
+        # Read input from stdin
+        input_data = read_json_input()
+        data_set_ids = input_data.get('data_set_ids', 'all')
+        rebuild = bool(input_data.get('rebuild', False))
+        
+        conn = get_connection()
+        cursor = conn.cursor()
+        if data_set_ids == 'all':
+            cursor.execute("SELECT id FROM data_sets ORDER BY id ASC")
+            data_set_ids = [row[0] for row in cursor.fetchall()]
+        elif not isinstance(data_set_ids, list) or not data_set_ids:
+            result = json_response(success=False, error="data_set_ids must be a list of IDs or 'all'")
+            write_json_output(result)
+            sys.exit(1)
+        
+        store = IndicatorStore(conn)
+        results = []
+        for data_set_id in data_set_ids:
+            try:
+                update = store.update(int(data_set_id), rebuild=rebuild)
+                results.append({'data_set_id': data_set_id, **update})
+            except Exception as e:
+                logger.exception(f"Error backfilling indicators of dataset {data_set_id}")
+                results.append({'data_set_id': data_set_id, 'error': str(e)})
+        
+        result = json_response(success=True, data={'data_sets': results})
+        write_json_output(result)
+    except Exception as e:
+        result = json_response(success=False, error=str(e))
+        write_json_output(result)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Long-lived backtest worker.
+Started detached by run_backtest.py when no worker is alive.
+
+Runs the backtest jobs queued in backtest_jobs and exits after idling. Logs
+go to logs/backtest_worker.log next to the database, since the process has
+no console.
+
+Usage:
+    python backtest_worker.py [--max-jobs 2] [--poll-interval 1.0] [--idle-timeout 60]
+"""
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.connection import get_db_path
+from modules.backtest.backtest_worker import BacktestWorker
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Backtest worker')
+    parser.add_argument('--max-jobs', type=int, default=2, help='Batches run at the same time')
+    parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds between queue checks')
+    parser.add_argument('--idle-timeout', type=float, default=60.0, help='Idle seconds before exiting')
+    args = parser.parse_args()
+    
+    log_path = Path(get_db_path()).parent / 'logs' / 'backtest_worker.log'
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        filename=str(log_path),
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    worker = BacktestWorker(
+        max_concurrent_jobs=args.max_jobs,
+        poll_interval=args.poll_interval,
+        idle_timeout=args.idle_timeout
+    )
+    try:
+        if not worker.run():
+            logger.info("Another backtest worker is alive; exiting")
+    except Exception:
+        logger.exception("Backtest worker failed")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Script to cancel a backtest job.
+Called from Rust Tauri command.
+
+A queued job is never run. A running parameter sweep or walk-forward analysis
+stops after its current batch, and a running backtest's results are not saved.
+Jobs that have already finished are left as they are.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.connection import get_connection
+from modules.backtest.job_manager import BacktestJobManager
+from utils.json_io import read_json_input, write_json_output, json_response
+
+
+def main():
+    """Main entry point."""
+    try:
+        # Read input from stdin
+        input_data = read_json_input()
+        job_id = input_data.get('job_id')
+        
+        if not job_id:
+            result = json_response(success=False, error="job_id is required")
+            write_json_output(result)
+            sys.exit(1)
+        
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT status FROM backtest_jobs WHERE job_id = ?", (job_id,))
+        row = cursor.fetchone()
+        if not row:
+            result = json_response(success=False, error=f"Job with id {job_id} not found")
+            write_json_output(result)
+            sys.exit(1)
+        
+        cancelled = BacktestJobManager(conn=conn).cancel_job(job_id)
+        
+        result = json_response(success=True, data={
+            'job_id': job_id,
+            'cancelled': cancelled,
+            'status': 'cancelled' if cancelled else row[0]
+        })
+        write_json_output(result)
+    except Exception as e:
+        result = json_response(success=False, error=str(e))
+        write_json_output(result)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
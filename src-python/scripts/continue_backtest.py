@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Script to continue a completed backtest over bars added after it ran.
+Called from Rust Tauri command.
+
+Only the new bars are processed: indicators, cash and any open position are
+restored from backtest_states, and the new trades and equity points are
+appended to backtest_trades and the stored equity curve.
+"""
+import sys
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.connection import get_connection
+from modules.backtest.backtest_engine import BacktestEngine, align_benchmark
+from modules.backtest.data_loader import load_ohlcv
+from modules.backtest.job_manager import BacktestJobManager, format_equity_dates
+from modules.backtest.performance_calculator import PerformanceCalculator
+from modules.backtest.result_cache import BacktestResultCache
+from utils.json_io import read_json_input, write_json_output, json_response
+
+
+def main():
+    """Main entry point."""
+    try:
+        # Read input from stdin
+        input_data = read_json_input()
+        job_id = input_data.get('job_id')
+        end_date = input_data.get('end_date')
+        
+        if not job_id:
+            result = json_response(success=False, error="job_id is required")
+            write_json_output(result)
+            sys.exit(1)
+        
+        conn = get_connection()
+        cursor = conn.cursor()
+        job_manager = BacktestJobManager(conn=conn)
+        
+        cursor.execute("SELECT data_set_id, status, parameters FROM backtest_jobs WHERE job_id = ?", (job_id,))
+        job_row = cursor.fetchone()
+        if not job_row:
+            result = json_response(success=False, error=f"Backtest job {job_id} not found")
+            write_json_output(result)
+            sys.exit(1)
+        
+        data_set_id, status, parameters_json = job_row
+        benchmark_data_set_id = json.loads(parameters_json).get('benchmark_data_set_id') if parameters_json else None
+        if status != 'completed':
+            result = json_response(success=False, error=f"Backtest job {job_id} is not completed")
+            write_json_output(result)
+            sys.exit(1)
+        
+        if not data_set_id:
+            # Portfolio jobs span several data sets; their bars cannot be read as one series
+            result = json_response(
+                success=False,
+                error=f"Backtest job {job_id} is a portfolio backtest, which cannot be continued; run the backtest again"
+            )
+            write_json_output(result)
+            sys.exit(1)
+        
+        state = job_manager.get_state(job_id)
+        if state is None:
+            result = json_response(
+                success=False,
+                error=f"Backtest job {job_id} has no saved state; run the backtest again"
+            )
+            write_json_output(result)
+            sys.exit(1)
+        
+        # Load the backtest's bars and those after it at once; the stored bars are
+        # used for buying and holding over the whole backtest and for recomputing
+        # indicators that cannot continue from a state, from their first bar on
+        stored_dates, stored_equity = job_manager.get_equity_curve(job_id)
+        history_start = format_equity_dates(stored_dates[:1])[0] if len(stored_dates) else state['last_date']
+        first_dates = [
+            pd.Timestamp(indicator_state['first_date']).strftime('%Y-%m-%d')
+            for indicator_state in state['indicators'].values()
+            if indicator_state.get('first_date')
+        ]
+        bars = load_ohlcv(cursor, data_set_id, min([history_start, *first_dates]), end_date)
+        previous_end = pd.Timestamp(state['last_date'])
+        history = bars[bars['date'] >= pd.Timestamp(history_start)].reset_index(drop=True)
+        data = bars[bars['date'] > previous_end].reset_index(drop=True)
+        if data.empty:
+            result = json_response(success=True, data={
+                'job_id': job_id,
+                'new_bars': 0,
+                'end_date': state['last_date']
+            })
+            write_json_output(result)
+            return
+        
+        first_date, last_date = format_equity_dates(data['date'].to_numpy()[[0, -1]])
+        
+        engine = BacktestEngine(
+            algorithm=state['algorithm'],
+            data=data,
+            start_date=first_date,
+            end_date=last_date,
+            initial_capital=state['initial_capital'],
+            state=state,
+            history=bars[bars['date'] <= previous_end].reset_index(drop=True)
+        )
+        results = engine.run()
+        
+        # Recompute performance over the whole backtest; the stored trade for a
+        # position still open at the previous end is superseded by the new trades
+        replace_open_trade = state['position'] is not None
+        cursor.execute("""
+            SELECT profit, profit_rate
+            FROM backtest_trades
+            WHERE job_id = ?
+            ORDER BY id ASC
+        """, (job_id,))
+        trades = [{'profit': row[0], 'profit_rate': row[1]} for row in cursor.fetchall()]
+        if replace_open_trade and trades:
+            trades = trades[:-1]
+        trades.extend(results['trades'])
+        
+        equity = np.concatenate([
+            stored_equity,
+            np.array([point['equity'] for point in results['equity_curve']], dtype=float)
+        ])
+        dates = np.concatenate([
+            stored_dates.astype('datetime64[ns]'),
+            pd.to_datetime(data['date']).to_numpy().astype('datetime64[ns]')
+        ])
+        benchmark = None
+        if benchmark_data_set_id:
+            benchmark = align_benchmark(load_ohlcv(cursor, benchmark_data_set_id, history_start, last_date), dates)
+        performance = PerformanceCalculator(state['initial_capital']).calculate_performance(
+            trades,
+            equity,
+            buy_and_hold=align_benchmark(history, dates),
+            benchmark=benchmark
+        )
+        
+        # Exposure counts a position still open as closed on the last bar, as for a full run
+        exposed_bars = results['state']['exposed_bars'] - (results['state']['position'] is not None)
+        performance['exposure'] = round(exposed_bars / len(equity) * 100, 2)
+        
+        job_manager.append_results(
+            job_id=job_id,
+            end_date=last_date,
+            performance=performance,
+            trades=results['trades'],
+            equity_curve=results['equity_curve'],
+            state=results['state'],
+            replace_open_trade=replace_open_trade
+        )
+        
+        # The job no longer holds the results of its original date range
+        BacktestResultCache(conn=conn).invalidate_job(job_id)
+        
+        result = json_response(success=True, data={
+            'job_id': job_id,
+            'new_bars': len(data),
+            'end_date': last_date,
+            'performance': performance
+        })
+        write_json_output(result)
+    except Exception as e:
+        result = json_response(success=False, error=str(e))
+        write_json_output(result)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
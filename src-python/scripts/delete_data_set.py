@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database.connection import get_connection
+from modules.backtest.result_cache import BacktestResultCache
 from utils.json_io import read_json_input, write_json_output, json_response
 
 
@@ -30,6 +31,8 @@ def main():
         
         # Delete OHLCV data first (CASCADE should handle this, but explicit is better)
         cursor.execute("DELETE FROM ohlcv_data WHERE data_set_id = ?", (data_set_id,))
+        cursor.execute("DELETE FROM indicator_states WHERE data_set_id = ?", (data_set_id,))
+        cursor.execute("DELETE FROM indicator_values WHERE data_set_id = ?", (data_set_id,))
         
         # Delete data set
         cursor.execute("DELETE FROM data_sets WHERE id = ?", (data_set_id,))
@@ -41,6 +44,8 @@ def main():
         
         conn.commit()
         
+        BacktestResultCache(conn=conn).invalidate_data_set(data_set_id)
+        
         result = json_response(success=True, data={"message": "Data set deleted successfully"})
         write_json_output(result)
     except Exception as e:
@@ -5,12 +5,15 @@ Called from Rust Tauri command.
 """
 import sys
 import json
+import numpy as np
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database.connection import get_connection
+from modules.backtest.job_manager import BacktestJobManager, format_equity_dates
+from modules.backtest.performance_calculator import ROLLING_SHARPE_WINDOWS, calculate_rolling_sharpe
 from utils.json_io import read_json_input, write_json_output, json_response
 
 
@@ -33,7 +36,11 @@ def main():
         cursor.execute("""
             SELECT job_id, algorithm_id, start_date, end_date,
                    total_return, sharpe_ratio, max_drawdown, win_rate,
-                   total_trades, average_profit, average_loss, created_at
+                   total_trades, average_profit, average_loss,
+                   cagr, volatility, sortino_ratio, calmar_ratio,
+                   exposure, var_95, cvar_95, longest_drawdown,
+                   buy_and_hold_return, excess_return, alpha, beta,
+                   benchmark_return, benchmark_excess_return, benchmark_alpha, benchmark_beta, created_at
             FROM backtest_results
             WHERE job_id = ?
         """, (job_id,))
@@ -47,12 +54,16 @@ def main():
         
         (job_id_db, algorithm_id, start_date, end_date,
          total_return, sharpe_ratio, max_drawdown, win_rate,
-         total_trades, average_profit, average_loss, created_at) = result_row
+         total_trades, average_profit, average_loss,
+         cagr, volatility, sortino_ratio, calmar_ratio,
+         exposure, var_95, cvar_95, longest_drawdown,
+         buy_and_hold_return, excess_return, alpha, beta,
+         benchmark_return, benchmark_excess_return, benchmark_alpha, benchmark_beta, created_at) = result_row
         
         # Get trades
         cursor.execute("""
             SELECT entry_date, exit_date, entry_price, exit_price,
-                   quantity, profit, profit_rate
+                   quantity, profit, profit_rate, symbol
             FROM backtest_trades
             WHERE job_id = ?
             ORDER BY entry_date ASC
@@ -62,7 +73,7 @@ def main():
         trades = []
         for trade_row in trade_rows:
             (entry_date, exit_date, entry_price, exit_price,
-             quantity, profit, profit_rate) = trade_row
+             quantity, profit, profit_rate, symbol) = trade_row
             trades.append({
                 'entry_date': entry_date,
                 'exit_date': exit_date,
@@ -70,25 +81,48 @@ def main():
                 'exit_price': exit_price,
                 'quantity': quantity,
                 'profit': profit,
-                'profit_rate': profit_rate
+                'profit_rate': profit_rate,
+                'symbol': symbol
             })
         
-        # Get equity curve
+        # Get equity curve (stored as rows or as one compact blob)
+        equity_dates, equity_values = BacktestJobManager(conn=conn).get_equity_curve(job_id)
+        equity_curve = [
+            {'date': date, 'equity': equity}
+            for date, equity in zip(format_equity_dates(equity_dates), equity_values.tolist())
+        ]
+        
+        # Rolling Sharpe ratios aligned with the equity curve (None until a window is full)
+        rolling_sharpe = {}
+        for window in ROLLING_SHARPE_WINDOWS:
+            values = np.round(calculate_rolling_sharpe(equity_values, window), 2)
+            rolling_sharpe[str(window)] = [None if np.isnan(value) else value for value in values.tolist()]
+        
+        # Get Monte Carlo confidence intervals (if a robustness check was run)
         cursor.execute("""
-            SELECT date, equity
-            FROM backtest_equity_curve
+            SELECT method, num_simulations, confidence_level,
+                   metric, mean, median, lower, upper
+            FROM backtest_monte_carlo_results
             WHERE job_id = ?
-            ORDER BY date ASC
+            ORDER BY method, metric
         """, (job_id,))
         
-        equity_rows = cursor.fetchall()
-        equity_curve = []
-        for equity_row in equity_rows:
-            date, equity = equity_row
-            equity_curve.append({
-                'date': date,
-                'equity': equity
+        monte_carlo = {}
+        for mc_row in cursor.fetchall():
+            (method, num_simulations, confidence_level,
+             metric, mean, median, lower, upper) = mc_row
+            report = monte_carlo.setdefault(method, {
+                'method': method,
+                'num_simulations': num_simulations,
+                'confidence_level': confidence_level,
+                'metrics': {}
             })
+            report['metrics'][metric] = {
+                'mean': mean,
+                'median': median,
+                'lower': lower,
+                'upper': upper
+            }
         
         result_data = {
             'job_id': job_id_db,
@@ -102,10 +136,28 @@ def main():
                 'win_rate': win_rate,
                 'total_trades': total_trades,
                 'average_profit': average_profit,
-                'average_loss': average_loss
+                'average_loss': average_loss,
+                'cagr': cagr,
+                'volatility': volatility,
+                'sortino_ratio': sortino_ratio,
+                'calmar_ratio': calmar_ratio,
+                'exposure': exposure,
+                'var_95': var_95,
+                'cvar_95': cvar_95,
+                'longest_drawdown': longest_drawdown,
+                'buy_and_hold_return': buy_and_hold_return,
+                'excess_return': excess_return,
+                'alpha': alpha,
+                'beta': beta,
+                'benchmark_return': benchmark_return,
+                'benchmark_excess_return': benchmark_excess_return,
+                'benchmark_alpha': benchmark_alpha,
+                'benchmark_beta': benchmark_beta
             },
             'trades': trades,
-            'equity_curve': equity_curve
+            'equity_curve': equity_curve,
+            'rolling_sharpe': rolling_sharpe,
+            'monte_carlo': list(monte_carlo.values())
         }
         
         result = json_response(success=True, data=result_data)
@@ -5,6 +5,8 @@ Called from Rust Tauri command.
 
 This script retrieves the latest backtest result for each specified algorithm.
 If algorithm_ids is not provided, it returns the latest result for all algorithms.
+With rank_by (e.g. 'excess_return'), results are ordered best first by that
+metric instead of by algorithm; results without it go last.
 """
 import sys
 import json
@@ -18,6 +20,86 @@ from database.connection import get_connection
 from utils.json_io import read_json_input, write_json_output, json_response
 
 
+# Metrics results can be ranked by; a smaller max_drawdown ranks higher
+RANKABLE_METRICS = {
+    'total_return',
+    'sharpe_ratio',
+    'max_drawdown',
+    'win_rate',
+    'excess_return',
+    'alpha',
+    'benchmark_excess_return',
+    'benchmark_alpha'
+}
+
+RESULT_COLUMNS = """
+    br.job_id,
+    br.algorithm_id,
+    a.name as algorithm_name,
+    br.start_date,
+    br.end_date,
+    br.total_return,
+    br.sharpe_ratio,
+    br.max_drawdown,
+    br.win_rate,
+    br.total_trades,
+    br.average_profit,
+    br.average_loss,
+    br.buy_and_hold_return,
+    br.excess_return,
+    br.alpha,
+    br.beta,
+    br.benchmark_return,
+    br.benchmark_excess_return,
+    br.benchmark_alpha,
+    br.benchmark_beta,
+    br.created_at
+"""
+
+
+def build_result(row: tuple) -> Dict[str, Any]:
+    """Convert a row selected with RESULT_COLUMNS into a summary result."""
+    (job_id, algorithm_id, algorithm_name, start_date, end_date,
+     total_return, sharpe_ratio, max_drawdown, win_rate,
+     total_trades, average_profit, average_loss,
+     buy_and_hold_return, excess_return, alpha, beta,
+     benchmark_return, benchmark_excess_return, benchmark_alpha, benchmark_beta, created_at) = row
+    
+    return {
+        'job_id': job_id,
+        'algorithm_id': algorithm_id,
+        'algorithm_name': algorithm_name,
+        'start_date': start_date,
+        'end_date': end_date,
+        'completed_at': created_at,  # Use created_at as completed_at
+        'performance': {
+            'total_return': total_return,
+            'sharpe_ratio': sharpe_ratio,
+            'max_drawdown': max_drawdown,
+            'win_rate': win_rate,
+            'total_trades': total_trades,
+            'average_profit': average_profit,
+            'average_loss': average_loss,
+            'buy_and_hold_return': buy_and_hold_return,
+            'excess_return': excess_return,
+            'alpha': alpha,
+            'beta': beta,
+            'benchmark_return': benchmark_return,
+            'benchmark_excess_return': benchmark_excess_return,
+            'benchmark_alpha': benchmark_alpha,
+            'benchmark_beta': benchmark_beta
+        }
+    }
+
+
+def rank_order(rank_by: Optional[str]) -> str:
+    """Build the ORDER BY terms for rank_by (metric names are checked against RANKABLE_METRICS)."""
+    if rank_by is None:
+        return "br.algorithm_id"
+    direction = 'ASC' if rank_by == 'max_drawdown' else 'DESC'
+    return f"br.{rank_by} IS NULL, br.{rank_by} {direction}, br.algorithm_id"
+
+
 def main():
     """Main entry point."""
     try:
@@ -25,6 +107,15 @@ def main():
         input_data = read_json_input()
         algorithm_ids = input_data.get('algorithm_ids')  # Optional list of algorithm IDs
         limit = input_data.get('limit', 10)  # Optional limit (default: 10)
+        rank_by = input_data.get('rank_by')  # Optional metric to rank by (default: by algorithm)
+        
+        if rank_by is not None and rank_by not in RANKABLE_METRICS:
+            result = json_response(
+                success=False,
+                error=f"Unknown rank_by '{rank_by}'; expected one of {sorted(RANKABLE_METRICS)}"
+            )
+            write_json_output(result)
+            sys.exit(1)
         
         conn = get_connection()
         cursor = conn.cursor()
@@ -35,20 +126,7 @@ def main():
             # Get latest backtest result for each specified algorithm
             placeholders = ','.join(['?'] * len(algorithm_ids))
             cursor.execute(f"""
-                SELECT 
-                    br.job_id,
-                    br.algorithm_id,
-                    a.name as algorithm_name,
-                    br.start_date,
-                    br.end_date,
-                    br.total_return,
-                    br.sharpe_ratio,
-                    br.max_drawdown,
-                    br.win_rate,
-                    br.total_trades,
-                    br.average_profit,
-                    br.average_loss,
-                    br.created_at
+                SELECT {RESULT_COLUMNS}
                 FROM backtest_results br
                 INNER JOIN algorithms a ON br.algorithm_id = a.id
                 WHERE br.algorithm_id IN ({placeholders})
@@ -63,84 +141,32 @@ def main():
                     algorithm_results[algorithm_id] = row
             
             # Convert to list format
-            for row in algorithm_results.values():
-                if row:
-                    (job_id, algorithm_id, algorithm_name, start_date, end_date,
-                     total_return, sharpe_ratio, max_drawdown, win_rate,
-                     total_trades, average_profit, average_loss, created_at) = row
-                    
-                    result = {
-                        'job_id': job_id,
-                        'algorithm_id': algorithm_id,
-                        'algorithm_name': algorithm_name,
-                        'start_date': start_date,
-                        'end_date': end_date,
-                        'completed_at': created_at,  # Use created_at as completed_at
-                        'performance': {
-                            'total_return': total_return,
-                            'sharpe_ratio': sharpe_ratio,
-                            'max_drawdown': max_drawdown,
-                            'win_rate': win_rate,
-                            'total_trades': total_trades,
-                            'average_profit': average_profit,
-                            'average_loss': average_loss
-                        }
-                    }
-                    results.append(result)
+            results = [build_result(row) for row in algorithm_results.values() if row]
+            if rank_by is not None:
+                sign = 1 if rank_by == 'max_drawdown' else -1
+                results.sort(key=lambda result: (
+                    result['performance'][rank_by] is None,
+                    sign * (result['performance'][rank_by] or 0.0)
+                ))
         else:
             # Get latest backtest result for all algorithms
             # Use a subquery to get the latest created_at for each algorithm
-            cursor.execute("""
-                SELECT 
-                    br.job_id,
-                    br.algorithm_id,
-                    a.name as algorithm_name,
-                    br.start_date,
-                    br.end_date,
-                    br.total_return,
-                    br.sharpe_ratio,
-                    br.max_drawdown,
-                    br.win_rate,
-                    br.total_trades,
-                    br.average_profit,
-                    br.average_loss,
-                    br.created_at
+            cursor.execute(f"""
+                SELECT {RESULT_COLUMNS}
                 FROM backtest_results br
                 INNER JOIN algorithms a ON br.algorithm_id = a.id
                 INNER JOIN (
                     SELECT algorithm_id, MAX(created_at) as max_created_at
                     FROM backtest_results
                     GROUP BY algorithm_id
-                ) latest ON br.algorithm_id = latest.algorithm_id 
+                ) latest ON br.algorithm_id = latest.algorithm_id
                     AND br.created_at = latest.max_created_at
-                ORDER BY br.algorithm_id
+                ORDER BY {rank_order(rank_by)}
                 LIMIT ?
             """, (limit,))
             
             # Convert to list format
-            for row in cursor.fetchall():
-                (job_id, algorithm_id, algorithm_name, start_date, end_date,
-                 total_return, sharpe_ratio, max_drawdown, win_rate,
-                 total_trades, average_profit, average_loss, created_at) = row
-                
-                result = {
-                    'job_id': job_id,
-                    'algorithm_id': algorithm_id,
-                    'algorithm_name': algorithm_name,
-                    'start_date': start_date,
-                    'end_date': end_date,
-                    'completed_at': created_at,  # Use created_at as completed_at
-                    'performance': {
-                        'total_return': total_return,
-                        'sharpe_ratio': sharpe_ratio,
-                        'max_drawdown': max_drawdown,
-                        'win_rate': win_rate,
-                        'total_trades': total_trades,
-                        'average_profit': average_profit,
-                        'average_loss': average_loss
-                    }
-                }
-                results.append(result)
+            results = [build_result(row) for row in cursor.fetchall()]
         
         result_data = {
             'results': results
@@ -156,4 +182,3 @@ def main():
 
 if __name__ == '__main__':
     main()
-
@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database.connection import get_connection
+from modules.backtest.job_manager import BacktestJobManager
 from utils.json_io import read_json_input, write_json_output, json_response
 
 
@@ -53,6 +54,11 @@ def main():
         if error:
             result_data['error'] = error
         
+        # Stage timings and peak memory of the run (once it has finished)
+        metrics = BacktestJobManager(conn=conn).get_metrics(job_id)
+        if metrics:
+            result_data['metrics'] = metrics
+        
         result = json_response(success=True, data=result_data)
         write_json_output(result)
     except Exception as e:
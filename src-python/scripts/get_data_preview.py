@@ -9,9 +9,13 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import pandas as pd
+import numpy as np
 from database.connection import get_connection
 from utils.json_io import read_json_input, write_json_output, json_response
+from utils.rolling import column_statistics
+
+# Columns summarized in the preview statistics
+STATISTICS_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
 
 
 def main():
@@ -73,50 +77,25 @@ def main():
                 "volume": int(row["volume"])
             })
         
-        # Calculate statistics using Pandas
-        df = pd.DataFrame(data)
-        
-        # Get date range
+        # Get date range (ISO dates sort as text)
+        dates = [row["date"] for row in data]
         date_range = {
-            "start": df["date"].min(),
-            "end": df["date"].max()
+            "start": min(dates),
+            "end": max(dates)
         }
         
-        # Calculate statistics for each column
+        # Calculate statistics for every column in one pass over the rows
+        values = np.array([[row[column] for column in STATISTICS_COLUMNS] for row in data], dtype=float)
+        column_stats = column_statistics(values)
         statistics = {
-            "count": len(df),
-            "date_range": date_range,
-            "open": {
-                "mean": float(df["open"].mean()),
-                "min": float(df["open"].min()),
-                "max": float(df["open"].max()),
-                "std": float(df["open"].std())
-            },
-            "high": {
-                "mean": float(df["high"].mean()),
-                "min": float(df["high"].min()),
-                "max": float(df["high"].max()),
-                "std": float(df["high"].std())
-            },
-            "low": {
-                "mean": float(df["low"].mean()),
-                "min": float(df["low"].min()),
-                "max": float(df["low"].max()),
-                "std": float(df["low"].std())
-            },
-            "close": {
-                "mean": float(df["close"].mean()),
-                "min": float(df["close"].min()),
-                "max": float(df["close"].max()),
-                "std": float(df["close"].std())
-            },
-            "volume": {
-                "mean": float(df["volume"].mean()),
-                "min": float(df["volume"].min()),
-                "max": float(df["volume"].max()),
-                "std": float(df["volume"].std())
-            }
+            "count": len(data),
+            "date_range": date_range
         }
+        for index, column in enumerate(STATISTICS_COLUMNS):
+            statistics[column] = {
+                name: float(column_stats[name][index])
+                for name in ("mean", "min", "max", "std")
+            }
         
         result = json_response(success=True, data={
             "data_set_id": data_set_id,
@@ -2,123 +2,25 @@
 """
 Script to run backtest job.
 Called from Rust Tauri command.
+
+The script only queues the jobs and returns; the backtest worker process
+runs them and is started here if none is alive.
 """
 import sys
 import json
-import uuid
-import threading
-import pandas as pd
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database.connection import get_connection
-from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.backtest_worker import ensure_worker_running
+from modules.backtest.data_loader import get_warmup_bars
 from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.result_cache import BacktestResultCache
 from utils.json_io import read_json_input, write_json_output, json_response
 
 
-def run_backtest_in_background(
-    job_id: str,
-    algorithm_id: int,
-    start_date: str,
-    end_date: str,
-    data_set_id: Optional[int]
-):
-    """Run backtest in background thread."""
-    conn = get_connection()
-    job_manager = BacktestJobManager(conn=conn)
-    
-    try:
-        # Update job status to running
-        job_manager.update_job_status(job_id, 'running', 0.1, 'Loading algorithm...')
-        
-        # Load algorithm from database
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT name, description, definition
-            FROM algorithms
-            WHERE id = ?
-        """, (algorithm_id,))
-        
-        algorithm_row = cursor.fetchone()
-        if not algorithm_row:
-            raise ValueError(f"Algorithm with id {algorithm_id} not found")
-        
-        algorithm_name, algorithm_description, definition_json = algorithm_row
-        algorithm_definition = json.loads(definition_json)
-        
-        job_manager.update_job_status(job_id, 'running', 0.2, 'Loading data...')
-        
-        # Load OHLCV data
-        if data_set_id:
-            cursor.execute("""
-                SELECT date, open, high, low, close, volume
-                FROM ohlcv_data
-                WHERE data_set_id = ?
-                ORDER BY date ASC
-            """, (data_set_id,))
-        else:
-            # If no data_set_id, get data from all data sets (for now, use first available)
-            cursor.execute("""
-                SELECT date, open, high, low, close, volume
-                FROM ohlcv_data
-                ORDER BY date ASC
-            """)
-        
-        rows = cursor.fetchall()
-        if not rows:
-            raise ValueError("No OHLCV data available")
-        
-        data = pd.DataFrame(rows, columns=['date', 'open', 'high', 'low', 'close', 'volume'])
-        
-        job_manager.update_job_status(job_id, 'running', 0.3, 'Running backtest...')
-        
-        # Run backtest
-        engine = BacktestEngine(
-            algorithm=algorithm_definition,
-            data=data,
-            start_date=start_date,
-            end_date=end_date
-        )
-        
-        results = engine.run()
-        
-        job_manager.update_job_status(job_id, 'running', 0.9, 'Saving results...')
-        
-        # Save results
-        job_manager.save_results(
-            job_id=job_id,
-            algorithm_id=algorithm_id,
-            start_date=start_date,
-            end_date=end_date,
-            performance=results['performance'],
-            trades=results['trades'],
-            equity_curve=results['equity_curve']
-        )
-        
-        job_manager.update_job_status(
-            job_id,
-            'completed',
-            1.0,
-            'Backtest completed successfully',
-            completed=True
-        )
-    except Exception as e:
-        # Update job status to failed
-        job_manager.update_job_status(
-            job_id,
-            'failed',
-            0.0,
-            f'Backtest failed: {str(e)}',
-            error=str(e),
-            completed=True
-        )
-
-
 def main():
     """Main entry point."""
     try:
@@ -128,6 +30,13 @@ def main():
         start_date = input_data.get('start_date')
         end_date = input_data.get('end_date')
         data_set_id = input_data.get('data_set_id')
+        data_set_ids = input_data.get('data_set_ids')
+        max_workers = input_data.get('max_workers', 1)
+        max_positions = input_data.get('max_positions')
+        initial_capital = float(input_data.get('initial_capital', 100000.0))
+        compact_equity = bool(input_data.get('compact_equity', False))
+        profile = bool(input_data.get('profile', False))
+        benchmark_data_set_id = input_data.get('benchmark_data_set_id')  # Optional index to compare with
         
         if not algorithm_ids:
             result = json_response(success=False, error="algorithm_ids is required")
@@ -139,19 +48,22 @@ def main():
             write_json_output(result)
             sys.exit(1)
         
-        # Validate algorithm exists
+        # Validate algorithms exist
         conn = get_connection()
         cursor = conn.cursor()
         
-        # For now, run backtest for first algorithm only
-        # TODO: Support multiple algorithms
-        algorithm_id = algorithm_ids[0]
+        definitions = {}
+        for algorithm_id in algorithm_ids:
+            cursor.execute("SELECT definition FROM algorithms WHERE id = ?", (algorithm_id,))
+            algorithm_row = cursor.fetchone()
+            if not algorithm_row:
+                result = json_response(success=False, error=f"Algorithm with id {algorithm_id} not found")
+                write_json_output(result)
+                sys.exit(1)
+            definitions[algorithm_id] = json.loads(algorithm_row[0])
         
-        cursor.execute("SELECT id FROM algorithms WHERE id = ?", (algorithm_id,))
-        if not cursor.fetchone():
-            result = json_response(success=False, error=f"Algorithm with id {algorithm_id} not found")
-            write_json_output(result)
-            sys.exit(1)
+        # Earlier bars to load so the longest indicator lookback is warmed up by start_date
+        warmup_bars = get_warmup_bars(list(definitions.values()))
         
         # Validate data set if provided
         if data_set_id:
@@ -160,25 +72,109 @@ def main():
                 result = json_response(success=False, error=f"Data set with id {data_set_id} not found")
                 write_json_output(result)
                 sys.exit(1)
+            data_set_ids = None
+        elif data_set_ids:
+            for portfolio_data_set_id in data_set_ids:
+                cursor.execute("SELECT id FROM data_sets WHERE id = ?", (portfolio_data_set_id,))
+                if not cursor.fetchone():
+                    result = json_response(
+                        success=False,
+                        error=f"Data set with id {portfolio_data_set_id} not found"
+                    )
+                    write_json_output(result)
+                    sys.exit(1)
+        else:
+            # Without a data set, run a portfolio backtest across every data set
+            cursor.execute("SELECT id FROM data_sets ORDER BY id ASC")
+            data_set_ids = [row[0] for row in cursor.fetchall()]
+            if not data_set_ids:
+                result = json_response(success=False, error="No data sets available")
+                write_json_output(result)
+                sys.exit(1)
         
-        # Create job
-        job_manager = BacktestJobManager(conn=conn)
-        job_id = job_manager.create_job(
-            algorithm_id=algorithm_id,
-            start_date=start_date,
-            end_date=end_date,
-            data_set_id=data_set_id
-        )
+        if benchmark_data_set_id:
+            cursor.execute("SELECT id FROM data_sets WHERE id = ?", (benchmark_data_set_id,))
+            if not cursor.fetchone():
+                result = json_response(
+                    success=False,
+                    error=f"Benchmark data set with id {benchmark_data_set_id} not found"
+                )
+                write_json_output(result)
+                sys.exit(1)
         
-        # Start backtest in background thread
-        thread = threading.Thread(
-            target=run_backtest_in_background,
-            args=(job_id, algorithm_id, start_date, end_date, data_set_id)
+        # Create one job per algorithm so results are stored per algorithm
+        job_manager = BacktestJobManager(conn=conn)
+        job_ids = {}
+        for algorithm_id in dict.fromkeys(algorithm_ids):
+            job_ids[algorithm_id] = job_manager.create_job(
+                algorithm_id=algorithm_id,
+                start_date=start_date,
+                end_date=end_date,
+                data_set_id=data_set_id,
+                data_set_ids=data_set_ids
+            )
+        
+        # Reuse stored results of identical single data set backtests
+        result_cache = BacktestResultCache(conn=conn)
+        cache_keys = {}
+        cached_job_ids = []
+        data_set_version = result_cache.get_data_set_version(data_set_id) if data_set_id else None
+        benchmark_version = (
+            result_cache.get_data_set_version(benchmark_data_set_id) if benchmark_data_set_id else None
         )
-        thread.daemon = True
-        thread.start()
-        
-        result = json_response(success=True, data={"job_id": job_id})
+        if data_set_version is not None:
+            for algorithm_id, job_id in job_ids.items():
+                cache_key = BacktestResultCache.make_key(
+                    definitions[algorithm_id],
+                    data_set_id,
+                    data_set_version,
+                    start_date,
+                    end_date,
+                    initial_capital,
+                    warmup_bars,
+                    benchmark_data_set_id,
+                    benchmark_version
+                )
+                cached_job_id = result_cache.lookup(cache_key)
+                if cached_job_id is None:
+                    cache_keys[algorithm_id] = cache_key
+                    continue
+                job_manager.copy_results(cached_job_id, job_id, algorithm_id)
+                job_manager.update_job_status(
+                    job_id,
+                    'completed',
+                    1.0,
+                    'Backtest results loaded from cache',
+                    completed=True
+                )
+                cached_job_ids.append(job_id)
+        
+        # Queue the remaining backtests as one batch for the backtest worker
+        job_parameters = {
+            job_id: {
+                'max_workers': max_workers,
+                'max_positions': max_positions,
+                'initial_capital': initial_capital,
+                'data_set_version': data_set_version,
+                'cache_key': cache_keys.get(algorithm_id),
+                'compact_equity': compact_equity,
+                'profile': profile,
+                'warmup_bars': warmup_bars,
+                'benchmark_data_set_id': benchmark_data_set_id
+            }
+            for algorithm_id, job_id in job_ids.items()
+            if job_id not in cached_job_ids
+        }
+        if job_parameters:
+            job_manager.enqueue_jobs(job_parameters)
+            ensure_worker_running(conn)
+        
+        job_id_list = list(job_ids.values())
+        result = json_response(success=True, data={
+            "job_id": job_id_list[0],
+            "job_ids": job_id_list,
+            "cached_job_ids": cached_job_ids
+        })
         write_json_output(result)
     except Exception as e:
         result = json_response(success=False, error=str(e))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Script to run a Monte Carlo robustness check on a finished backtest.
+Called from Rust Tauri command.
+
+Resamples the stored trades (or daily returns of the equity curve) and saves
+the confidence intervals to backtest_monte_carlo_results.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.connection import get_connection
+from modules.backtest.monte_carlo import MonteCarloSimulator
+from modules.backtest.job_manager import BacktestJobManager
+from utils.json_io import read_json_input, write_json_output, json_response
+
+
+def main():
+    """Main entry point."""
+    try:
+        # Read input from stdin
+        input_data = read_json_input()
+        job_id = input_data.get('job_id')
+        method = input_data.get('method', 'trades')
+        num_simulations = input_data.get('num_simulations', 10000)
+        confidence_level = input_data.get('confidence_level', 0.9)
+        seed = input_data.get('seed')
+        
+        if not job_id:
+            result = json_response(success=False, error="job_id is required")
+            write_json_output(result)
+            sys.exit(1)
+        
+        if method not in ('trades', 'daily_returns'):
+            result = json_response(success=False, error="method must be 'trades' or 'daily_returns'")
+            write_json_output(result)
+            sys.exit(1)
+        
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT job_id FROM backtest_results WHERE job_id = ?", (job_id,))
+        if not cursor.fetchone():
+            result = json_response(success=False, error=f"Backtest results for job {job_id} not found")
+            write_json_output(result)
+            sys.exit(1)
+        
+        job_manager = BacktestJobManager(conn=conn)
+        _, equity = job_manager.get_equity_curve(job_id)
+        
+        # Mark-to-market equity on the first bar equals the initial capital
+        initial_capital = input_data.get('initial_capital')
+        if initial_capital is None:
+            initial_capital = float(equity[0]) if len(equity) > 0 else 100000.0
+        
+        simulator = MonteCarloSimulator(
+            initial_capital=initial_capital,
+            num_simulations=int(num_simulations),
+            confidence_level=float(confidence_level),
+            seed=seed
+        )
+        
+        if method == 'trades':
+            cursor.execute("""
+                SELECT profit, profit_rate
+                FROM backtest_trades
+                WHERE job_id = ?
+                ORDER BY entry_date ASC
+            """, (job_id,))
+            trades = [{'profit': row[0], 'profit_rate': row[1]} for row in cursor.fetchall()]
+            report = simulator.simulate_trades(trades)
+        else:
+            report = simulator.simulate_daily_returns(equity)
+        
+        job_manager.save_monte_carlo_results(job_id, report)
+        
+        report['job_id'] = job_id
+        result = json_response(success=True, data=report)
+        write_json_output(result)
+    except Exception as e:
+        result = json_response(success=False, error=str(e))
+        write_json_output(result)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Script to run a parameter sweep for an algorithm.
+Called from Rust Tauri command.
+
+The sweep runs to completion before the script returns. Progress is written to
+backtest_jobs and the ranked results to backtest_sweep_results. With
+background, the sweep is queued for the backtest worker and the script returns
+its job_id at once. Either way the job can be cancelled with
+cancel_backtest_job.py and stops after its current batch.
+
+With search 'successive_halving', num_candidates combinations are drawn from
+the grid and searched with SuccessiveHalvingOptimizer instead of running the
+whole grid on the full range.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.connection import get_connection
+from modules.backtest.backtest_worker import ensure_worker_running
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.optimization_jobs import run_sweep_job
+from utils.json_io import read_json_input, write_json_output, json_response
+
+
+def main():
+    """Main entry point."""
+    try:
+        # Read input from stdin
+        input_data = read_json_input()
+        algorithm_id = input_data.get('algorithm_id')
+        data_set_id = input_data.get('data_set_id')
+        start_date = input_data.get('start_date')
+        end_date = input_data.get('end_date')
+        parameter_grid = input_data.get('parameter_grid')
+        initial_capital = input_data.get('initial_capital', 100000.0)
+        rank_by = input_data.get('rank_by', 'sharpe_ratio')
+        max_workers = input_data.get('max_workers')
+        limit = input_data.get('limit', 20)
+        search = input_data.get('search', 'grid')
+        num_candidates = input_data.get('num_candidates')
+        eta = input_data.get('eta', 3)
+        min_bars = input_data.get('min_bars', 63)
+        seed = input_data.get('seed', 0)
+        background = bool(input_data.get('background', False))
+        
+        if not algorithm_id or not data_set_id:
+            result = json_response(success=False, error="algorithm_id and data_set_id are required")
+            write_json_output(result)
+            sys.exit(1)
+        
+        if not start_date or not end_date:
+            result = json_response(success=False, error="start_date and end_date are required")
+            write_json_output(result)
+            sys.exit(1)
+        
+        if not parameter_grid or not isinstance(parameter_grid, dict):
+            result = json_response(success=False, error="parameter_grid is required")
+            write_json_output(result)
+            sys.exit(1)
+        
+        if search not in ('grid', 'successive_halving'):
+            result = json_response(success=False, error=f"Unknown search: {search}")
+            write_json_output(result)
+            sys.exit(1)
+        
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        # Validate algorithm
+        cursor.execute("SELECT id FROM algorithms WHERE id = ?", (algorithm_id,))
+        if not cursor.fetchone():
+            result = json_response(success=False, error=f"Algorithm with id {algorithm_id} not found")
+            write_json_output(result)
+            sys.exit(1)
+        
+        # Validate data set
+        cursor.execute("SELECT id FROM data_sets WHERE id = ?", (data_set_id,))
+        if not cursor.fetchone():
+            result = json_response(success=False, error=f"Data set with id {data_set_id} not found")
+            write_json_output(result)
+            sys.exit(1)
+        
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(
+            algorithm_id=algorithm_id,
+            start_date=start_date,
+            end_date=end_date,
+            data_set_id=data_set_id,
+            job_type='sweep'
+        )
+        settings = {
+            'parameter_grid': parameter_grid,
+            'initial_capital': initial_capital,
+            'rank_by': rank_by,
+            'max_workers': max_workers,
+            'search': search,
+            'num_candidates': num_candidates,
+            'eta': eta,
+            'min_bars': min_bars,
+            'seed': seed
+        }
+        
+        if background:
+            # Let the backtest worker run the sweep; it resumes from checkpoints after a restart
+            job_manager.enqueue_jobs({job_id: settings})
+            ensure_worker_running(conn)
+            result = json_response(success=True, data={'job_id': job_id, 'status': 'pending'})
+            write_json_output(result)
+            return
+        
+        ranked_results = run_sweep_job({
+            'job_id': job_id,
+            'algorithm_id': algorithm_id,
+            'start_date': start_date,
+            'end_date': end_date,
+            'data_set_id': data_set_id,
+            'parameters': settings
+        }, conn)
+        
+        result = json_response(success=True, data={
+            'job_id': job_id,
+            'total_combinations': len(ranked_results),
+            'search': search,
+            'rank_by': rank_by,
+            'results': ranked_results[:limit]
+        })
+        write_json_output(result)
+    except Exception as e:
+        result = json_response(success=False, error=str(e))
+        write_json_output(result)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
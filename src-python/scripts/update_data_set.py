@@ -20,6 +20,7 @@ logging.basicConfig(
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from modules.backtest.result_cache import BacktestResultCache
 from modules.data_collection.data_updater import DataUpdater
 from utils.json_io import read_json_input, write_json_output, json_response
 
@@ -48,6 +49,10 @@ def main():
             end_date=end_date
         )
         
+        # Backtest results computed on the old rows are stale now
+        if result.get('added_count') or result.get('updated_count'):
+            BacktestResultCache().invalidate_data_set(data_set_id)
+        
         # Write result to stdout
         write_json_output(json_response(success=result.get('success', False), data=result))
         
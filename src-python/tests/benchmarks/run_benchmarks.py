@@ -0,0 +1,252 @@
+"""
+Backtest benchmark suite.
+
+Times each backtest stage on seeded synthetic data of 1k to 1M bars and
+compares the timings with the JSON baseline in baselines/backtest.json.
+Everything runs offline against a temporary SQLite database.
+
+Usage (from src-python):
+    python -m tests.benchmarks.run_benchmarks                    # compare with baseline
+    python -m tests.benchmarks.run_benchmarks --save             # record a new baseline
+    python -m tests.benchmarks.run_benchmarks --sizes 1000 10000 --repeat 5
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.schema import create_all_tables
+from modules.backtest.algorithm_parser import AlgorithmParser
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.data_loader import load_ohlcv
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.performance_calculator import PerformanceCalculator
+from modules.backtest.signal_generator import SignalGenerator
+from modules.backtest.trade_simulator import TradeSimulator
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+SIZES = (1000, 10000, 100000, 1000000)
+BASELINE_PATH = Path(__file__).parent / 'baselines' / 'backtest.json'
+
+# Hourly bars, so 1M bars stay inside the pandas Timestamp range
+BAR_FREQUENCY = 'h'
+PERIODS_PER_YEAR = 24 * 365
+START_DATE = '2000-01-01'
+END_DATE = '2200-12-31'
+INITIAL_CAPITAL = 100000.0
+
+ALGORITHM = {
+    'triggers': [
+        {'type': 'rsi', 'condition': {'operator': 'lt', 'value': 45}},
+        {'type': 'macd', 'condition': {'operator': 'gt', 'value': 0}}
+    ],
+    'actions': [{'type': 'buy', 'parameters': {'percentage': 50}}]
+}
+
+
+def best_time(func: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest of repeat timed calls in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def benchmark_size(conn: sqlite3.Connection, num_bars: int, repeat: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Time every backtest stage on one synthetic data set.
+    
+    Args:
+        conn: Connection to the temporary database
+        num_bars: Number of bars
+        repeat: Number of timed calls per stage (the fastest is kept)
+        seed: Seed of the synthetic data
+    
+    Returns:
+        Dict with the number of bars and trades and the seconds of each stage
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT INTO data_sets (name, symbol, imported_at, source)
+        VALUES (?, 'SYN', ?, 'benchmark')
+    """, (f'synthetic {num_bars}', datetime.now().isoformat()))
+    data_set_id = cursor.lastrowid
+    raw = generate_ohlcv(num_bars, seed=seed, freq=BAR_FREQUENCY, periods_per_year=PERIODS_PER_YEAR)
+    cursor.executemany("""
+        INSERT INTO ohlcv_data (data_set_id, date, open, high, low, close, volume)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, [(data_set_id, *row) for row in raw.itertuples(index=False, name=None)])
+    conn.commit()
+    
+    data = load_ohlcv(cursor, data_set_id)
+    parsed_algorithm = AlgorithmParser().parse_algorithm(ALGORITHM)
+    signal_generator = SignalGenerator()
+    signals_df = signal_generator.generate_signals(data, parsed_algorithm)
+    
+    # Round trips on RSI extremes, so the simulator sees many entries and exits
+    rsi = IndicatorCache(data).get('rsi')
+    trade_signals = signals_df.copy()
+    trade_signals['signal'] = pd.Series(np.where(rsi < 30, 'buy', np.where(rsi > 70, 'sell', None)), dtype=object)
+    trade_simulator = TradeSimulator(INITIAL_CAPITAL)
+    trade_array, _ = trade_simulator.simulate_signal_trades(trade_signals, parsed_algorithm)
+    trades = trade_simulator.trades_to_dicts(trade_array, data['date'].tolist())
+    
+    performance_calculator = PerformanceCalculator(INITIAL_CAPITAL)
+    closes = data['close'].to_numpy()
+    dates = data['date'].tolist()
+    
+    def calculate_performance():
+        equity = performance_calculator.calculate_equity(trade_array, closes)
+        performance_calculator.calculate_performance(trades, equity)
+        performance_calculator.calculate_equity_curve(equity, dates)
+    
+    def run_backtest():
+        return BacktestEngine(ALGORITHM, data, START_DATE, END_DATE, INITIAL_CAPITAL).run()
+    
+    results = run_backtest()
+    job_manager = BacktestJobManager(conn=conn)
+    
+    def save_results():
+        job_id = job_manager.create_job(1, START_DATE, END_DATE, data_set_id=data_set_id)
+        job_manager.save_results(
+            job_id, 1, START_DATE, END_DATE,
+            results['performance'], results['trades'], results['equity_curve']
+        )
+    
+    timings = {
+        'load': best_time(lambda: load_ohlcv(conn.cursor(), data_set_id), repeat),
+        'signals': best_time(
+            lambda: signal_generator.generate_signals(data, parsed_algorithm, IndicatorCache(data)),
+            repeat
+        ),
+        'trades': best_time(lambda: trade_simulator.simulate_trades(trade_signals, parsed_algorithm), repeat),
+        'performance': best_time(calculate_performance, repeat),
+        'backtest': best_time(run_backtest, repeat),
+        'save': best_time(save_results, repeat)
+    }
+    
+    return {
+        'bars': num_bars,
+        'trades': len(trades),
+        'stages': {stage: round(seconds, 6) for stage, seconds in timings.items()}
+    }
+
+
+def run_benchmarks(sizes: List[int], repeat: int) -> Dict[str, Any]:
+    """
+    Run the benchmark for every size against a fresh temporary database.
+    
+    Args:
+        sizes: Numbers of bars
+        repeat: Number of timed calls per stage
+    
+    Returns:
+        Dict with the environment and the results per size
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        conn = sqlite3.connect(os.path.join(temp_dir, 'benchmark.db'))
+        try:
+            create_all_tables(conn)
+            conn.commit()
+            results = {
+                str(num_bars): benchmark_size(conn, num_bars, repeat)
+                for num_bars in sizes
+            }
+        finally:
+            conn.close()
+    
+    return {
+        'created_at': datetime.now().isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'system': platform.system()
+        },
+        'repeat': repeat,
+        'sizes': results
+    }
+
+
+def compare_with_baseline(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    max_slowdown: float,
+    min_seconds: float = 0.001
+) -> List[str]:
+    """
+    Print each stage timing next to its baseline and collect regressions.
+    
+    Args:
+        results: Output of run_benchmarks
+        baseline: Earlier output of run_benchmarks
+        max_slowdown: Ratio to the baseline above which a stage counts as regressed
+        min_seconds: Timings below this are too noisy to count as regressions
+    
+    Returns:
+        List of regression descriptions
+    """
+    regressions = []
+    print(f"{'bars':>9}  {'stage':<12} {'seconds':>10} {'baseline':>10} {'ratio':>7}")
+    for size, result in results['sizes'].items():
+        baseline_stages = baseline.get('sizes', {}).get(size, {}).get('stages', {})
+        for stage, seconds in result['stages'].items():
+            baseline_seconds = baseline_stages.get(stage)
+            if baseline_seconds:
+                ratio = seconds / baseline_seconds
+                print(f"{size:>9}  {stage:<12} {seconds:>10.4f} {baseline_seconds:>10.4f} {ratio:>6.2f}x")
+                if ratio > max_slowdown and seconds > min_seconds:
+                    regressions.append(f"{stage} at {size} bars: {seconds:.4f}s vs {baseline_seconds:.4f}s")
+            else:
+                print(f"{size:>9}  {stage:<12} {seconds:>10.4f} {'-':>10} {'-':>7}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Backtest benchmark suite')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='Numbers of bars')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed calls per stage (fastest is kept)')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help='Baseline JSON file')
+    parser.add_argument('--save', action='store_true', help='Write the results as the new baseline')
+    parser.add_argument('--output', type=Path, help='Also write the results to this JSON file')
+    parser.add_argument('--max-slowdown', type=float, default=1.5, help='Allowed ratio to the baseline')
+    args = parser.parse_args(argv)
+    
+    results = run_benchmarks(args.sizes, args.repeat)
+    
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + '\n')
+    
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + '\n')
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = compare_with_baseline(results, baseline, args.max_slowdown)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Seeded synthetic OHLCV data for benchmarks.
+
+Close prices follow a geometric Brownian motion; open, high and low are
+derived from the close path with random intrabar ranges, and volume is
+log-normal around a base level that rises with the size of the move.
+"""
+import numpy as np
+import pandas as pd
+
+
+def generate_ohlcv(
+    num_bars: int,
+    seed: int = 0,
+    start_date: str = '2000-01-03',
+    freq: str = 'B',
+    periods_per_year: float = 252,
+    initial_price: float = 100.0,
+    drift: float = 0.05,
+    volatility: float = 0.2,
+    base_volume: float = 1000000.0
+) -> pd.DataFrame:
+    """
+    Generate OHLCV data following a geometric Brownian motion.
+    
+    Args:
+        num_bars: Number of bars
+        seed: Random seed (same seed, same data)
+        start_date: Date of the first bar
+        freq: pandas frequency of the bar dates ('B' for business days, 'h' for
+            hourly bars when num_bars business days would not fit the Timestamp range)
+        periods_per_year: Bars per year, which scales drift and volatility per bar
+        initial_price: Open price of the first bar
+        drift: Annualized drift
+        volatility: Annualized volatility
+        base_volume: Median volume of a bar without a price move
+    
+    Returns:
+        DataFrame with columns date (YYYY-MM-DD, or YYYY-MM-DD HH:MM:SS for
+        intraday freq), open, high, low, close, volume
+    """
+    rng = np.random.default_rng(seed)
+    dt = 1 / periods_per_year
+    
+    shocks = rng.standard_normal(num_bars)
+    log_returns = (drift - 0.5 * volatility ** 2) * dt + volatility * np.sqrt(dt) * shocks
+    closes = initial_price * np.exp(np.cumsum(log_returns))
+    opens = np.concatenate(([initial_price], closes[:-1]))
+    
+    # Intrabar range beyond the open/close body
+    ranges = np.abs(rng.normal(0, volatility * np.sqrt(dt) / 2, (2, num_bars)))
+    highs = np.maximum(opens, closes) * (1 + ranges[0])
+    lows = np.minimum(opens, closes) * (1 - ranges[1])
+    
+    volumes = base_volume * np.exp(rng.normal(0, 0.3, num_bars) + np.abs(shocks) * 0.25)
+    
+    dates = pd.date_range(start_date, periods=num_bars, freq=freq)
+    date_format = '%Y-%m-%d' if (dates == dates.normalize()).all() else '%Y-%m-%d %H:%M:%S'
+    
+    return pd.DataFrame({
+        'date': dates.strftime(date_format),
+        'open': np.round(opens, 4),
+        'high': np.round(highs, 4),
+        'low': np.round(lows, 4),
+        'close': np.round(closes, 4),
+        'volume': volumes.astype(np.int64)
+    })
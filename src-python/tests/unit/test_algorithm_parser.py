@@ -0,0 +1,96 @@
+"""
+Unit tests for algorithm parser.
+"""
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.algorithm_parser import AlgorithmParser
+
+
+@pytest.mark.unit
+class TestAlgorithmParser:
+    """Test cases for AlgorithmParser class."""
+    
+    @pytest.fixture
+    def parser(self):
+        """Create AlgorithmParser instance."""
+        return AlgorithmParser()
+    
+    @pytest.fixture
+    def arrays(self):
+        """Create indicator and price arrays with missing leading values."""
+        rng = np.random.default_rng(7)
+        rsi = rng.uniform(0, 100, 200).round(2)
+        rsi[:14] = np.nan
+        ma_20 = rng.uniform(90, 110, 200)
+        ma_20[:19] = np.nan
+        close = rng.uniform(90, 110, 200)
+        close[5] = 100.0
+        indicator_arrays = {'rsi': rsi, 'ma_20': ma_20}
+        price_arrays = {
+            'open': close,
+            'high': close + 1,
+            'low': close - 1,
+            'close': close,
+            'volume': rng.integers(1000, 2000, 200)
+        }
+        return indicator_arrays, price_arrays
+    
+    def _evaluate_per_row(self, parser, triggers, indicator_arrays, price_arrays):
+        """Evaluate triggers with the row-by-row API."""
+        results = []
+        for i in range(len(price_arrays['close'])):
+            indicator_values = {
+                name: values[i] for name, values in indicator_arrays.items()
+                if not np.isnan(values[i])
+            }
+            price_data = {name: values[i] for name, values in price_arrays.items()}
+            results.append(parser.evaluate_triggers(triggers, indicator_values, price_data))
+        return np.array(results)
+    
+    @pytest.mark.parametrize('triggers', [
+        [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': 30}}],
+        [{'type': 'rsi', 'condition': {'operator': 'gte', 'value': 70}}],
+        [{'type': 'price', 'condition': {'operator': 'eq', 'value': 100.0}}],
+        [{'type': 'volume', 'condition': {'operator': 'between', 'value': [1200, 1500]}}],
+        [{'type': 'moving_average', 'condition': {'operator': 'gt', 'value': 100, 'period': 20}}],
+        [{'type': 'moving_average', 'condition': {'operator': 'gt', 'value': 100, 'period': 5}}],
+        [{'type': 'unknown', 'condition': {'operator': 'gt', 'value': 0}}],
+        [{'type': 'rsi', 'condition': {'operator': 'between', 'value': 50}}],
+        [
+            {'type': 'rsi', 'condition': {'operator': 'lt', 'value': 40}, 'logical_operator': 'OR'},
+            {'type': 'price', 'condition': {'operator': 'gt', 'value': 105}, 'logical_operator': 'AND'},
+            {'type': 'volume', 'condition': {'operator': 'lte', 'value': 1800}},
+        ],
+        [
+            {'type': 'rsi', 'condition': {'operator': 'gt', 'value': 20}, 'logical_operator': 'XOR'},
+            {'type': 'moving_average', 'condition': {'operator': 'lt', 'value': 100, 'period': 20}},
+        ],
+    ])
+    def test_compile_trigger_mask_matches_evaluate_triggers(self, parser, arrays, triggers):
+        """Test vectorized trigger evaluation matches row-by-row evaluation."""
+        indicator_arrays, price_arrays = arrays
+        
+        mask = parser.compile_trigger_mask(triggers, indicator_arrays, price_arrays)
+        expected = self._evaluate_per_row(parser, triggers, indicator_arrays, price_arrays)
+        
+        assert mask.dtype == bool
+        assert (mask == expected).all()
+    
+    def test_compile_trigger_mask_no_triggers(self, parser, arrays):
+        """Test empty trigger list never fires."""
+        indicator_arrays, price_arrays = arrays
+        
+        mask = parser.compile_trigger_mask([], indicator_arrays, price_arrays)
+        
+        assert len(mask) == 200
+        assert not mask.any()
+    
+    def test_parse_algorithm_missing_keys(self, parser):
+        """Test parse_algorithm rejects incomplete definitions."""
+        with pytest.raises(ValueError):
+            parser.parse_algorithm({'triggers': []})
@@ -0,0 +1,157 @@
+"""
+Unit tests for incremental backtest continuation.
+"""
+import pytest
+import json
+import sqlite3
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.backtest.job_manager import BacktestJobManager
+
+
+@pytest.mark.unit
+class TestBacktestContinuation:
+    """Test cases for continuing a backtest from its saved state."""
+    
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample OHLCV data."""
+        rng = np.random.default_rng(3)
+        prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 300)))
+        return pd.DataFrame({
+            'date': pd.date_range('2023-01-01', periods=300, freq='D').strftime('%Y-%m-%d'),
+            'open': prices,
+            'high': prices * 1.01,
+            'low': prices * 0.99,
+            'close': prices,
+            'volume': rng.integers(1000000, 2000000, 300)
+        })
+    
+    @pytest.fixture
+    def algorithm(self):
+        """Create an RSI buy algorithm."""
+        return {
+            'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': 45}}],
+            'actions': [{'type': 'buy', 'parameters': {'percentage': 50}}]
+        }
+    
+    def run_engine(self, algorithm, data, state=None, history=None):
+        """Run the engine over the whole frame."""
+        return BacktestEngine(
+            algorithm=algorithm,
+            data=data,
+            start_date=data['date'].iloc[0],
+            end_date=data['date'].iloc[-1],
+            initial_capital=100000.0,
+            state=state,
+            history=history
+        ).run()
+    
+    @pytest.mark.parametrize('split', [120, 200, 299])
+    def test_continuation_matches_full_run(self, algorithm, sample_data, split):
+        """Test a run continued on the new bars matches one run over all bars."""
+        full = self.run_engine(algorithm, sample_data)
+        head = self.run_engine(algorithm, sample_data.iloc[:split])
+        state = json.loads(json.dumps(head['state']))
+        tail = self.run_engine(algorithm, sample_data.iloc[split:].reset_index(drop=True), state)
+        
+        head_trades = head['trades'][:-1] if state['position'] is not None else head['trades']
+        assert head_trades + tail['trades'] == full['trades']
+        assert head['equity_curve'] + tail['equity_curve'] == full['equity_curve']
+        assert tail['state']['last_date'] == full['state']['last_date']
+        assert tail['state']['capital'] == full['state']['capital']
+        assert tail['state']['exposed_bars'] == full['state']['exposed_bars']
+        exposed_bars = full['state']['exposed_bars'] - (full['state']['position'] is not None)
+        assert exposed_bars / len(full['equity_curve']) * 100 == pytest.approx(
+            full['performance']['exposure'], abs=0.01
+        )
+    
+    @pytest.mark.parametrize('split', [5, 150])
+    def test_engine_indicators_continue(self, sample_data, split):
+        """Test batched indicators continue from streaming states or recompute over the history."""
+        names = [
+            'sma_20', 'ema_10', 'atr_14', 'bollinger_20.upper', 'bollinger_20.percent_b',
+            'stochastic_14.d', 'obv', 'vwap_20', 'adx_14'
+        ]
+        full = IndicatorCache(sample_data).get_many(names)
+        head = IndicatorCache(sample_data.iloc[:split])
+        head.precompute(names)
+        tail = IndicatorCache(
+            sample_data.iloc[split:].reset_index(drop=True),
+            resume_states=json.loads(json.dumps(head.get_states())),
+            history=sample_data.iloc[:split]
+        )
+        for name in names:
+            np.testing.assert_array_equal(np.concatenate([head.get(name), tail.get(name)]), full[name], err_msg=name)
+        
+        # Without the earlier bars only the streaming indicators can continue
+        tail = IndicatorCache(sample_data.iloc[split:].reset_index(drop=True), resume_states=head.get_states())
+        assert tail.get('ema_10') is not None
+        with pytest.raises(ValueError):
+            tail.get('obv')
+    
+    def test_engine_trigger_continuation_matches_full_run(self, sample_data):
+        """Test a run on engine indicators continues with the same trades as a full run."""
+        algorithm = {
+            'triggers': [
+                {'type': 'stochastic', 'condition': {'operator': 'lt', 'value': 25}},
+                {'type': 'ema', 'condition': {'operator': 'gt', 'value': 0, 'period': 10}, 'logical_operator': 'AND'}
+            ],
+            'actions': [{'type': 'buy', 'parameters': {'percentage': 50}}]
+        }
+        full = self.run_engine(algorithm, sample_data)
+        head = self.run_engine(algorithm, sample_data.iloc[:200])
+        state = json.loads(json.dumps(head['state']))
+        tail = self.run_engine(algorithm, sample_data.iloc[200:].reset_index(drop=True), state, sample_data.iloc[:200])
+        
+        head_trades = head['trades'][:-1] if state['position'] is not None else head['trades']
+        assert full['trades']
+        assert head_trades + tail['trades'] == full['trades']
+        assert head['equity_curve'] + tail['equity_curve'] == full['equity_curve']
+    
+    def test_state_requires_saved_indicators(self, algorithm, sample_data):
+        """Test continuing without the needed indicator state fails."""
+        head = self.run_engine(algorithm, sample_data.iloc[:100])
+        state = dict(head['state'], indicators={})
+        
+        with pytest.raises(ValueError):
+            self.run_engine(algorithm, sample_data.iloc[100:].reset_index(drop=True), state)
+    
+    def test_append_results(self, temp_db, algorithm, sample_data):
+        """Test continuation results are appended and the state is replaced."""
+        head_end = sample_data['date'].iloc[199]
+        end_date = sample_data['date'].iloc[-1]
+        head = self.run_engine(algorithm, sample_data.iloc[:200])
+        tail = self.run_engine(algorithm, sample_data.iloc[200:].reset_index(drop=True), head['state'])
+        conn = sqlite3.connect(temp_db)
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(1, '2023-01-01', head_end, data_set_id=1)
+        job_manager.save_results(
+            job_id, 1, '2023-01-01', head_end,
+            head['performance'], head['trades'], head['equity_curve'], state=head['state']
+        )
+        
+        assert job_manager.get_state(job_id) == head['state']
+        
+        replace_open_trade = head['state']['position'] is not None
+        job_manager.append_results(
+            job_id, end_date, tail['performance'], tail['trades'],
+            tail['equity_curve'], tail['state'], replace_open_trade=replace_open_trade
+        )
+        
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM backtest_trades WHERE job_id = ?", (job_id,))
+        expected_trades = len(head['trades']) - int(replace_open_trade) + len(tail['trades'])
+        assert cursor.fetchone()[0] == expected_trades
+        cursor.execute("SELECT COUNT(*) FROM backtest_equity_curve WHERE job_id = ?", (job_id,))
+        assert cursor.fetchone()[0] == len(sample_data)
+        cursor.execute("SELECT end_date FROM backtest_jobs WHERE job_id = ?", (job_id,))
+        assert cursor.fetchone()[0] == end_date
+        assert job_manager.get_state(job_id)['last_date'] == end_date
@@ -0,0 +1,138 @@
+"""
+Unit tests for backtest job manager result persistence.
+"""
+import pytest
+import sqlite3
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.job_manager import (
+    BacktestJobManager,
+    decode_equity_curve,
+    encode_equity_curve,
+    format_equity_dates
+)
+
+
+@pytest.mark.unit
+class TestBacktestJobManager:
+    """Test cases for BacktestJobManager result persistence."""
+    
+    @pytest.fixture
+    def job_manager(self, temp_db):
+        """Create BacktestJobManager instance."""
+        conn = sqlite3.connect(temp_db)
+        yield BacktestJobManager(conn=conn)
+        conn.close()
+    
+    @pytest.fixture
+    def trades(self):
+        """Create two trades."""
+        return [
+            {
+                'entry_date': pd.Timestamp('2023-01-03'), 'exit_date': pd.Timestamp('2023-01-10'),
+                'entry_price': 10.0, 'exit_price': 11.0, 'quantity': 100, 'profit': 100.0, 'profit_rate': 10.0
+            },
+            {
+                'entry_date': '2023-02-01', 'exit_date': '2023-02-06', 'entry_price': 11.0,
+                'exit_price': 10.5, 'quantity': 90, 'profit': -45.0, 'profit_rate': -4.55
+            }
+        ]
+    
+    @pytest.fixture
+    def equity_curve(self):
+        """Create an equity curve over business days."""
+        dates = pd.bdate_range('2023-01-02', periods=300)
+        equity = np.round(100000 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.01, 300))), 2)
+        return [{'date': date, 'equity': value} for date, value in zip(dates, equity.tolist())]
+    
+    def save(self, job_manager, trades, equity_curve, compact_equity):
+        """Create a job and save results for it."""
+        job_id = job_manager.create_job(1, '2023-01-01', '2024-12-31', data_set_id=1)
+        job_manager.save_results(
+            job_id, 1, '2023-01-01', '2024-12-31', {'total_return': 1.0, 'total_trades': 2},
+            trades, equity_curve, compact_equity=compact_equity
+        )
+        return job_id
+    
+    def test_encode_decode_round_trip(self):
+        """Test blobs decode to the exact dates and values."""
+        dates = np.array(['1999-12-31', '2000-01-03', '2023-06-30'], dtype='datetime64[D]')
+        equity = np.array([100000.0, 100123.45, 99999.99])
+        
+        decoded_dates, decoded_equity = decode_equity_curve(*encode_equity_curve(dates, equity))
+        
+        assert np.array_equal(decoded_dates, dates)
+        assert np.array_equal(decoded_equity, equity)
+    
+    def test_encode_keeps_intraday_times(self):
+        """Test intraday bars keep their times and formatted dates drop only midnight times."""
+        dates = np.array(['2024-03-01T09:30:00', '2024-03-01T09:35:00', '2024-03-04T00:00:00'], dtype='datetime64[s]')
+        equity = np.array([100000.0, 100010.0, 100020.0])
+        
+        decoded_dates, _ = decode_equity_curve(*encode_equity_curve(dates, equity))
+        
+        assert decoded_dates.dtype == np.dtype('datetime64[s]')
+        assert np.array_equal(decoded_dates, dates)
+        assert format_equity_dates(decoded_dates) == ['2024-03-01T09:30:00', '2024-03-01T09:35:00', '2024-03-04']
+    
+    @pytest.mark.parametrize('compact_equity', [False, True])
+    def test_save_results_round_trip(self, job_manager, trades, equity_curve, compact_equity):
+        """Test both storage modes return the saved equity curve and trades."""
+        job_id = self.save(job_manager, trades, equity_curve, compact_equity)
+        
+        dates, equity = job_manager.get_equity_curve(job_id)
+        
+        assert format_equity_dates(dates) == [p['date'].strftime('%Y-%m-%d') for p in equity_curve]
+        assert equity.tolist() == [p['equity'] for p in equity_curve]
+        cursor = job_manager.conn.cursor()
+        cursor.execute("SELECT entry_date, profit FROM backtest_trades WHERE job_id = ? ORDER BY id", (job_id,))
+        assert cursor.fetchall() == [('2023-01-03', 100.0), ('2023-02-01', -45.0)]
+        cursor.execute("SELECT COUNT(*) FROM backtest_equity_curve WHERE job_id = ?", (job_id,))
+        assert cursor.fetchone()[0] == (0 if compact_equity else len(equity_curve))
+    
+    def test_save_results_keeps_intraday_times(self, job_manager, trades):
+        """Test trade and equity rows keep times that are not midnight."""
+        intraday_trades = [dict(trades[0], entry_date=pd.Timestamp('2023-01-03 09:30'))]
+        equity_curve = [
+            {'date': pd.Timestamp('2023-01-03 09:30'), 'equity': 100000.0},
+            {'date': pd.Timestamp('2023-01-03 09:35'), 'equity': 100050.0}
+        ]
+        job_id = self.save(job_manager, intraday_trades, equity_curve, compact_equity=False)
+        
+        cursor = job_manager.conn.cursor()
+        cursor.execute("SELECT entry_date, exit_date FROM backtest_trades WHERE job_id = ?", (job_id,))
+        assert cursor.fetchall() == [('2023-01-03T09:30:00', '2023-01-10')]
+        dates, _ = job_manager.get_equity_curve(job_id)
+        assert format_equity_dates(dates) == ['2023-01-03T09:30:00', '2023-01-03T09:35:00']
+    
+    def test_save_results_rolls_back_on_error(self, job_manager, trades, equity_curve):
+        """Test a failing insert leaves no partial results behind."""
+        job_id = job_manager.create_job(1, '2023-01-01', '2024-12-31', data_set_id=1)
+        broken_trades = trades + [{'entry_date': '2023-03-01'}]
+        
+        with pytest.raises(KeyError):
+            job_manager.save_results(job_id, 1, '2023-01-01', '2024-12-31', {}, broken_trades, equity_curve)
+        
+        cursor = job_manager.conn.cursor()
+        for table in ('backtest_results', 'backtest_trades', 'backtest_equity_curve'):
+            cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE job_id = ?", (job_id,))
+            assert cursor.fetchone()[0] == 0
+    
+    def test_append_and_copy_compact_equity(self, job_manager, trades, equity_curve):
+        """Test continuation runs and cache copies extend and duplicate the blob."""
+        job_id = self.save(job_manager, trades, equity_curve[:200], compact_equity=True)
+        state = {'last_date': '2023-12-15'}
+        
+        job_manager.append_results(job_id, '2024-12-31', {}, [], equity_curve[200:], state)
+        job_manager.update_job_status(job_id, 'completed', 1.0, 'done', completed=True)
+        copy_job_id = job_manager.create_job(2, '2023-01-01', '2024-12-31', data_set_id=1)
+        job_manager.copy_results(job_id, copy_job_id, 2)
+        
+        for stored_job_id in (job_id, copy_job_id):
+            _, equity = job_manager.get_equity_curve(stored_job_id)
+            assert equity.tolist() == [p['equity'] for p in equity_curve]
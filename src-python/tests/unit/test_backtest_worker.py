@@ -0,0 +1,115 @@
+"""
+Unit tests for the backtest job queue and worker.
+"""
+import pytest
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.connection import get_connection
+from modules.backtest.backtest_worker import BacktestWorker, is_worker_alive
+from modules.backtest.job_manager import BacktestJobManager
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+@pytest.mark.unit
+class TestBacktestWorker:
+    """Test cases for BacktestWorker and the job queue."""
+    
+    @pytest.fixture
+    def conn(self, temp_db):
+        """Create a connection with one data set and two algorithms."""
+        conn = get_connection()
+        conn.execute("""
+            INSERT INTO data_sets (id, name, symbol, imported_at, source)
+            VALUES (1, 'test', 'TEST', '2024-01-01', 'csv')
+        """)
+        conn.executemany("""
+            INSERT INTO ohlcv_data (data_set_id, date, open, high, low, close, volume)
+            VALUES (1, ?, ?, ?, ?, ?, ?)
+        """, list(generate_ohlcv(300).itertuples(index=False)))
+        for algorithm_id, value in ((1, 40), (2, 60)):
+            conn.execute("INSERT INTO algorithms (id, name, definition) VALUES (?, ?, ?)", (
+                algorithm_id,
+                f'Algorithm {algorithm_id}',
+                json.dumps({
+                    'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': value}}],
+                    'actions': [{'type': 'buy', 'parameters': {'percentage': 100}}]
+                })
+            ))
+        conn.commit()
+        yield conn
+        conn.close()
+    
+    def enqueue(self, conn, algorithm_ids):
+        """Create and queue one batch of jobs."""
+        job_manager = BacktestJobManager(conn=conn)
+        job_ids = [
+            job_manager.create_job(algorithm_id, '2000-01-01', '2001-12-31', data_set_id=1)
+            for algorithm_id in algorithm_ids
+        ]
+        job_manager.enqueue_jobs({job_id: {'initial_capital': 50000.0} for job_id in job_ids})
+        return job_ids
+    
+    def statuses(self, conn, job_ids):
+        """Get the status of each job."""
+        return [
+            conn.execute("SELECT status FROM backtest_jobs WHERE job_id = ?", (job_id,)).fetchone()[0]
+            for job_id in job_ids
+        ]
+    
+    def test_claim_pending_batch(self, conn):
+        """Test a batch is claimed whole, once, oldest first; unqueued jobs are left alone."""
+        job_manager = BacktestJobManager(conn=conn)
+        unqueued_job_id = job_manager.create_job(1, '2000-01-01', '2001-12-31', data_set_id=1)
+        first = self.enqueue(conn, [1, 2])
+        second = self.enqueue(conn, [1])
+        
+        jobs = job_manager.claim_pending_batch()
+        assert [job['job_id'] for job in jobs] == first
+        assert jobs[0]['parameters'] == {'initial_capital': 50000.0}
+        assert self.statuses(conn, first) == ['running', 'running']
+        assert [job['job_id'] for job in job_manager.claim_pending_batch()] == second
+        assert job_manager.claim_pending_batch() is None
+        assert self.statuses(conn, [unqueued_job_id]) == ['pending']
+        
+        assert job_manager.fail_unfinished_jobs(first + second, 'stopped') == 3
+        assert self.statuses(conn, first) == ['failed', 'failed']
+    
+    def test_single_live_worker(self, conn):
+        """Test a second worker is refused while the first sends heartbeats."""
+        worker = BacktestWorker(conn=conn)
+        assert worker.register()
+        assert is_worker_alive(conn)
+        assert not BacktestWorker(conn=conn).register()
+        
+        worker.unregister()
+        assert not is_worker_alive(conn)
+    
+    def test_dead_worker_jobs_are_queued_again(self, conn):
+        """Test a worker replacing one with a stale heartbeat requeues its running jobs."""
+        job_ids = self.enqueue(conn, [1])
+        dead_worker = BacktestWorker(conn=conn)
+        dead_worker.register()
+        BacktestJobManager(conn=conn).claim_pending_batch()
+        stale = (datetime.now() - timedelta(minutes=5)).isoformat()
+        conn.execute("UPDATE backtest_workers SET heartbeat_at = ?", (stale,))
+        conn.commit()
+        
+        assert BacktestWorker(conn=conn).register()
+        assert self.statuses(conn, job_ids) == ['pending']
+        assert not dead_worker.heartbeat()
+    
+    def test_run_processes_queue(self, conn):
+        """Test the worker runs every queued batch in child processes and exits when idle."""
+        job_ids = self.enqueue(conn, [1, 2]) + self.enqueue(conn, [1])
+        
+        worker = BacktestWorker(max_concurrent_jobs=2, poll_interval=0.05, idle_timeout=0.0, conn=conn)
+        assert worker.run()
+        
+        assert self.statuses(conn, job_ids) == ['completed'] * 3
+        assert conn.execute("SELECT COUNT(*) FROM backtest_results").fetchone()[0] == 3
+        assert not is_worker_alive(conn)
@@ -0,0 +1,70 @@
+"""
+Unit tests for multi-data-set analysis.
+"""
+import pytest
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.connection import get_connection
+from modules.data_analysis.analyzer import DataAnalyzer
+from modules.data_analysis.batch_analyzer import BatchAnalyzer
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+@pytest.mark.unit
+class TestBatchAnalyzer:
+    """Test cases for BatchAnalyzer."""
+    
+    @pytest.fixture
+    def conn(self, temp_db):
+        """Create a connection with three data sets, the last one without bars."""
+        conn = get_connection()
+        for data_set_id in (1, 2, 3):
+            conn.execute("""
+                INSERT INTO data_sets (id, name, symbol, imported_at, source)
+                VALUES (?, ?, ?, '2024-01-01', 'csv')
+            """, (data_set_id, f'test {data_set_id}', f'TEST{data_set_id}'))
+        for data_set_id in (1, 2):
+            conn.executemany("""
+                INSERT INTO ohlcv_data (data_set_id, date, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [(data_set_id, *row) for row in generate_ohlcv(120, seed=data_set_id).itertuples(index=False)])
+        conn.commit()
+        yield conn
+        conn.close()
+    
+    @pytest.mark.parametrize('max_workers', [1, 2])
+    def test_run_writes_results_and_statuses(self, conn, max_workers):
+        """Test every job ends completed with the single-analysis result, or failed without data."""
+        analyzer = BatchAnalyzer(conn, max_workers=max_workers, write_batch_size=2)
+        jobs = analyzer.create_jobs([1, 2, 3])
+        assert [row[0] for row in conn.execute("SELECT status FROM analysis_jobs")] == ['pending'] * 3
+        
+        assert analyzer.run(jobs) == {'completed': 2, 'failed': 1}
+        
+        statuses = {
+            row['data_set_id']: (row['status'], row['error'])
+            for row in conn.execute("SELECT data_set_id, status, error FROM analysis_jobs")
+        }
+        assert statuses == {1: ('completed', None), 2: ('completed', None), 3: ('failed', 'No data found')}
+        rows = conn.execute("SELECT job_id, data_set_id, technical_indicators FROM analysis_results").fetchall()
+        assert sorted(row['data_set_id'] for row in rows) == [1, 2]
+        expected = DataAnalyzer(conn).analyze(2)['technical_indicators']
+        assert json.loads(next(row for row in rows if row['data_set_id'] == 2)['technical_indicators']) == expected
+        assert {row['job_id'] for row in rows} == {job_id for job_id, data_set_id in jobs if data_set_id != 3}
+    
+    def test_interrupted_run_fails_unfinished_jobs(self, conn, monkeypatch):
+        """Test jobs left without an outcome are marked failed instead of staying running."""
+        analyzer = BatchAnalyzer(conn, max_workers=1, write_batch_size=10)
+        jobs = analyzer.create_jobs([1, 2])
+        
+        def interrupt(self, data_set_id):
+            raise KeyboardInterrupt
+        
+        monkeypatch.setattr(DataAnalyzer, 'analyze', interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            analyzer.run(jobs)
+        assert [row[0] for row in conn.execute("SELECT status FROM analysis_jobs")] == ['failed', 'failed']
@@ -0,0 +1,136 @@
+"""
+Unit tests for batch backtests.
+"""
+import pytest
+import json
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.connection import get_connection
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.batch_backtest import BatchBacktest, prepare_shared_inputs
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.backtest_worker import run_backtest_jobs
+
+
+ALGORITHMS = {
+    1: {
+        'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': 40}}],
+        'actions': [{'type': 'buy', 'parameters': {'percentage': 100}}]
+    },
+    2: {
+        'triggers': [{'type': 'moving_average', 'condition': {'operator': 'lt', 'value': 100, 'period': 20}}],
+        'actions': [{'type': 'buy', 'parameters': {'percentage': 50}}]
+    },
+    3: {
+        'triggers': [{'type': 'macd', 'condition': {'operator': 'gt', 'value': 0}}],
+        'actions': [{'type': 'buy'}]
+    },
+}
+
+
+@pytest.fixture
+def sample_data():
+    """Create sample OHLCV data."""
+    rng = np.random.default_rng(11)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 150)))
+    return pd.DataFrame({
+        'date': pd.date_range('2023-01-01', periods=150, freq='D').strftime('%Y-%m-%d'),
+        'open': prices,
+        'high': prices * 1.01,
+        'low': prices * 0.99,
+        'close': prices,
+        'volume': rng.integers(1000000, 2000000, 150)
+    })
+
+
+@pytest.mark.unit
+class TestBatchBacktest:
+    """Test cases for BatchBacktest class."""
+    
+    def test_prepare_shared_inputs(self, sample_data):
+        """Test every referenced indicator is computed once up front."""
+        filtered, cache = prepare_shared_inputs(
+            list(ALGORITHMS.values()), sample_data, '2023-02-01', '2023-12-31'
+        )
+        
+        assert len(filtered) == len(cache) == 119
+        assert sorted(cache.names) == ['ma_20', 'macd', 'rsi']
+    
+    def test_run_matches_individual_backtests(self, sample_data):
+        """Test batch results equal separate BacktestEngine runs."""
+        batch = BatchBacktest(ALGORITHMS, sample_data.copy(), '2023-01-01', '2023-12-31')
+        
+        results = batch.run()
+        
+        assert set(results.keys()) == {1, 2, 3}
+        for algorithm_id, algorithm in ALGORITHMS.items():
+            expected = BacktestEngine(algorithm, sample_data.copy(), '2023-01-01', '2023-12-31').run()
+            assert results[algorithm_id]['performance'] == expected['performance']
+            assert results[algorithm_id]['trades'] == expected['trades']
+    
+    def test_run_in_process_pool(self, sample_data):
+        """Test worker processes report every algorithm through the callback."""
+        batch = BatchBacktest(ALGORITHMS, sample_data.copy(), '2023-01-01', '2023-12-31', max_workers=2)
+        reported = []
+        
+        results = batch.run(result_callback=lambda algorithm_id, _: reported.append(algorithm_id))
+        
+        assert sorted(reported) == [1, 2, 3]
+        expected = BatchBacktest(ALGORITHMS, sample_data.copy(), '2023-01-01', '2023-12-31').run()
+        for algorithm_id in ALGORITHMS:
+            assert results[algorithm_id]['performance'] == expected[algorithm_id]['performance']
+    
+    def test_run_algorithm_error_is_isolated(self, sample_data):
+        """Test one invalid algorithm does not fail the others."""
+        algorithms = {1: ALGORITHMS[1], 9: {'triggers': []}}
+        
+        results = BatchBacktest(algorithms, sample_data, '2023-01-01', '2023-12-31').run()
+        
+        assert 'performance' in results[1]
+        assert 'error' in results[9]
+
+
+@pytest.mark.unit
+def test_run_backtest_jobs_saves_per_algorithm(temp_db, sample_data):
+    """Test each selected algorithm gets its own completed job and results."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT INTO data_sets (name, symbol, imported_at, source)
+        VALUES ('Test', 'TEST', '2023-01-01', 'csv')
+    """)
+    data_set_id = cursor.lastrowid
+    cursor.executemany("""
+        INSERT INTO ohlcv_data (data_set_id, date, open, high, low, close, volume)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, [
+        (data_set_id, row.date, row.open, row.high, row.low, row.close, int(row.volume))
+        for row in sample_data.itertuples()
+    ])
+    for algorithm_id, algorithm in ALGORITHMS.items():
+        cursor.execute("""
+            INSERT INTO algorithms (id, name, definition) VALUES (?, ?, ?)
+        """, (algorithm_id, f'Algorithm {algorithm_id}', json.dumps(algorithm)))
+    conn.commit()
+    
+    job_manager = BacktestJobManager(conn=conn)
+    job_ids = {
+        algorithm_id: job_manager.create_job(algorithm_id, '2023-01-01', '2023-12-31', data_set_id)
+        for algorithm_id in [1, 2, 3, 42]
+    }
+    
+    run_backtest_jobs(job_ids, '2023-01-01', '2023-12-31', data_set_id)
+    
+    for algorithm_id, job_id in job_ids.items():
+        cursor.execute("SELECT status FROM backtest_jobs WHERE job_id = ?", (job_id,))
+        expected_status = 'failed' if algorithm_id == 42 else 'completed'
+        assert cursor.fetchone()[0] == expected_status
+    
+    cursor.execute("SELECT algorithm_id FROM backtest_results ORDER BY algorithm_id")
+    assert [row[0] for row in cursor.fetchall()] == [1, 2, 3]
+    conn.close()
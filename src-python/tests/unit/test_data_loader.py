@@ -0,0 +1,98 @@
+"""
+Unit tests for backtest data loading.
+"""
+import pytest
+import sqlite3
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.batch_backtest import prepare_shared_inputs
+from modules.backtest.data_loader import get_warmup_bars, load_ohlcv, load_symbol_data
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+@pytest.mark.unit
+class TestDataLoader:
+    """Test cases for load_ohlcv, load_symbol_data and get_warmup_bars."""
+    
+    @pytest.fixture
+    def conn(self, temp_db):
+        """Create a connection with two data sets of 300 business days."""
+        conn = sqlite3.connect(temp_db)
+        conn.row_factory = sqlite3.Row
+        for data_set_id, symbol in ((1, 'AAA'), (2, 'BBB')):
+            conn.execute("""
+                INSERT INTO data_sets (id, name, symbol, imported_at, source)
+                VALUES (?, ?, ?, '2024-01-01', 'csv')
+            """, (data_set_id, symbol, symbol))
+            conn.executemany("""
+                INSERT INTO ohlcv_data (data_set_id, date, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [(data_set_id, *row) for row in generate_ohlcv(300, seed=data_set_id).itertuples(index=False)])
+        conn.commit()
+        yield conn
+        conn.close()
+    
+    def test_get_warmup_bars(self):
+        """Test the warmup is the longest lookback of every algorithm's indicators."""
+        rsi = {'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': 30}}]}
+        macd = {'triggers': [{'type': 'macd', 'condition': {'operator': 'gt', 'value': 0}}]}
+        
+        assert get_warmup_bars([]) == 0
+        assert get_warmup_bars([rsi]) == 14
+        assert get_warmup_bars([rsi, macd]) == 34
+    
+    def test_load_ohlcv_range_and_warmup(self, conn):
+        """Test the end date is inclusive and the warmup counts bars, not days."""
+        full = load_ohlcv(conn.cursor(), 1)
+        data = load_ohlcv(conn.cursor(), 1, '2000-03-01', '2000-06-30', warmup_bars=10)
+        
+        assert len(full) == 300
+        assert full['date'].dtype == np.dtype('datetime64[ns]')
+        assert (data['date'].iloc[10:] >= '2000-03-01').all()
+        assert (data['date'].iloc[:10] < '2000-03-01').all()
+        assert data['date'].iloc[-1] == np.datetime64('2000-06-30')
+        assert np.array_equal(data['close'], full['close'][full['date'].between(data['date'].iloc[0], '2000-06-30')])
+        
+        # Fewer earlier bars than requested loads them all
+        assert load_ohlcv(conn.cursor(), 1, '2000-01-10', None, warmup_bars=100)['date'].iloc[0] == full['date'].iloc[0]
+        with pytest.raises(ValueError):
+            load_ohlcv(conn.cursor(), 1, '2010-01-01', '2010-12-31')
+    
+    def test_load_symbol_data(self, conn):
+        """Test data sets are keyed by symbol and empty ones are left out."""
+        conn.execute("UPDATE data_sets SET symbol = 'AAA' WHERE id = 2")
+        conn.execute("""
+            INSERT INTO data_sets (id, name, symbol, imported_at, source)
+            VALUES (3, 'empty', 'CCC', '2024-01-01', 'csv')
+        """)
+        
+        symbol_data = load_symbol_data(conn.cursor(), [1, 2, 3], '2000-03-01', '2000-06-30', warmup_bars=5)
+        
+        assert list(symbol_data) == ['AAA (1)', 'AAA (2)']
+        assert all(len(data) == len(symbol_data['AAA (1)']) for data in symbol_data.values())
+    
+    def test_warmup_gives_indicators_from_first_bar(self, conn):
+        """Test warmup bars fill the indicators at start_date without being traded."""
+        algorithm = {
+            'triggers': [{'type': 'moving_average', 'condition': {'operator': 'lt', 'value': 0, 'period': 50}}],
+            'actions': [{'type': 'buy', 'parameters': {'percentage': 100}}]
+        }
+        warmup_bars = get_warmup_bars([algorithm])
+        data = load_ohlcv(conn.cursor(), 1, '2000-06-01', '2000-12-31', warmup_bars)
+        
+        shared_data, indicator_cache = prepare_shared_inputs([algorithm], data, '2000-06-01', '2000-12-31', warmup_bars)
+        assert shared_data['date'].iloc[0] == np.datetime64('2000-06-01')
+        assert not np.isnan(indicator_cache.get('ma_50')[0])
+        
+        results = BacktestEngine(algorithm, data, '2000-06-01', '2000-12-31', warmup_bars=warmup_bars).run()
+        shared_results = BacktestEngine(
+            algorithm, shared_data, '2000-06-01', '2000-12-31', indicator_cache=indicator_cache
+        ).run()
+        assert results['equity_curve'][0]['date'] == np.datetime64('2000-06-01')
+        assert results['trades'] == shared_results['trades']
+        assert results['equity_curve'] == shared_results['equity_curve']
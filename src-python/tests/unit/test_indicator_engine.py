@@ -0,0 +1,167 @@
+"""
+Unit tests for the batched indicator engine.
+"""
+import pickle
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.algorithm_parser import AlgorithmParser
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.data_analysis.analyzer import DataAnalyzer
+from modules.data_analysis.indicator_engine import IndicatorEngine
+from modules.data_analysis.streaming_indicators import (
+    StreamingATR,
+    StreamingBollinger,
+    StreamingEMA,
+    StreamingSMA
+)
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+@pytest.mark.unit
+class TestIndicatorEngine:
+    """Test cases for IndicatorEngine and the triggers and analysis built on it."""
+    
+    @pytest.fixture
+    def sample_data(self):
+        """Create 300 bars of synthetic OHLCV data."""
+        return generate_ohlcv(300, seed=11)
+    
+    def stream(self, indicator, data, field=None):
+        """Run a streaming indicator over data, with NaN where it has no value."""
+        values = []
+        for bar in data.to_dict('records'):
+            value = indicator.update(bar)
+            if value is not None and field is not None:
+                value = value[field]
+            values.append(np.nan if value is None else value)
+        return np.array(values)
+    
+    def test_matches_streaming_indicators(self, sample_data):
+        """Test SMA, EMA, Bollinger Bands and ATR equal the streaming indicators."""
+        arrays = IndicatorEngine(sample_data).compute(['sma_20', 'ema_12', 'bollinger_20', 'atr_14'])
+        
+        np.testing.assert_array_equal(arrays['sma_20'], self.stream(StreamingSMA(20), sample_data))
+        np.testing.assert_array_equal(arrays['ema_12'], self.stream(StreamingEMA(12), sample_data))
+        np.testing.assert_array_equal(arrays['atr_14'], self.stream(StreamingATR(14), sample_data))
+        for field in ('upper', 'middle', 'lower'):
+            np.testing.assert_array_equal(
+                arrays[f'bollinger_20.{field}'],
+                self.stream(StreamingBollinger(20), sample_data, field)
+            )
+        assert set(arrays) == {
+            'sma_20', 'ema_12', 'atr_14',
+            'bollinger_20.upper', 'bollinger_20.middle', 'bollinger_20.lower', 'bollinger_20.percent_b'
+        }
+    
+    def test_matches_reference_formulas(self, sample_data):
+        """Test stochastic, OBV, VWAP and ADX equal direct pandas and loop implementations."""
+        engine = IndicatorEngine(sample_data)
+        high, low, close, volume = (sample_data[column] for column in ('high', 'low', 'close', 'volume'))
+        
+        k = 100 * (close - low.rolling(14).min()) / (high.rolling(14).max() - low.rolling(14).min())
+        np.testing.assert_allclose(engine.get('stochastic_14.k'), k, rtol=1e-12)
+        np.testing.assert_allclose(engine.get('stochastic_14.d'), k.rolling(3).mean(), rtol=1e-12)
+        np.testing.assert_allclose(engine.get('obv'), (np.sign(close.diff().fillna(0)) * volume).cumsum())
+        typical_price = (high + low + close) / 3
+        np.testing.assert_allclose(
+            engine.get('vwap_20'),
+            (typical_price * volume).rolling(20).sum() / volume.rolling(20).sum(),
+            rtol=1e-12
+        )
+        
+        # ADX with Wilder averages written out bar by bar
+        period = 14
+        atr = self.stream(StreamingATR(period), sample_data)
+        plus_dm = [0.0]
+        minus_dm = [0.0]
+        for i in range(1, len(sample_data)):
+            up = high[i] - high[i - 1]
+            down = low[i - 1] - low[i]
+            plus_dm.append(up if up > down and up > 0 else 0.0)
+            minus_dm.append(down if down > up and down > 0 else 0.0)
+        
+        def wilder(values, start):
+            smoothed = [np.nan] * len(values)
+            smoothed[start + period - 1] = np.mean(values[start:start + period])
+            for i in range(start + period, len(values)):
+                smoothed[i] = (smoothed[i - 1] * (period - 1) + values[i]) / period
+            return np.array(smoothed)
+        
+        plus_di = 100 * wilder(plus_dm, 0) / atr
+        minus_di = 100 * wilder(minus_dm, 0) / atr
+        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+        np.testing.assert_allclose(engine.get('adx_14.plus_di'), plus_di, rtol=1e-10)
+        np.testing.assert_allclose(engine.get('adx_14'), wilder(np.nan_to_num(dx), period - 1), rtol=1e-10)
+        assert np.isnan(engine.get('adx_14')[:2 * period - 2]).all()
+    
+    def test_lookback_and_unknown_names(self, sample_data):
+        """Test lookbacks match the first value of each indicator and unknown names are rejected."""
+        engine = IndicatorEngine(sample_data)
+        for name in ('sma_20', 'ema_12', 'bollinger_20.upper', 'atr_14', 'stochastic_14.d', 'vwap_20', 'obv',
+                     'adx_14', 'adx_14.minus_di'):
+            array = engine.get(name)
+            assert np.isnan(array[:IndicatorEngine.get_lookback(name)]).all()
+            assert not np.isnan(array[IndicatorEngine.get_lookback(name)])
+        
+        for name in ('sma_0', 'ema_x', 'bollinger_20.k', 'obv.value', 'rsi', 'wma_10'):
+            assert engine.get(name) is None
+            assert IndicatorEngine.get_lookback(name) is None
+        assert engine.compute(['sma_x']) == {}
+        
+        # A flat series has no band and no range; both oscillators sit in the middle
+        flat = pd.DataFrame({'high': [5.0] * 30, 'low': [5.0] * 30, 'close': [5.0] * 30, 'volume': [0.0] * 30})
+        flat_engine = IndicatorEngine(flat)
+        assert flat_engine.get('bollinger_20')[-1] == 0.5
+        assert flat_engine.get('stochastic_14')[-1] == 50.0
+        assert np.isnan(flat_engine.get('vwap_20')[-1])
+    
+    def test_triggers_and_cache(self, sample_data):
+        """Test new trigger types resolve to engine indicators computed through the cache."""
+        parser = AlgorithmParser()
+        triggers = [
+            {'type': 'ema', 'condition': {'operator': 'gt', 'value': 0, 'period': 12}},
+            {'type': 'sma', 'condition': {'operator': 'gt', 'value': 0, 'period': 20}},
+            {'type': 'bollinger', 'condition': {'operator': 'lt', 'value': 0.2, 'period': 20}},
+            {'type': 'adx', 'condition': {'operator': 'gt', 'value': 20, 'indicator': 'plus_di'}},
+            {'type': 'stochastic', 'condition': {'operator': 'lt', 'value': 20, 'indicator': 'x'}},
+            {'type': 'obv', 'condition': {'operator': 'gt', 'value': 0}}
+        ]
+        assert parser.get_required_indicators(triggers) == [
+            'ema_12', 'ma_20', 'bollinger_20.percent_b', 'adx_14.plus_di', 'obv'
+        ]
+        
+        cache = IndicatorCache(sample_data)
+        arrays = cache.get_many(parser.get_required_indicators(triggers))
+        np.testing.assert_array_equal(arrays['adx_14.plus_di'], IndicatorEngine(sample_data).get('adx_14.plus_di'))
+        assert IndicatorCache.get_lookback('bollinger_20.percent_b') == 19
+        assert pickle.loads(pickle.dumps(cache))._engine is None
+        
+        # Per-bar and vectorized evaluation agree
+        prices = {column: sample_data[column].to_numpy() for column in ('open', 'high', 'low', 'close', 'volume')}
+        mask = parser.compile_trigger_mask(triggers[2:3], arrays, prices)
+        bar = 250
+        assert mask[bar] == parser.evaluate_trigger(
+            triggers[2],
+            {name: array[bar] for name, array in arrays.items()},
+            {column: values[bar] for column, values in prices.items()}
+        )
+        
+        # Engine indicators have no state to continue from
+        with pytest.raises(ValueError):
+            IndicatorCache(sample_data, resume_states={}).get('ema_12')
+    
+    def test_analysis_reports_catalogue(self, sample_data):
+        """Test analysis reports the last value of each configured indicator and skips short series."""
+        results = DataAnalyzer(indicators=['sma_20', 'sma_200', 'ema_12', 'adx_14', 'obv'])._calculate_engine_indicators(
+            sample_data.iloc[:100]
+        )
+        assert [sma['period'] for sma in results['sma']] == [20]
+        assert results['ema'][0]['value'] == round(float(self.stream(StreamingEMA(12), sample_data.iloc[:100])[-1]), 4)
+        assert set(results['adx']) == {'adx', 'plus_di', 'minus_di', 'period'}
+        assert set(results['obv']) == {'value'}
@@ -0,0 +1,126 @@
+"""
+Unit tests for materialized indicator values.
+"""
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.connection import get_connection
+from modules.backtest.batch_backtest import prepare_shared_inputs
+from modules.backtest.data_loader import load_ohlcv
+from modules.data_analysis.analyzer import DataAnalyzer
+from modules.data_analysis.indicator_store import IndicatorStore
+from modules.data_analysis.streaming_indicators import StreamingMACD, StreamingRSI
+from modules.data_analysis.technical_indicators import TechnicalIndicators
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+@pytest.mark.unit
+class TestIndicatorStore:
+    """Test cases for IndicatorStore and its readers."""
+    
+    @pytest.fixture
+    def sample_data(self):
+        """Create 300 bars of synthetic OHLCV data."""
+        return generate_ohlcv(300, seed=5)
+    
+    @pytest.fixture
+    def conn(self, temp_db):
+        """Create a connection with an empty data set."""
+        conn = get_connection()
+        conn.execute("""
+            INSERT INTO data_sets (id, name, symbol, imported_at, source)
+            VALUES (1, 'test', 'TEST', '2024-01-01', 'csv')
+        """)
+        conn.commit()
+        yield conn
+        conn.close()
+    
+    def insert(self, conn, data):
+        """Insert bars into data set 1."""
+        conn.executemany("""
+            INSERT INTO ohlcv_data (data_set_id, date, open, high, low, close, volume)
+            VALUES (1, ?, ?, ?, ?, ?, ?)
+        """, list(data.itertuples(index=False)))
+        conn.commit()
+    
+    def test_incremental_update_matches_rebuild(self, conn, sample_data):
+        """Test columns extended by new bars equal columns computed in one pass."""
+        store = IndicatorStore(conn)
+        self.insert(conn, sample_data.iloc[:200])
+        assert store.update(1) == {'num_points': 200, 'rebuilt': False}
+        self.insert(conn, sample_data.iloc[200:])
+        assert store.update(1) == {'num_points': 100, 'rebuilt': False}
+        assert store.update(1) == {'num_points': 0, 'rebuilt': False}
+        incremental = store.load(1)
+        
+        store.update(1, rebuild=True)
+        rebuilt = store.load(1)
+        assert list(incremental.columns) == list(rebuilt.columns)
+        assert 'macd_12_26_9.signal' in rebuilt.columns
+        assert len(rebuilt) == 300
+        np.testing.assert_array_equal(rebuilt['date'], np.asarray(sample_data['date'], dtype='datetime64[ns]'))
+        np.testing.assert_allclose(
+            incremental.drop(columns='date').values,
+            rebuilt.drop(columns='date').values,
+            rtol=1e-9
+        )
+        
+        indicator = StreamingRSI(14)
+        rsi = [indicator.update(bar) for bar in sample_data.to_dict('records')]
+        np.testing.assert_array_equal(rebuilt['rsi_14'], [np.nan if value is None else value for value in rsi])
+        np.testing.assert_allclose(
+            rebuilt['sma_20'],
+            TechnicalIndicators().calculate_sma_series(sample_data, 20),
+            rtol=1e-12
+        )
+    
+    def test_out_of_sync_columns_are_rebuilt(self, conn, sample_data):
+        """Test columns that lag behind the saved states are recomputed from the first bar."""
+        store = IndicatorStore(conn)
+        self.insert(conn, sample_data.iloc[:250])
+        store.update(1)
+        conn.execute("DELETE FROM indicator_values WHERE indicator = 'macd_12_26_9.histogram'")
+        conn.commit()
+        assert store.load(1, ['rsi_14', 'macd_12_26_9.histogram']) is None
+        
+        self.insert(conn, sample_data.iloc[250:])
+        assert store.update(1) == {'num_points': 300, 'rebuilt': True}
+        
+        indicator = StreamingMACD()
+        expected = [indicator.update(bar) for bar in sample_data.to_dict('records')][-1]
+        assert store.load(1, ['macd_12_26_9.histogram'])['macd_12_26_9.histogram'].iloc[-1] == expected['histogram']
+    
+    def test_backtests_and_analysis_read_stored_columns(self, conn, sample_data):
+        """Test stored moving averages replace computed ones and analysis reads stored RSI and MACD."""
+        self.insert(conn, sample_data)
+        cursor = conn.cursor()
+        algorithms = [{'triggers': [{'type': 'moving_average', 'condition': {'operator': 'gt', 'value': 0, 'period': 20}}]}]
+        
+        # Without stored columns the indicators are computed
+        assert 'ma_20' not in load_ohlcv(cursor, 1, stored_indicators=True).columns
+        _, computed = prepare_shared_inputs(
+            algorithms, load_ohlcv(cursor, 1, warmup_bars=19), '2000-03-01', '2000-12-31', warmup_bars=19
+        )
+        
+        IndicatorStore(conn).update(1)
+        data = load_ohlcv(cursor, 1, '2000-03-01', '2000-12-31', warmup_bars=19, stored_indicators=True)
+        _, stored = prepare_shared_inputs(algorithms, data, '2000-03-01', '2000-12-31', warmup_bars=19)
+        assert not np.isnan(stored.get('ma_20')).any()
+        np.testing.assert_array_equal(stored.get('ma_20'), computed.get('ma_20'))
+        assert stored.get_states()['ma_20'] == computed.get_states()['ma_20']
+        
+        analyzer = DataAnalyzer(conn)
+        ohlcv = analyzer._load_ohlcv_data(1)
+        technical_indicators = TechnicalIndicators()
+        assert analyzer._load_stored_indicators(1, ohlcv) == (
+            technical_indicators.calculate_rsi(ohlcv),
+            technical_indicators.calculate_macd(ohlcv)
+        )
+        
+        # A bar the store has not seen yet falls back to calculating
+        self.insert(conn, generate_ohlcv(301, seed=5).iloc[300:])
+        assert analyzer._load_stored_indicators(1, analyzer._load_ohlcv_data(1)) is None
@@ -0,0 +1,151 @@
+"""
+Unit tests for job cancellation and checkpoints.
+"""
+import pytest
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.connection import get_connection
+from modules.backtest.backtest_worker import BacktestWorker
+from modules.backtest.job_control import JobCancelled, JobControl
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.parameter_sweep import ParameterSweep, expand_grid
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+@pytest.mark.unit
+class TestJobControl:
+    """Test cases for job cancellation and checkpointed sweeps."""
+    
+    @pytest.fixture
+    def conn(self, temp_db):
+        """Create a connection with one data set and one algorithm."""
+        conn = get_connection()
+        conn.execute("""
+            INSERT INTO data_sets (id, name, symbol, imported_at, source)
+            VALUES (1, 'test', 'TEST', '2024-01-01', 'csv')
+        """)
+        conn.executemany("""
+            INSERT INTO ohlcv_data (data_set_id, date, open, high, low, close, volume)
+            VALUES (1, ?, ?, ?, ?, ?, ?)
+        """, list(generate_ohlcv(300).itertuples(index=False)))
+        conn.execute("INSERT INTO algorithms (id, name, definition) VALUES (1, 'RSI', ?)", (
+            json.dumps({
+                'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': 40}}],
+                'actions': [{'type': 'buy', 'parameters': {'percentage': 100}}]
+            }),
+        ))
+        conn.commit()
+        yield conn
+        conn.close()
+    
+    @pytest.fixture
+    def parameter_grid(self):
+        """Create a grid of 40 combinations (20 batches of 2)."""
+        return {
+            'triggers.0.condition.value': list(range(25, 65, 5)),
+            'actions.0.parameters.percentage': [20, 40, 60, 80, 100]
+        }
+    
+    def sweep(self, conn):
+        """Create an in-process sweep over the test data set."""
+        algorithm = json.loads(conn.execute("SELECT definition FROM algorithms WHERE id = 1").fetchone()[0])
+        data = generate_ohlcv(300)
+        return ParameterSweep(algorithm, data, '2000-01-01', '2001-12-31', max_workers=1)
+    
+    def status(self, conn, job_id):
+        """Get the status of a job."""
+        return conn.execute("SELECT status FROM backtest_jobs WHERE job_id = ?", (job_id,)).fetchone()[0]
+    
+    def test_cancel_job(self, conn):
+        """Test only unfinished jobs are cancelled and later status updates are ignored."""
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(1, '2000-01-01', '2001-12-31', data_set_id=1)
+        job_manager.enqueue_jobs({job_id: {}})
+        
+        assert job_manager.cancel_job(job_id)
+        assert job_manager.is_cancelled(job_id)
+        assert job_manager.claim_pending_batch() is None
+        job_manager.update_job_status(job_id, 'completed', 1.0, 'Done', completed=True)
+        assert self.status(conn, job_id) == 'cancelled'
+        
+        finished_job_id = job_manager.create_job(1, '2000-01-01', '2001-12-31', data_set_id=1)
+        job_manager.update_job_status(finished_job_id, 'completed', 1.0, 'Done', completed=True)
+        assert not job_manager.cancel_job(finished_job_id)
+        assert self.status(conn, finished_job_id) == 'completed'
+    
+    def test_sweep_stops_between_batches(self, conn, parameter_grid):
+        """Test a cancelled sweep stops after its current batch with the finished batches saved."""
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(1, '2000-01-01', '2001-12-31', data_set_id=1, job_type='sweep')
+        control = JobControl(job_id, job_manager)
+        
+        def cancel_after_five(completed, total):
+            if completed == 5:
+                job_manager.cancel_job(job_id)
+        
+        with pytest.raises(JobCancelled):
+            self.sweep(conn).run(parameter_grid, progress_callback=cancel_after_five, control=control)
+        
+        # The third batch (results 5 and 6) finishes before the cancellation is seen
+        assert sorted(control.load_checkpoints()) == [0, 1, 2]
+    
+    def test_sweep_resumes_from_checkpoints(self, conn, parameter_grid):
+        """Test saved batches are reused and the result matches an uninterrupted sweep."""
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(1, '2000-01-01', '2001-12-31', data_set_id=1, job_type='sweep')
+        control = JobControl(job_id, job_manager)
+        expected = self.sweep(conn).run(parameter_grid)
+        
+        combinations = expand_grid(parameter_grid)
+        saved = [
+            {'parameters': parameters, 'performance': {'sharpe_ratio': 99.0 - index}}
+            for index, parameters in enumerate(combinations[:4])
+        ]
+        control.save_checkpoint(0, saved[:2])
+        control.save_checkpoint(1, saved[2:])
+        progress = []
+        results = self.sweep(conn).run(
+            parameter_grid,
+            progress_callback=lambda completed, total: progress.append(completed),
+            control=control
+        )
+        
+        # Saved batches are not run again; their stored results rank first
+        assert results[:4] == saved
+        assert results[4:] == [result for result in expected if result['parameters'] not in combinations[:4]]
+        assert progress[:3] == [2, 4, 5]
+        assert sorted(control.load_checkpoints()) == list(range(20))
+    
+    def test_restarted_worker_resumes_sweep(self, conn, parameter_grid):
+        """Test a sweep interrupted by a dead worker resumes from its checkpoints."""
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(1, '2000-01-01', '2001-12-31', data_set_id=1, job_type='sweep')
+        job_manager.enqueue_jobs({job_id: {'parameter_grid': parameter_grid, 'max_workers': 1}})
+        job_manager.claim_pending_batch()
+        first = expand_grid(parameter_grid)[:2]
+        job_manager.save_checkpoint(job_id, 0, [
+            {'parameters': parameters, 'performance': {'sharpe_ratio': 99.0}}
+            for parameters in first
+        ])
+        conn.execute("""
+            INSERT INTO backtest_workers (worker_id, pid, started_at, heartbeat_at)
+            VALUES ('dead', 0, '2000-01-01', '2000-01-01')
+        """)
+        conn.commit()
+        
+        assert BacktestWorker(poll_interval=0.05, idle_timeout=0.0, conn=conn).run()
+        
+        assert self.status(conn, job_id) == 'completed'
+        rows = conn.execute("""
+            SELECT parameters, sharpe_ratio FROM backtest_sweep_results
+            WHERE job_id = ? ORDER BY rank
+        """, (job_id,)).fetchall()
+        assert len(rows) == 40
+        assert [(json.loads(parameters), sharpe) for parameters, sharpe in rows[:2]] == [
+            (parameters, 99.0) for parameters in first
+        ]
+        assert job_manager.load_checkpoints(job_id) == {}
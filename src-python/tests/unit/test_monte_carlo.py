@@ -0,0 +1,93 @@
+"""
+Unit tests for Monte Carlo simulator.
+"""
+import pytest
+import sqlite3
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import modules.backtest.monte_carlo as monte_carlo
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.monte_carlo import MonteCarloSimulator
+from modules.backtest.performance_calculator import calculate_risk_metrics
+
+
+@pytest.mark.unit
+class TestMonteCarloSimulator:
+    """Test cases for MonteCarloSimulator class."""
+    
+    @pytest.fixture
+    def trades(self):
+        """Create trades with mixed profits."""
+        rng = np.random.default_rng(0)
+        profits = rng.normal(50, 500, 40).round(2)
+        return [{'profit': p, 'profit_rate': round(p / 100, 2)} for p in profits]
+    
+    def test_identical_trades_have_no_spread(self):
+        """Test every resampled path equals the original when all trades are equal."""
+        trades = [{'profit': 100.0, 'profit_rate': 1.0}] * 10
+        
+        report = MonteCarloSimulator(initial_capital=1000.0, num_simulations=100, seed=1).simulate_trades(trades)
+        
+        assert report['metrics']['total_return'] == {'mean': 100.0, 'median': 100.0, 'lower': 100.0, 'upper': 100.0}
+        assert report['metrics']['max_drawdown']['upper'] == 0.0
+    
+    def test_simulate_trades_interval(self, trades):
+        """Test the confidence interval brackets the median."""
+        report = MonteCarloSimulator(initial_capital=10000.0, num_simulations=2000, seed=1).simulate_trades(trades)
+        
+        assert report['method'] == 'trades'
+        assert report['num_simulations'] == 2000
+        for values in report['metrics'].values():
+            assert values['lower'] <= values['median'] <= values['upper']
+        # Resampling keeps the trade count, so the mean total return stays near the original
+        original = sum(t['profit'] for t in trades) / 10000.0 * 100
+        assert report['metrics']['total_return']['mean'] == pytest.approx(original, abs=5.0)
+    
+    def test_batches_do_not_change_results(self, trades, monkeypatch):
+        """Test splitting paths into batches gives the same report for the same seed."""
+        expected = MonteCarloSimulator(num_simulations=500, seed=7).simulate_trades(trades)
+        monkeypatch.setattr(monte_carlo, 'MAX_BATCH_ELEMENTS', 400)
+        
+        assert MonteCarloSimulator(num_simulations=500, seed=7).simulate_trades(trades) == expected
+    
+    def test_simulate_daily_returns_matches_performance_calculator(self):
+        """Test constant daily returns reproduce the deterministic metrics."""
+        equity = np.array([100.0, 110.0, 99.0, 108.9])
+        simulator = MonteCarloSimulator(initial_capital=100.0, num_simulations=1, seed=3)
+        returns = np.diff(equity) / equity[:-1]
+        indices = np.array([[0, 1, 2]])
+        
+        metrics = simulator._return_metrics(returns[indices], np.log1p(returns)[indices])
+        expected = calculate_risk_metrics(equity)
+        
+        assert metrics['total_return'][0] == pytest.approx(8.9)
+        assert metrics['max_drawdown'][0] == pytest.approx(expected['max_drawdown'][0])
+        assert metrics['sharpe_ratio'][0] == pytest.approx(expected['sharpe_ratio'][0])
+    
+    def test_no_trades(self):
+        """Test resampling without trades is rejected."""
+        with pytest.raises(ValueError):
+            MonteCarloSimulator().simulate_trades([])
+    
+    def test_save_monte_carlo_results(self, temp_db, trades):
+        """Test reports are stored per metric and replaced on rerun."""
+        conn = sqlite3.connect(temp_db)
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(1, '2023-01-01', '2023-12-31', data_set_id=1)
+        report = MonteCarloSimulator(num_simulations=100, seed=1).simulate_trades(trades)
+        
+        job_manager.save_monte_carlo_results(job_id, report)
+        job_manager.save_monte_carlo_results(job_id, report)
+        
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT metric, median FROM backtest_monte_carlo_results
+            WHERE job_id = ? ORDER BY metric
+        """, (job_id,))
+        rows = cursor.fetchall()
+        assert [row[0] for row in rows] == ['max_drawdown', 'sharpe_ratio', 'total_return']
+        assert rows[2][1] == report['metrics']['total_return']['median']
@@ -0,0 +1,150 @@
+"""
+Unit tests for parameter sweep.
+"""
+import pytest
+import sqlite3
+import json
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.parameter_sweep import ParameterSweep, apply_parameters
+
+
+@pytest.mark.unit
+class TestParameterSweep:
+    """Test cases for ParameterSweep class."""
+    
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample OHLCV data."""
+        rng = np.random.default_rng(3)
+        prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 200)))
+        return pd.DataFrame({
+            'date': pd.date_range('2023-01-01', periods=200, freq='D').strftime('%Y-%m-%d'),
+            'open': prices,
+            'high': prices * 1.01,
+            'low': prices * 0.99,
+            'close': prices,
+            'volume': rng.integers(1000000, 2000000, 200)
+        })
+    
+    @pytest.fixture
+    def algorithm(self):
+        """Create an RSI algorithm with a moving average filter."""
+        return {
+            'triggers': [
+                {'type': 'rsi', 'condition': {'operator': 'lt', 'value': 40}, 'logical_operator': 'AND'},
+                {'type': 'moving_average', 'condition': {'operator': 'gt', 'value': 0, 'period': 20}}
+            ],
+            'actions': [{'type': 'buy', 'parameters': {'percentage': 100}}]
+        }
+    
+    @pytest.fixture
+    def parameter_grid(self):
+        """Create a small parameter grid."""
+        return {
+            'triggers.0.condition.value': [30, 45],
+            'triggers.1.condition.period': [10, 20],
+            'actions.0.parameters.percentage': [50, 100]
+        }
+    
+    def test_apply_parameters(self, algorithm):
+        """Test parameter paths are applied to a copy of the algorithm."""
+        updated = apply_parameters(algorithm, {
+            'triggers.0.condition.value': 25,
+            'actions.0.parameters.percentage': 10
+        })
+        
+        assert updated['triggers'][0]['condition']['value'] == 25
+        assert updated['actions'][0]['parameters']['percentage'] == 10
+        assert algorithm['triggers'][0]['condition']['value'] == 40
+    
+    def test_expand_grid(self, algorithm, sample_data, parameter_grid):
+        """Test grid expansion produces the cartesian product."""
+        sweep = ParameterSweep(algorithm, sample_data, '2023-01-01', '2023-12-31')
+        
+        combinations = sweep.expand_grid(parameter_grid)
+        
+        assert len(combinations) == 8
+        assert {'triggers.0.condition.value': 30, 'triggers.1.condition.period': 10,
+                'actions.0.parameters.percentage': 50} in combinations
+    
+    def test_run_matches_individual_backtests(self, algorithm, sample_data, parameter_grid):
+        """Test sweep results equal running BacktestEngine for each combination."""
+        sweep = ParameterSweep(algorithm, sample_data, '2023-02-01', '2023-12-31', max_workers=1)
+        
+        results = sweep.run(parameter_grid)
+        
+        assert len(results) == 8
+        for result in results:
+            engine = BacktestEngine(
+                algorithm=apply_parameters(algorithm, result['parameters']),
+                data=sample_data.copy(),
+                start_date='2023-02-01',
+                end_date='2023-12-31'
+            )
+            assert result['performance'] == engine.run()['performance']
+        
+        sharpe_ratios = [r['performance']['sharpe_ratio'] for r in results]
+        assert sharpe_ratios == sorted(sharpe_ratios, reverse=True)
+    
+    def test_run_in_process_pool(self, algorithm, sample_data, parameter_grid):
+        """Test worker processes produce the same ranking as in-process runs."""
+        in_process = ParameterSweep(algorithm, sample_data, '2023-01-01', '2023-12-31', max_workers=1)
+        pooled = ParameterSweep(algorithm, sample_data, '2023-01-01', '2023-12-31', max_workers=2)
+        progress = []
+        
+        expected = in_process.run(parameter_grid, rank_by='total_return')
+        results = pooled.run(parameter_grid, rank_by='total_return',
+                             progress_callback=lambda done, total: progress.append((done, total)))
+        
+        assert results == expected
+        assert progress[-1] == (8, 8)
+    
+    def test_rank_results_failures_last(self, algorithm, sample_data):
+        """Test failed combinations rank after successful ones."""
+        sweep = ParameterSweep(algorithm, sample_data, '2023-01-01', '2023-12-31')
+        results = [
+            {'parameters': {'a': 1}, 'error': 'boom'},
+            {'parameters': {'a': 2}, 'performance': {'max_drawdown': 5.0}},
+            {'parameters': {'a': 3}, 'performance': {'max_drawdown': 2.0}},
+        ]
+        
+        ranked = sweep.rank_results(results, rank_by='max_drawdown')
+        
+        assert [r['parameters']['a'] for r in ranked] == [3, 2, 1]
+    
+    def test_run_no_data_in_range(self, algorithm, sample_data, parameter_grid):
+        """Test sweep over an empty date range fails early."""
+        sweep = ParameterSweep(algorithm, sample_data, '2030-01-01', '2030-12-31', max_workers=1)
+        
+        with pytest.raises(ValueError):
+            sweep.run(parameter_grid)
+    
+    def test_save_sweep_results(self, temp_db):
+        """Test ranked results are stored in rank order."""
+        conn = sqlite3.connect(temp_db)
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(1, '2023-01-01', '2023-12-31', data_set_id=1, job_type='sweep')
+        
+        job_manager.save_sweep_results(job_id, [
+            {'parameters': {'a': 2}, 'performance': {'sharpe_ratio': 1.5, 'total_trades': 3}},
+            {'parameters': {'a': 1}, 'error': 'boom'},
+        ])
+        
+        cursor = conn.cursor()
+        cursor.execute("SELECT job_type FROM backtest_jobs WHERE job_id = ?", (job_id,))
+        assert cursor.fetchone()[0] == 'sweep'
+        cursor.execute("""
+            SELECT rank, parameters, sharpe_ratio, total_trades, error
+            FROM backtest_sweep_results WHERE job_id = ? ORDER BY rank
+        """, (job_id,))
+        rows = cursor.fetchall()
+        assert rows[0] == (1, json.dumps({'a': 2}), 1.5, 3, None)
+        assert rows[1] == (2, json.dumps({'a': 1}), None, None, 'boom')
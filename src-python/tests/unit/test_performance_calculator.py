@@ -0,0 +1,204 @@
+"""
+Unit tests for performance calculator.
+"""
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.backtest_engine import BacktestEngine, align_benchmark
+from modules.backtest.performance_calculator import (
+    PerformanceCalculator,
+    TRADING_DAYS_PER_YEAR,
+    calculate_benchmark_metrics,
+    calculate_risk_metrics,
+    calculate_rolling_sharpe
+)
+from modules.backtest.trade_simulator import TradeSimulator
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+def mark_to_market_per_bar(trades, closes, initial_capital):
+    """Reference equity computed bar by bar."""
+    cash = initial_capital
+    position = 0
+    equity = []
+    for i, close in enumerate(closes):
+        for trade in trades:
+            if trade['entry_index'] == i:
+                cash -= trade['quantity'] * trade['entry_price']
+                position += trade['quantity']
+            if trade['exit_index'] == i:
+                cash += trade['quantity'] * trade['exit_price']
+                position -= trade['quantity']
+        equity.append(cash + position * close)
+    return np.array(equity)
+
+
+@pytest.mark.unit
+class TestPerformanceCalculator:
+    """Test cases for PerformanceCalculator class."""
+    
+    @pytest.mark.parametrize('seed', range(3))
+    def test_calculate_equity_matches_per_bar(self, seed):
+        """Test vectorized equity matches bar-by-bar mark-to-market."""
+        rng = np.random.default_rng(seed)
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 200)))
+        signals = rng.choice(np.array(['buy', 'sell', None], dtype=object), size=200, p=[0.1, 0.1, 0.8])
+        trades = TradeSimulator(10000.0).simulate_trades_state(signals, closes, {'percentage': 50})[0]
+        
+        equity = PerformanceCalculator(10000.0).calculate_equity(trades, closes)
+        
+        assert len(trades) > 0
+        np.testing.assert_allclose(equity, mark_to_market_per_bar(trades, closes, 10000.0), rtol=1e-12)
+    
+    def test_calculate_equity_marks_open_position(self):
+        """Test equity reflects unrealized profit while a position is open."""
+        closes = np.array([10.0, 12.0, 9.0, 11.0])
+        signals = np.array(['buy', None, None, 'sell'], dtype=object)
+        trades = TradeSimulator(100.0).simulate_trades_state(signals, closes, {})[0]
+        
+        equity = PerformanceCalculator(100.0).calculate_equity(trades, closes)
+        
+        np.testing.assert_allclose(equity, [100.0, 120.0, 90.0, 110.0])
+    
+    def test_drawdown_and_sharpe_from_daily_returns(self):
+        """Test max drawdown and Sharpe ratio use daily equity."""
+        calculator = PerformanceCalculator(100.0)
+        equity = np.array([100.0, 120.0, 90.0, 110.0])
+        returns = np.diff(equity) / equity[:-1]
+        
+        metrics = calculate_risk_metrics(equity)
+        assert metrics['max_drawdown'][0] == pytest.approx(25.0)
+        assert metrics['sharpe_ratio'][0] == pytest.approx(
+            np.mean(returns) / np.std(returns) * np.sqrt(TRADING_DAYS_PER_YEAR)
+        )
+        
+        trades = [{'profit': 10.0, 'profit_rate': 10.0}]
+        performance = calculator.calculate_performance(trades, equity)
+        assert performance['max_drawdown'] == 25.0
+        assert performance['total_return'] == 10.0
+    
+    def test_calculate_equity_curve(self):
+        """Test equity curve points are rounded and dated."""
+        curve = PerformanceCalculator().calculate_equity_curve(np.array([100.004, 101.256]), ['d0', 'd1'])
+        
+        assert curve == [{'date': 'd0', 'equity': 100.0}, {'date': 'd1', 'equity': 101.26}]
+    
+    def test_risk_metrics_of_many_curves(self):
+        """Test each row of a 2-D batch matches the metrics of that curve alone."""
+        rng = np.random.default_rng(0)
+        equity = 1000 * np.exp(np.cumsum(rng.normal(0, 0.01, (4, 300)), axis=1))
+        positions = rng.integers(0, 2, equity.shape)
+        
+        batch = calculate_risk_metrics(equity, positions)
+        
+        for row in range(4):
+            single = calculate_risk_metrics(equity[row], positions[row])
+            for metric, values in batch.items():
+                assert values[row] == pytest.approx(single[metric][0])
+            returns = np.diff(equity[row]) / equity[row][:-1]
+            assert batch['sharpe_ratio'][row] == pytest.approx(
+                np.mean(returns) / np.std(returns) * np.sqrt(TRADING_DAYS_PER_YEAR)
+            )
+        
+        # Scoring the batch gives the performance of each backtest alone
+        calculator = PerformanceCalculator(1000.0)
+        trade_lists = [[{'profit': 10.0 * row, 'profit_rate': 1.0}] for row in range(4)]
+        closes = equity[0] / 10
+        performances = calculator.calculate_performances(trade_lists, equity, positions, buy_and_hold=closes)
+        for row in range(4):
+            assert performances[row] == calculator.calculate_performance(
+                trade_lists[row], equity[row], positions[row], buy_and_hold=closes
+            )
+    
+    def test_risk_metrics_known_values(self):
+        """Test drawdown duration, calmar, value at risk and exposure on a small curve."""
+        equity = np.array([100.0, 120.0, 90.0, 110.0, 80.0, 130.0, 125.0])
+        returns = np.diff(equity) / equity[:-1]
+        
+        metrics = {
+            metric: values[0]
+            for metric, values in calculate_risk_metrics(equity, np.array([0, 1, 1, 0, 0, 1, 1]), periods_per_year=6).items()
+        }
+        
+        assert metrics['total_return'] == pytest.approx(25.0)
+        assert metrics['cagr'] == pytest.approx(25.0)
+        assert metrics['longest_drawdown'] == 3
+        assert metrics['max_drawdown'] == pytest.approx(100 / 3)
+        assert metrics['calmar_ratio'] == pytest.approx(25.0 / (100 / 3))
+        assert metrics['var_95'] == pytest.approx(-np.quantile(returns, 0.05) * 100)
+        assert metrics['cvar_95'] == pytest.approx(-returns.min() * 100)
+        assert metrics['exposure'] == pytest.approx(400 / 7)
+        downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+        assert metrics['sortino_ratio'] == pytest.approx(np.mean(returns) / downside * np.sqrt(6))
+    
+    def test_rolling_sharpe(self):
+        """Test each rolling value is the Sharpe ratio of the trailing window."""
+        rng = np.random.default_rng(1)
+        equity = 1000 * np.exp(np.cumsum(rng.normal(0, 0.01, 100)))
+        
+        rolling = calculate_rolling_sharpe(equity, 20)
+        
+        assert rolling.shape == equity.shape
+        assert np.isnan(rolling[:20]).all()
+        for end in (20, 57, 99):
+            assert rolling[end] == pytest.approx(calculate_risk_metrics(equity[end - 20:end + 1])['sharpe_ratio'][0])
+        np.testing.assert_allclose(calculate_rolling_sharpe(np.vstack([equity, equity]), 20)[1], rolling)
+    
+    def test_performance_includes_risk_metrics(self):
+        """Test exposure counts bars holding a position and risk metrics are added from equity."""
+        closes = np.array([10.0, 12.0, 9.0, 11.0, 10.0])
+        signals = np.array(['buy', None, 'sell', None, None], dtype=object)
+        trades = TradeSimulator(100.0).simulate_trades_state(signals, closes, {})[0]
+        calculator = PerformanceCalculator(100.0)
+        equity = calculator.calculate_equity(trades, closes)
+        positions = calculator.calculate_open_positions(trades, len(closes))
+        
+        performance = calculator.calculate_performance([{'profit': -10.0, 'profit_rate': -10.0}], equity, positions)
+        
+        assert positions.tolist() == [1, 1, 0, 0, 0]
+        assert performance['exposure'] == 40.0
+        assert performance['longest_drawdown'] == 3
+        assert 'exposure' not in calculator.calculate_performance([], equity)
+    
+    def test_benchmark_metrics(self):
+        """Test a curve levered on the benchmark has its beta, and alpha is the return left over."""
+        rng = np.random.default_rng(2)
+        benchmark = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 250)))
+        benchmark_returns = np.diff(benchmark) / benchmark[:-1]
+        levered = 1000 * np.concatenate(([1.0], np.cumprod(1 + 2 * benchmark_returns + 0.001)))
+        
+        metrics = calculate_benchmark_metrics(np.vstack([levered, benchmark]), benchmark)
+        
+        np.testing.assert_allclose(metrics['beta'], [2.0, 1.0])
+        np.testing.assert_allclose(metrics['alpha'], [0.001 * TRADING_DAYS_PER_YEAR * 100, 0.0], atol=1e-9)
+        assert metrics['benchmark_return'][0] == pytest.approx((benchmark[-1] / benchmark[0] - 1) * 100)
+        assert metrics['excess_return'][1] == pytest.approx(0.0)
+    
+    def test_engine_compares_with_buy_and_hold_and_benchmark(self):
+        """Test backtests report excess return over their own data and an aligned index."""
+        data = generate_ohlcv(300, seed=3)
+        index = generate_ohlcv(300, seed=4).iloc[::2].reset_index(drop=True)
+        algorithm = {
+            'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': 40}}],
+            'actions': [{'type': 'buy', 'parameters': {'percentage': 100}}]
+        }
+        
+        performance = BacktestEngine(algorithm, data, '2000-01-01', '2010-12-31', benchmark=index).run()['performance']
+        
+        closes = data['close'].to_numpy()
+        assert performance['buy_and_hold_return'] == round((closes[-1] / closes[0] - 1) * 100, 2)
+        assert performance['excess_return'] == pytest.approx(
+            performance['total_return'] - performance['buy_and_hold_return'], abs=0.02
+        )
+        index_closes = index['close'].to_numpy()
+        assert performance['benchmark_return'] == round((index_closes[-1] / index_closes[0] - 1) * 100, 2)
+        
+        # Bars between index dates take the last earlier close; bars before it take the first
+        aligned = align_benchmark(index, data['date'])
+        assert aligned[1] == index_closes[0]
+        assert aligned[2] == index_closes[1]
+        assert align_benchmark(index.iloc[5:], data['date'])[0] == index_closes[5]
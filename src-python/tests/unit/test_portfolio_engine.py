@@ -0,0 +1,106 @@
+"""
+Unit tests for portfolio backtest engine.
+"""
+import pytest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.algorithm_parser import AlgorithmParser
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.portfolio_engine import PortfolioBacktestEngine, SymbolPanel
+
+
+def make_data(seed: int, length: int = 300, start: str = '2023-01-02') -> pd.DataFrame:
+    """Create OHLCV data following a random walk."""
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, length)))
+    return pd.DataFrame({
+        'date': pd.bdate_range(start, periods=length).strftime('%Y-%m-%d'),
+        'open': prices,
+        'high': prices * 1.01,
+        'low': prices * 0.99,
+        'close': prices,
+        'volume': rng.integers(1000000, 2000000, length)
+    })
+
+
+@pytest.mark.unit
+class TestPortfolioBacktestEngine:
+    """Test cases for PortfolioBacktestEngine class."""
+    
+    @pytest.fixture
+    def algorithm(self):
+        """Create an RSI buy algorithm."""
+        return {
+            'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': 40}}],
+            'actions': [{'type': 'buy', 'parameters': {'percentage': 100}}]
+        }
+    
+    @pytest.mark.parametrize('seed', range(3))
+    @pytest.mark.parametrize('action', ['buy', 'sell'])
+    def test_single_symbol_matches_backtest_engine(self, seed, action):
+        """Test a one-symbol portfolio reproduces BacktestEngine."""
+        algorithm = {
+            'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt' if action == 'buy' else 'gt', 'value': 45}}],
+            'actions': [{'type': action, 'parameters': {'percentage': 60}}]
+        }
+        expected = BacktestEngine(algorithm, make_data(seed), '2023-01-01', '2024-12-31').run()
+        panel = SymbolPanel({'AAA': make_data(seed)}, '2023-01-01', '2024-12-31')
+        
+        results = PortfolioBacktestEngine(algorithm, panel).run()
+        
+        assert [{k: v for k, v in t.items() if k != 'symbol'} for t in results['trades']] == expected['trades']
+        assert results['equity_curve'] == expected['equity_curve']
+        assert results['performance'] == expected['performance']
+    
+    def test_panel_aligns_on_union_of_dates(self):
+        """Test symbols with different date ranges share one index with NaN gaps."""
+        panel = SymbolPanel({
+            'AAA': make_data(0, length=100),
+            'BBB': make_data(1, length=50, start='2023-03-01')
+        }, '2023-01-01', '2024-12-31')
+        
+        assert panel.symbols == ['AAA', 'BBB']
+        assert panel.prices['close'].shape == (len(panel), 2)
+        assert panel.available[:, 0].sum() == 100
+        assert panel.available[:, 1].sum() == 50
+        rsi = panel.get_indicators(['rsi'])['rsi']
+        assert np.isnan(rsi[~panel.available]).all()
+    
+    def test_compile_trigger_mask_2d(self):
+        """Test triggers evaluate element-wise on (dates x symbols) arrays."""
+        closes = np.array([[1.0, 5.0], [3.0, np.nan]])
+        mask = AlgorithmParser().compile_trigger_mask(
+            [{'type': 'price', 'condition': {'operator': 'gt', 'value': 2}}],
+            {},
+            {'close': closes}
+        )
+        
+        assert mask.tolist() == [[False, True], [True, False]]
+    
+    def test_max_positions_and_shared_cash(self, algorithm):
+        """Test open positions never exceed max_positions and cash is never overdrawn."""
+        data = {f'S{i}': make_data(i) for i in range(8)}
+        panel = SymbolPanel(data, '2023-01-01', '2024-12-31')
+        
+        results = PortfolioBacktestEngine(algorithm, panel, max_positions=3).run()
+        
+        trades = results['trades']
+        assert len({trade['symbol'] for trade in trades}) > 1
+        for date in panel.dates:
+            open_trades = [t for t in trades if t['entry_date'] <= date < t['exit_date']]
+            assert len(open_trades) <= 3
+            assert sum(t['entry_price'] * t['quantity'] for t in open_trades) <= 100000.0
+        assert sum(s['total_trades'] for s in results['symbols']) == len(trades)
+        assert len(results['equity_curve']) == len(panel)
+    
+    def test_invalid_max_positions(self, algorithm):
+        """Test max_positions must be positive."""
+        panel = SymbolPanel({'AAA': make_data(0)}, '2023-01-01', '2024-12-31')
+        
+        with pytest.raises(ValueError):
+            PortfolioBacktestEngine(algorithm, panel, max_positions=0)
@@ -0,0 +1,93 @@
+"""
+Unit tests for backtest result cache.
+"""
+import pytest
+import sqlite3
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.result_cache import BacktestResultCache
+
+
+@pytest.mark.unit
+class TestBacktestResultCache:
+    """Test cases for BacktestResultCache class."""
+    
+    @pytest.fixture
+    def conn(self, temp_db):
+        """Create a connection with one data set."""
+        conn = sqlite3.connect(temp_db)
+        conn.execute("""
+            INSERT INTO data_sets (id, name, symbol, imported_at, source)
+            VALUES (1, 'test', 'TEST', '2024-01-01', 'csv')
+        """)
+        conn.commit()
+        yield conn
+        conn.close()
+    
+    def save_job(self, conn) -> str:
+        """Create a completed job with stored results."""
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(1, '2023-01-01', '2023-12-31', data_set_id=1)
+        job_manager.save_results(
+            job_id, 1, '2023-01-01', '2023-12-31',
+            {'total_return': 5.0, 'total_trades': 1},
+            [{
+                'entry_date': '2023-01-05', 'exit_date': '2023-02-01', 'entry_price': 10.0,
+                'exit_price': 10.5, 'quantity': 100, 'profit': 50.0, 'profit_rate': 5.0
+            }],
+            [{'date': '2023-01-05', 'equity': 1000.0}, {'date': '2023-02-01', 'equity': 1050.0}]
+        )
+        job_manager.update_job_status(job_id, 'completed', 1.0, 'done', completed=True)
+        return job_id
+    
+    def test_make_key_normalizes_algorithm(self):
+        """Test key order does not matter but every input does."""
+        algorithm = {'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': 30}}], 'actions': []}
+        reordered = {'actions': [], 'triggers': [{'condition': {'value': 30, 'operator': 'lt'}, 'type': 'rsi'}]}
+        key = BacktestResultCache.make_key(algorithm, 1, 1, '2023-01-01', '2023-12-31', 100000)
+        
+        assert BacktestResultCache.make_key(reordered, 1, 1, '2023-01-01', '2023-12-31', 100000.0) == key
+        assert BacktestResultCache.make_key(algorithm, 1, 2, '2023-01-01', '2023-12-31', 100000) != key
+        assert BacktestResultCache.make_key(algorithm, 1, 1, '2023-01-01', '2023-12-31', 50000) != key
+        assert BacktestResultCache.make_key(algorithm, 1, 1, '2023-01-01', '2023-12-31', 100000, 33) != key
+    
+    def test_store_and_lookup(self, conn):
+        """Test a stored job is found until its data set is invalidated."""
+        cache = BacktestResultCache(conn=conn)
+        job_id = self.save_job(conn)
+        
+        assert cache.lookup('key') is None
+        cache.store('key', job_id, 1, cache.get_data_set_version(1))
+        assert cache.lookup('key') == job_id
+        
+        assert cache.invalidate_data_set(1) == 1
+        assert cache.lookup('key') is None
+    
+    def test_lookup_drops_entries_without_results(self, conn):
+        """Test entries pointing at a job that is not completed are removed."""
+        cache = BacktestResultCache(conn=conn)
+        job_id = BacktestJobManager(conn=conn).create_job(1, '2023-01-01', '2023-12-31', data_set_id=1)
+        cache.store('key', job_id, 1, 1)
+        
+        assert cache.lookup('key') is None
+        assert conn.execute("SELECT COUNT(*) FROM backtest_result_cache").fetchone()[0] == 0
+    
+    def test_copy_results(self, conn):
+        """Test a cache hit copies results, trades and equity to the new job."""
+        job_manager = BacktestJobManager(conn=conn)
+        source_job_id = self.save_job(conn)
+        job_id = job_manager.create_job(2, '2023-01-01', '2023-12-31', data_set_id=1)
+        
+        job_manager.copy_results(source_job_id, job_id, 2)
+        
+        cursor = conn.cursor()
+        cursor.execute("SELECT algorithm_id, total_return FROM backtest_results WHERE job_id = ?", (job_id,))
+        assert cursor.fetchone() == (2, 5.0)
+        cursor.execute("SELECT profit FROM backtest_trades WHERE job_id = ?", (job_id,))
+        assert cursor.fetchall() == [(50.0,)]
+        cursor.execute("SELECT equity FROM backtest_equity_curve WHERE job_id = ? ORDER BY date", (job_id,))
+        assert cursor.fetchall() == [(1000.0,), (1050.0,)]
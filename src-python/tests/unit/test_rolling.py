@@ -0,0 +1,109 @@
+"""
+Unit tests for rolling-window kernels.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.rolling import (
+    column_statistics,
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_std,
+    rolling_sum,
+    window_mean,
+    window_std
+)
+import utils.rolling
+from modules.data_analysis.streaming_indicators import StreamingBollinger, StreamingSMA
+
+
+@pytest.mark.unit
+class TestRolling:
+    """Test cases for rolling_* kernels, window_mean, window_std and column_statistics."""
+    
+    def expected(self, rolling, period):
+        """Get the complete-window values of a pandas rolling result."""
+        return rolling.to_numpy()[period - 1:]
+    
+    @pytest.mark.parametrize('length,period', [(1, 1), (5, 5), (10, 3), (64, 7), (1001, 50)])
+    def test_matches_pandas(self, length, period):
+        """Test every kernel equals pandas rolling, including windows at block boundaries."""
+        values = 100 + np.cumsum(np.random.default_rng(length).normal(size=length))
+        series = pd.Series(values)
+        
+        np.testing.assert_allclose(rolling_sum(values, period), self.expected(series.rolling(period).sum(), period), rtol=1e-12)
+        np.testing.assert_allclose(rolling_mean(values, period), self.expected(series.rolling(period).mean(), period), rtol=1e-12)
+        np.testing.assert_allclose(
+            rolling_std(values, period),
+            self.expected(series.rolling(period).std(ddof=0), period),
+            rtol=1e-9,
+            atol=1e-12
+        )
+        np.testing.assert_allclose(
+            rolling_std(values, period, ddof=1),
+            self.expected(series.rolling(period).std(), period),
+            rtol=1e-9
+        )
+        np.testing.assert_array_equal(rolling_min(values, period), self.expected(series.rolling(period).min(), period))
+        np.testing.assert_array_equal(rolling_max(values, period), self.expected(series.rolling(period).max(), period))
+    
+    def test_precision_on_long_drifting_series(self):
+        """Test sums restart per block, so a long drifting series keeps window-level precision."""
+        values = 1e4 + np.cumsum(np.random.default_rng(0).normal(size=200_000))
+        windows = np.lib.stride_tricks.sliding_window_view(values, 50)
+        
+        np.testing.assert_allclose(rolling_mean(values, 50), windows.mean(axis=1), rtol=1e-13)
+        np.testing.assert_allclose(rolling_std(values, 50), windows.std(axis=1), rtol=1e-10)
+        np.testing.assert_array_equal(rolling_std(np.full(10, 3.3), 4), np.zeros(7))
+    
+    def test_window_mean_depends_only_on_window(self):
+        """Test window means are equal from any first bar and equal the per-bar StreamingSMA."""
+        values = 1e4 + np.cumsum(np.random.default_rng(2).normal(size=500))
+        means = window_mean(values, 20)
+        
+        for i in (0, 100, len(means) - 1):
+            assert means[i] == pd.Series(values[i:i + 20]).mean()
+        for start in (1, 7, 33):
+            np.testing.assert_array_equal(window_mean(values[start:], 20), means[start:])
+        sma = StreamingSMA(20)
+        streamed = [sma.update({'close': value}) for value in values]
+        np.testing.assert_array_equal(np.array(streamed[19:], dtype=float), means)
+    
+    def test_window_std_matches_streaming_bollinger(self, monkeypatch):
+        """Test window deviations equal numpy std of each window and the per-bar StreamingBollinger, across chunks."""
+        values = 1e4 + np.cumsum(np.random.default_rng(4).normal(size=500))
+        stds = window_std(values, 20)
+        windows = np.lib.stride_tricks.sliding_window_view(values, 20)
+        
+        np.testing.assert_allclose(stds, windows.std(axis=1), rtol=1e-12)
+        monkeypatch.setattr(utils.rolling, 'WINDOW_CHUNK_ROWS', 7)
+        np.testing.assert_array_equal(window_std(values, 20), stds)
+        bollinger = StreamingBollinger(20, num_std=1.0)
+        streamed = [bollinger.update({'close': value}) for value in values][19:]
+        np.testing.assert_array_equal([band['upper'] for band in streamed], window_mean(values, 20) + stds)
+    
+    def test_short_input_and_invalid_period(self):
+        """Test inputs shorter than the window give no values and periods below 1 are rejected."""
+        assert len(rolling_mean(np.arange(3.0), 5)) == 0
+        assert len(rolling_min(np.arange(3.0), 5)) == 0
+        assert len(window_mean(np.arange(3.0), 5)) == 0
+        assert len(window_std(np.arange(3.0), 5)) == 0
+        with pytest.raises(ValueError):
+            rolling_sum(np.arange(3.0), 0)
+    
+    def test_column_statistics(self):
+        """Test column statistics equal pandas describe values, with NaN std for one row."""
+        frame = pd.DataFrame(np.random.default_rng(1).normal(size=(20, 3)), columns=['a', 'b', 'c'])
+        stats = column_statistics(frame.to_numpy())
+        
+        np.testing.assert_allclose(stats['mean'], frame.mean().to_numpy(), rtol=1e-12)
+        np.testing.assert_array_equal(stats['min'], frame.min().to_numpy())
+        np.testing.assert_array_equal(stats['max'], frame.max().to_numpy())
+        np.testing.assert_allclose(stats['std'], frame.std().to_numpy(), rtol=1e-12)
+        assert np.isnan(column_statistics(frame.to_numpy()[:1])['std']).all()
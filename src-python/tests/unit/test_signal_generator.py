@@ -0,0 +1,104 @@
+"""
+Unit tests for signal generator.
+"""
+import pytest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.indicator_cache import IndicatorCache
+from modules.backtest.signal_generator import SignalGenerator
+from modules.data_analysis.technical_indicators import TechnicalIndicators
+
+
+def calculate_indicators_per_bar(data):
+    """
+    Calculate the default indicators by re-running each calculation on every prefix.
+    
+    This is O(n^2) and kept as the reference implementation for the full-series path.
+    """
+    technical_indicators = TechnicalIndicators()
+    indicators = {'rsi': [], 'macd': [], 'ma_20': [], 'ma_50': []}
+    for i in range(len(data)):
+        subset = data.iloc[:i+1]
+        rsi_result = technical_indicators.calculate_rsi(subset, period=14)
+        indicators['rsi'].append(rsi_result['value'] if rsi_result else None)
+        macd_result = technical_indicators.calculate_macd(subset)
+        indicators['macd'].append(macd_result['macd'] if macd_result else None)
+        indicators['ma_20'].append(subset['close'].tail(20).mean() if len(subset) >= 20 else None)
+        indicators['ma_50'].append(subset['close'].tail(50).mean() if len(subset) >= 50 else None)
+    return indicators
+
+
+@pytest.mark.unit
+class TestSignalGenerator:
+    """Test cases for SignalGenerator class."""
+    
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample OHLCV data."""
+        rng = np.random.default_rng(42)
+        prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 120)))
+        return pd.DataFrame({
+            'date': pd.date_range('2023-01-01', periods=120, freq='D'),
+            'open': prices,
+            'high': prices * 1.01,
+            'low': prices * 0.99,
+            'close': prices,
+            'volume': rng.integers(1000000, 2000000, 120)
+        })
+    
+    @pytest.fixture
+    def algorithm(self):
+        """Create a simple RSI/moving average algorithm."""
+        return {
+            'triggers': [
+                {'type': 'rsi', 'condition': {'operator': 'lt', 'value': 45}, 'logical_operator': 'OR'},
+                {'type': 'moving_average', 'condition': {'operator': 'gt', 'value': 100, 'period': 20}}
+            ],
+            'actions': [{'type': 'buy', 'parameters': {'percentage': 50}}]
+        }
+    
+    def test_full_series_indicators_match_per_bar(self, sample_data):
+        """Test full-series indicators are identical to the per-bar computation."""
+        full = IndicatorCache(sample_data).get_many(IndicatorCache.DEFAULT_INDICATORS)
+        per_bar = calculate_indicators_per_bar(sample_data)
+        
+        assert set(full.keys()) == set(per_bar.keys())
+        for name, values in per_bar.items():
+            for i, value in enumerate(values):
+                if value is None:
+                    assert np.isnan(full[name][i])
+                else:
+                    assert full[name][i] == value
+    
+    def test_generate_signals_unchanged(self, sample_data, algorithm):
+        """Test signals are the same in both indicator modes."""
+        full = SignalGenerator().generate_signals(sample_data, algorithm)
+        per_bar = SignalGenerator().generate_signals(
+            sample_data,
+            algorithm,
+            indicator_cache=IndicatorCache(sample_data, values=calculate_indicators_per_bar(sample_data))
+        )
+        
+        assert full['signal'].tolist() == per_bar['signal'].tolist()
+        assert (full['signal'] == 'buy').any()
+    
+    def test_generate_signals_no_triggers(self, sample_data):
+        """Test signals are empty without triggers."""
+        result = SignalGenerator().generate_signals(sample_data, {'triggers': [], 'actions': []})
+        
+        assert result['signal'].isna().all()
+    
+    def test_generate_signals_filtered_index(self, sample_data, algorithm):
+        """Test signals align by position when the frame index does not start at zero."""
+        filtered = sample_data.iloc[30:]
+        
+        result = SignalGenerator().generate_signals(filtered, algorithm)
+        expected = SignalGenerator().generate_signals(filtered.reset_index(drop=True), algorithm)
+        
+        assert result.index.equals(filtered.index)
+        assert result['signal'].tolist() == expected['signal'].tolist()
@@ -0,0 +1,98 @@
+"""
+Unit tests for backtest stage profiler.
+"""
+import pytest
+import sqlite3
+import pstats
+import tracemalloc
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.stage_profiler import StageProfiler
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+@pytest.mark.unit
+class TestStageProfiler:
+    """Test cases for StageProfiler class."""
+    
+    @pytest.fixture
+    def algorithm(self):
+        """Create an RSI buy algorithm."""
+        return {
+            'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': 40}}],
+            'actions': [{'type': 'buy', 'parameters': {'percentage': 100}}]
+        }
+    
+    def test_stages_accumulate_in_order(self):
+        """Test repeated stages add up and keep their first-seen order."""
+        profiler = StageProfiler()
+        
+        with profiler.run():
+            for name in ('load', 'compute', 'load'):
+                with profiler.stage(name):
+                    sum(range(1000))
+        
+        figures = profiler.to_dict()
+        assert list(figures['stages']) == ['load', 'compute']
+        assert figures['total_seconds'] >= sum(figures['stages'].values())
+        assert figures['profile_path'] is None
+    
+    def test_stage_memory_is_per_stage(self):
+        """Test each stage reports its own peak, not the high-water mark of earlier stages."""
+        profiler = StageProfiler(trace_memory=True)
+        
+        with profiler.run():
+            with profiler.stage('large'):
+                block = bytearray(20_000_000)
+                del block
+            with profiler.stage('small'):
+                bytearray(1000)
+        
+        memory = profiler.to_dict()['stage_peak_memory']
+        assert memory['large'] >= 20_000_000
+        assert memory['small'] < 1_000_000
+        assert not tracemalloc.is_tracing()
+    
+    def test_engine_reports_stages(self, algorithm):
+        """Test BacktestEngine.run returns the timings of its six stages, and their memory when traced."""
+        results = BacktestEngine(algorithm, generate_ohlcv(300), '2000-01-01', '2001-12-31').run()
+        
+        profile = results['profile']
+        assert list(profile['stages']) == ['filter', 'parse', 'signals', 'simulate', 'equity', 'performance']
+        assert profile['peak_memory'] is None
+        
+        profile = BacktestEngine(
+            algorithm, generate_ohlcv(300), '2000-01-01', '2001-12-31',
+            profiler=StageProfiler(trace_memory=True)
+        ).run()['profile']
+        assert profile['peak_memory'] == max(profile['stage_peak_memory'].values())
+    
+    def test_cprofile_dump(self, algorithm, tmp_path):
+        """Test an opt-in cProfile dump of the run is written and readable."""
+        profile_path = str(tmp_path / 'profiles' / 'job.prof')
+        
+        BacktestEngine(
+            algorithm, generate_ohlcv(300), '2000-01-01', '2001-12-31',
+            profiler=StageProfiler(profile_path)
+        ).run()
+        
+        stats = pstats.Stats(profile_path)
+        assert any(function[2] == '_run_stages' for function in stats.stats)
+    
+    def test_save_and_get_metrics(self, algorithm, temp_db):
+        """Test metrics round-trip through backtest_job_metrics."""
+        conn = sqlite3.connect(temp_db)
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(1, '2000-01-01', '2001-12-31', data_set_id=1)
+        profile = BacktestEngine(algorithm, generate_ohlcv(300), '2000-01-01', '2001-12-31').run()['profile']
+        
+        assert job_manager.get_metrics(job_id) is None
+        job_manager.save_metrics(job_id, profile)
+        
+        assert job_manager.get_metrics(job_id) == profile
+        conn.close()
@@ -0,0 +1,148 @@
+"""
+Unit tests for streaming technical indicators.
+"""
+import pytest
+import json
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.connection import get_connection
+from modules.data_analysis.streaming_indicators import (
+    DEFAULT_STREAMING_INDICATORS,
+    StreamingATR,
+    StreamingBollinger,
+    StreamingEMA,
+    StreamingMACD,
+    StreamingRSI,
+    StreamingSMA,
+    advance_indicator_states,
+    create_streaming_indicator,
+    restore_streaming_indicator
+)
+from modules.data_analysis.technical_indicators import TechnicalIndicators
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+@pytest.mark.unit
+class TestStreamingIndicators:
+    """Test cases for streaming indicator classes."""
+    
+    @pytest.fixture
+    def sample_data(self):
+        """Create 300 bars of synthetic OHLCV data."""
+        return generate_ohlcv(300, seed=11)
+    
+    def stream(self, indicator, data):
+        """Feed every bar to an indicator and collect its values."""
+        return [indicator.update(bar) for bar in data.to_dict('records')]
+    
+    def as_array(self, values):
+        """Convert streamed values to an array with NaN while warming up."""
+        return np.array([np.nan if value is None else value for value in values])
+    
+    def flatten(self, values):
+        """Flatten streamed values (numbers, dicts or None) into an array."""
+        flat = []
+        for value in values:
+            if isinstance(value, dict):
+                flat.extend(value[name] for name in sorted(value))
+            else:
+                flat.append(np.nan if value is None else value)
+        return np.array(flat)
+    
+    def test_rsi_matches_series(self, sample_data):
+        """Test streamed RSI equals calculate_rsi_series bar for bar."""
+        expected = TechnicalIndicators().calculate_rsi_series(sample_data)
+        np.testing.assert_array_equal(self.as_array(self.stream(StreamingRSI(14), sample_data)), expected)
+    
+    def test_moving_averages_match_series(self, sample_data):
+        """Test streamed SMA and EMA match the full-series calculations."""
+        technical_indicators = TechnicalIndicators()
+        sma = self.as_array(self.stream(StreamingSMA(20), sample_data))
+        np.testing.assert_allclose(sma, technical_indicators.calculate_sma_series(sample_data, 20), rtol=1e-12)
+        
+        ema = self.as_array(self.stream(StreamingEMA(20), sample_data))
+        assert np.isnan(ema[:19]).all()
+        np.testing.assert_allclose(
+            ema[19:],
+            technical_indicators._calculate_ema(sample_data['close'].values, 20),
+            rtol=1e-12
+        )
+    
+    def test_macd_matches_calculate_macd(self, sample_data):
+        """Test streamed MACD, signal and histogram equal calculate_macd on each prefix."""
+        technical_indicators = TechnicalIndicators()
+        values = self.stream(StreamingMACD(), sample_data)
+        
+        assert values[33] is None
+        for end in (35, 80, 300):
+            expected = technical_indicators.calculate_macd(sample_data.iloc[:end])
+            del expected['signal_type']
+            assert values[end - 1] == expected
+    
+    def test_bollinger_and_atr(self, sample_data):
+        """Test Bollinger Bands and ATR against direct calculations."""
+        closes = sample_data['close']
+        middle = closes.rolling(20).mean().values
+        width = 2 * closes.rolling(20).std(ddof=0).values
+        bands = self.stream(StreamingBollinger(20, 2), sample_data)
+        assert bands[18] is None
+        np.testing.assert_allclose([band['upper'] for band in bands[19:]], (middle + width)[19:], rtol=1e-9)
+        np.testing.assert_allclose([band['lower'] for band in bands[19:]], (middle - width)[19:], rtol=1e-9)
+        
+        high = sample_data['high'].values
+        low = sample_data['low'].values
+        previous_close = np.concatenate(([np.nan], closes.values[:-1]))
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - previous_close), np.abs(low - previous_close)))
+        expected = [np.nan] * 13 + [true_range[:14].mean()]
+        for value in true_range[14:]:
+            expected.append((expected[-1] * 13 + value) / 14)
+        np.testing.assert_allclose(self.as_array(self.stream(StreamingATR(14), sample_data)), expected, rtol=1e-12)
+    
+    def test_restored_indicator_continues(self, sample_data):
+        """Test an indicator serialized mid-series continues exactly like an uninterrupted one."""
+        head, tail = sample_data.iloc[:120], sample_data.iloc[120:]
+        for spec in DEFAULT_STREAMING_INDICATORS:
+            uninterrupted = create_streaming_indicator(spec)
+            expected = self.stream(uninterrupted, sample_data)[120:]
+            
+            indicator = create_streaming_indicator(spec)
+            self.stream(indicator, head)
+            restored = restore_streaming_indicator(json.loads(json.dumps(indicator.to_dict())))
+            assert restored.key == indicator.key
+            np.testing.assert_allclose(self.flatten(self.stream(restored, tail)), self.flatten(expected), rtol=1e-9)
+        
+        assert StreamingBollinger(20, 2).key == 'bollinger_20_2'
+        with pytest.raises(ValueError):
+            create_streaming_indicator({'type': 'vwap'})
+    
+    def test_advance_indicator_states(self, temp_db, sample_data):
+        """Test saved states advance over new bars to the values of a full replay."""
+        conn = get_connection()
+        conn.execute("""
+            INSERT INTO data_sets (id, name, symbol, imported_at, source)
+            VALUES (1, 'test', 'TEST', '2024-01-01', 'csv')
+        """)
+        rows = list(sample_data.itertuples(index=False))
+        insert = """
+            INSERT INTO ohlcv_data (data_set_id, date, open, high, low, close, volume)
+            VALUES (1, ?, ?, ?, ?, ?, ?)
+        """
+        conn.executemany(insert, rows[:250])
+        conn.commit()
+        
+        advance_indicator_states(conn, 1)
+        conn.executemany(insert, rows[250:])
+        conn.commit()
+        advanced = advance_indicator_states(conn, 1)
+        
+        rebuilt = advance_indicator_states(conn, 1, rebuild=True)
+        assert list(advanced) == list(rebuilt)
+        np.testing.assert_allclose(self.flatten(advanced.values()), self.flatten(rebuilt.values()), rtol=1e-9)
+        assert advanced['rsi_14'] == TechnicalIndicators().calculate_rsi(sample_data)['value']
+        last_dates = conn.execute("SELECT DISTINCT last_date FROM indicator_states").fetchall()
+        assert [row[0] for row in last_dates] == [rows[-1][0]]
+        conn.close()
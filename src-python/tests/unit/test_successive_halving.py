@@ -0,0 +1,104 @@
+"""
+Unit tests for successive halving parameter search.
+"""
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.parameter_sweep import apply_parameters, expand_grid
+from modules.backtest.successive_halving import SuccessiveHalvingOptimizer, build_rungs, sample_grid
+from tests.benchmarks.synthetic_data import generate_ohlcv
+
+
+@pytest.mark.unit
+class TestSuccessiveHalving:
+    """Test cases for SuccessiveHalvingOptimizer class."""
+    
+    @pytest.fixture
+    def sample_data(self):
+        """Create 900 business days of synthetic OHLCV data."""
+        return generate_ohlcv(900, seed=5)
+    
+    @pytest.fixture
+    def algorithm(self):
+        """Create an RSI algorithm with a moving average filter."""
+        return {
+            'triggers': [
+                {'type': 'rsi', 'condition': {'operator': 'lt', 'value': 40}, 'logical_operator': 'AND'},
+                {'type': 'moving_average', 'condition': {'operator': 'gt', 'value': 0, 'period': 20}}
+            ],
+            'actions': [{'type': 'buy', 'parameters': {'percentage': 100}}]
+        }
+    
+    @pytest.fixture
+    def parameter_grid(self):
+        """Create a grid of 27 combinations."""
+        return {
+            'triggers.0.condition.value': [30, 40, 50],
+            'triggers.1.condition.period': [10, 20, 50],
+            'actions.0.parameters.percentage': [25, 50, 100]
+        }
+    
+    def test_sample_grid(self, parameter_grid):
+        """Test the full grid matches expand_grid and draws are seeded and distinct."""
+        assert sample_grid(parameter_grid) == expand_grid(parameter_grid)
+        
+        drawn = sample_grid(parameter_grid, 10, seed=1)
+        assert len(drawn) == 10
+        assert all(parameters in expand_grid(parameter_grid) for parameters in drawn)
+        assert len({tuple(parameters.values()) for parameters in drawn}) == 10
+        assert sample_grid(parameter_grid, 10, seed=1) == drawn
+        assert sample_grid(parameter_grid, 10, seed=2) != drawn
+    
+    def test_build_rungs(self):
+        """Test windows grow and candidates shrink by eta until the full range."""
+        assert build_rungs(27, 900) == [
+            {'rung': 0, 'candidates': 27, 'bars': 100},
+            {'rung': 1, 'candidates': 9, 'bars': 300},
+            {'rung': 2, 'candidates': 3, 'bars': 900}
+        ]
+        # The shortest window stops the rungs early
+        assert [rung['bars'] for rung in build_rungs(81, 900, min_bars=200)] == [300, 900]
+        assert build_rungs(5, 900, eta=10) == [{'rung': 0, 'candidates': 5, 'bars': 900}]
+        with pytest.raises(ValueError):
+            build_rungs(27, 900, eta=1)
+    
+    def test_run_promotes_best_candidates(self, algorithm, sample_data, parameter_grid):
+        """Test every candidate is reported once and finalists are scored on the full range."""
+        progress = []
+        optimizer = SuccessiveHalvingOptimizer(
+            algorithm, sample_data, '2000-01-01', '2010-12-31', max_workers=1
+        )
+        
+        results = optimizer.run(
+            parameter_grid,
+            progress_callback=lambda completed, total: progress.append((completed, total))
+        )
+        
+        assert len(results) == 27
+        assert progress[-1] == (39, 39)
+        assert [result['rung'] for result in results] == [2] * 3 + [1] * 6 + [0] * 18
+        
+        finalist = results[0]
+        assert finalist['bars'] == 900
+        expected = BacktestEngine(
+            apply_parameters(algorithm, finalist['parameters']), sample_data, '2000-01-01', '2010-12-31'
+        ).run()
+        assert finalist['performance'] == expected['performance']
+        
+        sharpe_ratios = [result['performance']['sharpe_ratio'] for result in results[:3]]
+        assert sharpe_ratios == sorted(sharpe_ratios, reverse=True)
+    
+    def test_worker_pool_matches_in_process(self, algorithm, sample_data, parameter_grid):
+        """Test the process pool gives the same ranking as running in-process."""
+        in_process = SuccessiveHalvingOptimizer(
+            algorithm, sample_data, '2000-01-01', '2010-12-31', max_workers=1
+        ).run(parameter_grid, num_candidates=9)
+        pooled = SuccessiveHalvingOptimizer(
+            algorithm, sample_data, '2000-01-01', '2010-12-31', max_workers=2
+        ).run(parameter_grid, num_candidates=9)
+        
+        assert pooled == in_process
@@ -0,0 +1,47 @@
+"""
+Unit tests for the synthetic OHLCV generator and benchmark runner.
+"""
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tests.benchmarks.synthetic_data import generate_ohlcv
+from tests.benchmarks.run_benchmarks import run_benchmarks, compare_with_baseline
+
+
+@pytest.mark.unit
+class TestSyntheticData:
+    """Test cases for generate_ohlcv and the benchmark runner."""
+    
+    def test_seeded_and_consistent(self):
+        """Test the same seed gives the same bars and every bar is valid OHLCV."""
+        data = generate_ohlcv(500, seed=3)
+        
+        assert data.equals(generate_ohlcv(500, seed=3))
+        assert not data.equals(generate_ohlcv(500, seed=4))
+        assert list(data.columns) == ['date', 'open', 'high', 'low', 'close', 'volume']
+        assert (data['high'] >= data[['open', 'close']].max(axis=1)).all()
+        assert (data['low'] <= data[['open', 'close']].min(axis=1)).all()
+        assert (data['volume'] > 0).all()
+        assert data['date'].iloc[0] == '2000-01-03'
+    
+    def test_intraday_dates(self):
+        """Test hourly bars keep their time of day."""
+        data = generate_ohlcv(3, freq='h', start_date='2000-01-01')
+        
+        assert data['date'].tolist() == ['2000-01-01 00:00:00', '2000-01-01 01:00:00', '2000-01-01 02:00:00']
+    
+    def test_run_benchmarks_and_compare(self, capsys):
+        """Test every stage is timed and slowdowns against the baseline are reported."""
+        results = run_benchmarks([1000], repeat=1)
+        
+        stages = results['sizes']['1000']['stages']
+        assert set(stages) == {'load', 'signals', 'trades', 'performance', 'backtest', 'save'}
+        assert all(seconds > 0 for seconds in stages.values())
+        
+        baseline = {'sizes': {'1000': {'stages': {stage: seconds / 10 for stage, seconds in stages.items()}}}}
+        regressions = compare_with_baseline(results, baseline, max_slowdown=1.5, min_seconds=0.0)
+        assert len(regressions) == len(stages)
+        assert compare_with_baseline(results, results, max_slowdown=1.5) == []
@@ -2,6 +2,7 @@
 Unit tests for technical indicators calculation.
 """
 import pytest
+import json
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -129,4 +130,50 @@ class TestTechnicalIndicators:
         if result:
             # MACD should be above signal (bullish)
             assert result['signal_type'] == 'bullish' or result['macd'] > result['signal']
-
+    
+    
+    def test_calculate_rsi_series_matches_per_bar(self, technical_indicators, sample_data):
+        """Test full-series RSI equals RSI computed on every prefix."""
+        series = technical_indicators.calculate_rsi_series(sample_data)
+        
+        assert len(series) == len(sample_data)
+        for i in range(len(sample_data)):
+            result = technical_indicators.calculate_rsi(sample_data.iloc[:i + 1])
+            if result is None:
+                assert np.isnan(series[i])
+            else:
+                assert series[i] == result['value']
+    
+    def test_calculate_macd_series_matches_per_bar(self, technical_indicators, sample_data):
+        """Test full-series MACD equals MACD computed on every prefix."""
+        series = technical_indicators.calculate_macd_series(sample_data)
+        
+        assert len(series) == len(sample_data)
+        for i in range(len(sample_data)):
+            result = technical_indicators.calculate_macd(sample_data.iloc[:i + 1])
+            if result is None:
+                assert np.isnan(series[i])
+            else:
+                assert series[i] == result['macd']
+    
+    def test_calculate_sma_series(self, technical_indicators, sample_data):
+        """Test full-series SMA."""
+        series = technical_indicators.calculate_sma_series(sample_data, 20)
+        
+        assert np.isnan(series[:19]).all()
+        assert series[-1] == sample_data['close'].tail(20).mean()
+    
+    def test_continue_series_matches_full_series(self, technical_indicators, sample_data):
+        """Test series continued from a JSON round-tripped state equal the full series."""
+        closes = sample_data['close'].values
+        split = 30
+        for method, kwargs in [
+            (technical_indicators.continue_rsi_series, {'period': 14}),
+            (technical_indicators.continue_macd_series, {}),
+            (technical_indicators.continue_sma_series, {'period': 20})
+        ]:
+            full, _ = method(closes, **kwargs)
+            head, state = method(closes[:split], **kwargs)
+            tail, _ = method(closes[split:], state=json.loads(json.dumps(state)), **kwargs)
+            
+            np.testing.assert_array_equal(np.concatenate([head, tail]), full)
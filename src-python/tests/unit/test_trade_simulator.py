@@ -0,0 +1,156 @@
+"""
+Unit tests for trade simulator.
+"""
+import pytest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.trade_simulator import TradeSimulator, TRADE_DTYPE
+
+
+def make_signals_df(seed: int, length: int = 300, buy_rate: float = 0.1, sell_rate: float = 0.1) -> pd.DataFrame:
+    """Create a frame with random buy/sell signals."""
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.03, length)))
+    draws = rng.random(length)
+    signals = np.full(length, None, dtype=object)
+    signals[draws < buy_rate] = 'buy'
+    signals[(draws >= buy_rate) & (draws < buy_rate + sell_rate)] = 'sell'
+    return pd.DataFrame({
+        'date': pd.date_range('2023-01-01', periods=length, freq='D'),
+        'open': prices,
+        'high': prices,
+        'low': prices,
+        'close': prices,
+        'volume': 1000,
+        'signal': pd.Series(signals, dtype=object)
+    })
+
+
+def simulate_trades_per_row(signals_df: pd.DataFrame, algorithm: dict, initial_capital: float) -> list:
+    """Simulate trades by iterating over every row; the reference implementation for the array simulator."""
+    trades = []
+    position = None  # {'entry_date', 'entry_price', 'quantity'}
+    capital = initial_capital
+    
+    actions = algorithm.get('actions', [])
+    if not actions:
+        return trades
+    percentage = actions[0].get('parameters', {}).get('percentage', 100.0)
+    
+    def close_position(date, exit_price):
+        profit = (exit_price - position['entry_price']) * position['quantity']
+        profit_rate = (profit / (position['entry_price'] * position['quantity'])) * 100
+        trades.append({
+            'entry_date': position['entry_date'],
+            'exit_date': date,
+            'entry_price': position['entry_price'],
+            'exit_price': exit_price,
+            'quantity': position['quantity'],
+            'profit': round(profit, 2),
+            'profit_rate': round(profit_rate, 2)
+        })
+    
+    for _, row in signals_df.iterrows():
+        if row['signal'] == 'buy' and position is None:
+            # Round down to avoid fractional shares
+            quantity = int(capital * percentage / 100.0 / row['close'])
+            if quantity > 0:
+                position = {'entry_date': row['date'], 'entry_price': row['close'], 'quantity': quantity}
+                capital -= quantity * row['close']
+        elif row['signal'] == 'sell' and position is not None:
+            close_position(row['date'], row['close'])
+            capital += position['quantity'] * row['close']
+            position = None
+    
+    # Close any open position at the end
+    if position is not None:
+        close_position(signals_df['date'].iloc[-1], signals_df['close'].iloc[-1])
+    return trades
+
+
+@pytest.mark.unit
+class TestTradeSimulator:
+    """Test cases for TradeSimulator class."""
+    
+    @pytest.mark.parametrize('seed', range(5))
+    @pytest.mark.parametrize('percentage', [100, 30])
+    def test_simulate_trades_matches_per_row(self, seed, percentage):
+        """Test the array simulator matches row-by-row simulation."""
+        signals_df = make_signals_df(seed)
+        algorithm = {'actions': [{'type': 'buy', 'parameters': {'percentage': percentage}}]}
+        simulator = TradeSimulator(initial_capital=100000.0)
+        
+        trades = simulator.simulate_trades(signals_df, algorithm)
+        expected = simulate_trades_per_row(signals_df, algorithm, 100000.0)
+        
+        assert len(trades) > 0
+        assert trades == expected
+    
+    def test_simulate_trades_skips_unaffordable_buys(self):
+        """Test buys that cannot afford one share are skipped."""
+        closes = np.array([500.0, 200.0, 50.0, 60.0, 70.0])
+        signals = np.array(['buy', 'buy', 'buy', 'sell', None], dtype=object)
+        simulator = TradeSimulator(initial_capital=100.0)
+        
+        trades = simulator.simulate_trades_state(signals, closes, {})[0]
+        
+        assert trades.dtype == TRADE_DTYPE
+        assert len(trades) == 1
+        assert trades[0]['entry_index'] == 2
+        assert trades[0]['exit_index'] == 3
+        assert trades[0]['quantity'] == 2
+        assert trades[0]['profit'] == 20.0
+    
+    def test_simulate_trades_closes_open_position(self):
+        """Test an open position is closed on the last bar."""
+        closes = np.array([10.0, 11.0, 12.0])
+        signals = np.array([None, 'buy', 'buy'], dtype=object)
+        simulator = TradeSimulator(initial_capital=100.0)
+        
+        trades = simulator.simulate_trades_state(signals, closes, {'percentage': 50})[0]
+        dicts = simulator.trades_to_dicts(trades, ['d0', 'd1', 'd2'])
+        
+        assert dicts == [{
+            'entry_date': 'd1',
+            'exit_date': 'd2',
+            'entry_price': 11.0,
+            'exit_price': 12.0,
+            'quantity': 4,
+            'profit': 4.0,
+            'profit_rate': 9.09
+        }]
+    
+    def test_simulate_trades_no_actions(self):
+        """Test no trades without actions."""
+        signals_df = make_signals_df(0, length=10)
+        
+        assert TradeSimulator().simulate_trades(signals_df, {'actions': []}) == []
+    
+    @pytest.mark.parametrize('seed', range(5))
+    def test_simulate_trades_state_continuation(self, seed):
+        """Test continuing from the end state reproduces a single run."""
+        signals_df = make_signals_df(seed)
+        signals = signals_df['signal'].values
+        closes = signals_df['close'].values
+        parameters = {'percentage': 50}
+        split = 150
+        simulator = TradeSimulator(initial_capital=100000.0)
+        
+        full, full_state = simulator.simulate_trades_state(signals, closes, parameters)
+        head, state = simulator.simulate_trades_state(signals[:split], closes[:split], parameters)
+        tail, end_state = simulator.simulate_trades_state(signals[split:], closes[split:], parameters, state)
+        
+        # The forced exit on the head's last bar is superseded by the continuation
+        if state['position'] is not None:
+            head = head[:-1]
+            assert tail[0]['entry_index'] == -1
+        combined = np.concatenate([head, tail])
+        assert len(combined) == len(full)
+        np.testing.assert_array_equal(combined['quantity'], full['quantity'])
+        np.testing.assert_array_equal(combined['profit'], full['profit'])
+        assert end_state['capital'] == full_state['capital']
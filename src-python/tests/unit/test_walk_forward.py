@@ -0,0 +1,144 @@
+"""
+Unit tests for walk-forward analysis.
+"""
+import pytest
+import sqlite3
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from modules.backtest.backtest_engine import BacktestEngine
+from modules.backtest.job_manager import BacktestJobManager
+from modules.backtest.parameter_sweep import apply_parameters
+from modules.backtest.walk_forward import WalkForwardAnalysis, build_windows
+
+
+@pytest.mark.unit
+class TestWalkForwardAnalysis:
+    """Test cases for WalkForwardAnalysis class."""
+    
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample OHLCV data."""
+        rng = np.random.default_rng(5)
+        prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 300)))
+        return pd.DataFrame({
+            'date': pd.date_range('2023-01-01', periods=300, freq='D').strftime('%Y-%m-%d'),
+            'open': prices,
+            'high': prices * 1.01,
+            'low': prices * 0.99,
+            'close': prices,
+            'volume': rng.integers(1000000, 2000000, 300)
+        })
+    
+    @pytest.fixture
+    def algorithm(self):
+        """Create an RSI buy algorithm."""
+        return {
+            'triggers': [{'type': 'rsi', 'condition': {'operator': 'lt', 'value': 40}}],
+            'actions': [{'type': 'buy', 'parameters': {'percentage': 100}}]
+        }
+    
+    @pytest.fixture
+    def parameter_grid(self):
+        """Create a small parameter grid."""
+        return {'triggers.0.condition.value': [30, 40, 50]}
+    
+    def test_build_windows_rolling(self):
+        """Test rolling windows move the in-sample range forward."""
+        windows = build_windows(250, 100, 60)
+        
+        assert [(w['in_sample_start'], w['in_sample_end'], w['out_of_sample_end']) for w in windows] == [
+            (0, 100, 160), (60, 160, 220), (120, 220, 250)
+        ]
+    
+    def test_build_windows_anchored(self):
+        """Test anchored windows keep the in-sample range starting at the first bar."""
+        windows = build_windows(250, 100, 60, anchored=True)
+        
+        assert [w['in_sample_start'] for w in windows] == [0, 0, 0]
+        assert [w['in_sample_end'] for w in windows] == [100, 160, 220]
+    
+    def test_build_windows_not_enough_data(self):
+        """Test an in-sample range longer than the series is rejected."""
+        with pytest.raises(ValueError):
+            build_windows(50, 100, 20)
+    
+    def test_run_scores_in_sample_winner_out_of_sample(self, algorithm, sample_data, parameter_grid):
+        """Test each window picks the best in-sample parameters and runs them out of sample."""
+        analysis = WalkForwardAnalysis(
+            algorithm, sample_data, '2023-01-01', '2023-12-31',
+            in_sample_size=120, out_of_sample_size=60, max_workers=1
+        )
+        
+        results = analysis.run(parameter_grid, rank_by='total_return')
+        
+        assert len(results['windows']) == 3
+        first = results['windows'][0]
+        in_sample_returns = {
+            value: BacktestEngine(
+                algorithm=apply_parameters(algorithm, {'triggers.0.condition.value': value}),
+                data=sample_data.copy(),
+                start_date=first['in_sample_start_date'],
+                end_date=first['in_sample_end_date']
+            ).run()['performance']['total_return']
+            for value in parameter_grid['triggers.0.condition.value']
+        }
+        assert first['in_sample_performance']['total_return'] == max(in_sample_returns.values())
+        assert len(results['equity_curve']) == 180
+        assert results['performance']['total_trades'] == len(results['trades'])
+    
+    def test_run_in_process_pool(self, algorithm, sample_data, parameter_grid):
+        """Test worker processes produce the same windows as in-process runs."""
+        kwargs = dict(in_sample_size=100, out_of_sample_size=50, anchored=True)
+        in_process = WalkForwardAnalysis(algorithm, sample_data, '2023-01-01', '2023-12-31', max_workers=1, **kwargs)
+        pooled = WalkForwardAnalysis(algorithm, sample_data, '2023-01-01', '2023-12-31', max_workers=2, **kwargs)
+        
+        expected = in_process.run(parameter_grid)
+        results = pooled.run(parameter_grid)
+        
+        assert [w['parameters'] for w in results['windows']] == [w['parameters'] for w in expected['windows']]
+        assert results['performance'] == expected['performance']
+        assert results['equity_curve'] == expected['equity_curve']
+    
+    def test_combine_out_of_sample_carries_profit(self, algorithm, sample_data):
+        """Test stitched equity continues from the previous window's profit."""
+        analysis = WalkForwardAnalysis(algorithm, sample_data, '2023-01-01', '2023-12-31', 100, 50, initial_capital=100.0)
+        
+        combined = analysis.combine_out_of_sample([
+            {'out_of_sample': {'trades': [], 'equity_curve': [
+                {'date': 'd0', 'equity': 100.0}, {'date': 'd1', 'equity': 110.0}
+            ]}},
+            {'error': 'boom'},
+            {'out_of_sample': {'trades': [], 'equity_curve': [
+                {'date': 'd2', 'equity': 100.0}, {'date': 'd3', 'equity': 95.0}
+            ]}},
+        ])
+        
+        assert [point['equity'] for point in combined['equity_curve']] == [100.0, 110.0, 110.0, 105.0]
+    
+    def test_save_walk_forward_windows(self, temp_db, algorithm, sample_data, parameter_grid):
+        """Test window results are stored per window."""
+        conn = sqlite3.connect(temp_db)
+        job_manager = BacktestJobManager(conn=conn)
+        job_id = job_manager.create_job(1, '2023-01-01', '2023-12-31', data_set_id=1, job_type='walk_forward')
+        analysis = WalkForwardAnalysis(
+            algorithm, sample_data, '2023-01-01', '2023-12-31',
+            in_sample_size=150, out_of_sample_size=100, max_workers=1
+        )
+        results = analysis.run(parameter_grid)
+        
+        job_manager.save_walk_forward_windows(job_id, results['windows'])
+        
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT window_index, in_sample_start, out_of_sample_start, out_of_sample_end
+            FROM backtest_walk_forward_windows WHERE job_id = ? ORDER BY window_index
+        """, (job_id,))
+        assert cursor.fetchall() == [
+            (0, '2023-01-01', '2023-05-31', '2023-09-07'),
+            (1, '2023-04-11', '2023-09-08', '2023-10-27'),
+        ]
@@ -0,0 +1,263 @@
+"""
+Rolling-window kernels over NumPy arrays.
+
+Every kernel does O(n) work with a fixed number of full-length temporary
+arrays, independent of the window length and with no per-window
+allocations, so they scale to millions of bars.
+
+Windowed functions return one value per complete window (length
+n - period + 1, like np.convolve(..., 'valid')); an input shorter than the
+window gives an empty array.
+
+All windowed kernels use the van Herk/Gil-Werman block scan: the bars are
+cut into blocks of one window length, and running sums or extremes are
+accumulated from the start and from the end of every block with one
+vectorized ufunc.accumulate each. A window that starts inside a block is the
+rest of that block plus the start of the next one, so its value combines one
+suffix and one prefix.
+
+- rolling_sum / rolling_mean / rolling_std: the running sums restart every
+  block, so they never grow beyond one window and lose no more precision
+  than summing each window directly (unlike a cumulative sum over the whole
+  series). Standard deviations use deviations from each block's first value
+  to avoid cancellation in sum(x^2) - sum(x)^2 / n.
+- rolling_min / rolling_max: the vectorized equivalent of a monotonic deque,
+  which would need a Python loop per bar.
+
+The exceptions are window_mean and window_std, which reduce each window
+with NumPy's own sum, as np.sum, np.mean and pandas do on one window. Their
+values depend only on the bars of each window, not on where the series
+starts, so they equal the streaming indicators that reduce their window
+every bar (StreamingSMA, StreamingBollinger). Use them where values computed
+from different first bars, or bar by bar, must agree exactly.
+"""
+from typing import Dict, Tuple
+import numpy as np
+
+
+# Windows window_std reduces at once, bounding its temporary to this many rows
+WINDOW_CHUNK_ROWS = 65536
+
+
+def _window_count(values: np.ndarray, period: int) -> int:
+    """Number of complete windows, validating the period."""
+    if period < 1:
+        raise ValueError(f"period must be at least 1, got {period}")
+    return max(len(values) - period + 1, 0)
+
+
+def _blocks(values: np.ndarray, period: int, fill: float) -> np.ndarray:
+    """Reshape values into rows of period bars, padding the last row with fill."""
+    num_blocks = -(-len(values) // period)
+    blocks = np.full(num_blocks * period, fill)
+    blocks[:len(values)] = values
+    return blocks.reshape(num_blocks, period)
+
+
+def _block_scan(blocks: np.ndarray, ufunc: np.ufunc) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Accumulate a ufunc within every block.
+    
+    Returns:
+        Tuple of (prefix, suffix) arrays: the accumulation from the start of each
+        bar's block up to the bar, and from the bar to the end of its block
+    """
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return prefix, suffix
+
+
+def _tail_sums(prefix: np.ndarray, period: int, count: int) -> np.ndarray:
+    """
+    Sums over the part of each window in the block after its first bar's block.
+    
+    A window starting at a block boundary is that whole block (its suffix), so
+    its tail is empty.
+    """
+    tail = prefix[period - 1:period - 1 + count].copy()
+    tail[::period] = 0.0
+    return tail
+
+
+def rolling_sum(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Sum of each window.
+    
+    Args:
+        values: 1-D array
+        period: Window length
+    
+    Returns:
+        Array of n - period + 1 window sums
+    """
+    values = np.asarray(values, dtype=np.float64)
+    count = _window_count(values, period)
+    if count == 0:
+        return np.empty(0)
+    prefix, suffix = _block_scan(_blocks(values, period, 0.0), np.add)
+    return suffix[:count] + _tail_sums(prefix, period, count)
+
+
+def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Simple moving average of each window.
+    
+    Args:
+        values: 1-D array
+        period: Window length
+    
+    Returns:
+        Array of n - period + 1 window means
+    """
+    return rolling_sum(values, period) / period
+
+
+def window_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Simple moving average of each window, reduced like np.sum of that window.
+    
+    Args:
+        values: 1-D array
+        period: Window length
+    
+    Returns:
+        Array of n - period + 1 window means, each equal to
+        np.sum(window) / period
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if _window_count(values, period) == 0:
+        return np.empty(0)
+    return np.lib.stride_tricks.sliding_window_view(values, period).sum(axis=1) / period
+
+
+def window_std(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Population standard deviation of each window around its window_mean.
+    
+    Windows are processed in chunks of WINDOW_CHUNK_ROWS, so the deviations
+    never take more than one chunk of period-wide rows.
+    
+    Args:
+        values: 1-D array
+        period: Window length
+    
+    Returns:
+        Array of n - period + 1 values, each equal to
+        sqrt(np.sum((window - mean) ** 2) / period) with mean = np.sum(window) / period
+    """
+    values = np.asarray(values, dtype=np.float64)
+    count = _window_count(values, period)
+    stds = np.empty(count)
+    if count == 0:
+        return stds
+    windows = np.lib.stride_tricks.sliding_window_view(values, period)
+    for start in range(0, count, WINDOW_CHUNK_ROWS):
+        chunk = windows[start:start + WINDOW_CHUNK_ROWS]
+        deviations = chunk - (chunk.sum(axis=1) / period)[:, np.newaxis]
+        stds[start:start + len(chunk)] = np.sqrt((deviations * deviations).sum(axis=1) / period)
+    return stds
+
+
+def rolling_std(values: np.ndarray, period: int, ddof: int = 0) -> np.ndarray:
+    """
+    Standard deviation of each window.
+    
+    Args:
+        values: 1-D array
+        period: Window length
+        ddof: Delta degrees of freedom (0: population, 1: sample)
+    
+    Returns:
+        Array of n - period + 1 window standard deviations (NaN if period <= ddof)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    count = _window_count(values, period)
+    if count == 0:
+        return np.empty(0)
+    if period <= ddof:
+        return np.full(count, np.nan)
+    
+    blocks = _blocks(values, period, 0.0)
+    centres = blocks[:, 0].copy()
+    deviations = blocks - centres[:, None]
+    prefix, suffix = _block_scan(deviations, np.add)
+    square_prefix, square_suffix = _block_scan(deviations * deviations, np.add)
+    
+    # Re-centre the tail of each window on the centre of its first block
+    starts = np.arange(count)
+    tail_length = starts % period
+    shift = np.diff(centres, append=centres[-1])[starts // period]
+    tail = _tail_sums(prefix, period, count)
+    square_tail = _tail_sums(square_prefix, period, count)
+    sums = suffix[:count] + tail + tail_length * shift
+    squares = square_suffix[:count] + square_tail + 2 * shift * tail + tail_length * shift * shift
+    
+    variance = (squares - sums * sums / period) / (period - ddof)
+    # Rounding can leave a constant window's variance slightly below zero
+    return np.sqrt(np.maximum(variance, 0.0))
+
+
+def _rolling_extreme(values: np.ndarray, period: int, ufunc: np.ufunc, fill: float) -> np.ndarray:
+    """Window minimums or maximums; a window starting at a block boundary takes the same block twice."""
+    values = np.asarray(values, dtype=np.float64)
+    count = _window_count(values, period)
+    if count == 0:
+        return np.empty(0)
+    prefix, suffix = _block_scan(_blocks(values, period, fill), ufunc)
+    return ufunc(suffix[:count], prefix[period - 1:period - 1 + count])
+
+
+def rolling_min(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Minimum of each window.
+    
+    Args:
+        values: 1-D array
+        period: Window length
+    
+    Returns:
+        Array of n - period + 1 window minimums
+    """
+    return _rolling_extreme(values, period, np.minimum, np.inf)
+
+
+def rolling_max(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Maximum of each window.
+    
+    Args:
+        values: 1-D array
+        period: Window length
+    
+    Returns:
+        Array of n - period + 1 window maximums
+    """
+    return _rolling_extreme(values, period, np.maximum, -np.inf)
+
+
+def column_statistics(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Mean, minimum, maximum and sample standard deviation of each column.
+    
+    The whole array is one window, so each statistic is a single vectorized
+    reduction over all columns instead of one pass per column.
+    
+    Args:
+        values: 2-D array with one column per series
+    
+    Returns:
+        Dict with 'mean', 'min', 'max' and 'std' arrays of one value per column
+        (std is NaN for fewer than two rows)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    mean = values.mean(axis=0)
+    if len(values) > 1:
+        std = np.sqrt(((values - mean) ** 2).sum(axis=0) / (len(values) - 1))
+    else:
+        std = np.full(values.shape[1], np.nan)
+    return {
+        'mean': mean,
+        'min': values.min(axis=0),
+        'max': values.max(axis=0),
+        'std': std
+    }
@@ -1,19 +1,47 @@
 use crate::utils::execute_python_script;
 
-/// Run backtest job
+/// Queue backtest jobs for the Python backtest worker (returns once they are queued)
 #[tauri::command]
 pub async fn run_backtest(
     algorithm_ids: Vec<i32>,
     start_date: String,
     end_date: String,
     data_set_id: Option<i32>,
+    data_set_ids: Option<Vec<i32>>,
+    max_workers: Option<i32>,
+    max_positions: Option<i32>,
+    initial_capital: Option<f64>,
+    compact_equity: Option<bool>,
+    profile: Option<bool>,
+    benchmark_data_set_id: Option<i32>,
 ) -> Result<serde_json::Value, String> {
-    let input = serde_json::json!({
+    let mut input = serde_json::json!({
         "algorithm_ids": algorithm_ids,
         "start_date": start_date,
         "end_date": end_date,
         "data_set_id": data_set_id
     });
+    if let Some(ids) = data_set_ids {
+        input["data_set_ids"] = serde_json::json!(ids);
+    }
+    if let Some(workers) = max_workers {
+        input["max_workers"] = serde_json::json!(workers);
+    }
+    if let Some(positions) = max_positions {
+        input["max_positions"] = serde_json::json!(positions);
+    }
+    if let Some(capital) = initial_capital {
+        input["initial_capital"] = serde_json::json!(capital);
+    }
+    if let Some(compact) = compact_equity {
+        input["compact_equity"] = serde_json::json!(compact);
+    }
+    if let Some(profile) = profile {
+        input["profile"] = serde_json::json!(profile);
+    }
+    if let Some(benchmark) = benchmark_data_set_id {
+        input["benchmark_data_set_id"] = serde_json::json!(benchmark);
+    }
     execute_python_script("run_backtest.py", Some(input)).await
 }
 
@@ -26,6 +54,15 @@ pub async fn get_backtest_status(job_id: String) -> Result<serde_json::Value, St
     execute_python_script("get_backtest_status.py", Some(input)).await
 }
 
+/// Cancel a queued or running backtest job
+#[tauri::command]
+pub async fn cancel_backtest_job(job_id: String) -> Result<serde_json::Value, String> {
+    let input = serde_json::json!({
+        "job_id": job_id
+    });
+    execute_python_script("cancel_backtest_job.py", Some(input)).await
+}
+
 /// Get backtest results
 #[tauri::command]
 pub async fn get_backtest_results(job_id: String) -> Result<serde_json::Value, String> {
@@ -40,6 +77,7 @@ pub async fn get_backtest_results(job_id: String) -> Result<serde_json::Value, S
 pub async fn get_backtest_results_summary(
     algorithm_ids: Option<Vec<i64>>,
     limit: Option<i64>,
+    rank_by: Option<String>,
 ) -> Result<serde_json::Value, String> {
     let mut input = serde_json::json!({});
     if let Some(ids) = algorithm_ids {
@@ -48,6 +86,149 @@ pub async fn get_backtest_results_summary(
     if let Some(l) = limit {
         input["limit"] = serde_json::json!(l);
     }
+    if let Some(metric) = rank_by {
+        input["rank_by"] = serde_json::json!(metric);
+    }
     execute_python_script("get_backtest_results_summary.py", Some(input)).await
 }
 
+
+/// Run parameter sweep for an algorithm
+#[tauri::command]
+pub async fn run_parameter_sweep(
+    algorithm_id: i32,
+    data_set_id: i32,
+    start_date: String,
+    end_date: String,
+    parameter_grid: serde_json::Value,
+    initial_capital: Option<f64>,
+    rank_by: Option<String>,
+    max_workers: Option<i32>,
+    search: Option<String>,
+    num_candidates: Option<i32>,
+    eta: Option<i32>,
+    min_bars: Option<i32>,
+    seed: Option<i64>,
+    background: Option<bool>,
+) -> Result<serde_json::Value, String> {
+    let mut input = serde_json::json!({
+        "algorithm_id": algorithm_id,
+        "data_set_id": data_set_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "parameter_grid": parameter_grid
+    });
+    if let Some(capital) = initial_capital {
+        input["initial_capital"] = serde_json::json!(capital);
+    }
+    if let Some(metric) = rank_by {
+        input["rank_by"] = serde_json::json!(metric);
+    }
+    if let Some(workers) = max_workers {
+        input["max_workers"] = serde_json::json!(workers);
+    }
+    if let Some(search) = search {
+        input["search"] = serde_json::json!(search);
+    }
+    if let Some(count) = num_candidates {
+        input["num_candidates"] = serde_json::json!(count);
+    }
+    if let Some(factor) = eta {
+        input["eta"] = serde_json::json!(factor);
+    }
+    if let Some(bars) = min_bars {
+        input["min_bars"] = serde_json::json!(bars);
+    }
+    if let Some(seed) = seed {
+        input["seed"] = serde_json::json!(seed);
+    }
+    if let Some(background) = background {
+        input["background"] = serde_json::json!(background);
+    }
+    execute_python_script("run_parameter_sweep.py", Some(input)).await
+}
+
+/// Run walk-forward analysis for an algorithm
+#[tauri::command]
+pub async fn run_walk_forward(
+    algorithm_id: i32,
+    data_set_id: i32,
+    start_date: String,
+    end_date: String,
+    parameter_grid: serde_json::Value,
+    in_sample_size: i32,
+    out_of_sample_size: i32,
+    anchored: Option<bool>,
+    initial_capital: Option<f64>,
+    rank_by: Option<String>,
+    max_workers: Option<i32>,
+    background: Option<bool>,
+) -> Result<serde_json::Value, String> {
+    let mut input = serde_json::json!({
+        "algorithm_id": algorithm_id,
+        "data_set_id": data_set_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "parameter_grid": parameter_grid,
+        "in_sample_size": in_sample_size,
+        "out_of_sample_size": out_of_sample_size
+    });
+    if let Some(anchored) = anchored {
+        input["anchored"] = serde_json::json!(anchored);
+    }
+    if let Some(capital) = initial_capital {
+        input["initial_capital"] = serde_json::json!(capital);
+    }
+    if let Some(metric) = rank_by {
+        input["rank_by"] = serde_json::json!(metric);
+    }
+    if let Some(workers) = max_workers {
+        input["max_workers"] = serde_json::json!(workers);
+    }
+    if let Some(background) = background {
+        input["background"] = serde_json::json!(background);
+    }
+    execute_python_script("run_walk_forward.py", Some(input)).await
+}
+
+/// Run Monte Carlo robustness check on a finished backtest
+#[tauri::command]
+pub async fn run_monte_carlo(
+    job_id: String,
+    method: Option<String>,
+    num_simulations: Option<i32>,
+    confidence_level: Option<f64>,
+    seed: Option<i64>,
+) -> Result<serde_json::Value, String> {
+    let mut input = serde_json::json!({
+        "job_id": job_id
+    });
+    if let Some(method) = method {
+        input["method"] = serde_json::json!(method);
+    }
+    if let Some(simulations) = num_simulations {
+        input["num_simulations"] = serde_json::json!(simulations);
+    }
+    if let Some(level) = confidence_level {
+        input["confidence_level"] = serde_json::json!(level);
+    }
+    if let Some(seed) = seed {
+        input["seed"] = serde_json::json!(seed);
+    }
+    execute_python_script("run_monte_carlo.py", Some(input)).await
+}
+
+/// Continue a completed backtest over bars added after it ran
+#[tauri::command]
+pub async fn continue_backtest(
+    job_id: String,
+    end_date: Option<String>,
+) -> Result<serde_json::Value, String> {
+    let mut input = serde_json::json!({
+        "job_id": job_id
+    });
+    if let Some(end_date) = end_date {
+        input["end_date"] = serde_json::json!(end_date);
+    }
+    execute_python_script("continue_backtest.py", Some(input)).await
+}
@@ -9,6 +9,24 @@ pub async fn run_data_analysis(data_set_id: i32) -> Result<serde_json::Value, St
     execute_python_script("run_data_analysis.py", Some(input)).await
 }
 
+/// Run data analysis jobs for many data sets in a process pool (all when data_set_ids is omitted)
+#[tauri::command]
+pub async fn analyze_many(
+    data_set_ids: Option<Vec<i32>>,
+    max_workers: Option<usize>,
+) -> Result<serde_json::Value, String> {
+    let mut input = serde_json::json!({
+        "data_set_ids": "all"
+    });
+    if let Some(ids) = data_set_ids {
+        input["data_set_ids"] = serde_json::json!(ids);
+    }
+    if let Some(w) = max_workers {
+        input["max_workers"] = serde_json::json!(w);
+    }
+    execute_python_script("analyze_many.py", Some(input)).await
+}
+
 /// Get analysis job status
 #[tauri::command]
 pub async fn get_analysis_status(job_id: String) -> Result<serde_json::Value, String> {
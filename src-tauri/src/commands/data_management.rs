@@ -81,6 +81,24 @@ pub async fn update_data_set(
     execute_python_script("update_data_set.py", Some(input)).await
 }
 
+/// Fill the stored indicator columns of existing data sets (all when data_set_ids is omitted)
+#[tauri::command]
+pub async fn backfill_indicators(
+    data_set_ids: Option<Vec<i32>>,
+    rebuild: Option<bool>,
+) -> Result<serde_json::Value, String> {
+    let mut input = serde_json::json!({
+        "data_set_ids": "all"
+    });
+    if let Some(ids) = data_set_ids {
+        input["data_set_ids"] = serde_json::json!(ids);
+    }
+    if let Some(r) = rebuild {
+        input["rebuild"] = serde_json::json!(r);
+    }
+    execute_python_script("backfill_indicators.py", Some(input)).await
+}
+
 /// Check data integrity
 #[tauri::command]
 pub async fn check_data_integrity(data_set_id: i32) -> Result<serde_json::Value, String> {
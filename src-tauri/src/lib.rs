@@ -24,8 +24,10 @@ pub fn run() {
             data_management::get_data_preview,
             data_management::update_data_set,
             data_management::check_data_integrity,
+            data_management::backfill_indicators,
             // Data Analysis
             data_analysis::run_data_analysis,
+            data_analysis::analyze_many,
             data_analysis::get_analysis_status,
             data_analysis::get_analysis_results,
             data_analysis::get_latest_analysis_results,
@@ -39,8 +41,13 @@ pub fn run() {
             // Backtest
             backtest::run_backtest,
             backtest::get_backtest_status,
+            backtest::cancel_backtest_job,
             backtest::get_backtest_results,
             backtest::get_backtest_results_summary,
+            backtest::run_parameter_sweep,
+            backtest::run_walk_forward,
+            backtest::run_monte_carlo,
+            backtest::continue_backtest,
             // News
             news::collect_market_news,
             news::get_news_collection_status,
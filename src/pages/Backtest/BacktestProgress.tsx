@@ -25,7 +25,7 @@ import {
 } from '@mantine/core';
 import { BacktestJob } from '../../types/backtest';
 
-type BacktestJobStatus = 'pending' | 'running' | 'completed' | 'failed';
+type BacktestJobStatus = 'pending' | 'running' | 'completed' | 'failed' | 'cancelled';
 
 interface BacktestProgressProps {
   jobId: string;
@@ -58,8 +58,13 @@ export function BacktestProgress({ jobId, onCompleted, onError }: BacktestProgre
           setError(response.error);
         }
 
-        // Stop polling if job is completed or failed
-        if (response.status === 'completed') {
+        // Stop polling if job is completed, failed or cancelled
+        if (response.status === 'cancelled') {
+          if (intervalRef.current) {
+            clearInterval(intervalRef.current);
+            intervalRef.current = null;
+          }
+        } else if (response.status === 'completed') {
           if (intervalRef.current) {
             clearInterval(intervalRef.current);
             intervalRef.current = null;
@@ -111,6 +116,8 @@ export function BacktestProgress({ jobId, onCompleted, onError }: BacktestProgre
         return 'red';
       case 'running':
         return 'blue';
+      case 'cancelled':
+        return 'orange';
       default:
         return 'gray';
     }
@@ -28,7 +28,21 @@ export interface AlgorithmDefinition {
 }
 
 export interface TriggerDefinition {
-  type: 'rsi' | 'macd' | 'price' | 'volume' | 'moving_average' | string;
+  type:
+    | 'rsi'
+    | 'macd'
+    | 'price'
+    | 'volume'
+    | 'moving_average'
+    | 'sma'
+    | 'ema'
+    | 'atr'
+    | 'obv'
+    | 'vwap'
+    | 'bollinger'
+    | 'stochastic'
+    | 'adx'
+    | string;
   condition: TriggerCondition;
   logical_operator?: 'AND' | 'OR';
 }
@@ -37,6 +51,7 @@ export interface TriggerCondition {
   operator: 'gt' | 'lt' | 'gte' | 'lte' | 'eq' | 'between' | 'cross_above' | 'cross_below';
   value: number | [number, number];
   period?: number;
+  // Value of bollinger (upper, middle, lower, percent_b), stochastic (k, d) and adx (adx, plus_di, minus_di) triggers
   indicator?: string;
 }
 
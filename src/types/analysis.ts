@@ -38,6 +38,11 @@ export interface TechnicalIndicators {
   sma?: SMAResult[];
   ema?: EMAResult[];
   bollinger_bands?: BollingerBandsResult;
+  atr?: PeriodValueResult;
+  stochastic?: StochasticResult;
+  obv?: { value: number };
+  vwap?: PeriodValueResult;
+  adx?: ADXResult;
 }
 
 export interface RSIResult {
@@ -67,9 +72,28 @@ export interface BollingerBandsResult {
   upper: number;
   middle: number;
   lower: number;
+  percent_b?: number;
   period: number;
 }
 
+export interface PeriodValueResult {
+  period: number;
+  value: number;
+}
+
+export interface StochasticResult {
+  period: number;
+  k: number;
+  d: number;
+}
+
+export interface ADXResult {
+  period: number;
+  adx: number;
+  plus_di: number;
+  minus_di: number;
+}
+
 export interface Statistics {
   price_range: {
     min: number;
@@ -12,7 +12,7 @@ export interface BacktestJob {
   start_date: string;
   end_date: string;
   data_set_id: number | null;
-  status: 'pending' | 'running' | 'completed' | 'failed';
+  status: 'pending' | 'running' | 'completed' | 'failed' | 'cancelled';
   progress: number;
   message: string | null;
   error: string | null;
@@ -28,6 +28,8 @@ export interface BacktestResult {
   performance: PerformanceMetrics;
   trades: Trade[];
   equity_curve: EquityPoint[];
+  rolling_sharpe?: Record<string, Array<number | null>>;  // Window (days) -> value per equity point
+  monte_carlo?: MonteCarloReport[];  // Present once a Monte Carlo check has been run
   created_at?: string;  // Optional, may not be included in API response
 }
 
@@ -39,6 +41,24 @@ export interface PerformanceMetrics {
   total_trades: number;
   average_profit: number;
   average_loss: number;
+  // Risk metrics from daily equity; null for results saved before they were added
+  cagr?: number | null;
+  volatility?: number | null;
+  sortino_ratio?: number | null;
+  calmar_ratio?: number | null;
+  exposure?: number | null;  // Percentage of bars with an open position
+  var_95?: number | null;  // Daily loss not exceeded on 95% of days, in percent
+  cvar_95?: number | null;  // Average daily loss beyond var_95, in percent
+  longest_drawdown?: number | null;  // Longest run of bars below an earlier peak
+  // Comparison with buying and holding the traded data, and with the optional benchmark data set
+  buy_and_hold_return?: number | null;
+  excess_return?: number | null;  // total_return - buy_and_hold_return, in percentage points
+  alpha?: number | null;  // Annualized, in percent
+  beta?: number | null;
+  benchmark_return?: number | null;
+  benchmark_excess_return?: number | null;
+  benchmark_alpha?: number | null;
+  benchmark_beta?: number | null;
 }
 
 export interface Trade {
@@ -49,6 +69,7 @@ export interface Trade {
   quantity: number;
   profit: number;
   profit_rate: number;
+  symbol?: string | null;
 }
 
 export interface EquityPoint {
@@ -56,3 +77,28 @@ export interface EquityPoint {
   equity: number;
 }
 
+export interface BacktestRunMetrics {
+  stages: Record<string, number>;  // Seconds per engine stage in run order
+  total_seconds: number;
+  stage_peak_memory: Record<string, number | null>;  // Peak bytes allocated during each stage
+  peak_memory: number | null;
+  profile_path: string | null;  // cProfile dump, present when profiling was requested
+}
+
+export interface ConfidenceInterval {
+  mean: number;
+  median: number;
+  lower: number;
+  upper: number;
+}
+
+export interface MonteCarloReport {
+  method: 'trades' | 'daily_returns';
+  num_simulations: number;
+  confidence_level: number;
+  metrics: {
+    total_return: ConfidenceInterval;
+    max_drawdown: ConfidenceInterval;
+    sharpe_ratio: ConfidenceInterval;
+  };
+}